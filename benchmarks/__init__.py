@@ -0,0 +1,3 @@
+"""
+Benchmarks of the library layer on synthetic granules.
+"""
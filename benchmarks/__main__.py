@@ -0,0 +1,89 @@
+"""
+Run the benchmarks without asv, and compare them with an earlier run.
+
+    $ python -m benchmarks --save baseline.json
+    $ python -m benchmarks --compare baseline.json
+
+Each time_* method is timed as the best of --repeat runs after its setup.
+With --compare, the run fails if any benchmark got slower than --threshold
+times its earlier time.
+"""
+import argparse
+import inspect
+import json
+import sys
+import time
+
+from . import products
+
+
+def benchmarks(module=products):
+    """
+    (name, class, parameter, method name) of each benchmark in module.
+    """
+    found = []
+    for cls_name, cls in sorted(vars(module).items()):
+        if not inspect.isclass(cls) or cls_name.startswith('_'):
+            continue
+        methods = sorted(m for m in dir(cls) if m.startswith('time_'))
+        for param in cls.params:
+            for method in methods:
+                name = '{0}.{1}({2})'.format(cls_name, method, param)
+                found.append((name, cls, param, method))
+    return found
+
+
+def run(selected, repeat=3):
+    """
+    Best time in seconds of each benchmark, by name.
+    """
+    times = {}
+    for name, cls, param, method in selected:
+        bench = cls()
+        bench.setup(param)
+        try:
+            best = None
+            for _ in range(repeat):
+                start = time.time()
+                getattr(bench, method)(param)
+                elapsed = time.time() - start
+                best = elapsed if best is None else min(best, elapsed)
+        finally:
+            bench.teardown(param)
+        times[name] = best
+        print('{0:9.4f}s  {1}'.format(best, name))
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('patterns', nargs='*',
+                        help='run only benchmarks whose name contains one')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--save', help='write the times to this JSON file')
+    parser.add_argument('--compare', help='JSON file of an earlier run')
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help='slowdown that counts as a regression')
+    args = parser.parse_args(argv)
+
+    selected = [b for b in benchmarks()
+                if not args.patterns or any(p in b[0] for p in args.patterns)]
+    times = run(selected, args.repeat)
+    if args.save:
+        with open(args.save, 'w') as fh:
+            json.dump(times, fh, indent=1, sort_keys=True)
+
+    status = 0
+    if args.compare:
+        with open(args.compare) as fh:
+            before = json.load(fh)
+        for name in sorted(times):
+            if name in before and times[name] > args.threshold * before[name]:
+                print('SLOWER {0}: {1:.4f}s, was {2:.4f}s'.format(
+                    name, times[name], before[name]))
+                status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Read, decode, geolocate and render each product family, on synthetic
+granules from testing.synthetic.
+
+The classes follow asv's conventions (setup, teardown, params and time_*
+methods), so that `asv run -E existing` runs them;  `python -m benchmarks`
+runs them without asv.
+"""
+import io
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import zoo.geo
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+from testing import synthetic
+
+
+def _figure():
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt.figure(figsize=(8, 6), dpi=100)
+
+
+def _save(fig):
+    import matplotlib.pyplot as plt
+    fig.savefig(io.BytesIO(), format='png')
+    plt.close(fig)
+
+
+class _Granule(object):
+    """
+    Writes a granule with write(filename, size) in setup and removes it in
+    teardown.
+    """
+    params = [600]
+    param_names = ['size']
+
+    def setup(self, size):
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, 'granule')
+        self.name = self.write(self.filename, size)
+        with zoo.io.open_file(self.filename) as f:
+            var = f[self.name]
+            self.raw = var[...]
+            self.rule = zoo.io.decode.rule_for(var.attrs, self.convention)
+        self.data = zoo.io.decode.decode_masked(self.raw, self.rule)
+
+    def teardown(self, size):
+        shutil.rmtree(self.tempdir)
+
+    def time_read(self, size):
+        with zoo.io.open_file(self.filename) as f:
+            f[self.name][...]
+
+    def time_decode(self, size):
+        zoo.io.decode.decode_masked(self.raw, self.rule)
+
+
+class ModisGrid(_Granule):
+    """
+    A MODIS sinusoidal tile (HDF4), as in MOD09GA or MYD09GQ.
+    """
+    params = [600, 2400]
+    convention = 'modis'
+
+    def write(self, filename, size):
+        return synthetic.modis_grid(filename, (size, size))
+
+    def time_geolocate(self, size):
+        zoo.geo.grid.clear_cache()
+        zoo.geo.grid_geolocator(self.filename, self.name)[:]
+
+    def time_render(self, size):
+        fig = _figure()
+        with zoo.io.open_file(self.filename) as f:
+            var = f[self.name]
+            data, key = zoo.plot.read_decimated(var, 'mean', rule=self.rule)
+        lon, lat = zoo.geo.grid_geolocator(self.filename, self.name)[key]
+        fig.gca().pcolormesh(lon, lat, data)
+        _save(fig)
+
+
+class Eos5Swath(_Granule):
+    """
+    An HDF-EOS5 swath with its geolocation fields, as in OMI L2.
+    """
+    params = [1644, 6576]
+    convention = 'cf'
+
+    def write(self, filename, size):
+        return synthetic.eos5_swath(filename, (size, 60))
+
+    def time_geolocate(self, size):
+        with zoo.io.open_file(self.filename) as f:
+            f['Latitude'][...]
+            f['Longitude'][...]
+
+    def time_render(self, size):
+        fig = _figure()
+        with zoo.io.open_file(self.filename) as f:
+            lat = f['Latitude'][...]
+            lon = f['Longitude'][...]
+        fig.gca().pcolormesh(lon, lat, self.data)
+        _save(fig)
+
+
+class Oco2Points(_Granule):
+    """
+    An HDF5 point product, as in OCO-2 L2 Lite.
+    """
+    params = [100000, 1000000]
+    convention = 'cf'
+
+    def write(self, filename, size):
+        return synthetic.oco2_points(filename, size)
+
+    def time_geolocate(self, size):
+        with zoo.io.open_file(self.filename) as f:
+            f['retrieval_latitude'][...]
+            f['retrieval_longitude'][...]
+
+    def time_render(self, size):
+        fig = _figure()
+        with zoo.io.open_file(self.filename) as f:
+            lat = f['retrieval_latitude'][...]
+            lon = f['retrieval_longitude'][...]
+        zoo.plot.points(None, lon, lat, np.ma.masked_invalid(self.data),
+                        ax=fig.gca())
+        _save(fig)
@@ -0,0 +1,218 @@
+"""
+Synthetic granules laid out like the NASA products of the examples, for
+tests and benchmarks that cannot download the real ones.
+
+    >>> synthetic.modis_grid('tile.hdf', shape=(2400, 2400))
+    >>> synthetic.eos5_swath('omi.he5', shape=(1644, 60))
+    >>> synthetic.oco2_points('oco2.h5', size=100000)
+
+The values are smooth fields with some fill, not data, but the files have
+the structure the readers depend on:  HDF4 SDS with MODIS-style scale,
+offset, valid range and fill attributes under a StructMetadata.0 sinusoidal
+grid;  HDF-EOS5 swath groups under /HDFEOS/SWATHS with their StructMetadata
+dataset;  and OCO-2 style HDF5 point products.
+
+    $ python -m testing.synthetic DIRECTORY
+
+writes one of each at full size.
+"""
+import os
+import sys
+
+import numpy as np
+
+# Side of a MODIS sinusoidal tile in metres, and the corner of tile (0, 0).
+TILE_M = 1111950.519667
+_ULX = -20015109.354
+_ULY = 10007554.677
+
+MODIS_GRID_METADATA = """\
+GROUP=GridStructure
+	GROUP=GRID_1
+		GridName="{grid}"
+		XDim={nx}
+		YDim={ny}
+		UpperLeftPointMtrs=({ulx:.6f},{uly:.6f})
+		LowerRightMtrs=({lrx:.6f},{lry:.6f})
+		Projection=GCTP_SNSOID
+		ProjParams=(6371007.181000,0,0,0,0,0,0,0,0,0,0,0,0)
+		SphereCode=-1
+		GridOrigin=HDFE_GD_UL
+		GROUP=Dimension
+		END_GROUP=Dimension
+		GROUP=DataField
+			OBJECT=DataField_1
+				DataFieldName="{field}"
+				DataType=DFNT_INT16
+				DimList=("YDim","XDim")
+			END_OBJECT=DataField_1
+		END_GROUP=DataField
+		GROUP=MergedFields
+		END_GROUP=MergedFields
+	END_GROUP=GRID_1
+END_GROUP=GridStructure
+GROUP=PointStructure
+END_GROUP=PointStructure
+END
+"""
+
+EOS5_SWATH_METADATA = """\
+GROUP=SwathStructure
+	GROUP=SWATH_1
+		SwathName="{swath}"
+		GROUP=Dimension
+			OBJECT=Dimension_1
+				DimensionName="nTimes"
+				Size={ntimes}
+			END_OBJECT=Dimension_1
+			OBJECT=Dimension_2
+				DimensionName="nXtrack"
+				Size={nxtrack}
+			END_OBJECT=Dimension_2
+		END_GROUP=Dimension
+		GROUP=DimensionMap
+		END_GROUP=DimensionMap
+		GROUP=GeoField
+			OBJECT=GeoField_1
+				GeoFieldName="Latitude"
+				DataType=H5T_NATIVE_FLOAT
+				DimList=("nTimes","nXtrack")
+			END_OBJECT=GeoField_1
+			OBJECT=GeoField_2
+				GeoFieldName="Longitude"
+				DataType=H5T_NATIVE_FLOAT
+				DimList=("nTimes","nXtrack")
+			END_OBJECT=GeoField_2
+		END_GROUP=GeoField
+		GROUP=DataField
+			OBJECT=DataField_1
+				DataFieldName="{field}"
+				DataType=H5T_NATIVE_FLOAT
+				DimList=("nTimes","nXtrack")
+			END_OBJECT=DataField_1
+		END_GROUP=DataField
+	END_GROUP=SWATH_1
+END_GROUP=SwathStructure
+END
+"""
+
+
+def field(shape, seed=0):
+    """
+    A smooth field of values between 0 and 1.
+    """
+    rng = np.random.RandomState(seed)
+    y = np.linspace(0, np.pi * rng.uniform(1, 4), shape[0])[:, np.newaxis]
+    x = np.linspace(0, np.pi * rng.uniform(1, 4), shape[1])[np.newaxis, :]
+    return 0.5 + 0.25 * np.sin(y) + 0.25 * np.cos(x + y / 2)
+
+
+def modis_grid(filename, shape=(2400, 2400), name='sur_refl_b01_1',
+               grid='MODIS_Grid_500m_2D', tile=(10, 8)):
+    """
+    Write an HDF-EOS2 tile of a MODIS sinusoidal grid with one int16 field
+    and return the field's name.  tile is (h, v).
+    """
+    from pyhdf.SD import SD, SDC
+
+    ny, nx = shape
+    ulx = _ULX + tile[0] * TILE_M
+    uly = _ULY - tile[1] * TILE_M
+    metadata = MODIS_GRID_METADATA.format(grid=grid, field=name, nx=nx,
+                                          ny=ny, ulx=ulx, uly=uly,
+                                          lrx=ulx + TILE_M, lry=uly - TILE_M)
+    data = np.round(field(shape) * 10000 - 100).astype(np.int16)
+    data[:ny // 10, :nx // 10] = -28672
+
+    sd = SD(filename, SDC.WRITE | SDC.CREATE | SDC.TRUNC)
+    try:
+        setattr(sd, 'StructMetadata.0', metadata)
+        sds = sd.create(name, SDC.INT16, shape)
+        sds.dim(0).setname('YDim:' + grid)
+        sds.dim(1).setname('XDim:' + grid)
+        sds[:] = data
+        sds.long_name = '500m Surface Reflectance Band 1'
+        sds.units = 'reflectance'
+        sds.attr('valid_range').set(SDC.INT16, [-100, 16000])
+        sds.setfillvalue(-28672)
+        sds.scale_factor = 0.0001
+        sds.add_offset = 0.0
+        sds.endaccess()
+    finally:
+        sd.end()
+    return name
+
+
+def eos5_swath(filename, shape=(1644, 60), swath='BrO',
+               name='ColumnAmount'):
+    """
+    Write an HDF-EOS5 swath, like OMI's, with one float32 field and its
+    geolocation, and return the field's path.
+    """
+    import h5py
+
+    ntimes, nxtrack = shape
+    lat = np.linspace(-80, 80, ntimes)[:, np.newaxis]
+    lat = lat + np.linspace(-1, 1, nxtrack)[np.newaxis, :]
+    lon = np.linspace(-60, 60, nxtrack)[np.newaxis, :]
+    lon = lon + np.linspace(0, -20, ntimes)[:, np.newaxis]
+    data = (field(shape, 1) * 1e14).astype(np.float32)
+    data[:, :2] = -1.0e30
+
+    metadata = EOS5_SWATH_METADATA.format(swath=swath, field=name,
+                                          ntimes=ntimes, nxtrack=nxtrack)
+    with h5py.File(filename, 'w') as f:
+        info = f.create_group('HDFEOS INFORMATION')
+        info.create_dataset('StructMetadata.0', data=np.bytes_(metadata))
+        group = f.create_group('HDFEOS/SWATHS/' + swath)
+        fields = group.create_group('Data Fields')
+        dset = fields.create_dataset(name, data=data, chunks=True)
+        dset.attrs['_FillValue'] = np.float32(-1.0e30)
+        dset.attrs['ScaleFactor'] = 1.0
+        dset.attrs['Offset'] = 0.0
+        dset.attrs['Units'] = np.bytes_('molec/cm2')
+        dset.attrs['Title'] = np.bytes_('BrO Vertical Column Amount')
+        geo = group.create_group('Geolocation Fields')
+        geo.create_dataset('Latitude', data=lat.astype(np.float32))
+        geo.create_dataset('Longitude', data=lon.astype(np.float32))
+    return '/HDFEOS/SWATHS/{0}/Data Fields/{1}'.format(swath, name)
+
+
+def oco2_points(filename, size=100000):
+    """
+    Write an OCO-2 style HDF5 point product of size soundings and return
+    the path of the xco2 field.
+    """
+    import h5py
+
+    rng = np.random.RandomState(2)
+    t = np.sort(rng.uniform(0, 1, size))
+    lat = np.degrees(np.arcsin(np.sin(2 * np.pi * 14.5 * t) * 0.99))
+    lon = (360 * t * -25 + 0.1 * rng.standard_normal(size)) % 360 - 180
+    xco2 = 395 + 5 * np.sin(np.radians(lat)) + rng.standard_normal(size)
+
+    with h5py.File(filename, 'w') as f:
+        results = f.create_group('RetrievalResults')
+        dset = results.create_dataset('xco2', data=xco2.astype(np.float32),
+                                      chunks=True)
+        dset.attrs['Units'] = np.bytes_('ppm')
+        dset.attrs['Description'] = np.bytes_(
+            'Column-averaged dry-air mole fraction of CO2')
+        geometry = f.create_group('RetrievalGeometry')
+        geometry.create_dataset('retrieval_latitude',
+                                data=lat.astype(np.float32))
+        geometry.create_dataset('retrieval_longitude',
+                                data=lon.astype(np.float32))
+    return '/RetrievalResults/xco2'
+
+
+def main(directory):
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    modis_grid(os.path.join(directory, 'synthetic_modis_grid.hdf'))
+    eos5_swath(os.path.join(directory, 'synthetic_eos5_swath.he5'))
+    oco2_points(os.path.join(directory, 'synthetic_oco2_points.h5'))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else '.')
@@ -0,0 +1,140 @@
+"""
+Tests for the batch runner and phase timing.
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from zoo import batch, phases
+from zoo.io import backends
+
+
+class TestPhases(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        phases.reset()
+        phases.enable()
+
+    def tearDown(self):
+        phases.enable(False)
+        phases.reset()
+        shutil.rmtree(self.tempdir)
+
+    def test_exclusive(self):
+        """
+        Time in a nested phase does not count towards the outer one.
+        """
+        @phases.timed('decode')
+        def decode():
+            time.sleep(0.05)
+
+        @phases.timed('read')
+        def read():
+            time.sleep(0.02)
+            decode()
+
+        read()
+        totals = phases.totals()
+        self.assertGreaterEqual(totals['decode'], 0.05)
+        self.assertGreaterEqual(totals['read'], 0.02)
+        self.assertLess(totals['read'], 0.05)
+
+    def test_disabled(self):
+        phases.enable(False)
+        phases.timed('read')(time.sleep)(0.01)
+        self.assertEqual(phases.totals(), {})
+
+    def test_libraries(self):
+        """
+        The examples' own reads and drawing calls are timed.
+        """
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.figure
+        batch._time_libraries()
+        batch._time_libraries()
+
+        figure = matplotlib.figure.Figure()
+        figure.add_subplot(111).pcolormesh(np.arange(12.).reshape(3, 4))
+        self.assertIn('render', phases.totals())
+        self.assertNotIn('read', phases.totals())
+
+        if backends.available('h5py'):
+            import h5py
+            path = os.path.join(self.tempdir, 'a.h5')
+            with h5py.File(path, 'w') as f:
+                f['x'] = np.arange(10)
+            phases.reset()
+            with h5py.File(path, 'r') as f:
+                np.testing.assert_array_equal(f['x'][2:4], [2, 3])
+            self.assertIn('read', phases.totals())
+
+        if backends.available('netcdf4'):
+            import netCDF4
+            path = os.path.join(self.tempdir, 'a.nc')
+            with netCDF4.Dataset(path, 'w') as nc:
+                nc.createDimension('x', 10)
+                nc.createVariable('x', 'i4', ('x',))[:] = np.arange(10)
+                nc['x'].units = 'm'
+            phases.reset()
+            with netCDF4.Dataset(path) as nc:
+                var = nc.variables['x']
+                self.assertEqual(var.__dict__, {'units': 'm'})
+                self.assertEqual(var.shape, (10,))
+                np.testing.assert_array_equal(nc['x'][2:4], [2, 3])
+            self.assertIn('read', phases.totals())
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_discover(self):
+        """
+        Examples and their data files are found without importing them.
+        """
+        examples = batch.discover(['lpdaac.mod.MOD09*', 'PODAAC_L3_bsst'])
+        names = [name for name, _, _ in examples]
+        self.assertEqual(names, ['zoo.lpdaac.mod.MOD09GA_Range',
+                                 'zoo.lpdaac.mod.MOD09GHK_sur_refl_01_1',
+                                 'zoo.podaac.avhrr.PODAAC_L3_bsst'])
+        self.assertEqual(examples[0][2],
+                         'MOD09GA.A2007268.h10v08.005.2007272184810.hdf')
+        self.assertEqual(examples[2][2], '2006001-2006005.s0454pfrt-bsst.hdf')
+        self.assertTrue(os.path.exists(examples[2][1]))
+        self.assertNotIn('zoo.lpdaac.mod.MOD09GA_Range', sys.modules)
+
+    def test_run(self):
+        """
+        Examples without data are reported missing, and failures are
+        recorded with their traceback.
+        """
+        data = os.path.join(self.tempdir, 'data')
+        os.mkdir(data)
+        examples = batch.discover(['lpdaac.mod.MOD09*'])
+        open(os.path.join(data, examples[0][2]), 'w').close()
+        report = os.path.join(self.tempdir, 'report.json')
+        output = os.path.join(self.tempdir, 'figures')
+        status = batch.main(['-d', data, '-o', report, '--output-dir',
+                             output, '-j', '1', 'lpdaac.mod.MOD09*'])
+        self.assertEqual(status, 1)
+        with open(report) as fh:
+            records = json.load(fh)['examples']
+        self.assertEqual([r['status'] for r in records],
+                         ['error', 'missing'])
+        self.assertIn('Traceback', records[0]['error'])
+        self.assertGreater(records[0]['peak_rss'], 0)
+        self.assertIsInstance(records[0]['phases'], dict)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Tests for binning swath pixels onto grids.
+"""
+import unittest
+
+import numpy as np
+
+import zoo.geo
+from zoo.geo import gctp
+
+
+class TestTargetGrid(unittest.TestCase):
+    def test_shapes(self):
+        self.assertEqual(zoo.geo.TargetGrid.equal_angle(0.25).shape,
+                         (720, 1440))
+        self.assertEqual(zoo.geo.TargetGrid.sinusoidal().shape,
+                         (21600, 43200))
+        self.assertEqual(zoo.geo.TargetGrid.sinusoidal(tile=(10, 8)).shape,
+                         (1200, 1200))
+        self.assertEqual(zoo.geo.TargetGrid.ease().shape, (586, 1383))
+
+    def test_forward(self):
+        """
+        forward() inverts inverse() for the grids binned onto.
+        """
+        lon = np.array([-179.5, -60.25, 0.0, 33.3, 120.0])
+        lat = np.array([-80.0, -15.5, 0.0, 45.0, 85.0])
+        for grid in (zoo.geo.TargetGrid.sinusoidal(),
+                     zoo.geo.TargetGrid.ease()):
+            x, y = gctp.forward(grid.projection, grid.params, lon, lat)
+            lon2, lat2 = gctp.inverse(grid.projection, grid.params, x, y)
+            np.testing.assert_allclose(lon2, lon, atol=1e-9)
+            np.testing.assert_allclose(lat2, lat, atol=1e-9)
+
+    def test_index(self):
+        """
+        Cell centres fall in their own cells, for each kind of grid.
+        """
+        for grid in (zoo.geo.TargetGrid.equal_angle(1.0, (0, 360, -90, 0)),
+                     zoo.geo.TargetGrid.sinusoidal(10000.0, tile=(17, 4)),
+                     zoo.geo.TargetGrid.ease(100000.0)):
+            lon, lat = grid.lonlat()
+            index, inside = grid.index(lon, lat)
+            ok = np.isfinite(lon)
+            self.assertTrue(inside[ok].all())
+            np.testing.assert_array_equal(
+                index[ok], np.arange(lon.size).reshape(lon.shape)[ok])
+
+    def test_outside(self):
+        grid = zoo.geo.TargetGrid.equal_angle(1.0, (-10, 10, -10, 10))
+        index, inside = grid.index([0.5, 50.0, np.nan], [0.5, 0.5, 0.5])
+        self.assertEqual(inside.tolist(), [True, False, False])
+        self.assertEqual(index[0], 9 * 20 + 10)
+
+
+class TestBinner(unittest.TestCase):
+    def test_reducers(self):
+        """
+        Binning granule by granule gives the statistics of all the values.
+        """
+        grid = zoo.geo.TargetGrid.equal_angle(10.0, (0, 20, 0, 10))
+        rng = np.random.RandomState(0)
+        lon = rng.uniform(0, 20, 3000)
+        lat = rng.uniform(0, 10, 3000)
+        values = rng.standard_normal(3000) * 5 + 1e6
+        binner = zoo.geo.Binner(grid, zoo.geo.binning.REDUCERS)
+        for part in np.array_split(np.arange(3000), 7):
+            binner.add(lon[part], lat[part], values[part])
+        left = lon < 10
+        for reducer, func in (('mean', np.mean), ('min', np.min),
+                              ('max', np.max), ('std', np.std),
+                              ('count', np.size)):
+            result = binner.result(reducer)
+            self.assertEqual(result.shape, (1, 2))
+            self.assertAlmostEqual(result[0, 0], func(values[left]),
+                                   places=6)
+            self.assertAlmostEqual(result[0, 1], func(values[~left]),
+                                   places=6)
+
+    def test_masked(self):
+        """
+        Masked, NaN and out of grid values are left out, and empty cells
+        are masked.
+        """
+        grid = zoo.geo.TargetGrid.equal_angle(1.0, (0, 3, 0, 1))
+        values = np.ma.masked_array([1.0, 2.0, np.nan, 4.0, 8.0],
+                                    mask=[False, True, False, False, False])
+        binner = zoo.geo.bin_swaths(
+            [([0.5, 0.5, 0.5, 2.5, 7.0], 0.5, values)], grid,
+            ('mean', 'count'))
+        self.assertEqual(binner.result('count').tolist(), [[1, 0, 1]])
+        mean = binner.result('mean')
+        self.assertEqual(mean.mask.tolist(), [[False, True, False]])
+        self.assertEqual(mean.compressed().tolist(), [1.0, 4.0])
+        self.assertRaises(ValueError, binner.result, 'std')
+        self.assertRaises(ValueError, zoo.geo.Binner, grid, ('median',))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Tests for the granule footprint catalog.
+"""
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from zoo import catalog
+from zoo.io import backends
+
+from . import synthetic
+
+
+class TestBoxes(unittest.TestCase):
+    def test_dateline(self):
+        """
+        Points across the dateline make two boxes, points around a pole
+        one of all longitudes.
+        """
+        self.assertEqual(catalog.boxes([170, 175, -178], [10, 20, 15]),
+                         [(170, 180, 10, 20), (-180, -178, 10, 20)])
+        self.assertEqual(catalog.boxes([-10, 10, 370, -999], [5, -5, 0, 0]),
+                         [(-10, 10, -5, 5)])
+        self.assertEqual(catalog.boxes([-180, -90, 10, 90, 179],
+                                       [80, 85, 82, 81, 80]),
+                         [(10, 180, 80, 85), (-180, -90, 80, 85)])
+        ring = np.arange(-180, 180, 10)
+        self.assertEqual(catalog.boxes(ring, ring * 0 + 80),
+                         [(-180, 170, 80, 80)])
+
+
+@unittest.skipUnless(backends.available('pyhdf') and
+                     backends.available('h5py'), 'requires pyhdf and h5py')
+class TestCatalog(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.root = os.path.join(self.tempdir, 'data')
+        os.makedirs(os.path.join(self.root, 'omi'))
+        # Tile h10v05 is 30-40N, 104-81W.
+        self.tile = os.path.join(self.root,
+                                 'MOD09A1.A2007257.h10v05.005.hdf')
+        synthetic.modis_grid(self.tile, (40, 40), tile=(10, 5))
+        # The swath runs from 80S to 80N, 60W-60E drifting west by 20.
+        self.swath = os.path.join(self.root, 'omi',
+                                  'OMBRO.A2007258.0100.he5')
+        synthetic.eos5_swath(self.swath, (200, 60))
+        self.points = os.path.join(self.root, 'oco2.h5')
+        synthetic.oco2_points(self.points, 500)
+        with open(os.path.join(self.root, 'notes.hdf'), 'w') as fh:
+            fh.write('not HDF')
+        self.catalog = catalog.Catalog(os.path.join(self.tempdir, 'c.db'))
+
+    def tearDown(self):
+        self.catalog.close()
+        shutil.rmtree(self.tempdir)
+
+    def test_footprint(self):
+        kind, found, times = catalog.footprint(self.tile)
+        self.assertEqual(kind, 'grid')
+        west, east, south, north = found[0]
+        self.assertAlmostEqual(south, 30, delta=0.01)
+        self.assertAlmostEqual(north, 40, delta=0.01)
+        self.assertAlmostEqual(west, -104.43, delta=0.01)
+        self.assertAlmostEqual(east, -80.83, delta=0.01)
+        self.assertEqual(times[1] - times[0], 86400)
+
+        kind, found, times = catalog.footprint(self.swath)
+        self.assertEqual(kind, 'swath')
+        west, east, south, north = found[0]
+        self.assertAlmostEqual(south, -81, delta=0.01)
+        self.assertAlmostEqual(west, -80, delta=0.01)
+        self.assertEqual(datetime.datetime.utcfromtimestamp(times[0]),
+                         datetime.datetime(2007, 9, 15, 1, 0))
+
+        kind, found, times = catalog.footprint(self.points)
+        self.assertEqual(kind, 'swath')
+        self.assertIsNone(times)
+
+    def test_query(self):
+        self.assertEqual(self.catalog.update(self.root), (4, 0))
+        self.assertEqual(len(self.catalog), 4)
+        self.assertEqual(self.catalog.query((-82, 35, -79, 36)),
+                         [self.tile, self.points, self.swath])
+        self.assertEqual(
+            self.catalog.query((-82, 35, -79, 36),
+                               datetime.datetime(2007, 9, 15, 0, 30),
+                               datetime.date(2007, 9, 16)),
+            [self.points, self.swath])
+        self.assertEqual(self.catalog.query((100, -10, 110, 10)),
+                         [self.points])
+        self.assertEqual(self.catalog.query((170, -90, -170, 90)),
+                         [self.points])
+
+    def test_update(self):
+        """
+        Only new and changed files are looked at again, and removed files
+        are forgotten.
+        """
+        self.catalog.update(self.root)
+        self.assertEqual(self.catalog.update(self.root), (0, 0))
+        os.remove(self.points)
+        synthetic.modis_grid(self.tile, (40, 40), tile=(30, 5))
+        self.assertEqual(self.catalog.update(self.root), (1, 1))
+        self.assertEqual(self.catalog.query((-82, 35, -79, 36)),
+                         [self.swath])
+        self.assertEqual(self.catalog.query((150, 35, 151, 36)),
+                         [self.tile])
+
+    def test_main(self):
+        path = os.path.join(self.tempdir, 'c.db')
+        self.assertEqual(catalog.main(['--catalog', path, 'update',
+                                       self.root]), 0)
+        self.assertEqual(catalog.main(['--catalog', path, 'query', '--bbox',
+                                       '-82', '35', '-79', '36', '--start',
+                                       '2007-09-15']), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
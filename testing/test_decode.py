@@ -0,0 +1,86 @@
+"""
+Tests for decoding stored values.
+"""
+import unittest
+
+import numpy as np
+
+from zoo.io import decode
+
+
+class TestDecode(unittest.TestCase):
+    """
+    Fill values, valid range, scale and offset in one pass.
+    """
+    def setUp(self):
+        self.raw = np.array([[-1, 0, 5, 10], [20, 32767, 7, 3]],
+                            dtype=np.int16)
+
+    def expected(self, formula):
+        data = self.raw.astype(np.float64)
+        invalid = np.logical_or(data > 10, data < 0)
+        invalid = np.logical_or(invalid, data == 32767)
+        data[invalid] = np.nan
+        if formula == 'cf':
+            return data * 0.5 + 2
+        if formula == 'modis':
+            return (data - 2) * 0.5
+        return (data - 2) / 0.5
+
+    def test_formulas(self):
+        for formula in ('cf', 'modis', 'divide'):
+            rule = decode.Rule(0.5, 2, 32767, 0, 10, formula)
+            np.testing.assert_array_equal(decode.decode(self.raw, rule),
+                                          self.expected(formula))
+
+    def test_blocks(self):
+        """
+        Small blocks, float32, and a separate mask.
+        """
+        rule = decode.Rule(0.5, 2, 32767, 0, 10, 'modis')
+        out = np.empty(self.raw.shape, dtype=np.float32)
+        mask = np.empty(self.raw.shape, dtype=bool)
+        block = decode._BLOCK
+        decode._BLOCK = 3
+        try:
+            result = decode.decode(self.raw, rule, out=out, mask=mask)
+        finally:
+            decode._BLOCK = block
+        self.assertIs(result, out)
+        expected = self.expected('modis')
+        np.testing.assert_array_equal(mask, np.isnan(expected))
+        np.testing.assert_allclose(out, expected)
+
+    def test_in_place(self):
+        data = self.raw.astype(np.float64)
+        rule = decode.Rule(0.5, 2, 32767, 0, 10, 'cf')
+        self.assertIs(decode.decode(data, rule, out=data), data)
+        np.testing.assert_array_equal(data, self.expected('cf'))
+
+    def test_masked(self):
+        rule = decode.Rule(fill=32767)
+        data = decode.decode_masked(self.raw, rule)
+        self.assertEqual(data.count(), 7)
+        self.assertEqual(data.max(), 20)
+
+    def test_rule_for(self):
+        """
+        Attribute names and formulas come from the convention table.
+        """
+        attrs = {'SCALE FACTOR': 0.01, 'OFFSET': 327.68,
+                 '_FillValue': -32768}
+        self.assertEqual(decode.rule_for(attrs, 'amsre'),
+                         decode.Rule(0.01, 327.68, -32768, None, None, 'cf'))
+        attrs = {'reflectance_scales': np.array([2e-5, 3e-5]),
+                 'reflectance_offsets': np.array([0.0, 316.9]),
+                 'valid_range': np.array([0, 32767])}
+        rule = decode.rule_for(attrs, 'modis_reflectance', index=1)
+        self.assertEqual(rule, decode.Rule(3e-5, 316.9, None, 0, 32767,
+                                           'modis'))
+        self.assertRaises(ValueError, decode.rule_for, attrs,
+                          'modis_reflectance')
+        self.assertRaises(ValueError, decode.rule_for, attrs, 'hdf4')
+
+
+if __name__ == "__main__":
+    unittest.main()
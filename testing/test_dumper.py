@@ -0,0 +1,68 @@
+"""
+Tests for the binary cache of HDF-EOS2 dumper output.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from zoo.io import dumper
+
+
+class TestDumper(unittest.TestCase):
+    """
+    Convert dumper text once, then memory map it.
+    """
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, 'lat_test.output')
+        self.values = np.linspace(-90, 90, 12)
+        self.write(self.values)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def write(self, values):
+        with open(self.filename, 'w') as fh:
+            for i, value in enumerate(values):
+                fh.write('{0}, {1}, {2}\n'.format(value, i // 4, i % 4))
+
+    def test_load(self):
+        """
+        Values come back reshaped, as float32, from a memory map.
+        """
+        lat = dumper.load(self.filename, (3, 4))
+        self.assertIsInstance(lat, np.memmap)
+        self.assertEqual(lat.dtype, np.float32)
+        np.testing.assert_allclose(lat, self.values.reshape(3, 4), rtol=1e-6)
+        self.assertTrue(os.path.exists(self.filename + '.float32.npy'))
+
+    def test_reuse(self):
+        """
+        The sidecar is not rebuilt while the text is unchanged, even if the
+        text's modification time changes.
+        """
+        dumper.load(self.filename)
+        sidecar = self.filename + '.float32.npy'
+        built = os.stat(sidecar).st_mtime_ns
+        st = os.stat(self.filename)
+        os.utime(self.filename, (st.st_atime, st.st_mtime + 10))
+        dumper.load(self.filename)
+        self.assertEqual(os.stat(sidecar).st_mtime_ns, built)
+
+    def test_rebuild(self):
+        """
+        Changed text is converted again.
+        """
+        dumper.load(self.filename)
+        self.write(self.values[::-1])
+        st = os.stat(self.filename)
+        os.utime(self.filename, (st.st_atime, st.st_mtime + 10))
+        np.testing.assert_allclose(dumper.load(self.filename),
+                                   self.values[::-1], rtol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Tests for exported copies of granules.
+"""
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+import zoo.io
+from zoo.io import backends, decode, export
+
+from . import synthetic
+
+
+@unittest.skipUnless(backends.available('pyhdf') and
+                     backends.available('netcdf4'),
+                     'requires pyhdf and netCDF4')
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir,
+                                     'MOD09A1.A2007001.h09v05.hdf')
+        self.name = synthetic.modis_grid(self.filename, (300, 200),
+                                         tile=(9, 5))
+        with zoo.io.open_file(self.filename) as f:
+            var = f[self.name]
+            self.data = var[...]
+            self.decoded = decode.read(var, convention='cf')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_raw(self):
+        """
+        The copy holds the stored values, chunked and compressed, and the
+        grid's geolocation.
+        """
+        path = export.export(self.filename)
+        self.assertEqual(path, self.filename + '.zoo.nc')
+        with zoo.io.open_file(path) as f:
+            var = f[self.name]
+            self.assertEqual(var.dtype, np.int16)
+            np.testing.assert_array_equal(var[...], self.data)
+            self.assertEqual(var.attrs['_FillValue'], -28672)
+            self.assertEqual(var.attrs['units'], 'reflectance')
+            self.assertIn('longitude', var.attrs['coordinates'])
+            lon = f['MODIS_Grid_500m_2D_longitude'][...]
+            lat = f['MODIS_Grid_500m_2D_latitude'][...]
+            self.assertEqual(lon.shape, (300, 200))
+            self.assertTrue(30 < lat.min() < lat.max() < 40)
+            self.assertEqual(f.attrs['Conventions'], 'CF-1.6')
+        from netCDF4 import Dataset
+        with Dataset(path) as nc:
+            v = nc[self.name]
+            self.assertEqual(v.chunking(), [300, 200])
+            self.assertTrue(v.filters()['zlib'])
+
+    def test_decoded(self):
+        path = export.export(self.filename, decoded=True)
+        with zoo.io.open_file(path) as f:
+            var = f[self.name]
+            self.assertEqual(var.dtype, np.float32)
+            self.assertNotIn('scale_factor', var.attrs)
+            data = var[...]
+        np.testing.assert_array_equal(np.isnan(data), self.decoded.mask)
+        np.testing.assert_allclose(data[~self.decoded.mask],
+                                   self.decoded.compressed(), rtol=1e-6)
+        # Physical values are not read in place of stored ones.
+        self.assertIsNone(export.find(self.filename))
+
+    def test_redirect(self):
+        """
+        open_file() reads from a fresh copy, and from the granule again
+        once it changes.
+        """
+        path = export.export(self.filename, names=[self.name])
+        with zoo.io.open_file(self.filename) as f:
+            var = f[self.name]
+            self.assertEqual(var.file.filename, path)
+            np.testing.assert_array_equal(var[50:60, ::3],
+                                          self.data[50:60, ::3])
+        with zoo.io.open_file(self.filename, backend='pyhdf') as f:
+            self.assertEqual(f[self.name].file.filename, self.filename)
+
+        time.sleep(0.01)
+        synthetic.modis_grid(self.filename, (300, 100), tile=(9, 5))
+        self.assertIsNone(export.find(self.filename))
+        with zoo.io.open_file(self.filename) as f:
+            self.assertEqual(f[self.name].shape, (300, 100))
+
+    def test_blocks(self):
+        """
+        Fields are read in blocks of whole chunks.
+        """
+        saved = export.BLOCK_BYTES
+        export.BLOCK_BYTES = 1000
+        try:
+            blocks = list(export._blocks((1200, 700), 2))
+        finally:
+            export.BLOCK_BYTES = saved
+        self.assertEqual(blocks, [(slice(0, 512),), (slice(512, 1024),),
+                                  (slice(1024, 1200),)])
+
+    def test_main(self):
+        output = os.path.join(self.tempdir, 'copy')
+        os.makedirs(output)
+        other = os.path.join(output, 'MOD09A1.A2007009.h09v05.hdf')
+        shutil.copy(self.filename, other)
+        self.assertEqual(export.main(['-j', '2', self.filename, other]), 0)
+        self.assertIsNotNone(export.find(self.filename))
+        self.assertIsNotNone(export.find(other))
+
+    @unittest.skipUnless(backends.available('zarr'), 'requires zarr')
+    def test_zarr(self):
+        path = export.export(self.filename, fmt='zarr')
+        self.assertTrue(path.endswith('.zoo.zarr'))
+        with zoo.io.open_file(path) as f:
+            np.testing.assert_array_equal(f[self.name][...], self.data)
+        self.assertEqual(export.find(self.filename), path)
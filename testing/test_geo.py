@@ -0,0 +1,284 @@
+"""
+Tests for grid geolocation.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import zoo.geo
+from zoo.geo import gctp, misr
+from zoo.io import backends
+from zoo.io.structmetadata import StructMetadata
+
+GRID_METADATA = """\
+GROUP=GridStructure
+	GROUP=GRID_1
+		GridName="MODIS_Grid_2D"
+		XDim=40
+		YDim=40
+		UpperLeftPointMtrs=(18903158.834333,-1111950.519667)
+		LowerRightMtrs=(20015109.354000,-2223901.039333)
+		Projection=GCTP_SNSOID
+		ProjParams=(6371007.181000,0,0,0,0,0,0,0,0,0,0,0,0)
+		SphereCode=-1
+	END_GROUP=GRID_1
+	GROUP=GRID_2
+		GridName="Northern Hemisphere"
+		XDim=721
+		YDim=721
+		UpperLeftPointMtrs=(-9036842.762500,9036842.762500)
+		LowerRightMtrs=(9036842.762500,-9036842.762500)
+		Projection=GCTP_LAMAZ
+		ProjParams=(6371228.000000,0,0,0,0,90000000.000000,0,0,0,0,0,0,0)
+		SphereCode=-1
+	END_GROUP=GRID_2
+	GROUP=GRID_3
+		GridName="NpPolarGrid12km"
+		XDim=608
+		YDim=896
+		UpperLeftPointMtrs=(-3850000.000000,5850000.000000)
+		LowerRightMtrs=(3750000.000000,-5350000.000000)
+		Projection=GCTP_PS
+		ProjParams=(6378273.000000,-0.006694,0,0,-45000000.000000,70000000.000000,0,0,0,0,0,0,0)
+		SphereCode=-1
+	END_GROUP=GRID_3
+END_GROUP=GridStructure
+END
+"""
+
+SOM_METADATA = """\
+GROUP=GridStructure
+	GROUP=GRID_1
+		GridName="BlueBand"
+		XDim=128
+		YDim=512
+		UpperLeftPointMtrs=(7460750.000000,1090650.000000)
+		LowerRightMtrs=(7601550.000000,527450.000000)
+		Projection=GCTP_SOM
+		ProjParams=(6378137,-0.0066943799901413165,0,98018013.752,-51028000.95588,0,0,0,98.88,0,0,0,0)
+		SphereCode=-1
+		GridOrigin=HDFE_GD_UL
+		GROUP=Dimension
+			OBJECT=Dimension_1
+				DimensionName="SOMBlockDim"
+				Size=180
+			END_OBJECT=Dimension_1
+		END_GROUP=Dimension
+	END_GROUP=GRID_1
+END_GROUP=GridStructure
+END
+"""
+
+
+def _available(name):
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+class TestGCTP(unittest.TestCase):
+    """
+    Inverse projections at points with known answers.
+    """
+    def test_sinusoidal(self):
+        """
+        The sinusoidal y axis is latitude times the radius.
+        """
+        radius = 6371007.181
+        lon, lat = gctp.inverse('SNSOID', (radius,), [0, radius * np.pi / 4],
+                                [radius * np.pi / 6, 0])
+        np.testing.assert_allclose(lat, [30, 0], atol=1e-9)
+        np.testing.assert_allclose(lon, [0, 45], atol=1e-9)
+
+    def test_outside(self):
+        """
+        Points off the projection's domain are NaN.
+        """
+        lon, lat = gctp.inverse('SNSOID', (6371007.181,), [2.1e7], [0])
+        self.assertTrue(np.isnan(lon[0]) and np.isnan(lat[0]))
+
+    def test_polar(self):
+        """
+        The origin of a north polar grid is the pole.
+        """
+        params = (6371228.0, 0, 0, 0, 0, 90000000.0)
+        lon, lat = gctp.inverse('LAMAZ', params, [0.0], [0.0])
+        self.assertAlmostEqual(lat[0], 90.0)
+
+    def test_sphere_code(self):
+        """
+        A SphereCode overrides ProjParams.
+        """
+        self.assertEqual(gctp.spheroid((6371007.181,), 12)[0], 6378137.0)
+        self.assertEqual(gctp.spheroid((6371007.181,), -1),
+                         (6371007.181, 0.0))
+
+    def test_unsupported(self):
+        self.assertRaises(ValueError, gctp.inverse, 'UTM', (), [0], [0])
+
+
+class TestGridGeolocator(unittest.TestCase):
+    """
+    Geolocate windows of a grid.
+    """
+    def setUp(self):
+        self.meta = StructMetadata(GRID_METADATA)
+        zoo.geo.grid.clear_cache()
+
+    def test_window(self):
+        """
+        A window is the same window of the full grid.
+        """
+        geo = zoo.geo.GridGeolocator(self.meta.grids['MODIS_Grid_2D'])
+        lon, lat = geo[:]
+        self.assertEqual(lon.shape, (40, 40))
+        wlon, wlat = geo[5:30:3, ::-2]
+        np.testing.assert_array_equal(wlon, lon[5:30:3, ::-2])
+        np.testing.assert_array_equal(wlat, lat[5:30:3, ::-2])
+        self.assertEqual(geo[3, 4][0], lon[3, 4])
+
+    def test_float32(self):
+        """
+        float32 results on request.
+        """
+        grid = self.meta.grids['MODIS_Grid_2D']
+        lon, lat = zoo.geo.GridGeolocator(grid, np.float32)[:]
+        self.assertEqual(lon.dtype, np.float32)
+        lon64, lat64 = zoo.geo.GridGeolocator(grid)[:]
+        np.testing.assert_allclose(lat, lat64, rtol=1e-6)
+
+    def test_cache(self):
+        """
+        Cached windows are shared, but callers get their own copies.
+        """
+        grid = self.meta.grids['MODIS_Grid_2D']
+        lon, lat = zoo.geo.GridGeolocator(grid)[:10]
+        lon[:] = 0
+        self.assertEqual(len(zoo.geo.grid._cache), 1)
+        lon2, _ = zoo.geo.GridGeolocator(grid)[:10]
+        self.assertEqual(len(zoo.geo.grid._cache), 1)
+        self.assertTrue((lon2 != 0).all())
+
+    @unittest.skipUnless(_available('pyproj'), 'requires pyproj')
+    def test_pyproj(self):
+        """
+        The same answers as pyproj, for the EASE grid and polar
+        stereographic grids.
+        """
+        import pyproj
+        cases = [('Northern Hemisphere',
+                  '+proj=laea +R=6371228 +lat_0=90 +lon_0=0'),
+                 ('NpPolarGrid12km',
+                  '+proj=stere +lat_0=90 +lat_ts=70 +lon_0=-45 +a=6378273 '
+                  '+b=6356889.449')]
+        for name, definition in cases:
+            grid = self.meta.grids[name]
+            lon, lat = zoo.geo.GridGeolocator(grid)[::37, ::23]
+            x, y = np.meshgrid(grid.x[::23], grid.y[::37])
+            transformer = pyproj.Transformer.from_crs(
+                pyproj.CRS(definition), 'EPSG:4326', always_xy=True)
+            plon, plat = transformer.transform(x, y)
+            ok = np.isfinite(lat) & (lat > 1)
+            np.testing.assert_allclose(lat[ok], plat[ok], atol=1e-6)
+            dlon = (lon[ok] - plon[ok] + 180) % 360 - 180
+            np.testing.assert_allclose(dlon, 0, atol=1e-6)
+
+
+class TestSOM(unittest.TestCase):
+    """
+    Geolocate MISR SOM blocks.
+    """
+    def setUp(self):
+        self.grid = StructMetadata(SOM_METADATA).grids['BlueBand']
+        self.offsets = np.full(179, -16.0)
+        zoo.geo.grid.clear_cache()
+
+    def test_blocks(self):
+        """
+        A block is the same block of the whole stack, and later blocks move
+        down the orbit.
+        """
+        geo = zoo.geo.SOMGeolocator(self.grid, self.offsets)
+        self.assertEqual(geo.shape, (180, 128, 512))
+        lon, lat = geo[10:12]
+        self.assertEqual(lat.shape, (2, 128, 512))
+        blon, blat = geo[11]
+        np.testing.assert_array_equal(blat, lat[1])
+        self.assertGreater(geo[0][1].mean(), geo[90][1].mean())
+        self.assertGreater(geo[90][1].mean(), geo[179][1].mean())
+
+    def test_offsets(self):
+        """
+        Block offsets shift blocks across track.
+        """
+        shifted = zoo.geo.SOMGeolocator(self.grid, self.offsets)
+        straight = zoo.geo.SOMGeolocator(self.grid, np.zeros(179))
+        np.testing.assert_allclose(shifted[1, :, 16:][1],
+                                   straight[1, :, :-16][1])
+        np.testing.assert_array_equal(shifted[0][1], straight[0][1])
+
+    def test_not_som(self):
+        grid = StructMetadata(GRID_METADATA).grids['MODIS_Grid_2D']
+        self.assertRaises(ValueError, zoo.geo.SOMGeolocator, grid, [])
+        self.assertRaises(ValueError, zoo.geo.GridGeolocator, self.grid)
+
+    @unittest.skipUnless(_available('pyproj'), 'requires pyproj')
+    def test_pyproj(self):
+        """
+        The same answers as PROJ's MISR SOM for path 117.
+        """
+        import pyproj
+        geo = zoo.geo.SOMGeolocator(self.grid, self.offsets)
+        lon, lat = geo[::30, ::40, ::100]
+        blocks, lines, samples = np.meshgrid(np.arange(180)[::30],
+                                             np.arange(128)[::40],
+                                             np.arange(512)[::100],
+                                             indexing='ij')
+        x = 7460750.0 + (blocks * 128 + lines + 0.5) * 1100
+        y = 527450.0 + (-16.0 * blocks + samples + 0.5) * 1100
+        transformer = pyproj.Transformer.from_crs(
+            pyproj.CRS('+proj=misrsom +path=117 +ellps=WGS84'), 'EPSG:4326',
+            always_xy=True)
+        plon, plat = transformer.transform(x, y)
+        np.testing.assert_allclose(lat, plat, atol=1e-5)
+        np.testing.assert_allclose((lon - plon + 180) % 360 - 180, 0,
+                                   atol=1e-4)
+
+
+@unittest.skipUnless(backends.available('pyhdf'), 'requires pyhdf')
+class TestBlockOffsets(unittest.TestCase):
+    """
+    Read SOM block offsets from their vdata.
+    """
+    def setUp(self):
+        from pyhdf.HDF import HDF, HC
+        from pyhdf.SD import SD, SDC
+        import pyhdf.VS  # noqa: F401
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, 'misr.hdf')
+        SD(self.filename, SDC.WRITE | SDC.CREATE).end()
+        hdf = HDF(self.filename, HC.WRITE)
+        vs = hdf.vstart()
+        vd = vs.create('_BLKSOM:BlueBand', (('Offset', HC.FLOAT32, 1),))
+        vd.write([[0.0], [-16.0], [-8.0]])
+        vd.detach()
+        vs.end()
+        hdf.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_offsets(self):
+        np.testing.assert_array_equal(
+            misr.block_offsets(self.filename, 'BlueBand'), [0, -16, -8])
+        self.assertRaises(KeyError, misr.block_offsets, self.filename,
+                          'RedBand')
+
+
+if __name__ == "__main__":
+    unittest.main()
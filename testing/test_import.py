@@ -0,0 +1,71 @@
+"""
+Benchmark of import zoo, which should load neither the examples nor the
+plotting and HDF libraries.
+"""
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loose bound on the time of import zoo and of the library layer, in
+# seconds, well above what they take but far below importing the examples.
+BUDGET = 1.0
+
+HEAVY = ('matplotlib', 'mpl_toolkits', 'pyproj', 'pyhdf', 'h5py', 'netCDF4',
+         'osgeo')
+
+SCRIPT = """
+import json, sys, time
+t = time.time()
+{0}
+elapsed = time.time() - t
+print(json.dumps({{'elapsed': elapsed, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def run(statements):
+    """
+    Run statements in a fresh interpreter;  return the seconds they took and
+    the modules loaded.
+    """
+    out = subprocess.check_output([sys.executable, '-c',
+                                   SCRIPT.format(statements)], cwd=ROOT)
+    result = json.loads(out.decode('utf-8').splitlines()[-1])
+    return result['elapsed'], result['modules']
+
+
+class TestImport(unittest.TestCase):
+    def assertLight(self, modules):
+        heavy = [m for m in modules if m.split('.')[0] in HEAVY]
+        self.assertEqual(heavy, [])
+
+    def test_zoo(self):
+        elapsed, modules = run('import zoo')
+        self.assertLight(modules)
+        self.assertEqual([m for m in modules if m.startswith('zoo')],
+                         ['zoo', 'zoo._lazy'])
+        self.assertLess(elapsed, BUDGET)
+
+    def test_library(self):
+        elapsed, modules = run('import zoo.geo, zoo.io, zoo.plot')
+        self.assertLight(modules)
+        self.assertLess(elapsed, BUDGET)
+
+    def test_lazy(self):
+        """
+        Packages load on first use, and list examples without loading them.
+        """
+        statements = ('import zoo\n'
+                      'names = dir(zoo.lpdaac.mod)\n'
+                      'assert "MOD09GA_Range" in names, names')
+        _, modules = run(statements)
+        self.assertLight(modules)
+        self.assertEqual([m for m in modules if m.startswith('zoo')],
+                         ['zoo', 'zoo._lazy', 'zoo.lpdaac', 'zoo.lpdaac.mod'])
+
+
+if __name__ == "__main__":
+    unittest.main()
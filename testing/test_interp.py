@@ -0,0 +1,132 @@
+"""
+Tests for MODIS scan-aware geolocation interpolation.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import zoo.geo
+from zoo.geo import interp
+from zoo.io import backends
+
+
+def _swath(lines, cols, factor, scan_lines, lon0=20.0, lat0=-70.0):
+    """
+    Analytic bow-tied swath geolocation on a grid of the given factor,
+    sampled at the centres MODIS uses.
+    """
+    fine_lines = scan_lines * factor
+    row, col = np.meshgrid(np.arange(lines * factor, dtype=np.float64),
+                           np.arange(cols * factor, dtype=np.float64),
+                           indexing='ij')
+    offset = (factor - 1) / 2.0
+    scan = row // fine_lines
+    centre = (fine_lines - 1) / 2.0
+    cross = (col - (cols * factor - 1) / 2.0) / factor * 0.01
+    # Scans widen along track away from nadir.
+    local = (row - scan * fine_lines - centre) * (1 + 0.05 * cross ** 2)
+    lat = lat0 - (scan * fine_lines + centre + local) / factor * 0.009
+    lon = lon0 + cross
+    coarse = (slice(int(offset), None, factor),) * 2
+    if offset != int(offset):
+        # Centres between fine samples:  average the two neighbours.
+        lo = (slice(int(offset), None, factor),) * 2
+        hi = (slice(int(offset) + 1, None, factor),) * 2
+
+        def coarse_of(a):
+            return (a[lo[0], lo[1]] + a[hi[0], lo[1]] + a[lo[0], hi[1]] +
+                    a[hi[0], hi[1]]) / 4
+    else:
+        def coarse_of(a):
+            return a[coarse]
+    return lon, lat, coarse_of(lon), coarse_of(lat)
+
+
+class TestScanInterpolate(unittest.TestCase):
+    """
+    Interpolate coarse geolocation to the fine samples.
+    """
+    def test_500m(self):
+        lon, lat, clon, clat = _swath(30, 40, 2, 10)
+        ilon, ilat = zoo.geo.scan_interpolate(clon, clat, 2, dtype=np.float64)
+        self.assertEqual(ilon.shape, (60, 80))
+        np.testing.assert_allclose(ilat, lat, atol=2e-4)
+        np.testing.assert_allclose(ilon, lon, atol=2e-4)
+
+    def test_5km(self):
+        """
+        5 km to 1 km, with the fine swath wider than five times the coarse.
+        """
+        lon, lat, clon, clat = _swath(6, 11, 5, 2)
+        shape = (30, 53)
+        ilon, ilat = zoo.geo.scan_interpolate(clon, clat, 5, scan_lines=2,
+                                              shape=shape)
+        self.assertEqual(ilon.dtype, np.float32)
+        np.testing.assert_allclose(ilat, lat[:, :53], atol=2e-4)
+        np.testing.assert_allclose(ilon, lon[:, :53], atol=2e-4)
+
+    def test_scan_edges(self):
+        """
+        Interpolating across scan boundaries would blur the bow-tie.
+        """
+        lon, lat, clon, clat = _swath(20, 40, 2, 10)
+        ilon, ilat = zoo.geo.scan_interpolate(clon, clat, 2, dtype=np.float64)
+        edge = 19
+        error = np.abs(ilat[edge] - lat[edge]).max()
+        across = np.abs(lat[edge] - lat[edge + 1]).max()
+        self.assertLess(error, across / 10)
+
+    def test_dateline(self):
+        lon, lat, clon, clat = _swath(10, 40, 4, 10, lon0=179.9)
+        clon = (clon + 180) % 360 - 180
+        ilon, ilat = zoo.geo.scan_interpolate(clon, clat, 4, dtype=np.float64)
+        dlon = (ilon - lon + 180) % 360 - 180
+        np.testing.assert_allclose(dlon, 0, atol=2e-4)
+        self.assertTrue((np.abs(ilon) <= 180).all())
+
+    def test_scans(self):
+        """
+        iter_scans() yields each scan's lines once, in order.
+        """
+        lon, lat, clon, clat = _swath(30, 8, 2, 10)
+        rows = [r for r, _, _ in interp.iter_scans(clon, clat, 2)]
+        self.assertEqual(rows, [slice(0, 20), slice(20, 40), slice(40, 60)])
+        self.assertRaises(ValueError, next,
+                          interp.iter_scans(clon[:25], clat[:25], 2))
+
+
+@unittest.skipUnless(backends.available('pyhdf'), 'requires pyhdf')
+class TestModisGeolocation(unittest.TestCase):
+    """
+    Geolocate a 500 m field from the 1 km geolocation of its file.
+    """
+    def setUp(self):
+        from pyhdf.SD import SD, SDC
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, 'MYD02HKM.hdf')
+        lon, lat, self.clon, self.clat = _swath(20, interp.MODIS_FRAMES, 2,
+                                                10)
+        self.lat = lat
+        sd = SD(self.filename, SDC.WRITE | SDC.CREATE)
+        for name, data in (('Longitude', self.clon), ('Latitude', self.clat)):
+            sds = sd.create(name, SDC.FLOAT32, data.shape)
+            sds[:] = data.astype(np.float32)
+            sds.endaccess()
+        sds = sd.create('EV_500_RefSB', SDC.UINT16, (1,) + lat.shape)
+        sds.endaccess()
+        sd.end()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_file(self):
+        lon, lat = zoo.geo.modis_geolocation(self.filename, 'EV_500_RefSB')
+        self.assertEqual(lat.shape, (40, 2 * interp.MODIS_FRAMES))
+        np.testing.assert_allclose(lat, self.lat, atol=2e-4)
+
+
+if __name__ == "__main__":
+    unittest.main()
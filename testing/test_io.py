@@ -0,0 +1,182 @@
+"""
+Tests for the zoo.io reader layer.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import zoo.io
+from zoo.io import backends
+
+
+def write_hdf4(filename, name, data, attrs):
+    """
+    Write a single SDS into a new HDF4 file.
+    """
+    from pyhdf.SD import SD, SDC
+    types = {'int16': SDC.INT16, 'uint8': SDC.UINT8, 'float32': SDC.FLOAT32}
+    hdf = SD(filename, SDC.WRITE | SDC.CREATE)
+    sds = hdf.create(name, types[data.dtype.name], data.shape)
+    sds[:] = data
+    for key, value in attrs.items():
+        setattr(sds, key, value)
+    sds.endaccess()
+    hdf.end()
+
+
+@unittest.skipUnless(backends.available('pyhdf'), 'requires pyhdf')
+class TestHDF4(unittest.TestCase):
+    """
+    Read HDF4 files through the reader layer.
+    """
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, 'test.hdf')
+        self.data = np.arange(40 * 30, dtype=np.int16).reshape(40, 30)
+        write_hdf4(self.filename, 'data', self.data,
+                   {'scale_factor': 0.01, 'valid_range': [0, 1000],
+                    'units': 'K'})
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_backend(self):
+        """
+        HDF4 files are read with pyhdf when it is installed.
+        """
+        with zoo.io.open_file(self.filename) as f:
+            self.assertEqual(f.format, 'hdf4')
+            self.assertEqual(f.backend.name, 'pyhdf')
+
+    def test_hyperslab(self):
+        """
+        Indexing a variable returns the same values as numpy, in the stored
+        type.
+        """
+        with zoo.io.open_file(self.filename) as f:
+            var = f['data']
+            self.assertEqual(var.shape, (40, 30))
+            self.assertEqual(var.dtype, np.int16)
+            np.testing.assert_array_equal(var[2:5, ::10],
+                                          self.data[2:5, ::10])
+            np.testing.assert_array_equal(var[-1, 3], self.data[-1, 3])
+            np.testing.assert_array_equal(var[..., 2], self.data[..., 2])
+            self.assertEqual(var[:].dtype, np.int16)
+
+    def test_hyperslab_planned(self):
+        """
+        Negative steps and array indices are read as native hyperslabs.
+        """
+        keys = [np.s_[5:1:-2, 0],
+                np.s_[::-1, ::-3],
+                np.s_[[3, 7, 11], 2:9:3],
+                np.s_[-3:, [29, 0, 5]],
+                np.s_[self.data[:, 0] % 7 == 0, 4],
+                np.s_[3:3]]
+        with zoo.io.open_file(self.filename) as f:
+            var = f['data']
+            for key in keys:
+                np.testing.assert_array_equal(var[key], self.data[key])
+            data = var.read(start=[2, None], stop=[10, None], stride=[3, 7])
+            np.testing.assert_array_equal(data, self.data[2:10:3, ::7])
+
+    def test_attributes(self):
+        """
+        Single valued attributes are scalars, multivalued are arrays.
+        """
+        with zoo.io.open_file(self.filename) as f:
+            attrs = f['data'].attrs
+            self.assertEqual(attrs['units'], 'K')
+            self.assertAlmostEqual(attrs['scale_factor'], 0.01)
+            np.testing.assert_array_equal(attrs['valid_range'], [0, 1000])
+
+
+class TestSlicing(unittest.TestCase):
+    """
+    Plan reads without touching a file.
+    """
+    def test_strided(self):
+        """
+        A strided read costs what it returns, not the size of the dataset.
+        """
+        slab = zoo.io.plan(np.s_[::6, ::6], (4800, 4800))
+        self.assertEqual(slab.start, (0, 0))
+        self.assertEqual(slab.count, (800, 800))
+        self.assertEqual(slab.stride, (6, 6))
+        self.assertEqual(slab.size, 800 * 800)
+
+    def test_reversed(self):
+        """
+        Negative steps become positive strides plus a flip.
+        """
+        slab = zoo.io.plan(np.s_[10:0:-3], (20,))
+        self.assertEqual((slab.start, slab.count, slab.stride),
+                         ((1,), (4,), (3,)))
+        data = np.arange(20)
+        np.testing.assert_array_equal(slab.finish(data[slab.slices]),
+                                      data[10:0:-3])
+
+    def test_array_index(self):
+        """
+        Evenly spaced array indices are read with a common stride.
+        """
+        slab = zoo.io.plan(([4, 12, 8], 3), (20, 5))
+        self.assertEqual(slab.start, (4, 3))
+        self.assertEqual(slab.count, (3, 1))
+        self.assertEqual(slab.stride, (4, 1))
+        self.assertEqual(slab.shape, (3,))
+
+    def test_out_of_bounds(self):
+        """
+        Indices outside the variable are rejected before any read.
+        """
+        self.assertRaises(IndexError, zoo.io.plan, 5, (5,))
+        self.assertRaises(IndexError, zoo.io.plan, (0, 0), (5,))
+
+
+@unittest.skipUnless(backends.available('h5py'), 'requires h5py')
+class TestHDF5(unittest.TestCase):
+    """
+    Read HDF-EOS5 files through the reader layer.
+    """
+    def setUp(self):
+        import h5py
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, 'test.he5')
+        self.data = np.arange(60, dtype=np.float32).reshape(6, 10)
+        with h5py.File(self.filename, 'w') as f:
+            path = '/HDFEOS/SWATHS/BrO/Data Fields/BrO'
+            dset = f.create_dataset(path, data=self.data)
+            dset.attrs['Units'] = b'molec/cm2'
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_names(self):
+        """
+        Variables can be named by full path or by a unique short name.
+        """
+        with zoo.io.open_file(self.filename) as f:
+            self.assertEqual(f.backend.name, 'h5py')
+            path = '/HDFEOS/SWATHS/BrO/Data Fields/BrO'
+            self.assertIs(f['BrO'], f[path])
+            self.assertTrue('BrO' in f)
+            self.assertFalse('Latitude' in f)
+            self.assertEqual(f['BrO'].attrs['Units'], 'molec/cm2')
+
+    def test_hyperslab(self):
+        """
+        h5py and netCDF4 return the same hyperslab.
+        """
+        names = [b for b in ('h5py', 'netcdf4') if backends.available(b)]
+        for name in names:
+            with zoo.io.open_file(self.filename, backend=name) as f:
+                np.testing.assert_array_equal(f['BrO'][1:3, ::4],
+                                              self.data[1:3, ::4])
+
+
+if __name__ == "__main__":
+    unittest.main()
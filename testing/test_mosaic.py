@@ -0,0 +1,74 @@
+"""
+Tests for mosaics of MODIS sinusoidal tiles.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import zoo.geo
+import zoo.io
+import zoo.io.decode
+from zoo.io import backends, mosaic
+
+from . import synthetic
+
+
+@unittest.skipUnless(backends.available('pyhdf') and
+                     backends.available('h5py'), 'requires pyhdf and h5py')
+class TestMosaic(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.tiles = {}
+        for h, v in ((8, 5), (9, 5), (9, 6)):
+            name = 'MOD09A1.A2007001.h{0:02d}v{1:02d}.005.hdf'.format(h, v)
+            filename = os.path.join(self.tempdir, name)
+            synthetic.modis_grid(filename, (60, 60), tile=(h, v))
+            self.tiles[h, v] = filename
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_tile_of(self):
+        filename = os.path.join(self.tempdir, 'tile.hdf')
+        synthetic.modis_grid(filename, (60, 60), tile=(30, 12))
+        self.assertEqual(mosaic.tile_of(filename), (30, 12))
+        self.assertEqual(mosaic.tile_of(self.tiles[9, 6]), (9, 6))
+
+    def test_mosaic(self):
+        """
+        Tiles land in their slots, the missing one is fill, and the mosaic
+        decodes and geolocates like its tiles.
+        """
+        output = os.path.join(self.tempdir, 'mosaic.he5')
+        path = mosaic.mosaic(list(self.tiles.values()), 'sur_refl_b01_1',
+                             output, threads=2)
+        with zoo.io.open_file(self.tiles[9, 6]) as f:
+            tile = f['sur_refl_b01_1'][...]
+            tile_lon, tile_lat = zoo.geo.grid_geolocator(
+                f, 'sur_refl_b01_1')[:]
+        with zoo.io.open_file(output) as f:
+            var = f[path]
+            self.assertEqual(var.shape, (120, 120))
+            np.testing.assert_array_equal(var[60:, 60:], tile)
+            self.assertTrue((var[60:, :60] == -28672).all())
+            data = zoo.io.decode.read(var, convention='modis')
+            self.assertTrue(data.mask[60:, :60].all())
+            lon, lat = zoo.geo.grid_geolocator(f, 'sur_refl_b01_1')[60:, 60:]
+        np.testing.assert_allclose(lon, tile_lon, atol=1e-6)
+        np.testing.assert_allclose(lat, tile_lat, atol=1e-6)
+
+    def test_duplicate(self):
+        filename = os.path.join(self.tempdir, 'copy.hdf')
+        shutil.copy(self.tiles[8, 5], filename)
+        output = os.path.join(self.tempdir, 'mosaic.he5')
+        self.assertRaises(ValueError, mosaic.mosaic,
+                          [self.tiles[8, 5], filename], 'sur_refl_b01_1',
+                          output)
+        self.assertFalse(os.path.exists(output))
+
+
+if __name__ == "__main__":
+    unittest.main()
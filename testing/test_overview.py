@@ -0,0 +1,131 @@
+"""
+Tests for overview pyramids.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import zoo.io
+from zoo.io import backends, overview
+from zoo.plot import decimate
+
+try:
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+except ImportError:
+    plt = None
+
+
+@unittest.skipUnless(backends.available('h5py'), 'requires h5py')
+class TestOverview(unittest.TestCase):
+    """
+    Build the levels of a 64 x 48 field down to 8 cells a side.
+    """
+    def setUp(self):
+        import h5py
+
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, 'tile.h5')
+        self.data = np.arange(64 * 48, dtype=np.int16).reshape(64, 48)
+        self.data[0, 0] = -1
+        self.codes = (np.arange(64 * 48) % 3).astype(np.uint8)
+        self.codes = self.codes.reshape(64, 48)
+        with h5py.File(self.filename, 'w') as f:
+            dset = f.create_dataset('ndvi', data=self.data)
+            dset.attrs['_FillValue'] = np.int16(-1)
+            f.create_dataset('snow', data=self.codes)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_mean(self):
+        """
+        Means leave the fill value out, level after level.
+        """
+        with zoo.io.open_file(self.filename) as f:
+            var = f['ndvi']
+            path = overview.build(var, min_size=8)
+            manifest = overview.find(var)
+        self.assertEqual(manifest['factors'], [2, 4])
+        self.assertEqual(manifest['how'], 'mean')
+        self.assertTrue(os.path.exists(path))
+
+        with zoo.io.open_file(self.filename) as f:
+            data, key = overview.read(f['ndvi'], (5, 5))
+        self.assertEqual(data.shape, (16, 12))
+        self.assertEqual(data.dtype, np.float32)
+        self.assertEqual(key, (slice(2, 64, 4), slice(2, 48, 4)))
+        block = self.data[4:8, 8:12].astype(np.float64)
+        self.assertAlmostEqual(data[1, 2], block.mean())
+        # The first 2 x 2 block lost its fill value.
+        first = (np.mean([1, 48, 49]) + 26.5 + 120.5 + 122.5) / 4
+        self.assertAlmostEqual(data[0, 0], first, places=4)
+
+    def test_mode(self):
+        with zoo.io.open_file(self.filename) as f:
+            var = f['snow']
+            overview.build(var, 'mode', min_size=8)
+            data, key = overview.read(var, (2, 4))
+            self.assertIsNone(overview.read(var, (2, 4), 'mean'))
+            self.assertIsNone(overview.read(var, (1, 4)))
+        self.assertEqual(data.dtype, np.uint8)
+        self.assertEqual(data.shape, (32, 12))
+        self.assertEqual(key, (slice(1, 64, 2), slice(1, 48, 4)))
+        expected = overview.block_reduce(self.codes, (2, 2), 'mode')
+        np.testing.assert_array_equal(data, expected[:, ::2])
+
+    def test_mode_codes(self):
+        """
+        Modes take the smallest of the most frequent codes, however large,
+        and leave empty blocks masked.
+        """
+        codes = np.ma.array([[2 ** 30, 7, 7, 7],
+                             [2 ** 30, -5, 7, 7]], dtype=np.int32,
+                            mask=[[0, 0, 1, 1], [0, 1, 1, 1]])
+        mode = overview.block_reduce(codes, (2, 2), 'mode')
+        self.assertEqual(mode[0, 0], 2 ** 30)
+        self.assertTrue(mode.mask[0, 1])
+        codes.mask = False
+        codes[0, 0] = 3
+        mode = overview.block_reduce(codes, (2, 2), 'mode')
+        self.assertEqual(mode.tolist(), [[-5, 7]])
+
+    def test_stale(self):
+        """
+        A changed source makes the overviews out of date.
+        """
+        with zoo.io.open_file(self.filename) as f:
+            overview.build(f['snow'], 'mode', min_size=8)
+        with open(self.filename, 'ab') as fh:
+            fh.write(b'\0' * 16)
+        with zoo.io.open_file(self.filename) as f:
+            self.assertIsNone(overview.find(f['snow']))
+            self.assertIsNone(overview.read(f['snow'], (4, 4)))
+
+    @unittest.skipIf(plt is None, 'requires matplotlib')
+    def test_read_decimated(self):
+        """
+        read_decimated() takes the level instead of the field.
+        """
+        fig = plt.figure(figsize=(1, 1), dpi=10)
+        fig.subplotpars.update(left=0, right=1, bottom=0, top=1)
+        try:
+            with zoo.io.open_file(self.filename) as f:
+                var = f['ndvi']
+                overview.build(var, min_size=8)
+                data, key = decimate.read_decimated(var, 'mean', dpi=10)
+                self.assertEqual(key, (slice(2, 64, 4), slice(2, 48, 4)))
+                self.assertEqual(data.shape, (16, 12))
+                _, plain = decimate.read_decimated(var, 'mean', dpi=10,
+                                                   overviews=False)
+                self.assertEqual(plain, (slice(3, 60, 6), slice(2, 48, 4)))
+        finally:
+            plt.close(fig)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,269 @@
+"""
+Tests for the shared plotting layer.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from zoo.io import backends
+from zoo.plot import decimate, footprints, maps, raster
+
+try:
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+except ImportError:
+    plt = None
+
+try:
+    from mpl_toolkits.basemap import Basemap
+except ImportError:
+    Basemap = None
+
+
+class TestAggregate(unittest.TestCase):
+    def test_mean(self):
+        x = np.array([0.5, 0.5, 1.5, 3.5, 5.0])
+        y = np.array([0.5, 0.5, 0.5, 1.5, 0.5])
+        c = np.array([1.0, 3.0, np.nan, 4.0, 9.0])
+        image = footprints.aggregate(x, y, c, (0, 4, 0, 2), (2, 4))
+        self.assertEqual(image[0, 0], 2.0)
+        self.assertEqual(image[1, 3], 4.0)
+        # The NaN and the point outside are left out.
+        self.assertEqual(image.count(), 2)
+
+    def test_categorical(self):
+        x = np.array([0.1, 0.2, 0.3, 1.5])
+        y = np.zeros(4)
+        c = np.ma.MaskedArray([2, 7, 2, 7], mask=[False, False, False, True])
+        image = footprints.aggregate(x, y, c, (0, 2, 0, 1), (1, 2),
+                                 categorical=True)
+        self.assertEqual(image[0, 0], 2)
+        self.assertTrue(image.mask[0, 1])
+        self.assertRaises(ValueError, footprints.aggregate, x, y, -c,
+                          (0, 2, 0, 1), (1, 2), True)
+
+    def test_large_codes(self):
+        """
+        Memory does not go with the largest code;  ties go to the smallest.
+        """
+        x = np.array([0.1, 0.2, 0.3, 0.4, 1.5])
+        y = np.zeros(5)
+        c = np.array([2 ** 40, 5, 2 ** 40, 5, 2 ** 40], dtype=np.int64)
+        image = footprints.aggregate(x, y, c, (0, 2, 0, 1), (1, 2),
+                                     categorical=True)
+        self.assertEqual(image[0, 0], 5)
+        self.assertEqual(image[0, 1], 2 ** 40)
+
+
+@unittest.skipIf(plt is None, 'requires matplotlib')
+class TestPoints(unittest.TestCase):
+    def setUp(self):
+        self.fig, self.ax = plt.subplots()
+        self.ax.set_xlim(-180, 180)
+        self.ax.set_ylim(-90, 90)
+        rng = np.random.RandomState(0)
+        self.x = rng.uniform(-180, 180, 10000)
+        self.y = rng.uniform(-90, 90, 10000)
+
+    def tearDown(self):
+        plt.close(self.fig)
+
+    def test_methods(self):
+        """
+        One artist either way, made current for colorbar().
+        """
+        sc = footprints.points(None, self.x, self.y, self.y,
+                               method='scatter')
+        self.assertEqual(len(sc.get_offsets()), 10000)
+        self.assertIs(plt.gci(), sc)
+        im = footprints.points(None, self.x, self.y, self.y,
+                               method='raster')
+        self.assertEqual(len(self.ax.images), 1)
+        self.assertIs(plt.gci(), im)
+        self.assertEqual(self.ax.get_xlim(), (-180, 180))
+        # Continuous colors are scaled like the scatter's.
+        self.assertEqual(im.norm.vmin, sc.norm.vmin)
+        self.assertRaises(ValueError, footprints.points, None, self.x,
+                          self.y, self.y, method='hexbin')
+
+
+class TestRegular(unittest.TestCase):
+    def test_regular(self):
+        self.assertEqual(raster.regular(np.arange(-179.5, 180)), (-180, 180))
+        self.assertEqual(raster.regular(np.linspace(89.75, -89.75, 360)),
+                         (90, -90))
+        self.assertIsNone(raster.regular([0, 1, 3]))
+        self.assertIsNone(raster.regular([[0, 1], [0, 1]]))
+
+    def test_resample(self):
+        """
+        Longitudes wrap;  points off the grid are masked.
+        """
+        data = np.arange(8.0).reshape(2, 4)
+        lon = np.array([-135.0, 225.0, 45.0, 0.0])
+        lat = np.array([-45.0, -45.0, 45.0, 95.0])
+        pixels = raster.resample(lon, lat, data, (-180, 180), (-90, 90))
+        np.testing.assert_array_equal(pixels[:3], [0, 0, 6])
+        self.assertTrue(pixels.mask[3])
+
+
+@unittest.skipIf(plt is None, 'requires matplotlib')
+class TestImage(unittest.TestCase):
+    def setUp(self):
+        self.fig, self.ax = plt.subplots()
+        self.ax.set_xlim(0, 10)
+        self.ax.set_ylim(0, 5)
+
+    def tearDown(self):
+        plt.close(self.fig)
+
+    def test_image(self):
+        """
+        A regular grid is one image of the size of the axes, north up.
+        """
+        data = np.repeat(np.arange(5.0)[::-1, np.newaxis], 10, axis=1)
+        im = raster.image(None, np.arange(10) + 0.5, np.arange(5)[::-1] + 0.5,
+                          data)
+        self.assertIs(plt.gci(), im)
+        pixels = im.get_array()
+        bbox = self.ax.get_window_extent()
+        self.assertEqual(pixels.shape, (int(bbox.height), int(bbox.width)))
+        self.assertEqual(pixels[0, 0], 0)
+        self.assertEqual(pixels[-1, -1], 4)
+
+    def test_irregular(self):
+        mesh = raster.image(None, [0.5, 1.5, 4], np.arange(5) + 0.5,
+                            np.zeros((5, 3)))
+        self.assertEqual(len(self.ax.collections), 1)
+        self.assertIs(plt.gci(), mesh)
+
+
+class TestBlockReduce(unittest.TestCase):
+    def test_mean(self):
+        data = np.arange(24.0).reshape(4, 6)
+        data[0, 0] = np.nan
+        mean = decimate.block_reduce(data, (2, 3))
+        self.assertEqual(mean.shape, (2, 2))
+        self.assertAlmostEqual(mean[0, 0], 4.8)
+        self.assertEqual(decimate.block_reduce(data, (2, 3), 'max')[1, 1],
+                         23)
+        # Rows and columns short of a block are dropped.
+        self.assertEqual(decimate.block_reduce(data, (3, 4)).shape, (1, 1))
+
+    def test_mode(self):
+        data = np.array([[1, 1, 2, 2], [1, 3, 2, 2]], dtype=np.uint8)
+        data = np.ma.masked_equal(data, 2)
+        mode = decimate.block_reduce(data, (2, 2), 'mode')
+        self.assertEqual(mode[0, 0], 1)
+        self.assertTrue(mode.mask[0, 1])
+        self.assertEqual(mode.dtype, np.uint8)
+        self.assertRaises(ValueError, decimate.block_reduce, data, (2, 2),
+                          'median')
+
+
+@unittest.skipIf(plt is None, 'requires matplotlib')
+class TestStride(unittest.TestCase):
+    def setUp(self):
+        self.fig = plt.figure(figsize=(4, 3), dpi=50)
+        self.fig.subplotpars.update(left=0, right=1, bottom=0, top=0.5)
+
+    def tearDown(self):
+        plt.close(self.fig)
+
+    def test_budget(self):
+        """
+        Before any axes exist, the subplot parameters give the area.
+        """
+        self.assertEqual(decimate.pixel_budget(dpi=100), (150, 400))
+        self.assertEqual(decimate.stride((2400, 2400), dpi=100), (16, 6))
+        ax = self.fig.add_axes([0, 0, 0.5, 0.5])
+        self.assertEqual(decimate.pixel_budget(ax, dpi=100), (150, 200))
+        self.assertEqual(decimate.stride(np.zeros((3, 100, 10)), ax, 100),
+                         (1, 1))
+
+    def test_read_decimated(self):
+        data = np.arange(1200.0 * 800).reshape(1200, 800)
+        out, key = decimate.read_decimated(data, dpi=100)
+        self.assertEqual(key, (slice(None, None, 8), slice(None, None, 2)))
+        np.testing.assert_array_equal(out, data[key])
+        out, key = decimate.read_decimated(data, 'mean', dpi=100)
+        self.assertEqual(out.shape, (150, 400))
+        # Blocks of 8 x 2 are located by cell (4, 1) of each.
+        np.testing.assert_allclose(out, data[key] - 0.5 * 800 - 0.5)
+
+    @unittest.skipUnless(backends.available('gdal'), 'requires GDAL')
+    def test_gdal_band(self):
+        """
+        A GDAL band is read by windows, cell for cell like an array.
+        """
+        from osgeo import gdal_array
+        data = np.arange(1200 * 800, dtype=np.int32).reshape(1200, 800) % 7
+        band = gdal_array.OpenArray(data).GetRasterBand(1)
+        self.assertEqual(decimate.stride(band, dpi=100), (8, 2))
+        for how in ('stride', 'mode'):
+            out, key = decimate.read_decimated(band, how, dpi=100)
+            expected, key2 = decimate.read_decimated(data, how, dpi=100)
+            self.assertEqual(key, key2)
+            np.testing.assert_array_equal(out, expected)
+
+
+@unittest.skipIf(Basemap is None, 'requires basemap')
+class TestBasemap(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.environ = os.environ.get('HDFEOS_ZOO_CACHE')
+        os.environ['HDFEOS_ZOO_CACHE'] = self.tempdir
+        maps.clear_cache()
+        self.kwargs = dict(projection='cyl', resolution='c',
+                           llcrnrlat=np.float64(-30), urcrnrlat=30,
+                           llcrnrlon=-60, urcrnrlon=60)
+
+    def tearDown(self):
+        maps.clear_cache()
+        if self.environ is None:
+            del os.environ['HDFEOS_ZOO_CACHE']
+        else:
+            os.environ['HDFEOS_ZOO_CACHE'] = self.environ
+        shutil.rmtree(self.tempdir)
+
+    def test_cache(self):
+        """
+        Copies share the coastlines of one instance, which is also pickled.
+        """
+        m1 = maps.basemap(**self.kwargs)
+        m2 = maps.basemap(**self.kwargs)
+        self.assertIsNot(m1, m2)
+        self.assertIs(m1.coastsegs, m2.coastsegs)
+        self.assertEqual(len(os.listdir(self.tempdir)), 1)
+
+        # Another process would load the pickle.
+        maps.clear_cache()
+        m3 = maps.basemap(**self.kwargs)
+        self.assertIsNot(m3.coastsegs, m1.coastsegs)
+        self.assertEqual(len(m3.coastsegs), len(m1.coastsegs))
+        self.assertEqual(m3(0, 0), m1(0, 0))
+
+        self.assertRaises(ValueError, maps.basemap, ax=None, **self.kwargs)
+
+    @unittest.skipIf(plt is None, 'requires matplotlib')
+    def test_axes_state(self):
+        """
+        A copy does not see, nor keep, the axes drawn on with another.
+        """
+        for _ in range(3):
+            m = maps.basemap(**self.kwargs)
+            self.assertEqual(m._initialized_axes, set())
+            self.assertFalse(m._mapboundarydrawn)
+            fig = plt.figure()
+            m.drawcoastlines()
+            m.drawmapboundary()
+            self.assertEqual(len(m._initialized_axes), 1)
+            plt.close(fig)
+
+
+if __name__ == "__main__":
+    unittest.main()
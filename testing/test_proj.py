@@ -0,0 +1,99 @@
+"""
+Tests for the cached pyproj transformers.
+"""
+import threading
+import unittest
+
+import numpy as np
+
+import zoo.geo
+from zoo.geo import proj
+
+
+def _available(name):
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+STERE = ["+proj=stere", "+lat_0=90", "+lon_0=-45", "+lat_ts=70", "+k=1",
+         "+a=6378273", "+b=6356889.449", "+x_0=0", "+y_0=0"]
+
+
+class TestNormalize(unittest.TestCase):
+    def test_normalize(self):
+        """
+        Argument lists, strings in any order and repeated parameters all
+        name the same projection.
+        """
+        self.assertEqual(proj.normalize(STERE),
+                         proj.normalize(' '.join(reversed(STERE))))
+        self.assertEqual(proj.normalize('+a=1 +b=2 +a=3'), '+a=1 +b=2')
+        self.assertEqual(proj.normalize('+init=epsg:4326'), 'EPSG:4326')
+        self.assertEqual(proj.normalize(' EPSG:3413 '), 'EPSG:3413')
+
+
+@unittest.skipUnless(_available('pyproj'), 'requires pyproj')
+class TestToLonLat(unittest.TestCase):
+    """
+    Transform grids to longitude and latitude.
+    """
+    def setUp(self):
+        self.x = np.linspace(-3850000, 3750000, 60)
+        self.y = np.linspace(5850000, -5350000, 50)
+
+    def expected(self):
+        import pyproj
+        crs = pyproj.CRS(' '.join(STERE))
+        t = pyproj.Transformer.from_crs(crs, crs.geodetic_crs,
+                                        always_xy=True)
+        xv, yv = np.meshgrid(self.x, self.y)
+        return t.transform(xv, yv)
+
+    def test_grid(self):
+        lon, lat = zoo.geo.to_lonlat(STERE, self.x[np.newaxis, :],
+                                     self.y[:, np.newaxis])
+        self.assertEqual(lon.shape, (50, 60))
+        self.assertEqual(lon.dtype, np.float32)
+        plon, plat = self.expected()
+        np.testing.assert_allclose(lon, plon, atol=1e-4)
+        np.testing.assert_allclose(lat, plat, atol=1e-4)
+
+    def test_chunks(self):
+        """
+        Any chunk size gives the same answer, written into out.
+        """
+        out = (np.empty((50, 60)), np.empty((50, 60)))
+        chunk = proj._CHUNK
+        proj._CHUNK = 130
+        try:
+            lon, lat = zoo.geo.to_lonlat(STERE, self.x[np.newaxis, :],
+                                         self.y[:, np.newaxis],
+                                         dtype=np.float64, out=out)
+        finally:
+            proj._CHUNK = chunk
+        self.assertIs(lon, out[0])
+        plon, plat = self.expected()
+        np.testing.assert_allclose(lon, plon, atol=1e-9)
+        np.testing.assert_allclose(lat, plat, atol=1e-9)
+        self.assertRaises(ValueError, zoo.geo.to_lonlat, STERE, self.x,
+                          self.y[:, np.newaxis], out=(lon[:2], lat[:2]))
+
+    def test_cache(self):
+        """
+        One transformer per projection and thread.
+        """
+        t = proj.transformer(STERE)
+        self.assertIs(proj.transformer(' '.join(STERE)), t)
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(proj.transformer(STERE)))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], t)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests for time stacks of granules.
+"""
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import zoo.io
+from zoo.io import backends, stack
+
+from . import synthetic
+
+
+class TestDate(unittest.TestCase):
+    def test_date_of(self):
+        self.assertEqual(
+            stack.date_of('/d/MOD13A1.A2007257.h09v05.005.2007275.hdf'),
+            datetime.date(2007, 9, 14))
+        self.assertEqual(stack.date_of('VIP01P4.A2010001.002.hdf'),
+                         datetime.date(2010, 1, 1))
+        self.assertIsNone(stack.date_of('MOD13A1.hdf'))
+
+
+@unittest.skipUnless(backends.available('pyhdf') and
+                     backends.available('h5py'), 'requires pyhdf and h5py')
+class TestTimeStack(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.environ = os.environ.get('HDFEOS_ZOO_CACHE')
+        os.environ['HDFEOS_ZOO_CACHE'] = os.path.join(self.tempdir, 'cache')
+        self.data = []
+        # Written out of order, and with a stray file.
+        for day in (49, 1, 17, 33):
+            filename = os.path.join(
+                self.tempdir, 'MOD09A1.A2007{0:03d}.h09v05.hdf'.format(day))
+            synthetic.modis_grid(filename, (40, 50), tile=(9, 5))
+            with zoo.io.open_file(filename) as f:
+                var = f['sur_refl_b01_1']
+                self.data.append((day, var[...]))
+        open(os.path.join(self.tempdir, 'README'), 'w').close()
+        self.data = np.stack([d for _, d in sorted(self.data)])
+
+    def tearDown(self):
+        if self.environ is None:
+            del os.environ['HDFEOS_ZOO_CACHE']
+        else:
+            os.environ['HDFEOS_ZOO_CACHE'] = self.environ
+        shutil.rmtree(self.tempdir)
+
+    def test_index(self):
+        """
+        Granules are ordered by date and index like one array, whether read
+        from the granules or from the persisted cube.
+        """
+        ts = zoo.io.TimeStack(self.tempdir, 'sur_refl_b01_1', threads=2)
+        self.assertEqual(ts.shape, (4, 40, 50))
+        self.assertEqual(ts.dates[1], datetime.date(2007, 1, 17))
+        self.assertEqual(ts.index(datetime.date(2007, 2, 18)), 3)
+        for cube in (False, True):
+            if cube:
+                ts.persist(chunks=(2, 16, 16))
+                self.assertIsNotNone(ts.cube)
+            np.testing.assert_array_equal(ts[:, 20, 30], self.data[:, 20, 30])
+            np.testing.assert_array_equal(ts[2], self.data[2])
+            np.testing.assert_array_equal(ts[[3, 0, 3], 5:9, ::-7],
+                                          self.data[[3, 0, 3], 5:9, ::-7])
+            self.assertEqual(ts[:0, 1].shape, (0, 50))
+
+        again = zoo.io.TimeStack(self.tempdir, 'sur_refl_b01_1')
+        self.assertEqual(again.cube, ts.cube)
+
+    def test_decode(self):
+        ts = zoo.io.TimeStack(self.tempdir, 'sur_refl_b01_1',
+                              convention='modis')
+        history = ts[:, 0, 0]
+        self.assertTrue(history.mask.all())
+        history = ts[:, 30, 30]
+        np.testing.assert_allclose(history, self.data[:, 30, 30] * 0.0001)
+
+    def test_duplicate_date(self):
+        shutil.copy(os.path.join(self.tempdir, 'MOD09A1.A2007001.h09v05.hdf'),
+                    os.path.join(self.tempdir, 'MOD09A1.A2007001.h10v05.hdf'))
+        self.assertRaises(ValueError, zoo.io.TimeStack, self.tempdir,
+                          'sur_refl_b01_1')
+        ts = zoo.io.TimeStack(self.tempdir, 'sur_refl_b01_1',
+                              pattern='*.h09v05.*')
+        self.assertEqual(len(ts), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+"""
+Tests for the StructMetadata parser.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import zoo.io
+from zoo.io import backends, odl
+from zoo.io.structmetadata import StructMetadata, dms_to_degrees
+
+GRID_METADATA = """\
+GROUP=SwathStructure
+END_GROUP=SwathStructure
+GROUP=GridStructure
+	GROUP=GRID_1
+		GridName="mod08"
+		XDim=360
+		YDim=180
+		UpperLeftPointMtrs=(-180000000.000000,90000000.000000)
+		LowerRightMtrs=(180000000.000000,-90000000.000000)
+		Projection=GCTP_GEO
+		GridOrigin=HDFE_GD_UL
+		GROUP=Dimension
+			OBJECT=Dimension_1
+				DimensionName="Cloud_Top_Pressure"
+				Size=10
+			END_OBJECT=Dimension_1
+		END_GROUP=Dimension
+		GROUP=DataField
+			OBJECT=DataField_1
+				DataFieldName="Cloud_Fraction_Liquid"
+				DataType=DFNT_INT16
+				DimList=("YDim","XDim")
+			END_OBJECT=DataField_1
+		END_GROUP=DataField
+	END_GROUP=GRID_1
+	GROUP=GRID_2
+		GridName="MODIS_Grid_2D"
+		XDim=4800
+		YDim=4800
+		UpperLeftPointMtrs=(-20015109.354000,-1111950.519667)
+		LowerRightMtrs=(-18903158.834333,-2223901.039333)
+		Projection=GCTP_SNSOID
+		ProjParams=(6371007.181000,0,0,0,0,0,0,0,0,0,0,0,0)
+		SphereCode=-1
+		GridOrigin=HDFE_GD_UL
+	END_GROUP=GRID_2
+END_GROUP=GridStructure
+GROUP=PointStructure
+END_GROUP=PointStructure
+END
+"""
+
+SWATH_METADATA = """\
+GROUP=SwathStructure
+	GROUP=SWATH_1
+		SwathName="mod05"
+		GROUP=Dimension
+			OBJECT=Dimension_1
+				DimensionName="Cell_Across_Swath_5km"
+				Size=270
+			END_OBJECT=Dimension_1
+		END_GROUP=Dimension
+		GROUP=DimensionMap
+			OBJECT=DimensionMap_1
+				GeoDimension="Cell_Across_Swath_5km"
+				DataDimension="Cell_Across_Swath_1km"
+				Offset=2
+				Increment=5
+			END_OBJECT=DimensionMap_1
+		END_GROUP=DimensionMap
+		GROUP=GeoField
+			OBJECT=GeoField_1
+				GeoFieldName="Latitude"
+				DataType=DFNT_FLOAT32
+				DimList=("Cell_Along_Swath_5km","Cell_Across_Swath_5km")
+			END_OBJECT=GeoField_1
+		END_GROUP=GeoField
+		GROUP=DataField
+			OBJECT=DataField_1
+				DataFieldName="Water_Vapor_Near_Infrared"
+				DataType=DFNT_INT16
+				DimList=("Cell_Along_Swath_1km",
+				         "Cell_Across_Swath_1km")
+			END_OBJECT=DataField_1
+		END_GROUP=DataField
+	END_GROUP=SWATH_1
+END_GROUP=SwathStructure
+END
+"""
+
+
+class TestODL(unittest.TestCase):
+    """
+    Parse raw ODL.
+    """
+    def test_values(self):
+        """
+        Strings, numbers, words and tuples.
+        """
+        tree = odl.parse('A="x y"\nB=12\nC=-1.5E3\nD=GCTP_GEO\n'
+                         'E=(1,"two",3.0)\nEND\n')
+        self.assertEqual(tree['A'], 'x y')
+        self.assertEqual(tree['B'], 12)
+        self.assertEqual(tree['C'], -1500.0)
+        self.assertEqual(tree['D'], 'GCTP_GEO')
+        self.assertEqual(tree['E'], (1, 'two', 3.0))
+
+    def test_unbalanced(self):
+        """
+        An END_GROUP without a GROUP is an error.
+        """
+        self.assertRaises(ValueError, odl.parse, 'END_GROUP=A\nEND\n')
+
+
+class TestStructMetadata(unittest.TestCase):
+    """
+    Build the typed view of StructMetadata.
+    """
+    def test_geographic_grid(self):
+        """
+        GEO grid corners are converted from packed DMS to degrees.
+        """
+        meta = StructMetadata(GRID_METADATA)
+        grid = meta.grid_of('Cloud_Fraction_Liquid')
+        self.assertEqual(grid.name, 'mod08')
+        self.assertEqual(grid.projection, 'GEO')
+        self.assertEqual(grid.shape, (180, 360))
+        self.assertEqual(grid.upper_left, (-180.0, 90.0))
+        self.assertEqual(grid.cell_size, (1.0, -1.0))
+        np.testing.assert_array_equal(grid.x[:2], [-179.5, -178.5])
+        np.testing.assert_array_equal(grid.y[-2:], [-88.5, -89.5])
+        self.assertEqual(grid.fields['Cloud_Fraction_Liquid'].dims,
+                         ('YDim', 'XDim'))
+        self.assertEqual(grid.dimensions['Cloud_Top_Pressure'], 10)
+
+    def test_projected_grid(self):
+        """
+        Projected grids keep their corners in meters.
+        """
+        grid = StructMetadata(GRID_METADATA).grids['MODIS_Grid_2D']
+        self.assertEqual(grid.projection, 'SNSOID')
+        self.assertEqual(grid.proj_params[0], 6371007.181)
+        self.assertAlmostEqual(grid.cell_size[0], 231.656358, places=5)
+        self.assertEqual(grid.origin, 'GD_UL')
+
+    def test_swath(self):
+        """
+        Dimension maps and fields of a swath, with a wrapped DimList.
+        """
+        swath = StructMetadata(SWATH_METADATA).swaths['mod05']
+        dimmap = swath.dimension_map('Cell_Across_Swath_5km',
+                                     'Cell_Across_Swath_1km')
+        self.assertEqual((dimmap.offset, dimmap.increment), (2, 5))
+        field = swath.data_fields['Water_Vapor_Near_Infrared']
+        self.assertEqual(field.dtype, 'INT16')
+        self.assertEqual(field.dims, ('Cell_Along_Swath_1km',
+                                      'Cell_Across_Swath_1km'))
+
+    def test_dms(self):
+        """
+        Packed DMS conversion.
+        """
+        self.assertEqual(dms_to_degrees(-180000000.0), -180.0)
+        self.assertAlmostEqual(dms_to_degrees(98018013.752), 98.30382, 5)
+
+
+@unittest.skipUnless(backends.available('pyhdf'), 'requires pyhdf')
+class TestMemoize(unittest.TestCase):
+    """
+    StructMetadata is parsed once per version of a file.
+    """
+    def setUp(self):
+        from pyhdf.SD import SD, SDC
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, 'test.hdf')
+        hdf = SD(self.filename, SDC.WRITE | SDC.CREATE)
+        setattr(hdf, 'StructMetadata.0', GRID_METADATA)
+        hdf.end()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_memoize(self):
+        """
+        The same object is returned until the file changes.
+        """
+        meta = zoo.io.structmetadata(self.filename)
+        self.assertIs(zoo.io.structmetadata(self.filename), meta)
+        with zoo.io.open_file(self.filename) as f:
+            self.assertIs(f.structmetadata, meta)
+
+        st = os.stat(self.filename)
+        os.utime(self.filename, (st.st_atime, st.st_mtime + 10))
+        self.assertIsNot(zoo.io.structmetadata(self.filename), meta)
+
+
+if __name__ == "__main__":
+    unittest.main()
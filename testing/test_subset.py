@@ -0,0 +1,133 @@
+"""
+Tests for reading the rows of swaths over a region.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import zoo.geo
+import zoo.io
+from zoo.geo import subset
+from zoo.io import backends
+
+from . import synthetic
+
+
+class TestRows(unittest.TestCase):
+    def test_in_box(self):
+        lon = np.array([175.0, 185.0, -170.0, 0.0, np.nan])
+        lat = np.zeros(5)
+        self.assertEqual(subset.in_box(lon, lat, (170, -1, -175, 1)).tolist(),
+                         [True, True, False, False, False])
+
+    def test_row_ranges(self):
+        lat = np.array([[0, 50], [50, 50], [50, 50], [10, 50], [50, 50],
+                        [50, 50], [50, 50], [50, 5]], dtype=float)
+        lon = np.zeros_like(lat)
+        box = (-1, -1, 1, 20)
+        self.assertEqual(subset.row_ranges(lon, lat, box),
+                         [(0, 1), (3, 4), (7, 8)])
+        self.assertEqual(subset.row_ranges(lon, lat, box, pad=1),
+                         [(0, 5), (6, 8)])
+        self.assertEqual(subset.row_ranges(lon, lat, (-1, 60, 1, 70)), [])
+
+    def test_map_rows(self):
+        """
+        5 km tie points at the centre of 5 x 5 blocks of 1 km rows.
+        """
+        self.assertEqual(subset.map_rows([(2, 4)], 5, 2, 50, 10), [(10, 20)])
+        self.assertEqual(subset.map_rows([(0, 1), (2, 3), (9, 10)], 5, 2,
+                                         50, 10),
+                         [(0, 5), (10, 15), (45, 50)])
+        self.assertEqual(subset.map_rows([(0, 2), (2, 3)], 1, 0, 3, 3),
+                         [(0, 3)])
+
+
+@unittest.skipUnless(backends.available('h5py'), 'requires h5py')
+class TestSwathSubset(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, 'swath.he5')
+        self.name = synthetic.eos5_swath(self.filename, (400, 60))
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_subset(self):
+        """
+        Only the rows crossing the box are read, and they are all there.
+        """
+        box = (-20, 10, 10, 30)
+        with zoo.io.open_file(self.filename) as f:
+            full = f[self.name][...]
+            lat = f['Latitude'][...]
+            lon = f['Longitude'][...]
+        wanted = np.flatnonzero(subset.in_box(lon, lat, box).any(axis=1))
+        data, sub_lon, sub_lat = zoo.geo.swath_subset(self.filename,
+                                                      self.name, box)
+        ranges = zoo.geo.swath_rows(self.filename, self.name, box)
+        rows = np.concatenate([np.arange(a, b) for a, b in ranges])
+        self.assertTrue(set(wanted) <= set(rows))
+        self.assertLess(len(rows), len(wanted) + 3)
+        self.assertLess(len(rows), 400 // 5)
+        np.testing.assert_array_equal(data, full[rows])
+        np.testing.assert_array_equal(sub_lat, lat[rows])
+        np.testing.assert_array_equal(sub_lon, lon[rows])
+
+    def test_empty(self):
+        data, lon, lat = zoo.geo.swath_subset(self.filename, self.name,
+                                              (100, 10, 120, 30))
+        self.assertEqual(data.shape, (0, 60))
+        self.assertEqual(lat.shape, (0, 60))
+
+
+@unittest.skipUnless(backends.available('h5py'), 'requires h5py')
+class TestProfiles(unittest.TestCase):
+    """
+    Fields with channels after the swath axes, and geolocation in one
+    variable, without StructMetadata.
+    """
+    def setUp(self):
+        import h5py
+
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, 'airs.h5')
+        lat, lon = np.meshgrid(np.linspace(-60, 60, 135),
+                               np.linspace(-20, 20, 90), indexing='ij')
+        self.lat, self.lon = lat, lon
+        self.radiances = np.arange(135 * 90 * 10,
+                                   dtype=np.float32).reshape(135, 90, 10)
+        with h5py.File(self.filename, 'w') as f:
+            f['Latitude'] = lat
+            f['Longitude'] = lon
+            f['radiances'] = self.radiances
+            f['geolocation'] = np.stack([lat, lon], axis=-1)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_channels(self):
+        box = (-30, 0, 30, 10)
+        rows = np.flatnonzero((self.lat[:, 0] >= 0) & (self.lat[:, 0] <= 10))
+        data, lon, lat = zoo.geo.swath_subset(self.filename, 'radiances',
+                                              box, pad=0)
+        np.testing.assert_array_equal(data, self.radiances[rows])
+        np.testing.assert_array_equal(lat, self.lat[rows])
+
+    def test_one_variable(self):
+        box = (-30, 0, 30, 10)
+        expected = zoo.geo.swath_rows(self.filename, 'radiances', box)
+        ranges = zoo.geo.swath_rows(self.filename, 'radiances', box,
+                                    lat_name=('geolocation', 0),
+                                    lon_name=('geolocation', 1))
+        self.assertEqual(ranges, expected)
+        ranges = zoo.geo.swath_rows(self.filename, 'radiances', box,
+                                    lat_name=self.lat, lon_name=self.lon)
+        self.assertEqual(ranges, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Tests for swath geolocation from tie points and MOD03 files.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import zoo.geo
+from zoo.geo import swath
+from zoo.io import backends
+
+SWATH_METADATA = """\
+GROUP=SwathStructure
+	GROUP=SWATH_1
+		SwathName="mod06"
+		GROUP=DimensionMap
+			OBJECT=DimensionMap_1
+				GeoDimension="Cell_Along_Swath_5km"
+				DataDimension="Cell_Along_Swath_1km"
+				Offset=2
+				Increment=5
+			END_OBJECT=DimensionMap_1
+			OBJECT=DimensionMap_2
+				GeoDimension="Cell_Across_Swath_5km"
+				DataDimension="Cell_Across_Swath_1km"
+				Offset=2
+				Increment=5
+			END_OBJECT=DimensionMap_2
+		END_GROUP=DimensionMap
+		GROUP=GeoField
+			OBJECT=GeoField_1
+				GeoFieldName="Latitude"
+				DataType=DFNT_FLOAT32
+				DimList=("Cell_Along_Swath_5km","Cell_Across_Swath_5km")
+			END_OBJECT=GeoField_1
+			OBJECT=GeoField_2
+				GeoFieldName="Longitude"
+				DataType=DFNT_FLOAT32
+				DimList=("Cell_Along_Swath_5km","Cell_Across_Swath_5km")
+			END_OBJECT=GeoField_2
+		END_GROUP=GeoField
+		GROUP=DataField
+			OBJECT=DataField_1
+				DataFieldName="Cloud_Optical_Thickness"
+				DataType=DFNT_INT16
+				DimList=("Cell_Along_Swath_1km","Cell_Across_Swath_1km")
+			END_OBJECT=DataField_1
+			OBJECT=DataField_2
+				DataFieldName="Cloud_Top_Pressure"
+				DataType=DFNT_INT16
+				DimList=("Cell_Along_Swath_5km","Cell_Across_Swath_5km")
+			END_OBJECT=DataField_2
+		END_GROUP=DataField
+	END_GROUP=SWATH_1
+END_GROUP=SwathStructure
+END
+"""
+
+
+def _write(filename, datasets, metadata=None):
+    from pyhdf.SD import SD, SDC
+    sd = SD(filename, SDC.WRITE | SDC.CREATE)
+    if metadata is not None:
+        setattr(sd, 'StructMetadata.0', metadata)
+    for name, data in datasets:
+        sds = sd.create(name, SDC.FLOAT32, data.shape)
+        sds[:] = data.astype(np.float32)
+        sds.endaccess()
+    sd.end()
+
+
+class TestGranule(unittest.TestCase):
+    def test_granule_id(self):
+        self.assertEqual(
+            swath.granule_id('/data/MOD06_L2.A2010001.0000.005.hdf'),
+            ('MOD', '2010001', '0000'))
+        self.assertIsNone(swath.granule_id('AIRS.2002.08.30.225.L2.hdf'))
+
+
+@unittest.skipUnless(backends.available('pyhdf'), 'requires pyhdf')
+class TestSwathGeolocation(unittest.TestCase):
+    """
+    Geolocate a 1 km field of a MOD06-like file.
+    """
+    def setUp(self):
+        zoo.geo.grid.clear_cache()
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(
+            self.tempdir, 'MOD06_L2.A2010001.0000.005.2010005213214.hdf')
+        rows, cols = np.meshgrid(np.arange(20.0), np.arange(53.0),
+                                 indexing='ij')
+        self.lat = -70 - rows * 0.009
+        self.lon = 20 + cols * 0.01
+        coarse = (slice(2, None, 5), slice(2, None, 5))
+        _write(self.filename,
+               [('Latitude', self.lat[coarse]),
+                ('Longitude', self.lon[coarse]),
+                ('Cloud_Optical_Thickness', np.zeros((20, 53))),
+                ('Cloud_Top_Pressure', np.zeros((4, 11)))],
+               SWATH_METADATA)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_tie_points(self):
+        lon, lat = zoo.geo.swath_geolocation(self.filename,
+                                             'Cloud_Optical_Thickness')
+        self.assertEqual(lat.shape, (20, 53))
+        self.assertEqual(lat.dtype, np.float32)
+        np.testing.assert_allclose(lat, self.lat, atol=1e-4)
+        np.testing.assert_allclose(lon, self.lon, atol=1e-4)
+
+    def test_native(self):
+        """
+        A field at the resolution of the geolocation needs none.
+        """
+        lon, lat = zoo.geo.swath_geolocation(self.filename,
+                                             'Cloud_Top_Pressure')
+        np.testing.assert_allclose(lat, self.lat[2::5, 2::5], atol=1e-5)
+
+    def test_geo_file(self):
+        """
+        The MOD03 file of the granule is found, read once and preferred.
+        """
+        geo_file = os.path.join(self.tempdir,
+                                'MOD03.A2010001.0000.005.2010003235220.hdf')
+        _write(geo_file, [('Latitude', self.lat + 1),
+                          ('Longitude', self.lon)])
+        self.assertEqual(swath.find_geo_file(self.filename), geo_file)
+        lon, lat = zoo.geo.swath_geolocation(self.filename,
+                                             'Cloud_Optical_Thickness')
+        np.testing.assert_allclose(lat, self.lat + 1, atol=1e-5)
+        lat[:] = 0
+        lon, lat = zoo.geo.swath_geolocation(self.filename,
+                                             'Cloud_Optical_Thickness',
+                                             geo_file)
+        np.testing.assert_allclose(lat, self.lat + 1, atol=1e-5)
+        keys = [k for k in zoo.geo.grid._cache if k[0] == 'MOD03']
+        self.assertEqual(len(keys), 1)
+        self.assertRaises(ValueError, zoo.geo.swath_geolocation,
+                          self.filename, 'Cloud_Top_Pressure', geo_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
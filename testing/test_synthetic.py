@@ -0,0 +1,95 @@
+"""
+Tests for the synthetic granules and the benchmarks that use them.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import zoo.geo
+import zoo.io
+import zoo.io.decode
+from zoo.io import backends
+
+from . import synthetic
+
+try:
+    import matplotlib
+    matplotlib.use('Agg')
+except ImportError:
+    matplotlib = None
+
+
+class TestSynthetic(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    @unittest.skipUnless(backends.available('pyhdf'), 'requires pyhdf')
+    def test_modis_grid(self):
+        """
+        The tile decodes by the MODIS convention and geolocates from its
+        StructMetadata.
+        """
+        filename = os.path.join(self.tempdir, 'tile.hdf')
+        name = synthetic.modis_grid(filename, (120, 120), tile=(8, 5))
+        with zoo.io.open_file(filename) as f:
+            data = zoo.io.decode.read(f[name], convention='modis')
+        self.assertEqual(data.shape, (120, 120))
+        self.assertEqual(data.mask.sum(), 144)
+        self.assertTrue(-0.01 <= data.min() and data.max() <= 1.6)
+        lon, lat = zoo.geo.grid_geolocator(filename, name)[:]
+        self.assertAlmostEqual(lat.max(), 40, delta=0.1)
+        self.assertAlmostEqual(lat.min(), 30, delta=0.1)
+
+    @unittest.skipUnless(backends.available('h5py'), 'requires h5py')
+    def test_eos5_swath(self):
+        filename = os.path.join(self.tempdir, 'swath.he5')
+        name = synthetic.eos5_swath(filename, (100, 60))
+        with zoo.io.open_file(filename) as f:
+            swath = f.structmetadata.swath_of('ColumnAmount')
+            self.assertEqual(swath.name, 'BrO')
+            self.assertEqual(f[name].shape, (100, 60))
+            self.assertEqual(f['Latitude'].shape, (100, 60))
+            rule = zoo.io.decode.rule_for(f[name].attrs)
+            self.assertEqual(rule.fill, np.float32(-1.0e30))
+
+    @unittest.skipUnless(backends.available('h5py'), 'requires h5py')
+    def test_oco2_points(self):
+        filename = os.path.join(self.tempdir, 'oco2.h5')
+        name = synthetic.oco2_points(filename, 1000)
+        with zoo.io.open_file(filename) as f:
+            xco2 = f[name][...]
+            lat = f['retrieval_latitude'][...]
+        self.assertEqual(xco2.shape, (1000,))
+        self.assertTrue((np.abs(lat) <= 90).all())
+
+
+@unittest.skipUnless(backends.available('pyhdf') and
+                     backends.available('h5py') and matplotlib is not None,
+                     'requires pyhdf, h5py and matplotlib')
+class TestBenchmarks(unittest.TestCase):
+    def test_run(self):
+        """
+        Every benchmark runs, at a small size.
+        """
+        from benchmarks import products
+        for cls, size in ((products.ModisGrid, 60),
+                          (products.Eos5Swath, 30),
+                          (products.Oco2Points, 500)):
+            bench = cls()
+            bench.setup(size)
+            try:
+                for method in dir(bench):
+                    if method.startswith('time_'):
+                        getattr(bench, method)(size)
+            finally:
+                bench.teardown(size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests for unpacking the CALIPSO Vertical Feature Mask.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from zoo.io import backends, vfm
+
+
+class TestVFM(unittest.TestCase):
+    def test_altitude(self):
+        alt = vfm.altitude()
+        self.assertEqual(alt.shape, (1020,))
+        self.assertAlmostEqual(alt[0], 30.085)
+        self.assertAlmostEqual(alt[-1], -0.485)
+        self.assertIs(vfm.altitude(), alt)
+
+    def test_grid(self):
+        """
+        Each value of a record lands on the cells it covers.
+        """
+        record = np.arange(vfm.RECORD)[np.newaxis, :]
+        g = vfm.grid(np.vstack([record, record + vfm.RECORD]))
+        self.assertEqual(g.shape, (30, 1020))
+        # 20.2-30.1 km:  3 profiles of 55 bins of 180 m.
+        np.testing.assert_array_equal(g[:5, :6], 0)
+        self.assertEqual(g[5, 6], 55 + 1)
+        # 8.2-20.2 km:  5 profiles of 200 bins of 60 m.
+        np.testing.assert_array_equal(g[3:6, 330:332], 165 + 200)
+        # -0.5-8.2 km:  15 profiles of 290 bins of 30 m.
+        self.assertEqual(g[14, 1019], vfm.RECORD - 1)
+        self.assertEqual(g[15, 0], vfm.RECORD)
+        for i, (top, bottom, bins, profiles) in enumerate(vfm.BLOCKS):
+            rows = (vfm.altitude() < top) & (vfm.altitude() > bottom)
+            self.assertEqual(len(np.unique(g[0, rows])), bins)
+            self.assertEqual(len(np.unique(g[:15, rows][:, 0])), profiles)
+        self.assertRaises(ValueError, vfm.grid, np.zeros((2, 5514)))
+
+    def test_unpack(self):
+        flags = np.array([2 | 3 << 3 | 1 << 5 | 2 << 7 | 5 << 9 | 1 << 12 |
+                          4 << 13], dtype=np.uint16)
+        fields = vfm.unpack(flags)
+        self.assertEqual(list(fields), list(vfm.FIELDS))
+        self.assertEqual([int(v[0]) for v in fields.values()],
+                         [2, 3, 1, 2, 5, 1, 4])
+        self.assertEqual(fields['type'].dtype, np.uint8)
+        self.assertRaises(ValueError, vfm.unpack, flags, ['colour'])
+
+
+@unittest.skipUnless(backends.available('pyhdf'), 'requires pyhdf')
+class TestRead(unittest.TestCase):
+    def setUp(self):
+        from pyhdf.SD import SD, SDC
+        self.tempdir = tempfile.mkdtemp()
+        self.filenames = []
+        for i in range(2):
+            filename = os.path.join(self.tempdir, 'vfm{0}.hdf'.format(i))
+            sd = SD(filename, SDC.WRITE | SDC.CREATE)
+            flags = sd.create('Feature_Classification_Flags', SDC.UINT16,
+                              (4, vfm.RECORD))
+            flags[:] = np.full((4, vfm.RECORD), 2 | i << 5, dtype=np.uint16)
+            for name in ('Latitude', 'Longitude'):
+                sds = sd.create(name, SDC.FLOAT32, (4, 1))
+                sds[:] = np.arange(4.0, dtype=np.float32).reshape(4, 1) + i
+                sds.endaccess()
+            flags.endaccess()
+            sd.end()
+            self.filenames.append(filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_iter_granules(self):
+        result = list(vfm.iter_granules(self.filenames, slice(1, 3),
+                                        ('type', 'phase')))
+        self.assertEqual([r[0] for r in result], self.filenames)
+        data = result[1][1]
+        self.assertEqual(data['type'].shape, (30, 1020))
+        self.assertTrue((data['type'] == 2).all())
+        self.assertTrue((data['phase'] == 1).all())
+        np.testing.assert_array_equal(data['latitude'],
+                                      np.repeat([2.0, 3.0], 15))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,8 @@
-from . import gesdisc
-from . import ghrc
-from . import laads
-from . import larc
-from . import lpdaac
-from . import podaac
-from . import nsidc
+from ._lazy import attach
+
+# Data center packages holding the examples.  Everything else in the package
+# (zoo.io, ...) is the shared library layer used by the examples.
+CENTERS = ('gesdisc', 'ghrc', 'laads', 'larc', 'lpdaac', 'nsidc', 'podaac')
+
+# Each is imported on first use, and so is each of its examples.
+__getattr__, __dir__, __all__ = attach(__name__, CENTERS)
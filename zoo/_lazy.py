@@ -0,0 +1,78 @@
+"""
+Import the packages and examples of the zoo on first use.
+
+    >>> __getattr__, __dir__, __all__ = attach(__name__, ['airs', 'buv'])
+
+import zoo used to import every data center package, each of those every
+instrument package and each of those every example, and the examples import
+matplotlib, Basemap and often pyproj at module level:  some 150 modules and
+Basemap's setup before anything ran.  attach() gives a package a module
+__getattr__ that imports a listed submodule the first time it is looked up,
+and a __dir__ that lists the submodules, so that zoo.lpdaac.mod.MOD09GA_Range
+and inspect.getmembers() work as before but load only what they touch.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+
+# Files of the examples given to attach() by file name, by package.
+_files = {}
+
+
+def source(package, name):
+    """
+    Path of the file of an example of the imported package, without
+    importing the example.
+    """
+    parent = sys.modules[package]
+    filename = _files.get(package, {}).get(name, name)
+    return os.path.join(os.path.dirname(parent.__file__), filename + '.py')
+
+
+def _load_file(package, name, path):
+    """
+    Import the file at path, whose name is not an identifier, as the
+    submodule package.name.
+    """
+    parent = sys.modules[package]
+    fullname = package + '.' + name
+    spec = importlib.util.spec_from_file_location(fullname, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[fullname] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[fullname]
+        raise
+    setattr(parent, name, module)
+    return module
+
+
+def attach(package, submodules, files=None):
+    """
+    (__getattr__, __dir__, __all__) for the package named package, importing
+    the given submodules lazily.  files maps the names of examples whose
+    file names are not identifiers (e.g. '2006001-2006005.s0454pfrt-bsst.hdf'
+    for an example named after its data file) to those files.
+    """
+    files = dict(files or {})
+    _files[package] = files
+    names = list(submodules) + sorted(set(files).difference(submodules))
+    known = frozenset(names)
+
+    def __getattr__(name):
+        if name in files:
+            return _load_file(package, name, source(package, name))
+        if name in known:
+            # The import binds the submodule in the package, so that this
+            # is called only once for each.
+            return importlib.import_module('.' + name, package)
+        msg = "module {0!r} has no attribute {1!r}"
+        raise AttributeError(msg.format(package, name))
+
+    def __dir__():
+        return sorted(known.union(vars(sys.modules[package])))
+
+    return __getattr__, __dir__, names
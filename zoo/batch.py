@@ -0,0 +1,330 @@
+"""
+Run the examples in parallel and report how long each phase took.
+
+    $ HDFEOS_ZOO_DIR=/data/zoo python -m zoo.batch -j 16 -o report.json
+    $ python -m zoo.batch MOD09 lpdaac.myd
+
+The test suite runs the examples one after the other.  discover() finds
+every example and the data file named in its __main__ block, without
+importing it.  run() runs those whose file is under the data directory in a
+pool of processes, a fresh one per example, with the Agg backend.  It
+records the wall time, the peak resident memory and the time spent reading,
+decoding, geolocating and rendering (see zoo.phases) of each, including
+what the examples read through pyhdf, h5py and netCDF4 and draw through
+matplotlib and Basemap themselves.  The report is written as JSON;  figures
+go to the output directory.
+"""
+
+import argparse
+import ast
+import fnmatch
+import functools
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+
+from . import _lazy, phases
+
+
+def data_file(path):
+    """
+    Name of the data file given in the __main__ block of the example at
+    path, or None.
+    """
+    with open(path, 'rb') as fh:
+        tree = ast.parse(fh.read(), path)
+    for node in tree.body:
+        if not (isinstance(node, ast.If) and
+                '__main__' in ast.dump(node.test)):
+            continue
+        for stmt in ast.walk(node):
+            if (isinstance(stmt, ast.Assign) and
+                    isinstance(stmt.value, ast.Constant) and
+                    isinstance(stmt.value.value, str)):
+                return stmt.value.value
+    return None
+
+
+def discover(patterns=None):
+    """
+    (name, path, data file) of each example, e.g.
+    ('zoo.lpdaac.mod.MOD09GA_Range', '.../MOD09GA_Range.py',
+    'MOD09GA.A2007268.h10v08.005.2007272184810.hdf').  patterns select
+    examples by shell patterns matching any part of their name.
+    """
+    import zoo
+
+    found = []
+    for center in zoo.CENTERS:
+        center_module = getattr(zoo, center)
+        for inst in center_module.__all__:
+            package = getattr(center_module, inst)
+            for example in package.__all__:
+                name = '.'.join((package.__name__, example))
+                if patterns and not any(fnmatch.fnmatch(name, '*' + p + '*')
+                                        for p in patterns):
+                    continue
+                path = _lazy.source(package.__name__, example)
+                found.append((name, path, data_file(path)))
+    return found
+
+
+def _peak_rss():
+    """
+    Peak resident memory of this process in bytes, or None.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+# Drawing calls of matplotlib Axes and of Basemap counted as rendering.
+_AXES_CALLS = ('pcolormesh', 'pcolor', 'pcolorfast', 'imshow', 'contour',
+               'contourf', 'scatter', 'plot', 'quiver', 'barbs')
+_BASEMAP_CALLS = _AXES_CALLS + ('drawcoastlines', 'drawcountries',
+                                'drawstates', 'drawparallels',
+                                'drawmeridians', 'drawmapboundary',
+                                'fillcontinents', 'colorbar')
+
+
+def _time_methods(cls, names, phase):
+    for name in names:
+        method = getattr(cls, name, None)
+        if method is None or getattr(method, '_phase', None) == phase:
+            continue
+        wrapper = phases.timed(phase)(method)
+        wrapper._phase = phase
+        setattr(cls, name, wrapper)
+
+
+class _TimedVariable(object):
+    """
+    A netCDF4 Variable whose reads count as 'read'.  netCDF4's types are
+    compiled and cannot be patched, so the variables are wrapped instead.
+    """
+    __slots__ = ('_var',)
+
+    def __init__(self, var):
+        object.__setattr__(self, '_var', var)
+
+    @phases.timed('read')
+    def __getitem__(self, key):
+        return self._var[key]
+
+    def __getattr__(self, name):
+        return getattr(self._var, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._var, name, value)
+
+    def __len__(self):
+        return len(self._var)
+
+    @property
+    def __dict__(self):
+        return self._var.__dict__
+
+
+def _timed_netcdf(dataset):
+    """
+    netCDF4.Dataset, opening files with their variables wrapped.
+    """
+    @functools.wraps(dataset)
+    def open_dataset(*args, **kwargs):
+        nc = dataset(*args, **kwargs)
+        for name, var in list(nc.variables.items()):
+            nc.variables[name] = _TimedVariable(var)
+        return nc
+    open_dataset._phase = 'read'
+    return open_dataset
+
+
+def _time_libraries():
+    """
+    Count the examples' own reads through pyhdf, h5py and netCDF4 as
+    'read', and their drawing and saving as 'render'.
+    """
+    import matplotlib.axes
+    import matplotlib.figure
+
+    _time_methods(matplotlib.figure.Figure, ['savefig'], 'render')
+    _time_methods(matplotlib.axes.Axes, _AXES_CALLS, 'render')
+    try:
+        from mpl_toolkits.basemap import Basemap
+    except ImportError:
+        pass
+    else:
+        _time_methods(Basemap, _BASEMAP_CALLS, 'render')
+
+    try:
+        from pyhdf.SD import SDS
+    except ImportError:
+        pass
+    else:
+        _time_methods(SDS, ['__getitem__', 'get'], 'read')
+    try:
+        import h5py
+    except ImportError:
+        pass
+    else:
+        _time_methods(h5py.Dataset, ['__getitem__', 'read_direct'], 'read')
+    try:
+        import netCDF4
+    except ImportError:
+        pass
+    else:
+        if getattr(netCDF4.Dataset, '_phase', None) != 'read':
+            netCDF4.Dataset = _timed_netcdf(netCDF4.Dataset)
+
+
+def _init_worker(output_dir):
+    import matplotlib
+    matplotlib.use('Agg')
+
+    _time_libraries()
+    os.chdir(output_dir)
+    phases.enable()
+
+
+def run_one(name, filename):
+    """
+    Import and run one example in this process;  return its record.
+    """
+    import matplotlib.pyplot as plt
+
+    phases.reset()
+    record = {'example': name, 'file': filename, 'status': 'ok'}
+    start = time.time()
+    try:
+        module = functools.reduce(getattr, name.split('.')[1:],
+                                  importlib.import_module('zoo'))
+        record['import'] = time.time() - start
+        module.run(filename)
+    except Exception:
+        record['status'] = 'error'
+        record['error'] = traceback.format_exc()
+    finally:
+        plt.close('all')
+    record['wall'] = time.time() - start
+    record['peak_rss'] = _peak_rss()
+    record['phases'] = phases.totals()
+    return record
+
+
+def _run_task(task):
+    return run_one(*task)
+
+
+def run(examples, data_dir, output_dir, processes=None):
+    """
+    Run examples, as given by discover(), whose data file is in data_dir.
+
+    Parameters
+    ----------
+    examples : list
+        (name, path, data file) of each example.
+    data_dir : str
+        Where the data files are, e.g. $HDFEOS_ZOO_DIR.
+    output_dir : str
+        Where the examples write their figures.
+    processes : int, optional
+        Size of the pool, by default the number of CPUs.
+
+    Returns
+    -------
+    list of dict
+        A record for each example, in the order given:  'status' is 'ok',
+        'error' (with the traceback in 'error') or 'missing' when the data
+        file is not there;  'wall', 'import' and the 'phases' are in
+        seconds, 'peak_rss' in bytes.
+    """
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+    output_dir = os.path.abspath(output_dir)
+    records = {}
+    tasks = []
+    for name, _, data in examples:
+        path = None if data is None else os.path.join(data_dir, data)
+        if path is None or not os.path.exists(path):
+            records[name] = {'example': name, 'file': path,
+                             'status': 'missing'}
+        else:
+            tasks.append((name, os.path.abspath(path)))
+
+    if tasks:
+        # A process per example keeps one example's memory, Basemap and
+        # library state from showing up in the next one's figures.
+        context = multiprocessing.get_context('spawn')
+        pool = context.Pool(processes, initializer=_init_worker,
+                            initargs=(output_dir,), maxtasksperchild=1)
+        try:
+            for record in pool.imap_unordered(_run_task, tasks):
+                records[record['example']] = record
+        finally:
+            pool.close()
+            pool.join()
+    return [records[name] for name, _, _ in examples]
+
+
+def summary(records):
+    """
+    Lines of text summing up the records, slowest examples first.
+    """
+    counts = {}
+    for record in records:
+        counts[record['status']] = counts.get(record['status'], 0) + 1
+    lines = [', '.join('{0} {1}'.format(n, status)
+                       for status, n in sorted(counts.items()))]
+    ran = [r for r in records if 'wall' in r]
+    ran.sort(key=lambda r: -r['wall'])
+    for record in ran:
+        times = ' '.join('{0}={1:.2f}'.format(p, record['phases'].get(p, 0))
+                         for p in phases.PHASES)
+        rss = record['peak_rss']
+        lines.append('{0:6.2f}s {1:>7} {2:5} {3} {4}'.format(
+            record['wall'],
+            '-' if rss is None else '{0}M'.format(rss >> 20),
+            record['status'], record['example'], times))
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m zoo.batch',
+                                     description=__doc__.split('\n')[1])
+    parser.add_argument('patterns', nargs='*',
+                        help='run only examples whose name matches')
+    parser.add_argument('-d', '--data-dir',
+                        default=os.environ.get('HDFEOS_ZOO_DIR', '.'),
+                        help='data files (default $HDFEOS_ZOO_DIR or .)')
+    parser.add_argument('-o', '--report', default='zoo-batch.json',
+                        help='JSON report (default %(default)s)')
+    parser.add_argument('--output-dir', default='zoo-batch',
+                        help='figures (default %(default)s)')
+    parser.add_argument('-j', '--processes', type=int, default=None,
+                        help='worker processes (default: one per CPU)')
+    args = parser.parse_args(argv)
+
+    start = time.time()
+    examples = discover(args.patterns)
+    records = run(examples, args.data_dir, args.output_dir, args.processes)
+    report = {'data_dir': os.path.abspath(args.data_dir),
+              'processes': args.processes or multiprocessing.cpu_count(),
+              'wall': time.time() - start,
+              'examples': records}
+    with open(args.report, 'w') as fh:
+        json.dump(report, fh, indent=1, sort_keys=True)
+    for line in summary(records):
+        print(line)
+    return 1 if any(r['status'] == 'error' for r in records) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,448 @@
+"""
+A catalog of where and when the granules under a directory are, to find
+those over a region without opening the others.
+
+    >>> with zoo.catalog.Catalog() as catalog:
+    ...     catalog.update('/data/zoo')
+    ...     files = catalog.query((-125, 24, -66, 50),
+    ...                           datetime.date(2007, 9, 1),
+    ...                           datetime.date(2007, 9, 30))
+
+    $ python -m zoo.catalog update /data/zoo
+    $ python -m zoo.catalog query --bbox -125 24 -66 50 --start 2007-09-01
+
+footprint() opens a granule once and works out longitude/latitude boxes
+around it:  from a lattice of points of each grid in its StructMetadata,
+from a strided sample of the geolocation of its swath (or of the latitude
+and longitude of a point product), or from the eos2dump output next to it.
+A box that would span more than half the globe but does not need to is
+split in two at the dateline.  The time range comes from the RANGEBEGINNING
+and RANGEENDING of the CoreMetadata, or else from the A2007257 (.HHMM) in
+the file's name.
+
+The catalog is an SQLite database, $HDFEOS_ZOO_CACHE/catalog.sqlite by
+default, with the boxes in an R-tree over longitude, latitude and time, so
+a query over hundreds of thousands of granules takes milliseconds.
+update() only looks again at files whose size or modification time
+changed, and drops files that are gone.
+"""
+
+import argparse
+import calendar
+import datetime
+import os
+import re
+import sqlite3
+import sys
+
+import numpy as np
+
+from .io import cache
+
+# Files looked at by update(), by extension.
+EXTENSIONS = ('.hdf', '.h4', '.hdf4', '.he2', '.h5', '.hdf5', '.he5', '.nc',
+              '.nc4')
+
+# Points along each side of the lattice sampled for a footprint.
+SAMPLES = 64
+
+# Names of latitude and longitude variables of products without swaths.
+LATLON_NAMES = (('latitude', 'longitude'), ('lat', 'lon'),
+                ('retrieval_latitude', 'retrieval_longitude'))
+
+# Time range, in the R-tree, of granules with no time.
+_NO_TIME = (-1e38, 1e38)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS granules (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER,
+    mtime REAL,
+    begin_time REAL,
+    end_time REAL,
+    kind TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS boxes USING rtree(
+    id, west, east, south, north, begin_time, end_time
+);
+"""
+
+_RANGE = re.compile(r'OBJECT\s*=\s*RANGE(BEGINNING|ENDING)(DATE|TIME)\s.*?'
+                    r'VALUE\s*=\s*"?([^"\s]+)"?', re.S)
+_NAME_TIME = re.compile(r'(?:^|\.)A(\d{4})(\d{3})(?:\.(\d{4}))?\.')
+
+
+def _seconds(value):
+    """
+    Seconds since 1970 of a date, a datetime (taken as UTC) or a number.
+    """
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime(value.year, value.month, value.day)
+    return calendar.timegm(value.timetuple()) + value.microsecond * 1e-6
+
+
+def time_range(f):
+    """
+    (begin, end) in seconds since 1970 of an open zoo.io.File, or None.
+    """
+    from .io.structmetadata import text_of
+
+    try:
+        text = text_of(f, 'CoreMetadata')
+    except KeyError:
+        text = ''
+    values = {}
+    for which, part, value in _RANGE.findall(text):
+        values[which, part] = value
+    if ('BEGINNING', 'DATE') in values and ('ENDING', 'DATE') in values:
+        times = []
+        for which in ('BEGINNING', 'ENDING'):
+            day = values[which, 'DATE']
+            clock = values.get((which, 'TIME'), '00:00:00').split('.')[0]
+            try:
+                stamp = datetime.datetime.strptime(day + ' ' + clock,
+                                                   '%Y-%m-%d %H:%M:%S')
+            except ValueError:
+                break
+            times.append(_seconds(stamp))
+        else:
+            return tuple(times)
+
+    match = _NAME_TIME.search(os.path.basename(f.filename))
+    if match is None:
+        return None
+    year, day, hhmm = match.groups()
+    begin = _seconds(datetime.datetime(int(year), 1, 1) +
+                     datetime.timedelta(int(day) - 1))
+    if hhmm is None:
+        return begin, begin + 86400.0
+    begin += int(hhmm[:2]) * 3600 + int(hhmm[2:]) * 60
+    return begin, begin + 300.0
+
+
+def boxes(lon, lat):
+    """
+    (west, east, south, north) boxes holding the points, one, or two when
+    they are better split at the dateline.  Fill and NaN are left out.
+    """
+    lon = np.asarray(lon, dtype=np.float64).ravel()
+    lat = np.asarray(lat, dtype=np.float64).ravel()
+    with np.errstate(invalid='ignore'):
+        ok = ((np.abs(lat) <= 90) & (lon >= -180) & (lon <= 360))
+    if not ok.any():
+        return []
+    lon = np.unique((lon[ok] + 180) % 360 - 180)
+    south, north = float(lat[ok].min()), float(lat[ok].max())
+    west, east = float(lon[0]), float(lon[-1])
+    if lon.size > 1:
+        # The points span the circle but for its widest gap;  if that gap
+        # is not the one across the dateline, the span crosses it.
+        gaps = np.diff(lon)
+        widest = int(gaps.argmax())
+        if gaps[widest] > west + 360 - east:
+            return [(float(lon[widest + 1]), 180.0, south, north),
+                    (-180.0, float(lon[widest]), south, north)]
+    return [(west, east, south, north)]
+
+
+def _grid_points(meta):
+    from .geo import gctp
+
+    lons, lats = [], []
+    for grid in meta.grids.values():
+        if (grid.projection not in gctp.PROJECTIONS or
+                grid.projection == 'SOM' or grid.upper_left is None or
+                grid.lower_right is None):
+            continue
+        (x0, y0), (x1, y1) = grid.upper_left, grid.lower_right
+        x = np.linspace(x0, x1, SAMPLES)
+        y = np.linspace(y0, y1, SAMPLES)
+        lon, lat = gctp.inverse(grid.projection, grid.proj_params,
+                                x[np.newaxis, :], y[:, np.newaxis],
+                                grid.sphere_code)
+        lons.append(lon)
+        lats.append(lat)
+    return lons, lats
+
+
+def _sample(var):
+    """
+    Every so many values of a latitude or longitude variable, with its
+    last row and column, read as strided hyperslabs.
+    """
+    shape = var.shape[:2]
+    extra = (0,) * (var.ndim - len(shape))
+    steps = [max(1, (n - 1) // (SAMPLES - 1)) for n in shape]
+    key = tuple(slice(None, None, s) for s in steps)
+    parts = [var[key + extra].ravel(), var[(-1,) + key[1:] + extra].ravel()]
+    if len(shape) > 1:
+        parts.append(var[(key[0], -1) + extra].ravel())
+    return np.concatenate(parts)
+
+
+def _latlon_vars(f, meta):
+    """
+    The latitude and longitude variables of a file, or None.
+    """
+    candidates = []
+    if meta is not None:
+        for swath in meta.swaths.values():
+            names = dict((n.lower(), n) for n in swath.geo_fields)
+            if 'latitude' in names and 'longitude' in names:
+                candidates.append((names['latitude'], names['longitude']))
+                prefix = '/HDFEOS/SWATHS/{0}/Geolocation Fields/'.format(
+                    swath.name)
+                candidates.append((prefix + names['latitude'],
+                                   prefix + names['longitude']))
+    for lat_name, lon_name in candidates:
+        if lat_name in f and lon_name in f:
+            return f[lat_name], f[lon_name]
+    by_name = dict((name.rstrip('/').split('/')[-1].lower(), name)
+                   for name in sorted(f.variables))
+    for lat_name, lon_name in LATLON_NAMES:
+        if lat_name in by_name and lon_name in by_name:
+            return f[by_name[lat_name]], f[by_name[lon_name]]
+    return None
+
+
+def _dumper_files(filename):
+    """
+    The lat_*.output and lon_*.output eos2dump wrote for a granule, or
+    None.
+    """
+    directory, name = os.path.split(filename)
+    try:
+        names = os.listdir(directory or '.')
+    except OSError:
+        return None
+    for candidate in sorted(names):
+        if not (candidate.startswith('lat_') and
+                candidate.endswith('.output')):
+            continue
+        stem = candidate[4:-len('.output')]
+        lon = 'lon_' + candidate[4:]
+        if stem and name.startswith(stem) and lon in names:
+            return (os.path.join(directory, candidate),
+                    os.path.join(directory, lon))
+    return None
+
+
+def footprint(filename):
+    """
+    Where and when a granule is.
+
+    Returns
+    -------
+    kind : str
+        'grid', 'swath' or 'dumper', after where the boxes came from, or
+        None when no geolocation was found.
+    boxes : list
+        (west, east, south, north) boxes in degrees.
+    times : tuple or None
+        (begin, end) in seconds since 1970.
+    """
+    from .io import dumper, open_file
+    from .io.structmetadata import structmetadata
+
+    kind, lon, lat = None, None, None
+    with open_file(filename) as f:
+        times = time_range(f)
+        try:
+            meta = structmetadata(f)
+        except KeyError:
+            meta = None
+        if meta is not None:
+            lons, lats = _grid_points(meta)
+            if lons:
+                kind = 'grid'
+                lon = np.concatenate([a.ravel() for a in lons])
+                lat = np.concatenate([a.ravel() for a in lats])
+        if kind is None:
+            pair = _latlon_vars(f, meta)
+            if pair is not None:
+                kind = 'swath'
+                lat, lon = _sample(pair[0]), _sample(pair[1])
+    if kind is None:
+        files = _dumper_files(filename)
+        if files is not None:
+            kind = 'dumper'
+            lat, lon = (np.asarray(dumper.load(name))[::97] for name in files)
+    if kind is None:
+        return None, [], times
+    return kind, boxes(lon, lat), times
+
+
+class Catalog(object):
+    """
+    Footprints of granules, in an SQLite database at path (by default
+    catalog.sqlite in the cache directory, see zoo.io.cache).
+    """
+    def __init__(self, path=None):
+        if path is None:
+            path = os.path.join(cache.cache_dir(), 'catalog.sqlite')
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(_SCHEMA)
+
+    def __repr__(self):
+        return "<Catalog {0!r}: {1} granules>".format(self.path, len(self))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def __len__(self):
+        return self.db.execute('SELECT count(*) FROM granules').fetchone()[0]
+
+    def _remove(self, ids):
+        for granule in ids:
+            self.db.execute('DELETE FROM boxes WHERE id IN (?, ?)',
+                            (2 * granule, 2 * granule + 1))
+            self.db.execute('DELETE FROM granules WHERE id = ?', (granule,))
+
+    def add(self, filename):
+        """
+        Catalog one file, again if it was already there.
+        """
+        path = os.path.abspath(filename)
+        st = os.stat(path)
+        try:
+            kind, found, times = footprint(path)
+        except Exception:
+            # Not a file the zoo can read;  remember it all the same, so
+            # that it is not opened again until it changes.
+            kind, found, times = None, [], None
+        row = self.db.execute('SELECT id FROM granules WHERE path = ?',
+                              (path,)).fetchone()
+        if row is not None:
+            self._remove([row[0]])
+        begin, end = times if times is not None else (None, None)
+        cursor = self.db.execute(
+            'INSERT INTO granules (path, size, mtime, begin_time, end_time, '
+            'kind) VALUES (?, ?, ?, ?, ?, ?)',
+            (path, st.st_size, st.st_mtime, begin, end, kind))
+        granule = cursor.lastrowid
+        for part, box in enumerate(found[:2]):
+            self.db.execute(
+                'INSERT INTO boxes VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (2 * granule + part,) + tuple(box) +
+                (times if times is not None else _NO_TIME))
+        return kind
+
+    def update(self, root, commit_every=1000):
+        """
+        Catalog the files under root that are new or changed since the last
+        update, and forget those that are gone.  Returns the number of
+        files (re)cataloged and forgotten.
+        """
+        root = os.path.abspath(root)
+        known = {}
+        prefix = os.path.join(root, '')
+        for granule, path, size, mtime in self.db.execute(
+                'SELECT id, path, size, mtime FROM granules'):
+            if path.startswith(prefix):
+                known[path] = (granule, size, mtime)
+
+        added = 0
+        for directory, _, names in os.walk(root):
+            for name in sorted(names):
+                if not name.lower().endswith(EXTENSIONS):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                old = known.pop(path, None)
+                if old is not None and old[1:] == (st.st_size, st.st_mtime):
+                    continue
+                self.add(path)
+                added += 1
+                if added % commit_every == 0:
+                    self.db.commit()
+        self._remove(granule for granule, _, _ in known.values())
+        self.db.commit()
+        return added, len(known)
+
+    def query(self, bbox=None, start=None, end=None):
+        """
+        Paths of the granules whose boxes meet bbox, given as (west,
+        south, east, north) in degrees with west > east across the
+        dateline, and whose time range meets [start, end].  Times are
+        dates, datetimes in UTC or seconds since 1970;  None leaves that
+        side open.
+        """
+        if bbox is None:
+            bbox = (-180, -90, 180, 90)
+        west, south, east, north = bbox
+        if west > east:
+            boxes = [(west, south, 180, north), (-180, south, east, north)]
+        else:
+            boxes = [(west, south, east, north)]
+        start = _seconds(start)
+        end = _seconds(end)
+        t0 = _NO_TIME[0] if start is None else start
+        t1 = _NO_TIME[1] if end is None else end
+
+        paths = set()
+        for w, s, e, n in boxes:
+            rows = self.db.execute(
+                'SELECT g.path FROM boxes AS b JOIN granules AS g '
+                'ON g.id = b.id / 2 '
+                'WHERE b.west <= ? AND b.east >= ? AND b.south <= ? '
+                'AND b.north >= ? AND b.begin_time <= ? AND b.end_time >= ? '
+                'AND (g.begin_time IS NULL OR '
+                '(g.begin_time <= ? AND g.end_time >= ?))',
+                (e, w, n, s, t1, t0, t1, t0))
+            paths.update(path for path, in rows)
+        return sorted(paths)
+
+
+def _date(text):
+    return datetime.datetime.strptime(text, '%Y-%m-%d')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m zoo.catalog',
+                                     description=__doc__.split('\n')[1])
+    parser.add_argument('--catalog', default=None,
+                        help='database (default in the cache directory)')
+    commands = parser.add_subparsers(dest='command')
+    update = commands.add_parser('update', help='catalog a directory')
+    update.add_argument('root', nargs='?',
+                        default=os.environ.get('HDFEOS_ZOO_DIR', '.'),
+                        help='directory (default $HDFEOS_ZOO_DIR or .)')
+    query = commands.add_parser('query', help='list granules')
+    query.add_argument('--bbox', nargs=4, type=float,
+                       metavar=('WEST', 'SOUTH', 'EAST', 'NORTH'))
+    query.add_argument('--start', type=_date, help='YYYY-MM-DD')
+    query.add_argument('--end', type=_date, help='YYYY-MM-DD')
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_usage()
+        return 2
+
+    with Catalog(args.catalog) as catalog:
+        if args.command == 'update':
+            added, removed = catalog.update(args.root)
+            print('{0} cataloged, {1} forgotten, {2} in all'.format(
+                added, removed, len(catalog)))
+        else:
+            end = args.end
+            if end is not None:
+                end += datetime.timedelta(days=1)
+            for path in catalog.query(args.bbox, args.start, end):
+                print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
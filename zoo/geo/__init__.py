@@ -0,0 +1,37 @@
+"""
+Geolocation for the zoo examples.
+
+    >>> import zoo.geo
+    >>> geo = zoo.geo.grid_geolocator(hdffile, 'sur_refl_b01_1')
+    >>> lon, lat = geo[:]
+
+grid_geolocator() computes the longitude and latitude of HDF-EOS grid cells
+from the grid's GCTP projection (sinusoidal, Lambert azimuthal, polar
+stereographic, Albers, cylindrical equal area or geographic), only for the
+window asked for, and caches the result.  som_geolocator() does the same
+for the Space Oblique Mercator blocks of MISR grids.
+
+modis_geolocation() interpolates the 1 km (or 5 km) geolocation of a MODIS
+swath to the resolution of a 500 m or 250 m field, scan by scan.
+swath_geolocation() does the same for the 5 km tie points of level 2
+swaths, following their dimension maps, or reads the 1 km geolocation of
+the granule's MOD03/MYD03 file once for all its products.
+
+to_lonlat() converts projected coordinates with a cached pyproj transformer,
+a block of rows at a time and into float32 unless asked otherwise.
+
+Binner accumulates the pixels of any number of swath granules into the
+cells of a TargetGrid (equal angle, MODIS sinusoidal or EASE-Grid) and
+gives their mean, min, max, count or standard deviation, holding only the
+accumulators in memory.
+
+swath_subset() reads only the rows of a swath field whose geolocation
+crosses a longitude/latitude box, a hyperslab per run of rows.
+"""
+from .binning import Binner, TargetGrid, bin_swaths
+from .grid import GridGeolocator, grid_geolocator
+from .interp import modis_geolocation, scan_interpolate
+from .misr import SOMGeolocator, som_geolocator
+from .proj import to_lonlat
+from .subset import swath_rows, swath_subset
+from .swath import swath_geolocation
@@ -0,0 +1,238 @@
+"""
+Bin swath pixels onto a regular grid, one granule at a time.
+
+    >>> grid = zoo.geo.TargetGrid.equal_angle(0.25)
+    >>> binner = zoo.geo.Binner(grid, reducers=('mean', 'std', 'count'))
+    >>> for lon, lat, data in granules:
+    ...     binner.add(lon, lat, data)
+    >>> mean = binner.result('mean')
+
+A TargetGrid is a grid of square cells in a GCTP projection:  equal angle
+(GEO), the sinusoidal of the MODIS land grids, or the global EASE-Grid
+cylindrical equal area of AMSR-E and SSM/I level 3 products.  Binner keeps
+only per-cell accumulators, so any number of granules can be binned in the
+memory of the grid;  each add() finds the cells of a granule's pixels with
+gctp.forward() and scatters the values into the accumulators with
+np.bincount and ufunc.reduceat rather than a Python loop.  Standard
+deviations are merged granule by granule with Chan's formula, which does not
+lose precision as sums of squares do.
+"""
+
+import numpy as np
+
+from . import gctp
+
+REDUCERS = ('mean', 'min', 'max', 'count', 'std')
+
+# Earth radius of the MODIS sinusoidal grids, and of the EASE-Grid sphere.
+SINUSOIDAL_RADIUS = 6371007.181
+EASE_RADIUS = 6371228.0
+
+
+class TargetGrid(object):
+    """
+    shape cells of cell projection units (degrees for GEO) with the upper
+    left corner of the upper left cell at (left, top).
+    """
+    def __init__(self, projection, params, left, top, cell, shape):
+        self.projection = projection
+        self.params = tuple(params)
+        self.left = float(left)
+        self.top = float(top)
+        self.cell = float(cell)
+        self.shape = tuple(int(n) for n in shape)
+
+    def __repr__(self):
+        return 'TargetGrid({0!r}, {1}x{2}, cell={3:g})'.format(
+            self.projection, self.shape[0], self.shape[1], self.cell)
+
+    @classmethod
+    def equal_angle(cls, resolution, extent=(-180, 180, -90, 90)):
+        """
+        A latitude-longitude grid of resolution degrees over extent, given
+        as (west, east, south, north).
+        """
+        west, east, south, north = extent
+        shape = (int(round((north - south) / resolution)),
+                 int(round((east - west) / resolution)))
+        return cls('GEO', (), west, north, resolution, shape)
+
+    @classmethod
+    def sinusoidal(cls, cell=926.625433, tile=None):
+        """
+        The MODIS sinusoidal grid with cells of cell metres (463.3127165
+        for 500 m, 926.625433 for 1 km products), global or of one tile
+        given as (h, v).
+        """
+        half_width = np.pi * SINUSOIDAL_RADIUS
+        side = 2 * half_width / 36
+        left, top = -half_width, half_width / 2
+        if tile is None:
+            shape = (int(round(half_width / cell)),
+                     int(round(2 * half_width / cell)))
+        else:
+            left += tile[0] * side
+            top -= tile[1] * side
+            n = int(round(side / cell))
+            shape = (n, n)
+        params = (SINUSOIDAL_RADIUS,) + (0.0,) * 12
+        return cls('SNSOID', params, left, top, cell, shape)
+
+    @classmethod
+    def ease(cls, cell=25067.525):
+        """
+        The global EASE-Grid, cylindrical equal area with true scale at 30
+        degrees, with cells of cell metres (1383 by 586 of 25 km).
+        """
+        cos_ts = np.cos(np.radians(30))
+        width = 2 * np.pi * EASE_RADIUS * cos_ts
+        height = 2 * EASE_RADIUS / cos_ts
+        shape = (int(height / cell), int(round(width / cell)))
+        params = (EASE_RADIUS, 0, 0, 0, 0, 30000000.0) + (0.0,) * 7
+        return cls('CEA', params, -shape[1] * cell / 2, shape[0] * cell / 2,
+                   cell, shape)
+
+    @property
+    def x(self):
+        """
+        Projection coordinates of the centres of the columns.
+        """
+        return self.left + self.cell * (np.arange(self.shape[1]) + 0.5)
+
+    @property
+    def y(self):
+        """
+        Projection coordinates of the centres of the rows.
+        """
+        return self.top - self.cell * (np.arange(self.shape[0]) + 0.5)
+
+    def lonlat(self):
+        """
+        Longitude and latitude of the cell centres, as 2D arrays.
+        """
+        return gctp.inverse(self.projection, self.params,
+                            self.x[np.newaxis, :], self.y[:, np.newaxis])
+
+    def index(self, lon, lat):
+        """
+        Flat index of the cell of each point, and whether it is in the grid
+        at all;  the index of points outside is 0.
+        """
+        x, y = gctp.forward(self.projection, self.params, lon, lat)
+        if self.projection == 'GEO':
+            x = (x - self.left) % 360.0 + self.left
+        with np.errstate(invalid='ignore'):
+            col = np.floor((x - self.left) / self.cell)
+            row = np.floor((self.top - y) / self.cell)
+            inside = ((col >= 0) & (col < self.shape[1]) &
+                      (row >= 0) & (row < self.shape[0]))
+        index = np.zeros(inside.shape, dtype=np.intp)
+        index[inside] = (row[inside] * self.shape[1] + col[inside])
+        return index, inside
+
+
+class Binner(object):
+    """
+    Accumulates values into the cells of grid for the reducers asked for
+    (of 'mean', 'min', 'max', 'count' and 'std').
+    """
+    def __init__(self, grid, reducers=('mean',)):
+        unknown = set(reducers) - set(REDUCERS)
+        if unknown:
+            msg = "Unknown reducers {0};  expected some of {1}."
+            raise ValueError(msg.format(sorted(unknown), REDUCERS))
+        self.grid = grid
+        self.reducers = tuple(reducers)
+        size = grid.shape[0] * grid.shape[1]
+        self.count = np.zeros(size, dtype=np.int64)
+        self.mean = None
+        self.m2 = None
+        self.min = None
+        self.max = None
+        if 'mean' in reducers or 'std' in reducers:
+            self.mean = np.zeros(size)
+        if 'std' in reducers:
+            self.m2 = np.zeros(size)
+        if 'min' in reducers:
+            self.min = np.full(size, np.inf)
+        if 'max' in reducers:
+            self.max = np.full(size, -np.inf)
+
+    def add(self, lon, lat, values):
+        """
+        Bin a granule:  values, a masked or plain array, and the longitude
+        and latitude of each of its pixels.  Masked and NaN values, and
+        pixels outside the grid, are left out.
+        """
+        values = np.ma.asarray(values)
+        data = values.filled(np.nan).astype(np.float64).ravel()
+        lon, lat = (np.broadcast_to(a, values.shape).ravel()
+                    for a in (lon, lat))
+        valid = np.isfinite(data)
+        index, inside = self.grid.index(lon[valid], lat[valid])
+        index = index[inside]
+        data = data[valid][inside]
+        if index.size == 0:
+            return
+
+        size = self.count.size
+        n = np.bincount(index, minlength=size)
+        if self.mean is not None:
+            hit = n > 0
+            mean = np.zeros(size)
+            mean[hit] = np.bincount(index, weights=data,
+                                    minlength=size)[hit] / n[hit]
+            total = self.count + n
+            delta = mean - self.mean
+            if self.m2 is not None:
+                m2 = np.bincount(index, weights=(data - mean[index]) ** 2,
+                                 minlength=size)
+                self.m2[hit] += m2[hit] + (delta[hit] ** 2 *
+                                           self.count[hit] * n[hit] /
+                                           total[hit])
+            self.mean[hit] += delta[hit] * n[hit] / total[hit]
+        self.count += n
+
+        if self.min is not None or self.max is not None:
+            order = np.argsort(index, kind='stable')
+            index = index[order]
+            data = data[order]
+            starts = np.flatnonzero(np.r_[True, index[1:] != index[:-1]])
+            cells = index[starts]
+            if self.min is not None:
+                self.min[cells] = np.minimum(
+                    self.min[cells], np.minimum.reduceat(data, starts))
+            if self.max is not None:
+                self.max[cells] = np.maximum(
+                    self.max[cells], np.maximum.reduceat(data, starts))
+
+    def result(self, reducer):
+        """
+        The grid of a reducer:  a masked array, masked where no values fell,
+        or for 'count' an int64 array.  'std' is the population standard
+        deviation.
+        """
+        if reducer not in self.reducers:
+            msg = "{0!r} is not one of this Binner's reducers {1}."
+            raise ValueError(msg.format(reducer, self.reducers))
+        if reducer == 'count':
+            return self.count.reshape(self.grid.shape)
+        empty = self.count == 0
+        if reducer == 'std':
+            with np.errstate(invalid='ignore', divide='ignore'):
+                values = np.sqrt(self.m2 / self.count)
+        else:
+            values = getattr(self, reducer)
+        values = np.ma.masked_array(values, mask=empty, copy=True)
+        return values.reshape(self.grid.shape)
+
+
+def bin_swaths(granules, grid, reducers=('mean',)):
+    """
+    Bin (lon, lat, values) of each granule from an iterable, which may be a
+    generator reading them one at a time, and return the Binner.
+    """
+    binner = Binner(grid, reducers)
+    for lon, lat, values in granules:
+        binner.add(lon, lat, values)
+    return binner
@@ -0,0 +1,416 @@
+"""
+Inverse GCTP projections, vectorized over numpy arrays.
+
+HDF-EOS grids describe their projection with a GCTP code (SNSOID, LAMAZ,
+PS, ALBERS, CEA, SOM, GEO), thirteen ProjParams and a SphereCode.  inverse()
+turns projection coordinates in meters into longitude and latitude in
+degrees, following the GCTP conventions for those parameters:  angles are in
+packed DMS, ProjParams[0:2] give the ellipsoid unless SphereCode selects
+one, and ProjParams[6:8] are the false easting and northing.  forward()
+goes the other way for the sinusoidal and the spherical cylindrical equal
+area, the projections zoo.geo.binning bins onto.
+
+Points that are outside the projection's domain come back as NaN.
+"""
+
+import numpy as np
+
+from ..io.structmetadata import dms_to_degrees
+
+# Semi-major and semi-minor axes of the GCTP spheroids, by SphereCode.
+SPHEROIDS = (
+    (6378206.4, 6356583.8),             # 0  Clarke 1866
+    (6378249.145, 6356514.86955),       # 1  Clarke 1880
+    (6377397.155, 6356078.96284),       # 2  Bessel
+    (6378157.5, 6356772.2),             # 3  International 1967
+    (6378388.0, 6356911.94613),         # 4  International 1909
+    (6378135.0, 6356750.519915),        # 5  WGS 72
+    (6377276.3452, 6356075.4133),       # 6  Everest
+    (6378145.0, 6356759.769356),        # 7  WGS 66
+    (6378137.0, 6356752.31414),         # 8  GRS 1980
+    (6377563.396, 6356256.91),          # 9  Airy
+    (6377304.063, 6356103.039),         # 10 Modified Everest
+    (6377340.189, 6356034.448),         # 11 Modified Airy
+    (6378137.0, 6356752.314245),        # 12 WGS 84
+    (6378155.0, 6356773.3205),          # 13 Southeast Asia
+    (6378160.0, 6356774.719),           # 14 Australian National
+    (6378245.0, 6356863.0188),          # 15 Krassovsky
+    (6378270.0, 6356794.343479),        # 16 Hough
+    (6378166.0, 6356784.283666),        # 17 Mercury 1960
+    (6378150.0, 6356768.337303),        # 18 Modified Mercury 1968
+    (6370997.0, 6370997.0),             # 19 Sphere of radius 6370997
+)
+
+
+def spheroid(params, sphere_code=None):
+    """
+    (semi-major axis, eccentricity squared) for a grid, as GCTP decides:
+    a non-negative SphereCode picks a spheroid from the table, otherwise
+    ProjParams[0] is the semi-major axis and ProjParams[1] is either the
+    semi-minor axis (> 1), the eccentricity squared (<= 1) or zero for a
+    sphere.
+    """
+    if sphere_code is not None and sphere_code >= 0:
+        major, minor = SPHEROIDS[int(sphere_code)]
+    else:
+        major = abs(params[0]) if len(params) > 0 else 0.0
+        minor = abs(params[1]) if len(params) > 1 else 0.0
+        if major == 0:
+            major, minor = SPHEROIDS[0]
+        elif minor == 0:
+            minor = major
+        elif minor <= 1:
+            minor = np.sqrt(1.0 - minor) * major
+    return major, 1.0 - (minor / major) ** 2
+
+
+def _param(params, i, angle=False):
+    value = params[i] if len(params) > i else 0.0
+    if angle:
+        return np.radians(dms_to_degrees(value))
+    return float(value)
+
+
+def _sinusoidal(x, y, params, sphere_code):
+    radius = spheroid(params, sphere_code)[0]
+    lon0 = _param(params, 4, angle=True)
+    x = x - _param(params, 6)
+    y = y - _param(params, 7)
+
+    lat = y / radius
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dlon = x / (radius * np.cos(lat))
+    bad = (np.abs(lat) > np.pi / 2) | (np.abs(dlon) > np.pi)
+    lon = lon0 + dlon
+    lon[bad] = np.nan
+    lat[bad] = np.nan
+    return lon, lat
+
+
+def _lambert_azimuthal(x, y, params, sphere_code):
+    radius = spheroid(params, sphere_code)[0]
+    lon0 = _param(params, 4, angle=True)
+    lat0 = _param(params, 5, angle=True)
+    x = x - _param(params, 6)
+    y = y - _param(params, 7)
+
+    rho = np.hypot(x, y)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        c = 2.0 * np.arcsin(rho / (2.0 * radius))
+        sin_c, cos_c = np.sin(c), np.cos(c)
+        ratio = np.where(rho > 0, sin_c / rho, 0.0)
+        lat = np.arcsin(cos_c * np.sin(lat0) + y * ratio * np.cos(lat0))
+    lon = lon0 + np.arctan2(x * sin_c,
+                            rho * np.cos(lat0) * cos_c
+                            - y * np.sin(lat0) * sin_c)
+    lon[np.isnan(lat)] = np.nan
+    return lon, lat
+
+
+def _phi_from_t(t, e, iterations=15):
+    """
+    Latitude from the isometric quantity t of the conformal projections
+    (Snyder 7-9), by fixed-point iteration.
+    """
+    phi = np.pi / 2 - 2.0 * np.arctan(t)
+    for _ in range(iterations):
+        es = e * np.sin(phi)
+        phi = np.pi / 2 - 2.0 * np.arctan(
+            t * ((1.0 - es) / (1.0 + es)) ** (e / 2.0))
+    return phi
+
+
+def _polar_stereographic(x, y, params, sphere_code):
+    a, es = spheroid(params, sphere_code)
+    e = np.sqrt(es)
+    lon0 = _param(params, 4, angle=True)
+    lat_ts = _param(params, 5, angle=True)
+    x = x - _param(params, 6)
+    y = y - _param(params, 7)
+
+    # Work in the northern hemisphere;  the south is its mirror image.
+    south = lat_ts < 0
+    if south:
+        x, y, lat_ts, lon0 = -x, -y, -lat_ts, -lon0
+
+    rho = np.hypot(x, y)
+    if np.isclose(lat_ts, np.pi / 2):
+        t = rho * np.sqrt((1 + e) ** (1 + e) * (1 - e) ** (1 - e)) / (2 * a)
+    else:
+        sin_ts = np.sin(lat_ts)
+        m_ts = np.cos(lat_ts) / np.sqrt(1 - es * sin_ts ** 2)
+        t_ts = (np.tan(np.pi / 4 - lat_ts / 2)
+                / ((1 - e * sin_ts) / (1 + e * sin_ts)) ** (e / 2))
+        t = rho * t_ts / (a * m_ts)
+    lat = _phi_from_t(t, e)
+    lon = lon0 + np.arctan2(x, -y)
+
+    if south:
+        lat, lon = -lat, -lon
+    return lon, lat
+
+
+def _q(sin_phi, e, es):
+    """
+    Snyder's q (3-12), the authalic quantity.
+    """
+    if e == 0:
+        return 2.0 * sin_phi
+    es_sin = e * sin_phi
+    return (1 - es) * (sin_phi / (1 - es_sin ** 2)
+                       - np.log((1 - es_sin) / (1 + es_sin)) / (2 * e))
+
+
+def _albers(x, y, params, sphere_code):
+    a, es = spheroid(params, sphere_code)
+    e = np.sqrt(es)
+    lat1 = _param(params, 2, angle=True)
+    lat2 = _param(params, 3, angle=True)
+    lon0 = _param(params, 4, angle=True)
+    lat0 = _param(params, 5, angle=True)
+    x = x - _param(params, 6)
+    y = y - _param(params, 7)
+
+    def m(phi):
+        return np.cos(phi) / np.sqrt(1 - es * np.sin(phi) ** 2)
+
+    q0, q1, q2 = (_q(np.sin(phi), e, es) for phi in (lat0, lat1, lat2))
+    m1, m2 = m(lat1), m(lat2)
+    if np.isclose(lat1, lat2):
+        n = np.sin(lat1)
+    else:
+        n = (m1 ** 2 - m2 ** 2) / (q2 - q1)
+    c = m1 ** 2 + n * q1
+    rho0 = a * np.sqrt(c - n * q0) / n
+
+    sign = 1.0 if n > 0 else -1.0
+    dy = rho0 - y
+    rho = sign * np.hypot(x, dy)
+    theta = np.arctan2(sign * x, sign * dy)
+    q = (c - (rho * n / a) ** 2) / n
+
+    with np.errstate(invalid='ignore'):
+        lat = np.arcsin(np.clip(q / 2.0, -1, 1))
+        if e > 0:
+            # Snyder 3-16.
+            for _ in range(15):
+                sin_phi = np.sin(lat)
+                one = 1 - es * sin_phi ** 2
+                lat = lat + one ** 2 / (2 * np.cos(lat)) * (
+                    q / (1 - es) - sin_phi / one
+                    + np.log((1 - e * sin_phi) / (1 + e * sin_phi)) / (2 * e))
+    lon = lon0 + theta / n
+    return lon, lat
+
+
+def _cylindrical_equal_area(x, y, params, sphere_code):
+    a, es = spheroid(params, sphere_code)
+    if es > 1e-12:
+        msg = "The ellipsoidal cylindrical equal area is not supported."
+        raise ValueError(msg)
+    lon0 = _param(params, 4, angle=True)
+    lat_ts = _param(params, 5, angle=True)
+    x = x - _param(params, 6)
+    y = y - _param(params, 7)
+
+    with np.errstate(invalid='ignore'):
+        lat = np.arcsin(y * np.cos(lat_ts) / a)
+    lon = lon0 + x / (a * np.cos(lat_ts))
+    lon[np.abs(lon - lon0) > np.pi] = np.nan
+    return lon, lat
+
+
+def _wrap(dlon):
+    return (dlon + np.pi) % (2 * np.pi) - np.pi
+
+
+def _sinusoidal_forward(lon, lat, params, sphere_code):
+    radius = spheroid(params, sphere_code)[0]
+    dlon = _wrap(lon - _param(params, 4, angle=True))
+    x = radius * dlon * np.cos(lat) + _param(params, 6)
+    y = radius * lat + _param(params, 7)
+    return x, y
+
+
+def _cylindrical_equal_area_forward(lon, lat, params, sphere_code):
+    a, es = spheroid(params, sphere_code)
+    if es > 1e-12:
+        msg = "The ellipsoidal cylindrical equal area is not supported."
+        raise ValueError(msg)
+    lat_ts = _param(params, 5, angle=True)
+    dlon = _wrap(lon - _param(params, 4, angle=True))
+    x = a * np.cos(lat_ts) * dlon + _param(params, 6)
+    y = a * np.sin(lat) / np.cos(lat_ts) + _param(params, 7)
+    return x, y
+
+
+def _som_coefficients(es, alf, p22):
+    """
+    Series coefficients of the Space Oblique Mercator (Snyder 1987, as in
+    PROJ's som.cpp), integrated over the orbit by Simpson's rule.
+    """
+    sa, ca = np.sin(alf), np.cos(alf)
+    if abs(ca) < 1e-9:
+        ca = 1e-9
+    one_es = 1 - es
+    esc, ess = es * ca * ca, es * sa * sa
+    w = ((1 - esc) / one_es) ** 2 - 1
+    q = ess / one_es
+    t = ess * (2 - es) / one_es ** 2
+    u = esc / one_es
+    xj = one_es ** 3
+
+    sums = dict(a2=0.0, a4=0.0, b=0.0, c1=0.0, c3=0.0)
+
+    def seraz0(lam, mult):
+        lam = np.radians(lam)
+        sdsq = np.sin(lam) ** 2
+        s = p22 * sa * np.cos(lam) * np.sqrt(
+            (1 + t * sdsq) / ((1 + w * sdsq) * (1 + q * sdsq)))
+        h = (np.sqrt((1 + q * sdsq) / (1 + w * sdsq))
+             * ((1 + w * sdsq) / (1 + q * sdsq) ** 2 - p22 * ca))
+        sq = np.sqrt(xj * xj + s * s)
+        fc = mult * (h * xj - s * s) / sq
+        sums['b'] += fc
+        sums['a2'] += fc * np.cos(2 * lam)
+        sums['a4'] += fc * np.cos(4 * lam)
+        fc = mult * s * (h + xj) / sq
+        sums['c1'] += fc * np.cos(lam)
+        sums['c3'] += fc * np.cos(3 * lam)
+
+    seraz0(0.0, 1.0)
+    for lam in (9.0, 27.0, 45.0, 63.0, 81.0):
+        seraz0(lam, 4.0)
+    for lam in (18.0, 36.0, 54.0, 72.0):
+        seraz0(lam, 2.0)
+    seraz0(90.0, 1.0)
+    return dict(sa=sa, ca=ca, w=w, q=q, t=t, u=u, xj=xj,
+                a2=sums['a2'] / 30, a4=sums['a4'] / 60, b=sums['b'] / 30,
+                c1=sums['c1'] / 15, c3=sums['c3'] / 45)
+
+
+def _space_oblique_mercator(x, y, params, sphere_code):
+    """
+    Space Oblique Mercator given by orbit parameters, as used by MISR:
+    ProjParams[3] is the inclination, [4] the longitude of the ascending
+    node and [8] the period in minutes.
+    """
+    a, es = spheroid(params, sphere_code)
+    alf = _param(params, 3, angle=True)
+    lon0 = _param(params, 4, angle=True)
+    p22 = _param(params, 8) / 1440.0
+    k = _som_coefficients(es, alf, p22)
+    sa, ca, xj = k['sa'], k['ca'], k['xj']
+    x = (x - _param(params, 6)) / a
+    y = (y - _param(params, 7)) / a
+
+    def s_of(lamdp):
+        sdsq = np.sin(lamdp) ** 2
+        return p22 * sa * np.cos(lamdp) * np.sqrt(
+            (1 + k['t'] * sdsq) / ((1 + k['w'] * sdsq) * (1 + k['q'] * sdsq)))
+
+    lamdp = x / k['b']
+    for _ in range(50):
+        s = s_of(lamdp)
+        previous = lamdp
+        lamdp = (x + y * s / xj - k['a2'] * np.sin(2 * lamdp)
+                 - k['a4'] * np.sin(4 * lamdp)
+                 - s / xj * (k['c1'] * np.sin(lamdp)
+                             + k['c3'] * np.sin(3 * lamdp))) / k['b']
+        if np.all(np.abs(lamdp - previous) < 1e-7):
+            break
+
+    sl = np.sin(lamdp)
+    fac = np.exp(np.sqrt(1 + s * s / xj / xj)
+                 * (y - k['c1'] * sl - k['c3'] * np.sin(3 * lamdp)))
+    phidp = 2 * (np.arctan(fac) - np.pi / 4)
+    dd = sl * sl
+    lamdp = np.where(np.abs(np.cos(lamdp)) < 1e-7, lamdp - 1e-7, lamdp)
+    spp = np.sin(phidp)
+    sppsq = spp * spp
+    with np.errstate(invalid='ignore', divide='ignore'):
+        lamt = np.arctan(
+            ((1 - sppsq / (1 - es)) * np.tan(lamdp) * ca
+             - spp * sa * np.sqrt((1 + k['q'] * dd) * (1 - sppsq)
+                                  - sppsq * k['u']) / np.cos(lamdp))
+            / (1 - sppsq * (1 + k['u'])))
+    sign = np.where(lamt >= 0, 1.0, -1.0)
+    scl = np.where(np.cos(lamdp) >= 0, 1.0, -1.0)
+    lamt = lamt - np.pi / 2 * (1 - scl) * sign
+    lon = lon0 + lamt - p22 * lamdp
+    if abs(sa) < 1e-7:
+        lat = np.arcsin(spp / np.sqrt((1 - es) ** 2 + sppsq))
+    else:
+        lat = np.arctan((np.tan(lamdp) * np.cos(lamt) - ca * np.sin(lamt))
+                        / ((1 - es) * sa))
+    return lon, lat
+
+
+_INVERSE = {
+    'SNSOID': _sinusoidal,
+    'LAMAZ': _lambert_azimuthal,
+    'PS': _polar_stereographic,
+    'ALBERS': _albers,
+    'CEA': _cylindrical_equal_area,
+    'SOM': _space_oblique_mercator,
+}
+
+_FORWARD = {
+    'SNSOID': _sinusoidal_forward,
+    'CEA': _cylindrical_equal_area_forward,
+}
+
+PROJECTIONS = ('GEO',) + tuple(sorted(_INVERSE))
+
+
+def inverse(projection, params, x, y, sphere_code=None):
+    """
+    Longitude and latitude, in degrees, of projection coordinates.
+
+    Parameters
+    ----------
+    projection : str
+        GCTP projection name without the GCTP_ prefix, e.g. 'SNSOID'.
+    params : sequence
+        The grid's ProjParams.
+    x, y : array_like
+        Projection coordinates, in meters (degrees for GEO).
+    sphere_code : int, optional
+        The grid's SphereCode.
+
+    Returns
+    -------
+    lon, lat : ndarray
+        float64 arrays of the broadcast shape of x and y.
+    """
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64),
+                               np.asarray(y, dtype=np.float64))
+    if projection == 'GEO':
+        return x.copy(), y.copy()
+    try:
+        func = _INVERSE[projection]
+    except KeyError:
+        msg = "Unsupported GCTP projection {0!r}."
+        raise ValueError(msg.format(projection))
+    lon, lat = func(x, y, tuple(params), sphere_code)
+    lon = np.degrees(lon)
+    # Keep longitudes in [-180, 180) like pyproj.
+    lon = (lon + 180.0) % 360.0 - 180.0
+    return lon, np.degrees(lat)
+
+
+def forward(projection, params, lon, lat, sphere_code=None):
+    """
+    Projection coordinates of longitudes and latitudes in degrees, the
+    inverse of inverse() for the projections in _FORWARD and GEO.
+    """
+    lon, lat = np.broadcast_arrays(np.asarray(lon, dtype=np.float64),
+                                   np.asarray(lat, dtype=np.float64))
+    if projection == 'GEO':
+        return lon.copy(), lat.copy()
+    try:
+        func = _FORWARD[projection]
+    except KeyError:
+        msg = "Unsupported GCTP projection {0!r} for forward()."
+        raise ValueError(msg.format(projection))
+    return func(np.radians(lon), np.radians(lat), tuple(params), sphere_code)
@@ -0,0 +1,163 @@
+"""
+Longitude and latitude of HDF-EOS grid cells, computed from StructMetadata.
+
+    >>> geo = zoo.geo.grid_geolocator(hdffile, 'sur_refl_b01_1')
+    >>> lon, lat = geo[::2, ::2]
+
+A GridGeolocator computes only the window it is asked for, straight from the
+grid's projection, so there is neither an eos2dump text file to read nor a
+full resolution meshgrid to push through pyproj.  Windows are cached by
+projection, parameters, corners, shape and window, so the many MODIS granules
+that share a tile share its geolocation too.
+"""
+
+import collections
+import threading
+
+import numpy as np
+
+from .. import phases
+from ..io import slicing
+from ..io.structmetadata import structmetadata
+from . import gctp
+
+# Budget for cached windows, in bytes.  One 4800x4800 float64 lon/lat pair
+# is about 370 MB.
+_CACHE_BYTES = 512 * 1024 * 1024
+_cache = collections.OrderedDict()
+_cache_nbytes = 0
+_cache_lock = threading.Lock()
+
+# Rows converted at a time, which bounds the float64 temporaries.
+_BLOCK_ROWS = 256
+
+
+def _cache_get(key):
+    with _cache_lock:
+        value = _cache.get(key)
+        if value is not None:
+            _cache.move_to_end(key)
+        return value
+
+
+def _cache_put(key, value):
+    global _cache_nbytes
+    nbytes = sum(a.nbytes for a in value)
+    if nbytes > _CACHE_BYTES:
+        return
+    with _cache_lock:
+        if key in _cache:
+            return
+        _cache[key] = value
+        _cache_nbytes += nbytes
+        while _cache_nbytes > _CACHE_BYTES:
+            _, old = _cache.popitem(last=False)
+            _cache_nbytes -= sum(a.nbytes for a in old)
+
+
+def clear_cache():
+    """
+    Forget all cached geolocation.
+    """
+    global _cache_nbytes
+    with _cache_lock:
+        _cache.clear()
+        _cache_nbytes = 0
+
+
+class GridGeolocator(object):
+    """
+    Lazy longitude/latitude of the cells of an HDF-EOS grid.
+
+    Index it like the grid's 2D fields;  the result is a (lon, lat) pair of
+    arrays of the shape the same index gives for a field.
+
+    Parameters
+    ----------
+    grid : zoo.io.structmetadata.Grid
+        The grid, from zoo.io.structmetadata(filename).grids[name].
+    dtype : numpy dtype
+        Type of the returned arrays.  The projection math is always done in
+        float64;  float32 halves the memory of the result.
+    """
+    def __init__(self, grid, dtype=np.float64):
+        if grid.projection == 'SOM':
+            msg = "Grid {0!r} is made of SOM blocks;  see zoo.geo.misr."
+            raise ValueError(msg.format(grid.name))
+        if grid.projection not in gctp.PROJECTIONS:
+            msg = "Unsupported GCTP projection {0!r} in grid {1!r}."
+            raise ValueError(msg.format(grid.projection, grid.name))
+        self.grid = grid
+        self.dtype = np.dtype(dtype)
+        self._key = (grid.projection, grid.proj_params, grid.sphere_code,
+                     grid.upper_left, grid.lower_right, grid.shape,
+                     grid.pixel_registration, self.dtype.str)
+
+    def __repr__(self):
+        return "<GridGeolocator {0!r} {1}>".format(self.grid.name,
+                                                   self.grid.projection)
+
+    @property
+    def shape(self):
+        return self.grid.shape
+
+    @phases.timed('geolocate')
+    def __getitem__(self, key):
+        return self.lonlat(key)
+
+    def lonlat(self, key=Ellipsis):
+        """
+        Longitude and latitude, in degrees, of grid[key].
+
+        New arrays are returned on every call, so they may be modified in
+        place (to shift longitudes across the dateline, for instance).
+        """
+        slab = slicing.plan(key, self.shape)
+        cache_key = self._key + (slab.start, slab.count, slab.stride)
+        value = _cache_get(cache_key)
+        if value is None:
+            value = self._compute(slab)
+            for a in value:
+                a.setflags(write=False)
+            _cache_put(cache_key, value)
+        return tuple(slab.finish(a.copy()) for a in value)
+
+    def _compute(self, slab):
+        grid = self.grid
+        rows, cols = [start + stride * np.arange(count)
+                      for start, count, stride
+                      in zip(slab.start, slab.count, slab.stride)]
+        shift = 0.0 if grid.pixel_registration == 'CORNER' else 0.5
+        dx, dy = grid.cell_size
+        x = grid.upper_left[0] + (cols + shift) * dx
+        y = grid.upper_left[1] + (rows + shift) * dy
+
+        lon = np.empty(slab.count, dtype=self.dtype)
+        lat = np.empty(slab.count, dtype=self.dtype)
+        for i in range(0, len(rows), _BLOCK_ROWS):
+            block = slice(i, i + _BLOCK_ROWS)
+            lon[block], lat[block] = gctp.inverse(
+                grid.projection, grid.proj_params, x[np.newaxis, :],
+                y[block, np.newaxis], grid.sphere_code)
+        return lon, lat
+
+
+def grid_geolocator(source, name, dtype=np.float64):
+    """
+    GridGeolocator for a grid of a file.
+
+    Parameters
+    ----------
+    source : str or zoo.io.File
+        The HDF-EOS file.
+    name : str
+        Either a grid name or the name of a data field of the grid.
+    dtype : numpy dtype
+        Type of the returned arrays.
+    """
+    meta = structmetadata(source)
+    grid = meta.grids.get(name) or meta.grid_of(name)
+    if grid is None:
+        msg = "No grid named {0!r} or holding a field {0!r}."
+        raise KeyError(msg.format(name))
+    return GridGeolocator(grid, dtype)
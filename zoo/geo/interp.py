@@ -0,0 +1,178 @@
+"""
+Scan-aware interpolation of MODIS swath geolocation to finer resolutions.
+
+    >>> lon, lat = zoo.geo.modis_geolocation(hdffile, 'EV_500_RefSB')
+
+MODIS scans 10 km along track at a time:  10 lines at 1 km, 20 at 500 m,
+40 at 250 m and 2 at 5 km.  Successive scans overlap away from nadir (the
+"bow-tie"), so geolocation must not be interpolated across a scan boundary.
+Here each scan is interpolated on its own, with linear extrapolation to the
+scan's first and last lines, and in 3D Cartesian coordinates so that the
+dateline and the poles need no special handling.  Only one scan of the
+coarse geolocation is held in float64 at a time.
+"""
+
+import numpy as np
+
+from .. import phases
+
+# Frames (1 km samples) in a MODIS scan line.
+MODIS_FRAMES = 1354
+
+# Along track extent of a MODIS scan, in 1 km lines.
+MODIS_SCAN_KM = 10
+
+
+def _axis(n_fine, n_coarse, factor, offset):
+    """
+    Left coarse neighbour and weight of each fine sample;  weights outside
+    [0, 1] extrapolate past the first and last coarse samples.
+    """
+    position = (np.arange(n_fine) - offset) / float(factor)
+    if n_coarse < 2:
+        return np.zeros(n_fine, dtype=np.intp), np.zeros(n_fine)
+    left = np.clip(np.floor(position).astype(np.intp), 0, n_coarse - 2)
+    return left, position - left
+
+
+def _to_xyz(lon, lat):
+    lon = np.radians(lon)
+    lat = np.radians(lat)
+    xyz = np.empty(lon.shape + (3,))
+    xyz[..., 0] = np.cos(lat) * np.cos(lon)
+    xyz[..., 1] = np.cos(lat) * np.sin(lon)
+    xyz[..., 2] = np.sin(lat)
+    return xyz
+
+
+def iter_scans(lon, lat, factor, scan_lines=MODIS_SCAN_KM, shape=None,
+               offset=None):
+    """
+    Interpolate coarse swath geolocation one scan at a time.
+
+    Yields (rows, lon, lat) where rows is the slice of fine lines the scan
+    covers and lon, lat are float64 arrays of shape (scan lines, columns).
+
+    Parameters
+    ----------
+    lon, lat : array_like or zoo.io.Variable
+        Coarse geolocation, in degrees.  Only one scan of it is read at a
+        time, so lazy variables stream from the file.
+    factor : int or (int, int)
+        Fine samples per coarse sample, along and across track (2 for 1 km
+        to 500 m, 4 for 1 km to 250 m, 5 for 5 km to 1 km).
+    scan_lines : int
+        Coarse lines in a scan.
+    shape : tuple, optional
+        Shape of the fine swath, by default the coarse one times factor.
+    offset : float or (float, float), optional
+        Fine coordinate of the centre of the first coarse sample, by default
+        (factor - 1) / 2 as for all MODIS resolutions.
+    """
+    nrows, ncols = lon.shape[-2:]
+    if nrows % scan_lines != 0:
+        msg = "{0} lines are not a whole number of {1} line scans."
+        raise ValueError(msg.format(nrows, scan_lines))
+    row_factor, col_factor = np.broadcast_to(factor, (2,)).tolist()
+    if offset is None:
+        offset = ((row_factor - 1) / 2.0, (col_factor - 1) / 2.0)
+    row_offset, col_offset = np.broadcast_to(offset, (2,)).tolist()
+    if shape is None:
+        shape = (nrows * row_factor, ncols * col_factor)
+    fine_lines = scan_lines * row_factor
+    if shape[0] != nrows // scan_lines * fine_lines:
+        msg = "{0} fine lines do not match {1} scans of {2} lines."
+        raise ValueError(msg.format(shape[0], nrows // scan_lines,
+                                    fine_lines))
+
+    row, row_weight = _axis(fine_lines, scan_lines, row_factor, row_offset)
+    col, col_weight = _axis(shape[1], ncols, col_factor, col_offset)
+    row_weight = row_weight[:, np.newaxis, np.newaxis]
+    col_weight = col_weight[np.newaxis, :, np.newaxis]
+    right = np.minimum(col + 1, ncols - 1)
+    below = np.minimum(row + 1, scan_lines - 1)
+
+    for scan in range(nrows // scan_lines):
+        lines = slice(scan * scan_lines, (scan + 1) * scan_lines)
+        xyz = _to_xyz(np.asarray(lon[lines], dtype=np.float64),
+                      np.asarray(lat[lines], dtype=np.float64))
+        # Across track first, then along track within the scan.
+        xyz = xyz[:, col] * (1 - col_weight) + xyz[:, right] * col_weight
+        xyz = xyz[row] * (1 - row_weight) + xyz[below] * row_weight
+        x, y, z = xyz[..., 0], xyz[..., 1], xyz[..., 2]
+        fine_lon = np.degrees(np.arctan2(y, x))
+        fine_lat = np.degrees(np.arctan2(z, np.hypot(x, y)))
+        rows = slice(scan * fine_lines, (scan + 1) * fine_lines)
+        yield rows, fine_lon, fine_lat
+
+
+@phases.timed('geolocate')
+def scan_interpolate(lon, lat, factor, scan_lines=MODIS_SCAN_KM, shape=None,
+                     offset=None, dtype=np.float32):
+    """
+    Interpolate coarse swath geolocation to a finer resolution, scan by
+    scan.  See iter_scans() for the parameters.
+
+    Returns
+    -------
+    lon, lat : numpy.ndarray
+        Fine geolocation of the requested dtype.
+    """
+    if shape is None:
+        row_factor, col_factor = np.broadcast_to(factor, (2,)).tolist()
+        shape = (lon.shape[-2] * row_factor, lon.shape[-1] * col_factor)
+    fine_lon = np.empty(shape, dtype=dtype)
+    fine_lat = np.empty(shape, dtype=dtype)
+    for rows, scan_lon, scan_lat in iter_scans(lon, lat, factor, scan_lines,
+                                               shape, offset):
+        fine_lon[rows] = scan_lon
+        fine_lat[rows] = scan_lat
+    return fine_lon, fine_lat
+
+
+@phases.timed('geolocate')
+def modis_geolocation(source, name, geo_source=None, dtype=np.float32):
+    """
+    Full resolution longitude and latitude of a MODIS swath field.
+
+    Parameters
+    ----------
+    source : str or zoo.io.File
+        The MODIS file holding the field.
+    name : str
+        The field, e.g. 'EV_500_RefSB' or 'EV_250_RefSB'.  Its last two
+        dimensions are taken as lines and frames.
+    geo_source : str or zoo.io.File, optional
+        A MOD03/MYD03 file to take the 1 km geolocation from.  By default the
+        Longitude and Latitude of source are used, 1 km in the 500 m and
+        250 m L1B files and 5 km in the 1 km L1B and most L2 files.
+    dtype : numpy dtype
+        Type of the returned arrays.
+    """
+    from ..io.reader import open_file
+
+    files = []
+    try:
+        if isinstance(source, str):
+            source = open_file(source)
+            files.append(source)
+        if geo_source is None:
+            geo_source = source
+        elif isinstance(geo_source, str):
+            geo_source = open_file(geo_source)
+            files.append(geo_source)
+
+        shape = source[name].shape[-2:]
+        lon = geo_source['Longitude']
+        lat = geo_source['Latitude']
+        coarse_km = int(round(MODIS_FRAMES / float(lon.shape[-1])))
+        scan_lines = MODIS_SCAN_KM // coarse_km
+        factor = shape[0] // lon.shape[-2]
+        if factor == 1 and tuple(shape) == tuple(lon.shape):
+            return (np.asarray(lon[:], dtype=dtype),
+                    np.asarray(lat[:], dtype=dtype))
+        return scan_interpolate(lon, lat, factor, scan_lines, shape,
+                                dtype=dtype)
+    finally:
+        for f in files:
+            f.close()
@@ -0,0 +1,145 @@
+"""
+Longitude and latitude of MISR Space Oblique Mercator (SOM) blocks.
+
+    >>> geo = zoo.geo.som_geolocator(hdffile, 'AlbedoLocal')
+    >>> lon, lat = geo[50]              # block 51, shape (XDim, YDim)
+
+A MISR grid is a stack of SOMBlockDim blocks laid along the orbit path.
+Inside a block, x runs along track (the XDim axis, line) and y across track
+(the YDim axis, sample).  Each block is shifted across track from the one
+before by the offset HDF-EOS keeps in the _BLKSOM:<grid> vdata, in pixels of
+the grid.  Only the blocks asked for are computed, and results are cached
+with the GridGeolocator windows, keyed by the path's projection parameters,
+the resolution and the offsets, so every product on the same path and
+resolution shares them.
+"""
+
+import numpy as np
+
+from .. import phases
+from ..io import slicing
+from ..io.structmetadata import structmetadata
+from . import gctp
+from .grid import _cache_get, _cache_put
+
+
+def block_offsets(source, grid_name):
+    """
+    Relative across-track offsets, in pixels, of blocks 2, 3, ... of a SOM
+    grid, from the _BLKSOM:<grid_name> vdata.
+    """
+    from ..io.reader import open_file
+
+    name = '_BLKSOM:' + grid_name
+    if isinstance(source, str):
+        with open_file(source) as f:
+            records = f.vdata(name)
+    else:
+        records = source.vdata(name)
+    return np.array([record[0] for record in records], dtype=np.float64)
+
+
+class SOMGeolocator(object):
+    """
+    Lazy longitude/latitude of the pixels of a MISR SOM grid.
+
+    Index it like the grid's (block, line, sample) fields;  the result is a
+    (lon, lat) pair of arrays of the shape the same index gives for a field.
+
+    Parameters
+    ----------
+    grid : zoo.io.structmetadata.Grid
+        A GCTP_SOM grid.
+    offsets : array_like
+        Relative block offsets, see block_offsets().
+    dtype : numpy dtype
+        Type of the returned arrays.
+    """
+    def __init__(self, grid, offsets, dtype=np.float64):
+        if grid.projection != 'SOM':
+            msg = "Grid {0!r} is {1}, not SOM."
+            raise ValueError(msg.format(grid.name, grid.projection))
+        self.grid = grid
+        self.offsets = np.asarray(offsets, dtype=np.float64)
+        self.nblocks = int(grid.dimensions.get('SOMBlockDim',
+                                               len(self.offsets) + 1))
+        if len(self.offsets) < self.nblocks - 1:
+            msg = "{0} blocks need {1} offsets, got {2}."
+            raise ValueError(msg.format(self.nblocks, self.nblocks - 1,
+                                        len(self.offsets)))
+        # Offset of each block from the first.
+        self.cumulative = np.concatenate(
+            ([0.0], np.cumsum(self.offsets[:self.nblocks - 1])))
+        self.dtype = np.dtype(dtype)
+        self._key = ('SOM', grid.proj_params, grid.sphere_code,
+                     grid.upper_left, grid.lower_right, self.shape,
+                     tuple(self.offsets), self.dtype.str)
+
+    def __repr__(self):
+        return "<SOMGeolocator {0!r} {1} blocks>".format(self.grid.name,
+                                                         self.nblocks)
+
+    @property
+    def shape(self):
+        return (self.nblocks, self.grid.xdim, self.grid.ydim)
+
+    @phases.timed('geolocate')
+    def __getitem__(self, key):
+        return self.lonlat(key)
+
+    def lonlat(self, key=Ellipsis):
+        """
+        Longitude and latitude, in degrees, of field[key].
+        """
+        slab = slicing.plan(key, self.shape)
+        cache_key = self._key + (slab.start, slab.count, slab.stride)
+        value = _cache_get(cache_key)
+        if value is None:
+            value = self._compute(slab)
+            for a in value:
+                a.setflags(write=False)
+            _cache_put(cache_key, value)
+        return tuple(slab.finish(a.copy()) for a in value)
+
+    def _compute(self, slab):
+        grid = self.grid
+        blocks, lines, samples = [start + stride * np.arange(count)
+                                  for start, count, stride
+                                  in zip(slab.start, slab.count, slab.stride)]
+        # x grows along track with the lines of successive blocks;  y is
+        # measured from the low corner, as MTK does, and grows with sample.
+        res_x = abs(grid.cell_size[0])
+        res_y = abs(grid.cell_size[1])
+        x0 = min(grid.upper_left[0], grid.lower_right[0])
+        y0 = min(grid.upper_left[1], grid.lower_right[1])
+
+        lon = np.empty(slab.count, dtype=self.dtype)
+        lat = np.empty(slab.count, dtype=self.dtype)
+        for i, block in enumerate(blocks):
+            x = x0 + (block * grid.xdim + lines + 0.5) * res_x
+            y = y0 + (self.cumulative[block] + samples + 0.5) * res_y
+            lon[i], lat[i] = gctp.inverse('SOM', grid.proj_params,
+                                          x[:, np.newaxis], y[np.newaxis, :],
+                                          grid.sphere_code)
+        return lon, lat
+
+
+def som_geolocator(source, name, dtype=np.float64):
+    """
+    SOMGeolocator for a MISR grid of a file.
+
+    Parameters
+    ----------
+    source : str or zoo.io.File
+        The MISR HDF-EOS file.
+    name : str
+        Either a grid name or the name of a data field of the grid.
+    dtype : numpy dtype
+        Type of the returned arrays.
+    """
+    meta = structmetadata(source)
+    grid = meta.grids.get(name) or meta.grid_of(name)
+    if grid is None:
+        msg = "No grid named {0!r} or holding a field {0!r}."
+        raise KeyError(msg.format(name))
+    return SOMGeolocator(grid, block_offsets(source, grid.name), dtype)
@@ -0,0 +1,126 @@
+"""
+Cached pyproj transformers and chunked transforms to longitude/latitude.
+
+    >>> lon, lat = zoo.geo.to_lonlat('+proj=laea +a=6371228 +lat_0=90', x, y)
+
+Building a pyproj transformer costs far more than using one, and the zoo
+scripts build the same few over and over.  transformer() keeps one per
+normalized definition (and per thread, as pyproj transformers must not be
+shared between threads).  to_lonlat() converts grid coordinates a block of
+rows at a time into preallocated arrays, float32 by default, so that
+neither a float64 meshgrid nor float64 results of the full grid are ever
+held at once.
+"""
+
+import threading
+
+import numpy as np
+
+from .. import phases
+
+# Points converted at a time;  bounds the float64 temporaries to 16 MB.
+_CHUNK = 1 << 20
+
+_local = threading.local()
+
+
+def normalize(definition):
+    """
+    Canonical form of a PROJ definition, given as a string or as a list of
+    '+key=value' arguments:  '+init=EPSG:4326' becomes 'EPSG:4326', and
+    '+' parameters are deduplicated (the first one wins, as in PROJ) and
+    sorted.  Anything else (EPSG codes, WKT) is returned stripped.
+    """
+    if not isinstance(definition, str):
+        definition = ' '.join(definition)
+    tokens = definition.split()
+    if not tokens or not all(t.startswith('+') for t in tokens):
+        return definition.strip()
+    params = {}
+    for token in tokens:
+        key = token.split('=', 1)[0].lower()
+        params.setdefault(key, token)
+    if list(params) == ['+init']:
+        return params['+init'].split('=', 1)[1].upper()
+    return ' '.join(sorted(params.values()))
+
+
+def transformer(definition, dst=None):
+    """
+    Cached pyproj.Transformer from definition to dst, with x/lon first.
+
+    Parameters
+    ----------
+    definition : str or sequence of str
+        Source PROJ definition.
+    dst : str or sequence of str, optional
+        Target definition.  By default the source's own geographic
+        coordinates, i.e. the plain inverse projection with no datum shift,
+        as GCTP does.
+    """
+    key = (normalize(definition), None if dst is None else normalize(dst))
+    pool = getattr(_local, 'transformers', None)
+    if pool is None:
+        pool = _local.transformers = {}
+    value = pool.get(key)
+    if value is None:
+        import pyproj
+        crs = pyproj.CRS(key[0])
+        target = crs.geodetic_crs if dst is None else pyproj.CRS(key[1])
+        value = pyproj.Transformer.from_crs(crs, target, always_xy=True)
+        pool[key] = value
+    return value
+
+
+@phases.timed('geolocate')
+def to_lonlat(definition, x, y, dst=None, dtype=np.float32, out=None):
+    """
+    Longitude and latitude of projected coordinates.
+
+    Parameters
+    ----------
+    definition : str or sequence of str
+        PROJ definition of x and y.
+    x, y : array_like
+        Projected coordinates, broadcast against each other:  pass
+        x[np.newaxis, :] and y[:, np.newaxis] for a grid instead of a
+        meshgrid.
+    dst : str or sequence of str, optional
+        See transformer().
+    dtype : numpy dtype
+        Type of the results.  The transform itself is always float64.
+    out : (ndarray, ndarray), optional
+        Arrays of the broadcast shape to write the results into.
+
+    Returns
+    -------
+    lon, lat : numpy.ndarray
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    shape = np.broadcast(x, y).shape
+    if out is None:
+        out = (np.empty(shape, dtype=dtype), np.empty(shape, dtype=dtype))
+    lon, lat = out
+    if lon.shape != shape or lat.shape != shape:
+        msg = "Output arrays must have the shape {0}."
+        raise ValueError(msg.format(shape))
+
+    t = transformer(definition, dst)
+    x = np.broadcast_to(x, shape).reshape((-1,) + shape[-1:])
+    y = np.broadcast_to(y, shape).reshape((-1,) + shape[-1:])
+    flat_lon = lon.reshape(x.shape)
+    flat_lat = lat.reshape(y.shape)
+    rows = max(1, _CHUNK // max(1, x.shape[-1]))
+    for i in range(0, x.shape[0], rows):
+        block = slice(i, i + rows)
+        # C order:  pyproj works in place only on contiguous buffers.
+        xs = np.array(x[block], dtype=np.float64, order='C')
+        ys = np.array(y[block], dtype=np.float64, order='C')
+        xs, ys = t.transform(xs, ys, inplace=True)
+        flat_lon[block] = xs
+        flat_lat[block] = ys
+    if not np.shares_memory(flat_lon, lon):
+        lon[...] = flat_lon.reshape(shape)
+        lat[...] = flat_lat.reshape(shape)
+    return lon, lat
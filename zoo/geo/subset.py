@@ -0,0 +1,226 @@
+"""
+Read only the scans of a swath that cross a region.
+
+    >>> box = (-10, 35, 30, 60)
+    >>> data, lon, lat = zoo.geo.swath_subset(hdffile, 'Cloud_Fraction', box)
+
+A swath granule crosses a region in one or a few runs of scans, and its
+geolocation is small next to its data fields (the 5 km tie points of MOD05
+are a 25th of a 1 km field).  swath_rows() reads only the geolocation,
+finds the runs of along-track rows with a pixel in the box and carries them
+over to the rows of the field through the swath's dimension map.
+swath_subset() then reads each run as one hyperslab, so a region of a
+TRMM, AIRS or CALIPSO granule costs the geolocation and the scans over the
+region, not the granule.
+
+Boxes are (west, south, east, north) in degrees, with west > east for a box
+across the dateline.  Rows are kept if any pixel centre is in the box, so
+pixels at the edge of the region may be partly outside it.
+
+The along-track axis of a field is the one as long as the geolocation has
+rows, or else the one the swath's dimension maps carry the geolocation's
+first dimension onto, so (along, across, channel) fields like AIRS
+radiances and (band, along, across) ones like MODIS L1B both work.
+Geolocation kept in one variable, like the geolocation[..., 0:2] of TRMM
+1B21, is given as (name, index) pairs.
+"""
+
+import numpy as np
+
+from ..io.structmetadata import structmetadata
+from .swath import swath_geolocation
+
+
+def in_box(lon, lat, bbox):
+    """
+    Which points are in bbox.  Longitudes may be in [-180, 180) or
+    [0, 360);  fill and NaN are out.
+    """
+    west, south, east, north = bbox
+    lon = (np.asarray(lon, dtype=np.float64) + 180) % 360 - 180
+    lat = np.asarray(lat, dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        inside = (lat >= south) & (lat <= north)
+        if west <= east:
+            inside &= (lon >= west) & (lon <= east)
+        else:
+            inside &= (lon >= west) | (lon <= east)
+    return inside
+
+
+def row_ranges(lon, lat, bbox, pad=0):
+    """
+    (start, stop) runs of the rows (first axis) of lon/lat that have a
+    point in bbox, widened by pad rows and merged where they touch.
+    """
+    inside = in_box(lon, lat, bbox)
+    if inside.ndim > 1:
+        inside = inside.reshape(inside.shape[0], -1).any(axis=1)
+    rows = np.flatnonzero(inside)
+    if rows.size == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(rows) > 1 + 2 * pad)
+    starts = np.r_[rows[0], rows[breaks + 1]] - pad
+    stops = np.r_[rows[breaks], rows[-1]] + 1 + pad
+    n = inside.shape[0]
+    return [(max(int(a), 0), min(int(b), n)) for a, b in zip(starts, stops)]
+
+
+def map_rows(ranges, increment, offset, size, geo_size):
+    """
+    Carry runs of geolocation rows over to the rows of a field of size
+    rows, where data row = offset + increment * geolocation row:  each run
+    takes the data rows nearest to its geolocation rows, and the first and
+    last runs of the geo_size rows take the data rows before and after
+    them.
+    """
+    mapped = []
+    for start, stop in ranges:
+        first = offset + increment * start - increment // 2
+        last = offset + increment * (stop - 1) + increment - increment // 2
+        if start == 0:
+            first = 0
+        if stop == geo_size:
+            last = size
+        first, last = max(first, 0), min(last, size)
+        if mapped and first <= mapped[-1][1]:
+            mapped[-1] = (mapped[-1][0], max(last, mapped[-1][1]))
+        elif first < last:
+            mapped.append((first, last))
+    return mapped
+
+
+def read_rows(var, ranges, axis=0):
+    """
+    Rows of a zoo.io.Variable, runs of them along axis, read a run at a
+    time and joined.
+    """
+    parts = []
+    for start, stop in ranges:
+        key = [slice(None)] * var.ndim
+        key[axis] = slice(start, stop)
+        parts.append(var[tuple(key)])
+    if not parts:
+        key = [slice(None)] * var.ndim
+        key[axis] = slice(0, 0)
+        return var[tuple(key)]
+    return np.concatenate(parts, axis=axis)
+
+
+def _geolocation(f, spec):
+    """
+    Longitude or latitude given as a variable name, a (name, index) pair
+    for a variable holding both along its last axis, or an array.
+    """
+    if isinstance(spec, str):
+        return f[spec][...]
+    if isinstance(spec, tuple) and len(spec) == 2:
+        return f[spec[0]][..., spec[1]]
+    return np.asarray(spec)
+
+
+def _geo_name(spec):
+    if isinstance(spec, tuple):
+        spec = spec[0]
+    return spec.rstrip('/').split('/')[-1] if isinstance(spec, str) else None
+
+
+def _along(f, name, var, rows, lat_name):
+    """
+    The along-track axis of field name, and (increment, offset) from the
+    rows of its geolocation onto that axis.
+    """
+    matches = [i for i, n in enumerate(var.shape) if n == rows]
+    if len(matches) == 1:
+        return matches[0], 1, 0
+    try:
+        swath = structmetadata(f).swath_of(
+            var.name.rstrip('/').split('/')[-1])
+    except KeyError:
+        swath = None
+    geo = swath and swath.geo_fields.get(_geo_name(lat_name))
+    field = swath and swath.data_fields.get(
+        var.name.rstrip('/').split('/')[-1])
+    if geo is not None and field is not None:
+        for axis, dim in enumerate(field.dims):
+            if dim == geo.dims[0]:
+                return axis, 1, 0
+            dimmap = swath.dimension_map(geo.dims[0], dim)
+            if dimmap is not None:
+                return axis, dimmap.increment, dimmap.offset
+    if matches:
+        return matches[0], 1, 0
+    msg = "No axis of {0} {1} matches the {2} rows of its geolocation."
+    raise ValueError(msg.format(name, var.shape, rows))
+
+
+def _rows(f, name, bbox, lat_name, lon_name, pad):
+    """
+    Data row runs of field name in bbox, the along-track axis, and the
+    geolocation they were found from.
+    """
+    var = f[name]
+    lat, lon = _geolocation(f, lat_name), _geolocation(f, lon_name)
+    axis, increment, offset = _along(f, name, var, lat.shape[0], lat_name)
+    ranges = row_ranges(lon, lat, bbox, pad)
+    ranges = map_rows(ranges, increment, offset, var.shape[axis],
+                      lat.shape[0])
+    return ranges, axis, lon, lat
+
+
+def swath_rows(source, name, bbox, lat_name='Latitude',
+               lon_name='Longitude', pad=1):
+    """
+    Runs of along-track rows of field name that cross bbox, as (start,
+    stop) pairs, from the swath's geolocation alone.
+
+    Parameters
+    ----------
+    source : str or zoo.io.File
+        The swath file.
+    name : str
+        The data field.
+    bbox : tuple
+        (west, south, east, north) in degrees.
+    lat_name, lon_name : str, tuple or array
+        The geolocation:  variable names, (name, index) pairs selecting
+        along the last axis of one variable, or arrays already read.
+    pad : int
+        Geolocation rows kept on either side of each run.
+    """
+    from ..io.reader import open_file
+
+    f = open_file(source) if isinstance(source, str) else source
+    try:
+        return _rows(f, name, bbox, lat_name, lon_name, pad)[0]
+    finally:
+        if f is not source:
+            f.close()
+
+
+def swath_subset(source, name, bbox, lat_name='Latitude',
+                 lon_name='Longitude', pad=1):
+    """
+    The rows of field name that cross bbox, and their longitude and
+    latitude:  (data, lon, lat).  Data are as stored;  decode them with the
+    variable's attributes (see zoo.io.decode), and keep the field's axes,
+    with only the rows of the along-track one.  Geolocation at a coarser
+    resolution than the field is interpolated to the field's (see
+    swath_geolocation()).  The arguments are those of swath_rows().
+    """
+    from ..io.reader import open_file
+
+    f = open_file(source) if isinstance(source, str) else source
+    try:
+        var = f[name]
+        ranges, axis, lon, lat = _rows(f, name, bbox, lat_name, lon_name,
+                                       pad)
+        data = read_rows(var, ranges, axis)
+        if lat.shape[0] != var.shape[axis]:
+            lon, lat = swath_geolocation(f, name)
+        rows = np.concatenate([np.arange(a, b) for a, b in ranges] or
+                              [np.arange(0, dtype=int)])
+        return data, lon[rows], lat[rows]
+    finally:
+        if f is not source:
+            f.close()
@@ -0,0 +1,181 @@
+"""
+Full resolution geolocation of HDF-EOS swath fields.
+
+    >>> lon, lat = zoo.geo.swath_geolocation(hdffile, 'Cloud_Top_Pressure')
+
+Many MODIS level 2 products (MOD05, MOD06, MOD07, MOD11_L2, ...) carry their
+Latitude and Longitude at 5 km, every fifth 1 km cell, and say so in the
+dimension maps of their StructMetadata (data index = offset + increment *
+geolocation index).  swath_geolocation() turns those tie points into
+geolocation for every cell of a field, scan by scan (see zoo.geo.interp).
+
+When the MOD03/MYD03 file of the same granule is at hand, its 1 km
+geolocation is used instead.  It is read once and cached, so the MOD05,
+MOD06, MOD07 and MOD35 files of a 5 minute granule all share one read.
+"""
+
+import glob
+import os
+import re
+
+import numpy as np
+
+from .. import phases
+from ..io.structmetadata import structmetadata
+from . import interp
+from .grid import _cache_get, _cache_put
+
+# MOD06_L2.A2010001.0000.005.2010005213214.hdf
+_GRANULE = re.compile(r'^(MOD|MYD)\w*\.A(\d{7})\.(\d{4})\.')
+
+
+def granule_id(filename):
+    """
+    ('MOD' or 'MYD', 'YYYYDDD', 'HHMM') of a MODIS file name, or None.
+    """
+    match = _GRANULE.match(os.path.basename(filename))
+    if match is None:
+        return None
+    return match.groups()
+
+
+def find_geo_file(filename):
+    """
+    The MOD03/MYD03 file of the same granule as filename, looked for next
+    to it and then in HDFEOS_ZOO_DIR, or None.  The latest collection wins.
+    """
+    granule = granule_id(filename)
+    if granule is None:
+        return None
+    pattern = '{0}03.A{1}.{2}.*.hdf'.format(*granule)
+    dirs = [os.path.dirname(os.path.abspath(filename))]
+    if 'HDFEOS_ZOO_DIR' in os.environ:
+        dirs.append(os.environ['HDFEOS_ZOO_DIR'])
+    for directory in dirs:
+        found = sorted(glob.glob(os.path.join(directory, pattern)))
+        if found:
+            return found[-1]
+    return None
+
+
+def _geo_file_lonlat(geo_file, dtype):
+    """
+    Cached Longitude and Latitude of a MOD03/MYD03 file, read only.
+    """
+    from ..io.reader import open_file
+
+    path = os.path.abspath(geo_file)
+    st = os.stat(path)
+    key = ('MOD03', path, st.st_mtime, st.st_size, np.dtype(dtype).str)
+    value = _cache_get(key)
+    if value is None:
+        with open_file(path) as f:
+            value = (np.asarray(f['Longitude'][:], dtype=dtype),
+                     np.asarray(f['Latitude'][:], dtype=dtype))
+        for a in value:
+            a.setflags(write=False)
+        _cache_put(key, value)
+    return value
+
+
+def _tie_points(swath, name):
+    """
+    Per-axis (increment, offset) from the geolocation onto field name.
+    """
+    try:
+        data_dims = swath.data_fields[name].dims[-2:]
+        geo_dims = swath.geo_fields['Latitude'].dims
+    except KeyError:
+        msg = "Swath {0!r} has no field {1!r} or no Latitude."
+        raise KeyError(msg.format(swath.name, name))
+    factors = []
+    offsets = []
+    for geo_dim, data_dim in zip(geo_dims, data_dims):
+        if geo_dim == data_dim:
+            factors.append(1)
+            offsets.append(0)
+            continue
+        dimmap = swath.dimension_map(geo_dim, data_dim)
+        if dimmap is None:
+            msg = "No dimension map from {0} onto {1} in swath {2!r}."
+            raise ValueError(msg.format(geo_dim, data_dim, swath.name))
+        factors.append(dimmap.increment)
+        offsets.append(dimmap.offset)
+    return tuple(factors), tuple(offsets)
+
+
+@phases.timed('geolocate')
+def swath_geolocation(source, name, geo_source=None, scan_lines=None,
+                      dtype=np.float32):
+    """
+    Longitude and latitude of every cell of a swath field.
+
+    Parameters
+    ----------
+    source : str or zoo.io.File
+        The HDF-EOS swath file holding the field.
+    name : str
+        The data field.  Its last two dimensions are taken as along and
+        across track.
+    geo_source : str, optional
+        A MOD03/MYD03 file to take geolocation from.  By default the file of
+        the same granule is used if find_geo_file() finds one of the field's
+        shape, and the swath's own tie points otherwise.
+    scan_lines : int, optional
+        Geolocation lines per scan, for interpolating the tie points.  By
+        default MODIS scans of 10 km, or the whole swath at once if the
+        tie points do not divide into those.
+    dtype : numpy dtype
+        Type of the returned arrays.
+    """
+    from ..io.reader import open_file
+
+    f = open_file(source) if isinstance(source, str) else source
+    try:
+        shape = tuple(f[name].shape[-2:])
+        explicit = geo_source is not None
+        if geo_source is None:
+            geo_source = find_geo_file(f.filename)
+        if geo_source is not None:
+            lon, lat = _geo_file_lonlat(geo_source, dtype)
+            if lon.shape == shape:
+                return lon.copy(), lat.copy()
+            if explicit:
+                msg = "Geolocation of {0} is {1}, but {2} is {3}."
+                raise ValueError(msg.format(geo_source, lon.shape, name,
+                                            shape))
+
+        swath = structmetadata(f).swath_of(name)
+        if swath is None:
+            msg = "{0!r} is not a field of any swath of {1}."
+            raise KeyError(msg.format(name, f.filename))
+        factors, offsets = _tie_points(swath, name)
+
+        path = os.path.abspath(f.filename)
+        st = os.stat(path)
+        key = ('swath', path, st.st_mtime, st.st_size, swath.name, factors,
+               offsets, shape, scan_lines, np.dtype(dtype).str)
+        value = _cache_get(key)
+        if value is None:
+            lon = f['Longitude']
+            lat = f['Latitude']
+            if factors == (1, 1):
+                value = (np.asarray(lon[:], dtype=dtype),
+                         np.asarray(lat[:], dtype=dtype))
+            else:
+                nrows = lon.shape[0]
+                if scan_lines is None:
+                    scan_lines = interp.MODIS_SCAN_KM // factors[0]
+                    if (interp.MODIS_SCAN_KM % factors[0] or
+                            nrows % scan_lines):
+                        scan_lines = nrows
+                value = interp.scan_interpolate(lon, lat, factors,
+                                                scan_lines, shape, offsets,
+                                                dtype)
+            for a in value:
+                a.setflags(write=False)
+            _cache_put(key, value)
+        return value[0].copy(), value[1].copy()
+    finally:
+        if f is not source:
+            f.close()
@@ -1 +1,15 @@
-from . import airs, buv, gosat, gsstf, hirdls, merra, mls, omi, toms, trmm, swdb
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'airs',
+    'buv',
+    'gosat',
+    'gsstf',
+    'hirdls',
+    'merra',
+    'mls',
+    'omi',
+    'toms',
+    'trmm',
+    'swdb',
+])
@@ -27,39 +27,25 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
 
 def run(FILE_NAME):
 
     # Identify the HDF-EOS2 swath data file.
     DATAFIELD_NAME = 'radiances'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset    
-        nc = Dataset(FILE_NAME)
-        data = nc.variables['radiances'][:,:,567]
-        latitude = nc.variables['Latitude'][:]
-        longitude = nc.variables['Longitude'][:]
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data3D = hdf.select(DATAFIELD_NAME)
-        data = data3D[:,:,567]
+    # Only channel 567 of the 2378 channels is read from the file.
+    with zoo.io.open_file(FILE_NAME) as f:
+        data = f[DATAFIELD_NAME][:,:,567]
 
         # Read geolocation dataset.
-        lat = hdf.select('Latitude')
-        latitude = lat[:,:]
-        lon = hdf.select('Longitude')
-        longitude = lon[:,:]
-        
+        latitude = f['Latitude'][:,:]
+        longitude = f['Longitude'][:,:]
 
-    
     # Replace the filled value with NaN, replace with a masked array.
     data[data == -9999] = np.nan
     datam = np.ma.masked_array(data, np.isnan(data))
@@ -67,8 +53,8 @@ def run(FILE_NAME):
  
     # Draw a polar stereographic projection using the low resolution coastline
     # database.
-    m = Basemap(projection='spstere', resolution='l',
-                boundinglat=-65, lon_0 = 180)
+    m = zoo.plot.basemap(projection='spstere', resolution='l',
+                         boundinglat=-65, lon_0 = 180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-80., -50., 5.))
     m.drawmeridians(np.arange(-180., 181., 20.), labels=[1, 0, 0, 1])
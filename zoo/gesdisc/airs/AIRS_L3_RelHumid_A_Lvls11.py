@@ -18,63 +18,40 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     # Identify the HDF-EOS2 grid data file.
     DATAFIELD_NAME = 'RelHumid_A'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-
-        # The variable has a fill value, 
-        # so netCDF4 converts it to a float64 masked array for us.
-        data = nc.variables[DATAFIELD_NAME][11,:,:]
-        latitude = nc.variables['Latitude'][:]
-        longitude = nc.variables['Longitude'][:]
-    
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # List available SDS datasets.
-        # print hdf.datasets()
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        # Read only the 11th level, masking the fill value.
+        data = zoo.io.decode.read(f[DATAFIELD_NAME], np.s_[11, :, :])
 
-        data3D = hdf.select(DATAFIELD_NAME)
-        data = data3D[11,:,:]
         # Read geolocation dataset.
-        lat = hdf.select('Latitude')
-        latitude = lat[:,:]
-        lon = hdf.select('Longitude')
-        longitude = lon[:,:]
-        # Handle fill value.
-        attrs = data3D.attributes(full=1)
-        fillvalue=attrs["_FillValue"]
-        # fillvalue[0] is the attribute value.
-        fv = fillvalue[0]
-        data[data == fv] = np.nan
-        data = np.ma.masked_array(data, np.isnan(data))
+        latitude = f['Latitude'][:]
+        longitude = f['Longitude'][:]
         
     
     # Draw an equidistant cylindrical projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-180, urcrnrlon = 180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-180, urcrnrlon = 180)
     
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
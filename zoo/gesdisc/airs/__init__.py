@@ -1,3 +1,7 @@
-from . import AIRS_L2_radiances_channel567
-from . import AIRS_L3_RelHumid_A_Lvls11
-from . import AIRS_L3_Temperature_MW_A_Lvls11
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'AIRS_L2_radiances_channel567',
+    'AIRS_L3_RelHumid_A_Lvls11',
+    'AIRS_L3_Temperature_MW_A_Lvls11',
+])
@@ -28,66 +28,31 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.io.decode
+
 
 def run(FILE_NAME):
     
-    if USE_NETCDF4:
-
-        from netCDF4 import Dataset
-
-        nc = Dataset(FILE_NAME)
-        grp = nc.groups['Data_Fields']
-        data_var = grp.variables['ProfileOzone']
-        lat_var = grp.variables['Latitude']
-        lev_var = grp.variables['ProfilePressureLevels']
-        date_var = grp.variables['Date']
-
-        # Read the data.
-        data = data_var[0,:,:]
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        data_var = f['/Data_Fields/ProfileOzone']
+        lat_var = f['/Data_Fields/Latitude']
+        lev_var = f['/Data_Fields/ProfilePressureLevels']
+
+        # Read the data, masking the fill value.
+        data = zoo.io.decode.read(data_var, np.s_[0, :, :])
         lat = lat_var[:]
         lev = lev_var[:]
-        date = date_var[0]
+        date = f['/Data_Fields/Date'][0]
 
         # Read the needed attributes.
-        data_units = data_var.units
-        lat_units = lat_var.units
-        lev_units = lev_var.units
-        data_longname = data_var.long_name
-        lat_longname = lat_var.long_name
-        lev_longname = lev_var.long_name
-
-    else:
-        
-        import h5py
-
-        with h5py.File(FILE_NAME, mode='r') as f:
-
-            dset_var = f['/Data_Fields/ProfileOzone']
-            dset_lat = f['/Data_Fields/Latitude']
-            dset_lev = f['/Data_Fields/ProfilePressureLevels']
-            dset_date = f['/Data_Fields/Date']
-
-            # Read the data.
-            data = dset_var[0,:,:]
-            lat = dset_lat[:]
-            lev = dset_lev[:]
-            date = dset_date[0]
-
-            # Read the needed attributes.
-            # String attributes actually come in as the bytes type and should
-            # be decoded to UTF-8 (python3).
-            data_units = dset_var.attrs['units'].decode()
-            lat_units = dset_lat.attrs['units'].decode()
-            lev_units = dset_lev.attrs['units'].decode()
-            data_longname = dset_var.attrs['long_name'].decode()
-            lat_longname = dset_lat.attrs['long_name'].decode()
-            lev_longname = dset_lev.attrs['long_name'].decode()
-
-            # H5PY doesn't automatically turn the data into a masked array.
-            fillvalue = dset_var.attrs['_FillValue']
-            data[data == fillvalue] = np.nan
-            data = np.ma.masked_array(data, np.isnan(data))
+        data_units = data_var.attrs['units']
+        lat_units = lat_var.attrs['units']
+        lev_units = lev_var.attrs['units']
+        data_longname = data_var.attrs['long_name']
+        lat_longname = lat_var.attrs['long_name']
+        lev_longname = lev_var.attrs['long_name']
 
     # The date is stored as a six-digit number, YYYYMM.  Convert it into
     # a string.
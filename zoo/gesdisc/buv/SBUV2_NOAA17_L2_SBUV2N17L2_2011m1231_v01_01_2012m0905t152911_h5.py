@@ -28,72 +28,32 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.io.decode
+
 
 def run(FILE_NAME):
     
-    if USE_NETCDF4:
-
-        from netCDF4 import Dataset
-
-        nc = Dataset(FILE_NAME)
-        data_var = nc.groups['SCIENCE_DATA'].variables['ProfileO3Retrieved']
-        lat_var = nc.groups['GEOLOCATION_DATA'].variables['Latitude']
-        lev_var = nc.groups['ANCILLARY_DATA'].variables['PressureLevels']
-        time_var = nc.variables['nTimes']
-
-        # Read the data.
-        data = data_var[:]
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        data_var = f['/SCIENCE_DATA/ProfileO3Retrieved']
+        lat_var = f['/GEOLOCATION_DATA/Latitude']
+        lev_var = f['/ANCILLARY_DATA/PressureLevels']
+
+        # Read the data, masking values that are filled or out of the valid
+        # range.
+        data = zoo.io.decode.read(data_var)
         lat = lat_var[:]
         lev = lev_var[:]
-        time = time_var[:]
+        time = f['nTimes'][:]
 
         # Read the needed attributes.
-        data_units = data_var.units
-        data_vmin = data_var.valid_min
-        data_vmax = data_var.valid_max
-        data_fillvalue = data_var._FillValue
-        lat_units = lat_var.units
-        lev_units = lev_var.units
-        data_longname = data_var.long_name
-        lat_longname = lat_var.long_name
-        lev_longname = lev_var.long_name
-
-    else:
-        
-        import h5py
-
-        with h5py.File(FILE_NAME, mode='r') as f:
-
-            dset_var = f['/SCIENCE_DATA/ProfileO3Retrieved']
-            dset_lat = f['/GEOLOCATION_DATA/Latitude']
-            dset_lev = f['/ANCILLARY_DATA/PressureLevels']
-            dset_time = f['nTimes']
-
-            # Read the data.
-            data = dset_var[:,:]
-            lat = dset_lat[:]
-            lev = dset_lev[:]
-            time = dset_time[:]
-
-            # Read the needed attributes.
-            # String attributes actually come in as the bytes type and should
-            # be decoded to UTF-8 (python3).
-            data_units = dset_var.attrs['units'].decode()
-            data_vmin = dset_var.attrs['valid_min']
-            data_vmax = dset_var.attrs['valid_max']
-            data_fillvalue = dset_var.attrs['_FillValue']
-            lat_units = dset_lat.attrs['units'].decode()
-            lev_units = dset_lev.attrs['units'].decode()
-            data_longname = dset_var.attrs['long_name'].decode()
-            lat_longname = dset_lat.attrs['long_name'].decode()
-            lev_longname = dset_lev.attrs['long_name'].decode()
-
-    # Apply the attribute information and transform into a masked array.
-    data[data < data_vmin] = np.nan
-    data[data > data_vmax] = np.nan
-    data[data == data_fillvalue] = np.nan
-    data = np.ma.masked_array(data, np.isnan(data))
+        data_units = data_var.attrs['units']
+        lat_units = lat_var.attrs['units']
+        lev_units = lev_var.attrs['units']
+        data_longname = data_var.attrs['long_name']
+        lat_longname = lat_var.attrs['long_name']
+        lev_longname = lev_var.attrs['long_name']
 
     # The latitude is not monotonic.  It must be sorted before CONTOURF can be
     # used.
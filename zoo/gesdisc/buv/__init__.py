@@ -1,2 +1,6 @@
-from . import BUV_Nimbus04_L3zm_v01_00_2012m0203t144121_h5
-from . import SBUV2_NOAA17_L2_SBUV2N17L2_2011m1231_v01_01_2012m0905t152911_h5
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'BUV_Nimbus04_L3zm_v01_00_2012m0203t144121_h5',
+    'SBUV2_NOAA17_L2_SBUV2N17L2_2011m1231_v01_01_2012m0905t152911_h5',
+])
@@ -1 +1,5 @@
-from . import acos_L2s_110101_02_Production_v110110_L2s2800_r01_PolB
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'acos_L2s_110101_02_Production_v110110_L2s2800_r01_PolB',
+])
@@ -33,63 +33,36 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = True
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
     
-    if USE_NETCDF4:
-
-        from netCDF4 import Dataset
-
-        nc = Dataset(FILE_NAME)
-        data_var = nc.groups['RetrievalResults'].variables['xco2']
-        lat_var = nc.groups['SoundingGeometry'].variables['sounding_latitude_geoid']
-        lon_var = nc.groups['SoundingGeometry'].variables['sounding_longitude_geoid']
-        lev_var = nc.groups['SoundingGeometry'].variables['sounding_altitude']
-        time_var = nc.groups['SoundingHeader'].variables['sounding_time_tai93']
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        data_var = f['/RetrievalResults/xco2']
+        lev_var = f['/SoundingGeometry/sounding_altitude']
 
         # Read the data.
         data = data_var[:]
-        lat = lat_var[:]
-        lon = lon_var[:]
+        lat = f['/SoundingGeometry/sounding_latitude_geoid'][:]
+        lon = f['/SoundingGeometry/sounding_longitude_geoid'][:]
         lev = lev_var[:]
-        time = time_var[:]
+        time = f['/SoundingHeader/sounding_time_tai93'][:]
 
         # Read the needed attributes.
-        data_units = data_var.Units
-        lev_units = lev_var.Units
-
-    else:
-        
-        import h5py
-
-        with h5py.File(FILE_NAME, mode='r') as f:
-
-            dset_var = f['/RetrievalResults/xco2']
-            dset_lat = f['/SoundingGeometry/sounding_latitude_geoid']
-            dset_lon = f['/SoundingGeometry/sounding_longitude_geoid']
-            dset_lev = f['/SoundingGeometry/sounding_altitude']
-            dset_time = f['/SoundingHeader/sounding_time_tai93']
-
-            # Read the data.
-            data = dset_var[:]
-            lat = dset_lat[:]
-            lon = dset_lon[:]
-            lev = dset_lev[:]
-            time = dset_time[:]
-
-            # Read the needed attributes.
-            data_units = dset_var.attrs['Units'][0]
-            lev_units = dset_lev.attrs['Units'][0]
+        data_units = data_var.attrs['Units']
+        lev_units = lev_var.attrs['Units']
 
     # First subplot is an orthographic projection using the low resolution
     # coastline database.  Plot the trajectory.
     fig = plt.figure(figsize=(15, 6))
     plt.subplot(1, 2, 1)
-    m = Basemap(projection='ortho', resolution='l', lat_0=-55, lon_0 = 120)
+    m = zoo.plot.basemap(projection='ortho', resolution='l',
+                         lat_0=-55, lon_0 = 120)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-80., -0., 20.))
     m.drawmeridians(np.arange(-180., 181., 20.))
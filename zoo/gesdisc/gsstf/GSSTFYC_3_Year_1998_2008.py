@@ -25,43 +25,24 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = True
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 
 def run(FILE_NAME):
     
-    if USE_NETCDF4:
-
-        from netCDF4 import Dataset
-
-        nc = Dataset(FILE_NAME)
-        grp = nc.groups['HDFEOS'].groups['GRIDS'].groups['NCEP']
-        data_var = grp.groups['Data Fields'].variables['SST']
-        data = data_var[:]
-
-        data_longname = data_var.LongName
-        data_units = data_var.units
-
-    else:
-        
-        import h5py
-
-        with h5py.File(FILE_NAME, mode='r') as f:
-
-            dset_var = f['/HDFEOS/GRIDS/NCEP/Data Fields/SST']
-            data = dset_var[:]
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        data_var = f['/HDFEOS/GRIDS/NCEP/Data Fields/SST']
 
-            # String attributes actually come in as the bytes type and should
-            # be decoded to UTF-8 (python3).
-            data_units = dset_var.attrs['units'].decode()
-            data_longname = dset_var.attrs['LongName'].decode()
-            fv = dset_var.attrs['_FillValue'][0]
+        # Read the data, masking the fill value.
+        data = zoo.io.decode.read(data_var)
 
-            # We have to apply the fill value ourselves.
-            data[data == fv] = np.nan
-            data = np.ma.masked_array(data, np.isnan(data))
+        data_longname = data_var.attrs['LongName']
+        data_units = data_var.attrs['units']
 
     # The projection is GEO, so we can construct the lat/lon arrays ourselves.
     scaleX = 360.0 / data.shape[1]
@@ -71,17 +52,16 @@ def run(FILE_NAME):
 
     # Draw an equidistant cylindrical projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-180, urcrnrlon = 180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-180, urcrnrlon = 180)
     
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 180., 45.), labels=[0, 0, 0, 1])
     
-    # Render the image in the projected coordinate system.
-    x, y = m(longitude, latitude)
-    m.pcolormesh(x, y, data)
+    # Render the grid as a single image.
+    zoo.plot.image(m, longitude, latitude, data)
     cb = m.colorbar()
     cb.set_label(data_units) 
 
@@ -1,3 +1,7 @@
-from . import GSSTF_3_2008_12_31
-from . import GSSTF_NCEP_3_2008_12_31
-from . import GSSTFYC_3_Year_1998_2008
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'GSSTF_3_2008_12_31',
+    'GSSTF_NCEP_3_2008_12_31',
+    'GSSTFYC_3_Year_1998_2008',
+])
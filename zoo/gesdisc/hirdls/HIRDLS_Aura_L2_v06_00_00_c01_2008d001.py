@@ -28,58 +28,30 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = True
+import zoo.io
+import zoo.io.decode
+
 
 def run(FILE_NAME):
     
-    if USE_NETCDF4:
-
-        from netCDF4 import Dataset
-
-        nc = Dataset(FILE_NAME)
-        grp = nc.groups['HDFEOS'].groups['SWATHS'].groups['HIRDLS']
-        data_var = grp.groups['Data Fields'].variables['O3']
-        pres_var = grp.groups['Geolocation Fields'].variables['Pressure']
-        time_var = grp.groups['Geolocation Fields'].variables['Time']
-
-        # Read the data.
-        data = data_var[0,:]
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        path = '/HDFEOS/SWATHS/HIRDLS/'
+        data_var = f[path + 'Data Fields/O3']
+        pres_var = f[path + 'Geolocation Fields/Pressure']
+        time_var = f[path + 'Geolocation Fields/Time']
+
+        # Read the data, masking the fill value.
+        data = zoo.io.decode.read(data_var, np.s_[0, :])
         pressure = pres_var[:]
         time = time_var[0]
 
         # Read the needed attributes.
-        data_units = data_var.Units
-        pres_units = pres_var.Units
-        data_title = data_var.Title
-        time_title = time_var.Title
-        pres_title = pres_var.Title
-
-    else:
-        
-        import h5py
-
-        with h5py.File(FILE_NAME, mode='r') as f:
-
-            dset_var = f['/HDFEOS/SWATHS/HIRDLS/Data Fields/O3']
-            dset_pres = f['/HDFEOS/SWATHS/HIRDLS/Geolocation Fields/Pressure']
-            dset_time = f['/HDFEOS/SWATHS/HIRDLS/Geolocation Fields/Time']
-
-            # Read the data.
-            data = dset_var[0,:]
-            pressure = dset_pres[:]
-            time = dset_time[0]
-
-            # Read the needed attributes.
-            # String attributes actually come in as the bytes type and should
-            # be decoded to UTF-8 (python3).
-            data_units = dset_var.attrs['Units'].decode()
-            pres_units = dset_pres.attrs['Units'].decode()
-            data_title = dset_var.attrs['Title'].decode()
-            time_title = dset_time.attrs['Title'].decode()
-            pres_title = dset_pres.attrs['Title'].decode()
-
-            fillvalue = dset_var.attrs['_FillValue']
-            data[data == fillvalue] = np.nan
+        data_units = data_var.attrs['Units']
+        pres_units = pres_var.attrs['Units']
+        data_title = data_var.attrs['Title']
+        time_title = time_var.attrs['Title']
+        pres_title = pres_var.attrs['Title']
 
     # The date is stored as a six-digit number, YYYYMM.  Convert it into
     # a string.
@@ -28,63 +28,31 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = True
+import zoo.io
+import zoo.io.decode
+
 
 def run(FILE_NAME):
     
-    if USE_NETCDF4:
-
-        from netCDF4 import Dataset
-
-        nc = Dataset(FILE_NAME)
-        grp = nc.groups['HDFEOS'].groups['ZAS'].groups['HIRDLS'].groups['Data Fields']
-        data_var = grp.variables['NO2Day']
-        lat_var = grp.variables['Latitude']
-        lev_var = grp.variables['Pressure']
-        date_var = grp.variables['Time']
-
-        # Read the data.
-        data = data_var[0,:,:]
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        path = '/HDFEOS/ZAS/HIRDLS/Data Fields/'
+        data_var = f[path + 'NO2Day']
+        lat_var = f[path + 'Latitude']
+        lev_var = f[path + 'Pressure']
+
+        # Read the data, masking the fill value.
+        data = zoo.io.decode.read(data_var, np.s_[0, :, :])
         lat = lat_var[:]
         lev = lev_var[:]
-        time = date_var[0]
+        time = f[path + 'Time'][0]
 
         # Read the needed attributes.
-        lat_units = lat_var.Units
-        lev_units = lev_var.Units
-        data_title = data_var.Title
-        lat_title = lat_var.Title
-        lev_title = lev_var.Title
-
-    else:
-        
-        import h5py
-
-        with h5py.File(FILE_NAME, mode='r') as f:
-            dset_var = f['/HDFEOS/ZAS/HIRDLS/Data Fields/NO2Day']
-            dset_lat = f['/HDFEOS/ZAS/HIRDLS/Data Fields/Latitude']
-            dset_lev = f['/HDFEOS/ZAS/HIRDLS/Data Fields/Pressure']
-            dset_date = f['/HDFEOS/ZAS/HIRDLS/Data Fields/Time']
-
-            # Read the data.
-            data = dset_var[0,:,:]
-            lat = dset_lat[:]
-            lev = dset_lev[:]
-            time = dset_date[0]
-
-            # Read the needed attributes.
-            # String attributes actually come in as the bytes type and should
-            # be decoded to UTF-8 (python3).
-            lat_units = dset_lat.attrs['Units'].decode()
-            lev_units = dset_lev.attrs['Units'].decode()
-            data_title = dset_var.attrs['Title'].decode()
-            lat_title = dset_lat.attrs['Title'].decode()
-            lev_title = dset_lev.attrs['Title'].decode()
-
-            # H5PY doesn't automatically turn the data into a masked array.
-            fillvalue = dset_var.attrs['_FillValue']
-            data[data == fillvalue] = np.nan
-            data = np.ma.masked_array(data, np.isnan(data))
+        lat_units = lat_var.attrs['Units']
+        lev_units = lev_var.attrs['Units']
+        data_title = data_var.attrs['Title']
+        lat_title = lat_var.attrs['Title']
+        lev_title = lev_var.attrs['Title']
 
     # The date is stored as a six-digit number, YYYYMM.  Convert it into
     # a string.
@@ -1,2 +1,6 @@
-from . import HIRDLS_Aura_L3ZAD_v06_00_00_c02_2005d022_2008d077
-from . import HIRDLS_Aura_L2_v06_00_00_c01_2008d001
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'HIRDLS_Aura_L3ZAD_v06_00_00_c02_2005d022_2008d077',
+    'HIRDLS_Aura_L2_v06_00_00_c01_2008d001',
+])
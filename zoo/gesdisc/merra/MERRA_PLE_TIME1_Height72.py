@@ -19,75 +19,52 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'PLE'
     
-    if USE_NETCDF4:
-        from netCDF4 import Dataset    
-        nc = Dataset(FILE_NAME)
-        data = nc.variables[DATAFIELD_NAME][0, 72, :, :].astype(np.float64)
-    
-        # Retrieve the attributes.
-        missing_value = nc.variables[DATAFIELD_NAME].missing_value
-        long_name = nc.variables[DATAFIELD_NAME].long_name
-        units = nc.variables[DATAFIELD_NAME].units
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
 
-        # Retrieve the geolocation data.
-        latitude = nc.variables['YDim'][:]
-        longitude = nc.variables['XDim'][:]
+        # Read only the level to be drawn.
+        data = var[0, 72, :, :]
 
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
+        # Retrieve the attributes.
+        missing_value = var.attrs['missing_value']
+        long_name = var.attrs['long_name']
+        units = var.attrs['units']
 
-        # Read dataset.
-        data4D = hdf.select(DATAFIELD_NAME)
-        data = data4D[0,72,:,:].astype(np.float64)
+        # Retrieve the geolocation data.
+        latitude = f['YDim'][:]
+        longitude = f['XDim'][:]
 
-        # Retrieve the attributes.
-        attrs = data4D.attributes(full=1)
-        mva=attrs["missing_value"]
-        missing_value = mva[0]
-        lna=attrs["long_name"]
-        long_name = lna[0]
-        ua=attrs["units"]
-        units = ua[0]        
-
-        # Read geolocation dataset.
-        lat = hdf.select('YDim')
-        latitude = lat[:]
-        lon = hdf.select('XDim')
-        longitude = lon[:]
-
-    # Replace the missing values with NaN.        
-    data[data == missing_value] = np.nan
-    datam = np.ma.masked_array(data, np.isnan(data))
+    # Mask the missing values.
+    datam = np.ma.masked_equal(data, missing_value)
     
     
     # Draw an equidistant cylindrical projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-180, urcrnrlon = 180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-180, urcrnrlon = 180)
     
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 180., 45.), labels=[0, 0, 0, 1])
-    m.pcolormesh(longitude, latitude, datam, latlon=True)
+    zoo.plot.image(m, longitude, latitude, datam)
     cb = m.colorbar()
     cb.set_label(units,  labelpad=-40, y=1.05)
 
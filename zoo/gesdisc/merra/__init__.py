@@ -1,2 +1,6 @@
-from . import MERRA_PLE_TIME1_Height72
-from . import MERRA_MFYC_TIME4_Height42
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'MERRA_PLE_TIME1_Height72',
+    'MERRA_MFYC_TIME4_Height42',
+])
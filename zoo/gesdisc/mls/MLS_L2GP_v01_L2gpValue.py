@@ -30,62 +30,31 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = True
+import zoo.io
+
 
 def run(FILE_NAME):
     
-    if USE_NETCDF4:
-
-        from netCDF4 import Dataset
-
-        nc = Dataset(FILE_NAME)
-        data_grp = nc.groups['HDFEOS'].groups['SWATHS'].groups['BrO'].groups['Data Fields']
-        data_var = data_grp.variables['L2gpValue']
-
-        data = data_var[399,:]
-        units = data_var.Units
-        fill_value = data_var._FillValue
-        missing_value = data_var.MissingValue
-        title = data_var.Title
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        path = '/HDFEOS/SWATHS/BrO/'
+        data_var = f[path + 'Data Fields/L2gpValue']
+
+        # Read only the profile to be drawn.
+        data = data_var[399, :]
+        units = data_var.attrs['Units']
+        fill_value = data_var.attrs['_FillValue']
+        missing_value = data_var.attrs['MissingValue']
+        title = data_var.attrs['Title']
+
+        pres_var = f[path + 'Geolocation Fields/Pressure']
+        pressure = pres_var[:]
+        pres_units = pres_var.attrs['Units']
 
-        data[data == fill_value] = np.nan
-        data[data == missing_value] = np.nan
-        data = np.ma.masked_array(data, np.isnan(data))
+        time = f[path + 'Geolocation Fields/Time'][:]
 
-        geo_grp = nc.groups['HDFEOS'].groups['SWATHS'].groups['BrO'].groups['Geolocation Fields']
-        pres_var = geo_grp.variables['Pressure']
-        pressure = pres_var[:]
-        pres_units = pres_var.Units
-
-        time_var = geo_grp.variables['Time']
-        time = time_var[:]
-
-    else:
-        
-        import h5py
-
-        path = '/HDFEOS/SWATHS/BrO'
-        DATAFIELD_NAME = path + 'CloudFraction'
-        with h5py.File(FILE_NAME, mode='r') as f:
-            varname = path + '/Data Fields/BrO'
-            dset = f[varname]
-            data = dset[399, :]
-
-            # Retrieve any attributes that may be needed later.
-            # String attributes actually come in as the bytes type and should
-            # be decoded to UTF-8 (python3).
-            missing_value = f[varname].attrs['MissingValue']
-            fill_value = f[varname].attrs['_FillValue']
-            title = f[varname].attrs['Title'].decode()
-            units = f[varname].attrs['Units'].decode()
-
-            # Retrieve the geolocation data.
-            varname = path + '/Geolocation Fields/Pressure'
-            pressure = f[varname][:]
-            pres_units = f[varname].attrs['Units'].decode()
-
-            varname = path + '/Geolocation Fields/Time'
-            time = f[varname][:]
+    data = np.ma.masked_where((data == fill_value) | (data == missing_value),
+                              data)
 
     # Convert to minutes, time from start.
     time = (time - time[0]) / 60.0
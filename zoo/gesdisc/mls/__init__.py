@@ -1,2 +1,6 @@
-from . import MLS_L2GP_v01_L2gpValue
-from . import MLS_L2GP_v02_L2gpValue
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'MLS_L2GP_v01_L2gpValue',
+    'MLS_L2GP_v02_L2gpValue',
+])
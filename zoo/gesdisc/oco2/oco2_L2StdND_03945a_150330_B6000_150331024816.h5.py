@@ -25,9 +25,10 @@ import os
 import h5py
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
+import zoo.plot
+
 def run(FILE_NAME):
     
     with h5py.File(FILE_NAME, mode='r') as f:
@@ -41,14 +42,13 @@ def run(FILE_NAME):
         latitude = f['/RetrievalGeometry/retrieval_latitude'][:]
         longitude = f['/RetrievalGeometry/retrieval_longitude'][:]
 
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 45))
     m.drawmeridians(np.arange(-180, 180, 45), labels=[True,False,False,True])
-    m.scatter(longitude, latitude, c=data, s=1, cmap=plt.cm.jet,
-            edgecolors=None, linewidth=0)
+    zoo.plot.points(m, longitude, latitude, data, cmap=plt.cm.jet, size=1)
     # cb = m.colorbar(orientation='horizontal', format='%.1e')
     cb = m.colorbar(location="bottom", format='%.1e', pad='10%')
     cb.set_label(units)
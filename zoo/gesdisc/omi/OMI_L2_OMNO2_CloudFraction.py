@@ -24,66 +24,33 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = True
+import zoo.io
+import zoo.plot
 
 def run(FILE_NAME):
     DATAFIELD_NAME = 'CloudFraction'
-    
-    if USE_NETCDF4:
-
-        from netCDF4 import Dataset
-
-        nc = Dataset(FILE_NAME)
-        grp = nc.groups['HDFEOS'].groups['SWATHS'].groups['ColumnAmountNO2']
-        var = grp.groups['Data Fields'].variables[DATAFIELD_NAME]
-        
-        # netCDF4 doesn't quite handle the scaling correctly in this case since
-        # the attributes are "ScaleFactor" and "AddOffset" instead of
-        # "scale_factor" and "add_offset".  We'll do the scaling and conversion
-        # to a masked array ourselves.
-        var.set_auto_maskandscale(False)
 
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        path = '/HDFEOS/SWATHS/ColumnAmountNO2/'
+        var = f[path + 'Data Fields/' + DATAFIELD_NAME]
         data = var[:].astype(np.float64)
-    
-        # Retrieve any attributes that may be needed later.
-        scale = var.ScaleFactor
-        offset = var.Offset
-        title = var.Title
-        missing_value = var.MissingValue
-        fill_value = var._FillValue
-        units = var.Units
+
+        # The attributes are "ScaleFactor" and "Offset" instead of
+        # "scale_factor" and "add_offset", so we'll do the scaling and
+        # conversion to a masked array ourselves.
+        scale = var.attrs['ScaleFactor']
+        offset = var.attrs['Offset']
+        missing_value = var.attrs['MissingValue']
+        fill_value = var.attrs['_FillValue']
+        title = var.attrs['Title']
+        units = var.attrs['Units']
 
         # Retrieve the geolocation data.
-        latitude = grp.groups['Geolocation Fields'].variables['Latitude'][:]
-        longitude = grp.groups['Geolocation Fields'].variables['Longitude'][:]
-
-    else:
-        
-        import h5py
-
-        path = '/HDFEOS/SWATHS/ColumnAmountNO2/Data Fields/'
-        DATAFIELD_NAME = path + 'CloudFraction'
-        with h5py.File(FILE_NAME, mode='r') as f:
-            dset = f[DATAFIELD_NAME]
-            data =dset[:].astype(np.float64)
-
-            # Retrieve any attributes that may be needed later.
-            # String attributes actually come in as the bytes type and should
-            # be decoded to UTF-8 (python3).
-            scale = f[DATAFIELD_NAME].attrs['ScaleFactor']
-            offset = f[DATAFIELD_NAME].attrs['Offset']
-            missing_value = f[DATAFIELD_NAME].attrs['MissingValue']
-            fill_value = f[DATAFIELD_NAME].attrs['_FillValue']
-            title = f[DATAFIELD_NAME].attrs['Title'].decode()
-            units = f[DATAFIELD_NAME].attrs['Units'].decode()
-
-            # Retrieve the geolocation data.
-            path = '/HDFEOS/SWATHS/ColumnAmountNO2/Geolocation Fields/'
-            latitude = f[path + 'Latitude'][:]
-            longitude = f[path + 'Longitude'][:]
+        latitude = f[path + 'Geolocation Fields/Latitude'][:]
+        longitude = f[path + 'Geolocation Fields/Longitude'][:]
 
     data[data == missing_value] = np.nan
     data[data == fill_value] = np.nan
@@ -92,9 +59,9 @@ def run(FILE_NAME):
 
     # Draw an equidistant cylindrical projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-180, urcrnrlon = 180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-180, urcrnrlon = 180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 180., 45.), labels=[0, 0, 0, 1])
@@ -23,51 +23,30 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 FILE_NAME = 'OMI-Aura_L3-OMTO3e_2005m1214_v002-2006m0929t143855.he5'
 
-# Can do this using either netCDF4 or h5py.
-USE_NETCDF4 = True
 
 def run(FILE_NAME):
-    if USE_NETCDF4:
-    
-        from netCDF4 import Dataset
-    
-        DATAFIELD_NAME = 'ColumnAmountO3'
-        nc = Dataset(FILE_NAME)
-        grp = nc.groups['HDFEOS'].groups['GRIDS'].groups['OMI Column Amount O3']
-        var = grp.groups['Data Fields'].variables[DATAFIELD_NAME]
-        data = var[:]
-    
+    DATAFIELD_NAME = 'ColumnAmountO3'
+
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f['/HDFEOS/GRIDS/OMI Column Amount O3/Data Fields/'
+                + DATAFIELD_NAME]
+
+        # Mask the fill value.  No need to scale the data, as the scale
+        # factor and add offset are 1.0 and 0.0 respectively.
+        data = zoo.io.decode.read(var)
+
         # Get attributes needed for the plot.
-        title = var.Title
-        units = var.Units
-        nc.close()
-    
-    else:
-    
-        import h5py
-    
-        DATAFIELD_NAME = '/HDFEOS/GRIDS/OMI Column Amount O3/Data Fields/ColumnAmountO3'
-        with h5py.File(FILE_NAME, mode='r') as f:
-    
-            dset = f[DATAFIELD_NAME]
-            data = dset[:]
-    
-            # Have to manually create a masked array due to the fill value.
-            # No need to scale the data, as the scale factor and add offset are
-            # 1.0 and 0.0 respectively.
-            data[data == dset.fillvalue] = np.nan
-            data = np.ma.masked_where(np.isnan(data), data)
-    
-            # Get attributes needed for the plot.
-            # String attributes actually come in as the bytes type and should
-            # be decoded to UTF-8 (python3).
-            title = dset.attrs['Title'].decode()
-            units = dset.attrs['Units'].decode()
+        title = var.attrs['Title']
+        units = var.attrs['Units']
     
     # There is no geolocation data, so construct it ourselves.
     longitude = np.arange(0., 1440.0) * 0.25 - 180 + 0.125
@@ -75,13 +54,13 @@ def run(FILE_NAME):
     
     # Draw an equidistant cylindrical projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-180, urcrnrlon = 180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-180, urcrnrlon = 180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 180., 45.), labels=[0, 0, 0, 1])
-    m.pcolormesh(longitude, latitude, data, latlon=True)
+    zoo.plot.image(m, longitude, latitude, data)
     cb = m.colorbar()
     cb.set_label(units)
 
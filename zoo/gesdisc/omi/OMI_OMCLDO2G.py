@@ -23,81 +23,46 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = True
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'CloudPressure'
 
-    if USE_NETCDF4:
-    
-        from netCDF4 import Dataset
-
-        nc = Dataset(FILE_NAME)
-        grp = nc.groups['HDFEOS'].groups['GRIDS'].groups['CloudFractionAndPressure'].groups['Data Fields']
-        var = grp.variables[DATAFIELD_NAME]
-        
-        # Turn off autoscaling so we can handle it uniformly for both h5py and
-        # netcdf.
-        var.set_auto_maskandscale(False)
-        data = var[0,:,:]
-        units = var.Units
-        title = var.Title
-        fill_value = var._FillValue
-        
-        # Retrieve the geolocation data.
-        var = grp.variables['Longitude']
-        var.set_auto_maskandscale(False)
-        longitude = var[0,:,:]
-        lon_fv = var._FillValue
-
-        var = grp.variables['Latitude']
-        var.set_auto_maskandscale(False)
-        latitude = var[0,:,:]
-        lat_fv = var._FillValue
-        
-    else:
-
-        import h5py
-
-        path = '/HDFEOS/GRIDS/CloudFractionAndPressure/Data Fields'
-        with h5py.File(FILE_NAME, mode='r') as f:
-
-            # String attributes actually come in as the bytes type and should
-            # be decoded to UTF-8 (python3).
-            varname = path + '/CloudPressure'
-            data = f[varname][0,:,:]
-            units = f[varname].attrs['Units'].decode()
-            title = f[varname].attrs['Title'].decode()
-            fill_value = f[varname].attrs['_FillValue'][0]
-            
-            # Retrieve the geolocation data.
-            varname = path + '/Longitude'
-            longitude = f[varname][0,:,:]
-            lon_fv = f[varname].attrs['_FillValue'][0]
-            varname = path + '/Latitude'
-            latitude = f[varname][0,:,:]
-            lat_fv = f[varname].attrs['_FillValue'][0]
-            
-    # The latitude and longitude grid is not complete and has a lot of fill 
-    # values, which is not the usual case. 
-    data[data == fill_value] = np.nan
-    datam = np.ma.masked_array(data, np.isnan(data))
-    
-    longitude[longitude == lon_fv] = np.nan
-    lonm = np.ma.masked_array(longitude, np.isnan(longitude))
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        path = '/HDFEOS/GRIDS/CloudFractionAndPressure/Data Fields/'
+
+        # Read only the first candidate of each cell.
+        var = f[path + DATAFIELD_NAME]
+        data = var[0, :, :]
+        units = var.attrs['Units']
+        title = var.attrs['Title']
+        fill_value = var.attrs['_FillValue']
 
-    latitude[latitude == lat_fv] = np.nan
-    latm = np.ma.masked_array(latitude, np.isnan(latitude))
+        # Retrieve the geolocation data.
+        var = f[path + 'Longitude']
+        longitude = var[0, :, :]
+        lon_fv = var.attrs['_FillValue']
+        var = f[path + 'Latitude']
+        latitude = var[0, :, :]
+        lat_fv = var.attrs['_FillValue']
+
+    # The latitude and longitude grid is not complete and has a lot of fill
+    # values, which is not the usual case.
+    datam = np.ma.masked_equal(data, fill_value)
+    lonm = np.ma.masked_equal(longitude, lon_fv)
+    latm = np.ma.masked_equal(latitude, lat_fv)
 
     # Draw an equidistant cylindrical projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-180, urcrnrlon = 180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-180, urcrnrlon = 180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 180., 45.), labels=[0, 0, 0, 1])
@@ -1,3 +1,7 @@
-from . import OMI_L3_ColumnAmountO3
-from . import OMI_L2_OMNO2_CloudFraction
-from . import OMI_OMCLDO2G
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'OMI_L3_ColumnAmountO3',
+    'OMI_L2_OMNO2_CloudFraction',
+    'OMI_OMCLDO2G',
+])
@@ -23,50 +23,33 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-# Can do this using either netCDF4 or h5py.
-USE_NETCDF4 = True
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'aerosol_optical_thickness_550_ocean'
 
-    if USE_NETCDF4:
-    
-        from netCDF4 import Dataset
-    
-        nc = Dataset(FILE_NAME)
-        data = nc.variables[DATAFIELD_NAME][:]
-        latitude = nc.variables['latitude'][:]
-        longitude = nc.variables['longitude'][:]
-    
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+        data = var[:]
+        latitude = f['latitude'][:]
+        longitude = f['longitude'][:]
+
         # Get attributes needed for the plot.
-        long_name = nc.variables[DATAFIELD_NAME].long_name
-    
-    else:
-    
-        import h5py
-    
-        with h5py.File(FILE_NAME, mode='r') as f:
-    
-            data = f[DATAFIELD_NAME][:]
-            latitude = f['latitude'][:]
-            longitude = f['longitude'][:]
-    
-            # String attributes actually come in as the bytes type and should
-            # be decoded to UTF-8 (python3).
-            long_name = f[DATAFIELD_NAME].attrs['long_name'].decode()
-
-    data[data == -999] = np.nan
-    data = np.ma.masked_array(data, np.isnan(data))
+        long_name = var.attrs['long_name']
+
+    data = np.ma.masked_equal(data, -999)
 
     # Draw an equidistant cylindrical projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-180, urcrnrlon = 180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-180, urcrnrlon = 180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.))
     m.drawmeridians(np.arange(-180, 180., 45.))
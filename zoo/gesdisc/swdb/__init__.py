@@ -1,2 +1,6 @@
-from . import DeepBlue_SeaWiFS_L2_20101211T000331Z_v002_20110527T105357Z
-from . import DeepBlue_SeaWiFS_1_0_L3_20100101_v002_20110527T191319Z
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'DeepBlue_SeaWiFS_L2_20101211T000331Z_v002_20110527T105357Z',
+    'DeepBlue_SeaWiFS_1_0_L3_20100101_v002_20110527T191319Z',
+])
@@ -1 +1,5 @@
-from . import TOMS_L3_Ozone
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'TOMS_L3_Ozone',
+])
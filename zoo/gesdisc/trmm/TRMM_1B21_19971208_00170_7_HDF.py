@@ -18,44 +18,29 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'binDIDHmean'
 
-    if USE_NETCDF4:    
-        from netCDF4 import Dataset    
-        nc = Dataset(FILE_NAME)
-        data = nc.variables[DATAFIELD_NAME][:].astype(np.float64)
-    
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        data = f[DATAFIELD_NAME][:]
+
         # Retrieve the geolocation data.
-        latitude = nc.variables['Latitude'][:]
-        longitude = nc.variables['Longitude'][:]
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.        
-        ds = hdf.select(DATAFIELD_NAME)
-        data = ds[:,:]
-
-        # Read geolocation dataset.
-        lat = hdf.select('Latitude')
-        latitude = lat[:,:]
-        lon = hdf.select('Longitude')
-        longitude = lon[:,:]
+        latitude = f['Latitude'][:]
+        longitude = f['Longitude'][:]
 
     
     # The swath crosses the international dateline between row 6000 and 7000.
@@ -66,9 +51,9 @@ def run(FILE_NAME):
     
     # Draw an equidistant cylindrical projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-60, urcrnrlon = 300)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-60, urcrnrlon = 300)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180., 181., 45.), labels=[0, 0, 0, 1])
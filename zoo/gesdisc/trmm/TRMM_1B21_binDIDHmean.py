@@ -18,40 +18,30 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'binDIDHmean'
 
-    if USE_NETCDF4:    
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-        data = nc.variables[DATAFIELD_NAME][:].astype(np.float64)
-    
-        # Retrieve the geolocation data.
-        latitude = nc.variables['geolocation'][:,:,0]
-        longitude = nc.variables['geolocation'][:,:,1]
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-        
-        ds = hdf.select(DATAFIELD_NAME)
-        data = ds[:,:]
-        geo = hdf.select('geolocation')
-        latitude = geo[:,:,0]
-        longitude = geo[:,:,1]
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        data = f[DATAFIELD_NAME][:]
+
+        # Read only the latitude and longitude planes of the geolocation.
+        geo = f['geolocation']
+        latitude = geo[:, :, 0]
+        longitude = geo[:, :, 1]
     
     # The swath crosses the international dateline between row 8000 and 9000.
     # This causes the mesh to smear, so we'll adjust the longitude (modulus
@@ -61,9 +51,9 @@ def run(FILE_NAME):
     
     # Draw an equidistant cylindrical projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-90, urcrnrlon = 270)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-90, urcrnrlon = 270)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180., 181., 45.), labels=[0, 0, 0, 1])
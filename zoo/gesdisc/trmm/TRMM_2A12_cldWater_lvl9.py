@@ -18,68 +18,44 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'cldWater'
 
-    if USE_NETCDF4:    
-        from netCDF4 import Dataset    
-        nc = Dataset(FILE_NAME)
-        var = nc.variables[DATAFIELD_NAME]
-
-        # Turn autoscaling off because this dataset does not follow the
-        # CF conventions scale/offset rule.
-        var.set_auto_maskandscale(False)
-
-        data = var[:,:,9].astype(np.double)
-        scale_factor = var.scale_factor
-        add_offset = var.add_offset
-
-        # Retrieve the geolocation data.
-        latitude = nc.variables['geolocation'][:,:,0]
-        longitude = nc.variables['geolocation'][:,:,1]
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-        
-        ds = hdf.select(DATAFIELD_NAME)
-        data = ds[:,:,9].astype(np.double)
-
-        # Handle scale/osffset attributes.
-        attrs = ds.attributes(full=1)
-        sfa=attrs["scale_factor"]
-        scale_factor = sfa[0]
-        aoa=attrs["add_offset"]
-        add_offset = aoa[0]
-
-        # Retrieve the geolocation data.        
-        geo = hdf.select('geolocation')
-        latitude = geo[:,:,0]
-        longitude = geo[:,:,1]
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+
+        # Read only the 9th level.
+        data = var[:, :, 9]
+        scale_factor = var.attrs['scale_factor']
+        add_offset = var.attrs['add_offset']
+
+        # Read only the latitude and longitude planes of the geolocation.
+        geo = f['geolocation']
+        latitude = geo[:, :, 0]
+        longitude = geo[:, :, 1]
 
     # The fill value is not explicitly set, but appears to be -9999.
-    data[data == -9999] = np.nan
-    # cldWater has "scale_factor" and "add_offset" attributes, 
-    # but the scaling equation to be used here does not follow the CF 
+    # cldWater has "scale_factor" and "add_offset" attributes,
+    # but the scaling equation to be used here does not follow the CF
     # conventoins
     #
     #     data = data * scale + offset
     #
-    data = data / scale_factor + add_offset
-    datam = np.ma.masked_array(data, np.isnan(data))
+    datam = np.ma.masked_equal(data, -9999) / scale_factor + add_offset
     
     
     # There is a wrap-around effect to deal with.  Adjust the longitude by
@@ -89,9 +65,9 @@ def run(FILE_NAME):
     
     # Draw an equidistant cylindrical projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-50, urcrnrlon = 310)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-50, urcrnrlon = 310)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-45, 315., 45.), labels=[0, 0, 0, 1])
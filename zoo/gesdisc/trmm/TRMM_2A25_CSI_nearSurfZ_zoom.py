@@ -18,51 +18,40 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'nearSurfZ'
     
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-        data = nc.variables[DATAFIELD_NAME][:].astype(np.float64)
-        # Retrieve the geolocation data.
-        latitude = nc.variables['geolocation'][:,:,0]
-        longitude = nc.variables['geolocation'][:,:,1]
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-        ds = hdf.select(DATAFIELD_NAME)
-        data = ds[:,:].astype(np.double)
-        # Retrieve the geolocation data.        
-        geo = hdf.select('geolocation')
-        latitude = geo[:,:,0]
-        longitude = geo[:,:,1]
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        data = f[DATAFIELD_NAME][:]
 
+        # Read only the latitude and longitude planes of the geolocation.
+        geo = f['geolocation']
+        latitude = geo[:, :, 0]
+        longitude = geo[:, :, 1]
 
     # There's no fill value set, but 0.0 is considered the fill value.
-    data[data == 0.0] = np.nan
-    datam = np.ma.masked_array(data, np.isnan(data))
+    datam = np.ma.masked_equal(data, 0.0)
     
     
     # Draw an equidistant cylindrical projection using the high resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='h',
-                llcrnrlat=30, urcrnrlat = 36,
-                llcrnrlon=123, urcrnrlon = 135)
+    m = zoo.plot.basemap(projection='cyl', resolution='h',
+                         llcrnrlat=30, urcrnrlat = 36,
+                         llcrnrlon=123, urcrnrlon = 135)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(30, 37), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(123, 135, 2), labels=[0, 0, 0, 1])
@@ -18,65 +18,44 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'dHat'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset    
-        nc = Dataset(FILE_NAME)
-        var = nc.variables[DATAFIELD_NAME]
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+
         # This datafield has scale factor and add offset attributes, but no
-        # fill value.  We'll turn off automatic scaling and do it ourselves.
-        var.set_auto_maskandscale(False)
-        data = nc.variables[DATAFIELD_NAME][:].astype(np.float64)
+        # fill value.
+        data = var[:]
+        scale_factor = var.attrs['scale_factor']
+        add_offset = var.attrs['add_offset']
 
-        # Retrieve scale/offset attributes.
-        scale_factor = var.scale_factor
-        add_offset = var.add_offset
-    
-        # Retrieve the geolocation data.
-        latitude = nc.variables['geolocation'][:,:,0]
-        longitude = nc.variables['geolocation'][:,:,1]
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-        
-        ds = hdf.select(DATAFIELD_NAME)
-        data = ds[:,:].astype(np.double)
-
-        # Handle scale/osffset attributes.
-        attrs = ds.attributes(full=1)
-        sfa=attrs["scale_factor"]
-        scale_factor = sfa[0]
-        aoa=attrs["add_offset"]
-        add_offset = aoa[0]
-
-        # Retrieve the geolocation data.        
-        geo = hdf.select('geolocation')
-        latitude = geo[:,:,0]
-        longitude = geo[:,:,1]
+        # Read only the latitude and longitude planes of the geolocation.
+        geo = f['geolocation']
+        latitude = geo[:, :, 0]
+        longitude = geo[:, :, 1]
 
     data = data / scale_factor + add_offset
     
     # Draw an equidistant cylindrical projection using the high resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='h',
-                llcrnrlat=30, urcrnrlat = 36,
-                llcrnrlon=121, urcrnrlon = 133)
+    m = zoo.plot.basemap(projection='cyl', resolution='h',
+                         llcrnrlat=30, urcrnrlat = 36,
+                         llcrnrlon=121, urcrnrlon = 133)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(30, 37), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(121, 133, 2), labels=[0, 0, 0, 1])
@@ -18,38 +18,28 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'ssmiData'
 
-    if USE_NETCDF4:    
-        from netCDF4 import Dataset    
-        nc = Dataset(FILE_NAME)
-        data = nc.variables[DATAFIELD_NAME][0,0,:,:].astype(np.float64)
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-        ds = hdf.select(DATAFIELD_NAME)
-        data = ds[0,0,:,:].astype(np.float64)
-        
-    
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        data = f[DATAFIELD_NAME][0, 0, :, :]
+
     # Consider 0 to be the fill value.
-    # Must create a masked array where nan is involved.
-    data[data == data[0,0]] = np.nan
-    datam = np.ma.masked_where(np.isnan(data), data)
+    datam = np.ma.masked_equal(data, data[0, 0])
     
     
     # The lat and lon should be calculated manually.
@@ -60,9 +50,9 @@ def run(FILE_NAME):
     
     # Draw an equidistant cylindrical projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=0, urcrnrlon = 360)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=0, urcrnrlon = 360)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 120, 30), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(0, 360, 45), labels=[0, 0, 0, 1])
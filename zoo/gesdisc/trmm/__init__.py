@@ -1,10 +1,14 @@
-from . import TRMM_1B21_19971208_00170_7_HDF
-from . import TRMM_1B21_binDIDHmean
-from . import TRMM_1B21_CSI_binDIDHmean_zoom
-from . import TRMM_2A12_20140308_92894_7_HDF
-from . import TRMM_2A12_cldWater_lvl9
-from . import TRMM_2A25_CSI_nearSurfZ_zoom
-from . import TRMM_2B31_CSI_dHat_zoom
-from . import TRMM_3A46_ssmiData
-from . import TRMM_3B42_precipitation_scan0
-from . import TRMM_3B43_precipitation_scan0
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'TRMM_1B21_19971208_00170_7_HDF',
+    'TRMM_1B21_binDIDHmean',
+    'TRMM_1B21_CSI_binDIDHmean_zoom',
+    'TRMM_2A12_20140308_92894_7_HDF',
+    'TRMM_2A12_cldWater_lvl9',
+    'TRMM_2A25_CSI_nearSurfZ_zoom',
+    'TRMM_2B31_CSI_dHat_zoom',
+    'TRMM_3A46_ssmiData',
+    'TRMM_3B42_precipitation_scan0',
+    'TRMM_3B43_precipitation_scan0',
+])
@@ -1 +1,5 @@
-from . import lis
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'lis',
+])
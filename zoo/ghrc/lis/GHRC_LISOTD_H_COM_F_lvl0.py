@@ -19,9 +19,6 @@ Usage:  save this script and run
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
 
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
-
 Last Update: 2015/06/08
 """
 
@@ -29,52 +26,29 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
-USE_NETCDF4 = False
+
+import zoo.io
+import zoo.io.decode
+import zoo.plot
 
 def run(FILE_NAME):
 
     # Identify the data field.
     DATAFIELD_NAME = 'HRAC_COM_FR'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-        # Subset the data to match the size of the swath geolocation fields.
-        # Turn off autoscaling, we'll handle that ourselves due to the existance
-        # of the valid range attribute.
-        var = nc.variables[DATAFIELD_NAME]
-        _FillValue = var._FillValue
-        units = var.units
-        long_name = var.long_name
-        var.set_auto_maskandscale(False)
-        latitude = nc.variables['Latitude'][:]
-        longitude = nc.variables['Longitude'][:]
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        var = hdf.select(DATAFIELD_NAME)
-
-        # Retrieve attributes.
-        attrs = var.attributes(full=1)
-        fva=attrs["_FillValue"]
-        _FillValue = fva[0]   
-        ua=attrs["units"]
-        units = ua[0]
-        lna=attrs["long_name"]
-        long_name = lna[0]
-
-        lat = hdf.select('Latitude')
-        lon = hdf.select('Longitude')
-        latitude = lat[:]
-        longitude = lon[:]
-    
-    data = var[:,:,0]
-    data[data == _FillValue] = np.nan
-    datam = np.ma.masked_array(data, np.isnan(data))
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+
+        # Read only the first plane, and mask the fill value.
+        datam = zoo.io.decode.read(var, np.s_[:, :, 0])
+        units = var.attrs['units']
+        long_name = var.attrs['long_name']
+
+        latitude = f['Latitude'][:]
+        longitude = f['Longitude'][:]
 
 
     # Retrieve the geolocation.  There's a minor wraparound issue.
@@ -86,9 +60,9 @@ def run(FILE_NAME):
     
     # Draw a southern polar stereographic projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 45))
     m.drawmeridians(np.arange(-180, 180, 45), labels=[True,False,False,True])
@@ -1 +1,5 @@
-from . import GHRC_LISOTD_H_COM_F_lvl0
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'GHRC_LISOTD_H_COM_F_lvl0',
+])
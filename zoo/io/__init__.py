@@ -0,0 +1,48 @@
+"""
+Shared reader layer for the zoo examples.
+
+    >>> import zoo.io
+    >>> with zoo.io.open_file(hdffile) as f:
+    ...     var = f['Cloud_Fraction_Liquid']
+    ...     data = var[100:200, ::2]
+
+open_file picks pyhdf, h5py, netCDF4 or GDAL depending on the format of the
+file and on what is installed, and every backend returns the same lazy
+Variable.  Indexing a Variable reads only the requested hyperslab, in the
+type stored in the file:  slices with any step, integers and integer arrays
+are planned into the library's native start/count/stride read.
+
+structmetadata() parses the HDF-EOS StructMetadata of a file into grids and
+swaths (projection, corners, dimensions, dimension maps), once per file.
+
+zoo.io.dumper.load() reads the lat/lon text written by the HDF-EOS2 dumper
+through a binary, memory mapped sidecar that is built on first use.
+
+zoo.io.decode applies fill values, valid range, scale and offset in a single
+blocked pass, by the attribute conventions of each product family.
+
+zoo.io.vfm unpacks the bit fields of the CALIPSO Vertical Feature Mask onto
+a uniform profile by altitude grid.
+
+zoo.io.overview.build() reduces a big tile once into a pyramid of block
+mean or most frequent value levels, kept in a chunked HDF5 file next to it;
+zoo.io.overview.read(), and zoo.plot.read_decimated(), read the coarsest
+level that will do.
+
+zoo.io.mosaic.mosaic() places MODIS sinusoidal tiles in the global tile
+grid and writes them, read once each by a pool of threads, into one chunked
+HDF-EOS5 grid.
+
+TimeStack orders the granules of a directory by acquisition date and
+indexes them as one lazy (time, y, x) array, reading only the dates and the
+window asked for.
+
+zoo.io.export copies granules into chunked, compressed netCDF-4 files or
+Zarr stores (python -m zoo.io.export *.hdf);  open_file() then reads the
+variables of a granule from its copy for as long as the granule does not
+change.
+"""
+from .reader import File, Variable, open_file
+from .slicing import Hyperslab, plan
+from .stack import TimeStack
+from .structmetadata import StructMetadata, structmetadata
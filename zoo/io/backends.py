@@ -0,0 +1,514 @@
+"""
+Storage backends for the zoo reader layer.
+
+Each backend wraps one open file and exposes the same small interface:  the
+names of the variables it holds, the global attributes, the shape, type,
+dimensions and attributes of a variable, and a read method that takes a
+planned Hyperslab (see zoo.io.slicing) and issues it as the library's native
+start/count/stride read, so that only the requested hyperslab ever leaves the
+file.
+
+The libraries themselves are optional.  They are imported when a backend is
+first used, never at module import time.
+"""
+
+import contextlib
+import os
+import threading
+
+import numpy as np
+
+# Magic numbers used to sniff the container format.
+HDF4_MAGIC = b'\x0e\x03\x13\x01'
+HDF5_MAGIC = b'\x89HDF\r\n\x1a\n'
+NETCDF3_MAGIC = b'CDF'
+
+# Neither the HDF4 nor the netCDF C library is thread-safe;  threads that
+# read such files take turns with this lock.  h5py has a lock of its own.
+LIBRARY_LOCK = threading.Lock()
+
+# Backends to try for each container format, fastest first.  PyHDF and h5py
+# talk to the native libraries with the least overhead.  netCDF4 and GDAL
+# can read both formats, but only if they were built with HDF4/HDF-EOS
+# support (see the README).
+PREFERENCES = {
+    'hdf4': ('pyhdf', 'netcdf4', 'gdal'),
+    'hdf5': ('h5py', 'netcdf4', 'gdal'),
+    'netcdf3': ('netcdf4',),
+    'zarr': ('zarr',),
+}
+
+
+def sniff(filename):
+    """
+    Return the container format of a file:  'hdf4', 'hdf5' or 'netcdf3',
+    or 'zarr' for a Zarr store directory.
+    """
+    if os.path.isdir(filename):
+        for marker in ('.zgroup', 'zarr.json'):
+            if os.path.exists(os.path.join(filename, marker)):
+                return 'zarr'
+        msg = "{0} is a directory but not a Zarr store."
+        raise IOError(msg.format(filename))
+    with open(filename, 'rb') as f:
+        header = f.read(8)
+        if header[:4] == HDF4_MAGIC:
+            return 'hdf4'
+        if header[:3] == NETCDF3_MAGIC:
+            return 'netcdf3'
+
+        # An HDF5 superblock may sit after a user block at 0, 512, 1024,
+        # 2048, ... bytes.
+        offset = 0
+        while True:
+            f.seek(offset)
+            header = f.read(8)
+            if len(header) < 8:
+                break
+            if header == HDF5_MAGIC:
+                return 'hdf5'
+            offset = 512 if offset == 0 else offset * 2
+
+    msg = "Unable to determine the format of {0}."
+    raise IOError(msg.format(filename))
+
+
+def lock_for(filename):
+    """
+    What to hold while reading filename from one of several threads:
+    LIBRARY_LOCK, or nothing for HDF5 files.
+    """
+    if sniff(filename) in ('hdf5', 'zarr'):
+        return contextlib.nullcontext()
+    return LIBRARY_LOCK
+
+
+def normalize_attr(value):
+    """
+    Give attribute values the same shape whatever library produced them.
+
+    Strings come back as str, single values as scalars, and anything with
+    more than one value as a numpy array.
+    """
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'replace').rstrip('\x00')
+    if isinstance(value, (list, tuple)):
+        value = np.asarray(value)
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == 'S':
+            if value.size == 1:
+                return normalize_attr(value.ravel()[0])
+            return [normalize_attr(v) for v in value.ravel()]
+        if value.size == 1:
+            return value.ravel()[0]
+        return value
+    return value
+
+
+class Backend(object):
+    """
+    Interface shared by all backends.
+    """
+    name = None
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def variables(self):
+        raise NotImplementedError
+
+    def attrs(self):
+        raise NotImplementedError
+
+    def info(self, name):
+        """
+        Return (shape, dtype, dimensions, attrs) for a variable.
+        """
+        raise NotImplementedError
+
+    def read(self, name, slab):
+        """
+        Read a Hyperslab.  The result has shape slab.count.
+        """
+        raise NotImplementedError
+
+    def vdata(self, name):
+        """
+        Records of an HDF4 vdata, as a list of lists.  Only backends that
+        can see HDF4 vdata implement this.
+        """
+        msg = "The {0} backend cannot read vdata {1!r} of {2}."
+        raise KeyError(msg.format(self.name, name, self.filename))
+
+    def close(self):
+        pass
+
+
+class PyHDFBackend(Backend):
+    """
+    HDF4 through pyhdf's SD interface.
+    """
+    name = 'pyhdf'
+
+    def __init__(self, filename):
+        from pyhdf.SD import SD, SDC
+        Backend.__init__(self, filename)
+        self._sd = SD(filename, SDC.READ)
+        self._sds = {}
+
+    def _select(self, name):
+        try:
+            return self._sds[name]
+        except KeyError:
+            sds = self._sd.select(name)
+            self._sds[name] = sds
+            return sds
+
+    def variables(self):
+        return list(self._sd.datasets().keys())
+
+    def attrs(self):
+        return dict((k, normalize_attr(v))
+                    for k, v in self._sd.attributes().items())
+
+    def info(self, name):
+        sds = self._select(name)
+        _, rank, dims, sdtype, _ = sds.info()
+        if rank == 1:
+            dims = [dims]
+        dimnames = tuple(sds.dim(i).info()[0] for i in range(rank))
+        attrs = dict((k, normalize_attr(v))
+                     for k, v in sds.attributes().items())
+        return tuple(dims), _PYHDF_TYPES.get(sdtype), dimnames, attrs
+
+    def read(self, name, slab):
+        sds = self._select(name)
+        return sds.get(start=list(slab.start), count=list(slab.count),
+                       stride=list(slab.stride))
+
+    def vdata(self, name):
+        from pyhdf.HDF import HDF, HC
+        from pyhdf.error import HDF4Error
+        import pyhdf.VS  # noqa: F401, HDF.vstart() needs it imported
+        hdf = HDF(self.filename, HC.READ)
+        vs = hdf.vstart()
+        try:
+            try:
+                vd = vs.attach(name)
+            except HDF4Error:
+                msg = "No vdata {0!r} in {1}."
+                raise KeyError(msg.format(name, self.filename))
+            try:
+                return vd[:]
+            finally:
+                vd.detach()
+        finally:
+            vs.end()
+            hdf.close()
+
+    def close(self):
+        for sds in self._sds.values():
+            sds.endaccess()
+        self._sds = {}
+        self._sd.end()
+
+
+# pyhdf SDC type codes.
+_PYHDF_TYPES = {
+    3: np.dtype('S1'),     # UCHAR8
+    4: np.dtype('S1'),     # CHAR8
+    5: np.dtype('float32'),
+    6: np.dtype('float64'),
+    20: np.dtype('int8'),
+    21: np.dtype('uint8'),
+    22: np.dtype('int16'),
+    23: np.dtype('uint16'),
+    24: np.dtype('int32'),
+    25: np.dtype('uint32'),
+}
+
+
+class NetCDF4Backend(Backend):
+    """
+    netCDF-4, netCDF-3 and (if the library was built for it) HDF4 through
+    netCDF4-python.  Groups are flattened into '/'-separated paths.
+    """
+    name = 'netcdf4'
+
+    def __init__(self, filename):
+        from netCDF4 import Dataset
+        Backend.__init__(self, filename)
+        self._nc = Dataset(filename)
+        self._vars = {}
+        self._walk(self._nc, '')
+
+    def _walk(self, group, prefix):
+        for name, var in group.variables.items():
+            var.set_auto_maskandscale(False)
+            self._vars[prefix + name] = var
+        for name, subgroup in group.groups.items():
+            self._walk(subgroup, prefix + name + '/')
+
+    def variables(self):
+        return list(self._vars.keys())
+
+    def attrs(self):
+        return dict((k, normalize_attr(self._nc.getncattr(k)))
+                    for k in self._nc.ncattrs())
+
+    def info(self, name):
+        var = self._vars[name]
+        attrs = dict((k, normalize_attr(var.getncattr(k)))
+                     for k in var.ncattrs())
+        return var.shape, var.dtype, var.dimensions, attrs
+
+    def read(self, name, slab):
+        return np.asarray(self._vars[name][slab.slices])
+
+    def close(self):
+        self._nc.close()
+
+
+class H5PyBackend(Backend):
+    """
+    HDF5 and HDF-EOS5 through h5py.  Variables are named by their full path.
+    """
+    name = 'h5py'
+
+    def __init__(self, filename):
+        import h5py
+        Backend.__init__(self, filename)
+        self._h5 = h5py.File(filename, mode='r')
+        self._names = []
+
+        def visit(name, obj):
+            if isinstance(obj, h5py.Dataset):
+                self._names.append('/' + name)
+        self._h5.visititems(visit)
+
+    def variables(self):
+        return list(self._names)
+
+    def attrs(self):
+        return dict((k, normalize_attr(v)) for k, v in self._h5.attrs.items())
+
+    def info(self, name):
+        dset = self._h5[name]
+        dims = []
+        for dim in dset.dims:
+            dims.append(dim.label or '')
+        attrs = dict((k, normalize_attr(v)) for k, v in dset.attrs.items())
+        return dset.shape, dset.dtype, tuple(dims), attrs
+
+    def read(self, name, slab):
+        return self._h5[name][slab.slices]
+
+    def close(self):
+        self._h5.close()
+
+
+class ZarrBackend(Backend):
+    """
+    Zarr stores, such as those written by zoo.io.export.  Arrays are named
+    by their path in the store;  dimension names are read from the
+    _ARRAY_DIMENSIONS attribute that xarray and zoo.io.export write.
+    """
+    name = 'zarr'
+
+    def __init__(self, filename):
+        import zarr
+        Backend.__init__(self, filename)
+        try:
+            self._root = zarr.open_consolidated(filename, mode='r')
+        except (KeyError, ValueError):
+            self._root = zarr.open_group(filename, mode='r')
+        self._arrays = {}
+        self._walk(self._root, '')
+
+    def _walk(self, group, prefix):
+        for name, array in group.arrays():
+            self._arrays[prefix + name] = array
+        for name, subgroup in group.groups():
+            self._walk(subgroup, prefix + name + '/')
+
+    def variables(self):
+        return list(self._arrays.keys())
+
+    def attrs(self):
+        return dict((k, normalize_attr(v))
+                    for k, v in self._root.attrs.asdict().items())
+
+    def info(self, name):
+        array = self._arrays[name]
+        attrs = array.attrs.asdict()
+        dims = tuple(attrs.pop('_ARRAY_DIMENSIONS', ('',) * array.ndim))
+        attrs = dict((k, normalize_attr(v)) for k, v in attrs.items())
+        return array.shape, array.dtype, dims, attrs
+
+    def read(self, name, slab):
+        return np.asarray(self._arrays[name][slab.slices])
+
+
+class GDALBackend(Backend):
+    """
+    HDF4/HDF5 (including HDF-EOS grids) through GDAL subdatasets.
+
+    Each subdataset is a raster of shape (ysize, xsize), or
+    (bands, ysize, xsize) when it has more than one band.  Reads are issued
+    as windows so that GDAL only decodes the blocks that are needed.
+    """
+    name = 'gdal'
+
+    def __init__(self, filename):
+        gdal = _import_gdal()
+        Backend.__init__(self, filename)
+        self._gdal = gdal
+        self._ds = gdal.Open(filename)
+        if self._ds is None:
+            raise IOError("GDAL could not open {0}.".format(filename))
+        self._subdatasets = {}
+        meta = self._ds.GetMetadata('SUBDATASETS') or {}
+        for key, value in meta.items():
+            if key.endswith('_NAME'):
+                name = value.split(':')[-1].strip('"')
+                self._subdatasets[name] = value
+        if not self._subdatasets:
+            self._subdatasets[''] = filename
+        self._open = {}
+
+    def _dataset(self, name):
+        try:
+            return self._open[name]
+        except KeyError:
+            ds = self._gdal.Open(self._subdatasets[name])
+            self._open[name] = ds
+            return ds
+
+    def variables(self):
+        return list(self._subdatasets.keys())
+
+    def attrs(self):
+        return gdal_metadata(self._ds)
+
+    def info(self, name):
+        ds = self._dataset(name)
+        band = ds.GetRasterBand(1)
+        dtype = np.dtype(self._gdal_array().GDALTypeCodeToNumericTypeCode(
+            band.DataType))
+        if ds.RasterCount > 1:
+            shape = (ds.RasterCount, ds.RasterYSize, ds.RasterXSize)
+            dims = ('band', 'y', 'x')
+        else:
+            shape = (ds.RasterYSize, ds.RasterXSize)
+            dims = ('y', 'x')
+        return shape, dtype, dims, gdal_metadata(ds)
+
+    def _gdal_array(self):
+        try:
+            from osgeo import gdal_array
+        except ImportError:
+            import gdal_array
+        return gdal_array
+
+    def read(self, name, slab):
+        ds = self._dataset(name)
+        if ds.RasterCount > 1:
+            bands = range(slab.start[0],
+                          slab.start[0] + slab.count[0] * slab.stride[0],
+                          slab.stride[0])
+            rows, cols = 1, 2
+        else:
+            bands = [None]
+            rows, cols = 0, 1
+        y = slab.start[rows], slab.count[rows], slab.stride[rows]
+        x = slab.start[cols], slab.count[cols], slab.stride[cols]
+
+        planes = []
+        for b in bands:
+            source = ds if b is None else ds.GetRasterBand(b + 1)
+            planes.append(read_window(source, y, x))
+        if bands == [None]:
+            return planes[0]
+        return np.stack(planes)
+
+    def close(self):
+        self._open = {}
+        self._ds = None
+
+
+def read_window(source, y, x):
+    """
+    Read (start, count, stride) rows y and columns x of a GDAL band or
+    one-band dataset.
+    """
+    (y0, ny, sy), (x0, nx, sx) = y, x
+    xsize = (nx - 1) * sx + 1
+    if sy == 1:
+        plane = source.ReadAsArray(x0, y0, xsize, ny)
+    else:
+        # GDAL's decimating reads resample rather than subsample, so read
+        # only the rows that are wanted, one window each.
+        plane = np.stack([source.ReadAsArray(x0, y0 + i * sy, xsize, 1)
+                          for i in range(ny)]).reshape(ny, xsize)
+    return plane[:, ::sx]
+
+
+def _import_gdal():
+    try:
+        from osgeo import gdal
+    except ImportError:
+        import gdal
+    return gdal
+
+
+def gdal_metadata(source):
+    """
+    Metadata of a GDAL dataset or band as a dict of attributes, with
+    numbers parsed.
+    """
+    return dict((k, _parse_gdal_value(v))
+                for k, v in source.GetMetadata().items())
+
+
+def _parse_gdal_value(value):
+    """
+    GDAL reports all metadata as strings.  Turn numbers and comma separated
+    lists of numbers back into numbers.
+    """
+    parts = [p.strip() for p in value.split(',')]
+    try:
+        numbers = [float(p) for p in parts]
+    except ValueError:
+        return value
+    if len(numbers) == 1:
+        return numbers[0]
+    return np.array(numbers)
+
+
+def available(name):
+    """
+    Is the library behind a backend importable?
+    """
+    modules = {
+        'pyhdf': 'pyhdf.SD',
+        'netcdf4': 'netCDF4',
+        'h5py': 'h5py',
+        'zarr': 'zarr',
+    }
+    try:
+        if name == 'gdal':
+            _import_gdal()
+        else:
+            __import__(modules[name])
+    except ImportError:
+        return False
+    return True
+
+
+BACKENDS = {
+    'pyhdf': PyHDFBackend,
+    'netcdf4': NetCDF4Backend,
+    'h5py': H5PyBackend,
+    'gdal': GDALBackend,
+    'zarr': ZarrBackend,
+}
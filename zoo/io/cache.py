@@ -0,0 +1,119 @@
+"""
+Where the zoo keeps derived files:  binary geolocation, overviews, exported
+copies and so on.
+
+A derived file is written next to its source when that directory is
+writable, and otherwise under the cache directory, which is
+$HDFEOS_ZOO_CACHE or ~/.cache/hdfeos_zoo.  Files are written to a temporary
+name and renamed into place, so a reader never sees half a file.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+
+
+def cache_dir():
+    """
+    The directory for derived files that cannot go next to their source.
+    """
+    path = os.environ.get('HDFEOS_ZOO_CACHE')
+    if path is None:
+        path = os.path.join(os.path.expanduser('~'), '.cache', 'hdfeos_zoo')
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+    return path
+
+
+def sidecar(source, suffix):
+    """
+    Path of the derived file for source, e.g. sidecar('lat.output', '.npy').
+    """
+    source = os.path.abspath(source)
+    directory, name = os.path.split(source)
+    if os.access(directory, os.W_OK):
+        return os.path.join(directory, name + suffix)
+    # Keep files of the same name from different directories apart.
+    prefix = hashlib.sha1(directory.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(cache_dir(), prefix + '_' + name + suffix)
+
+
+def file_digest(filename, blocksize=1 << 20):
+    """
+    SHA-1 hex digest of a file's contents.
+    """
+    digest = hashlib.sha1()
+    with open(filename, 'rb') as fh:
+        for block in iter(lambda: fh.read(blocksize), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def signature(filename):
+    """
+    Size and modification time of a file, to tell whether it changed.
+    """
+    st = os.stat(filename)
+    return {'size': st.st_size, 'mtime': st.st_mtime}
+
+
+def fresh(filename, manifest_path):
+    """
+    True if the derived file described by the JSON manifest at
+    manifest_path was built from the current contents of filename.  The
+    manifest holds the signature() and the 'sha1' of the source.
+    """
+    manifest = load_manifest(manifest_path)
+    if manifest is None:
+        return False
+    current = signature(filename)
+    if manifest.get('size') != current['size']:
+        return False
+    if manifest.get('mtime') == current['mtime']:
+        return True
+    # Touched but maybe not changed (copied, extracted again):  compare the
+    # contents and keep the derived file if they are the same.
+    if manifest.get('sha1') != file_digest(filename):
+        return False
+    manifest.update(current)
+    write_manifest(manifest_path, manifest)
+    return True
+
+
+def load_manifest(path):
+    """
+    A manifest written by write_manifest(), or None if it cannot be read.
+    """
+    try:
+        with open(path) as fh:
+            return json.load(fh)
+    except (IOError, ValueError):
+        return None
+
+
+def write_manifest(path, manifest):
+    """
+    Write a manifest as JSON, atomically.
+    """
+    with atomic_path(path) as tmp:
+        with open(tmp, 'w') as fh:
+            json.dump(manifest, fh)
+
+
+@contextlib.contextmanager
+def atomic_path(path):
+    """
+    Yield a temporary path next to path, and rename it onto path if the
+    block succeeds.
+    """
+    directory, name = os.path.split(path)
+    fd, tmp = tempfile.mkstemp(prefix='.' + name, dir=directory)
+    os.close(fd)
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
@@ -0,0 +1,195 @@
+"""
+Turn stored integers into physical values:  fill values, valid range, scale
+and offset in one pass.
+
+    >>> rule = zoo.io.decode.rule_for(var.attrs, 'modis')
+    >>> data = zoo.io.decode.decode_masked(var[:], rule)
+
+The examples used to build five or more full size temporaries per field
+(two comparisons, two logical_or, the NaN mask, the scaled copy).  decode()
+works a block of rows at a time into one preallocated output, optionally
+with a separate boolean mask, so the temporaries are block sized.
+
+Products disagree on what scale and offset mean and on what they call
+them.  CONVENTIONS maps a convention name to the attribute names and to the
+formula;  rule_for() reads a variable's attributes through it.
+"""
+
+import collections
+
+import numpy as np
+
+from .. import phases
+
+# Elements decoded at a time.
+_BLOCK = 1 << 18
+
+Rule = collections.namedtuple('Rule', 'scale offset fill valid_min valid_max '
+                                      'formula')
+Rule.__doc__ = """\
+How to decode a field.  formula is 'cf' for x * scale + offset, 'modis' for
+(x - offset) * scale and 'divide' for (x - offset) / scale.  fill, valid_min
+and valid_max, in stored units, may be None."""
+Rule.__new__.__defaults__ = (1.0, 0.0, None, None, None, 'cf')
+
+Convention = collections.namedtuple('Convention', 'scale offset formula')
+
+CONVENTIONS = {
+    # netCDF/CF, HDF-EOS5 and most GES DISC products.
+    'cf': Convention('scale_factor', 'add_offset', 'cf'),
+    # MODIS HDF4 products, whose scale_factor/add_offset are GCTP-era.
+    'modis': Convention('scale_factor', 'add_offset', 'modis'),
+    # MOD09 surface reflectance, whose scale_factor is 10000.
+    'modis_divide': Convention('scale_factor', 'add_offset', 'divide'),
+    # MODIS L1B, with one scale and offset per band.
+    'modis_reflectance': Convention('reflectance_scales',
+                                    'reflectance_offsets', 'modis'),
+    'modis_radiance': Convention('radiance_scales', 'radiance_offsets',
+                                 'modis'),
+    # AMSR_E, with its own attribute names.
+    'amsre': Convention('SCALE FACTOR', 'OFFSET', 'cf'),
+}
+
+
+def _scalar(value, index):
+    value = np.asarray(value)
+    if value.ndim == 0:
+        return value.item()
+    if index is not None:
+        return value[index].item()
+    if value.size == 1:
+        return value.ravel()[0].item()
+    msg = "{0} values where one was expected;  give an index."
+    raise ValueError(msg.format(value.size))
+
+
+def rule_for(attrs, convention='cf', index=None):
+    """
+    Rule for a field from its attributes.
+
+    Parameters
+    ----------
+    attrs : dict
+        Attributes of the field, e.g. zoo.io.Variable.attrs.
+    convention : str
+        A key of CONVENTIONS.
+    index : int, optional
+        Which element to take from per-band scales and offsets.
+    """
+    try:
+        conv = CONVENTIONS[convention]
+    except KeyError:
+        msg = "Unknown convention {0!r}, not one of {1}."
+        raise ValueError(msg.format(convention, sorted(CONVENTIONS)))
+    scale = attrs.get(conv.scale)
+    offset = attrs.get(conv.offset)
+    fill = attrs.get('_FillValue')
+    valid_min = attrs.get('valid_min')
+    valid_max = attrs.get('valid_max')
+    if 'valid_range' in attrs:
+        valid_min, valid_max = np.asarray(attrs['valid_range']).tolist()
+    return Rule(1.0 if scale is None else _scalar(scale, index),
+                0.0 if offset is None else _scalar(offset, index),
+                None if fill is None else _scalar(fill, None),
+                valid_min, valid_max, conv.formula)
+
+
+def _invalid(x, rule):
+    bad = np.zeros(x.shape, dtype=bool)
+    if rule.valid_min is not None:
+        np.logical_or(bad, x < rule.valid_min, out=bad)
+    if rule.valid_max is not None:
+        np.logical_or(bad, x > rule.valid_max, out=bad)
+    if rule.fill is not None:
+        np.logical_or(bad, x == rule.fill, out=bad)
+    if x.dtype.kind == 'f':
+        np.logical_or(bad, np.isnan(x), out=bad)
+    return bad
+
+
+def _rows(a, rows):
+    """
+    a viewed as (rows, -1), which must not be a copy.
+    """
+    view = a.reshape(rows, -1)
+    if a.size and not np.shares_memory(view, a):
+        raise ValueError("Output arrays must be contiguous.")
+    return view
+
+
+@phases.timed('decode')
+def decode(raw, rule, dtype=np.float64, out=None, mask=None):
+    """
+    Decode stored values, setting invalid ones to NaN.
+
+    Parameters
+    ----------
+    raw : array_like
+        Stored values, of any numeric type.
+    rule : Rule
+        See rule_for().
+    dtype : numpy dtype
+        Type of the result, float32 or float64.
+    out : ndarray, optional
+        Where to write the result;  may be raw itself if raw is already of
+        a floating type.
+    mask : ndarray of bool, optional
+        Also set to True where values are invalid.
+
+    Returns
+    -------
+    out : ndarray
+    """
+    if rule.formula not in ('cf', 'modis', 'divide'):
+        raise ValueError("Unknown formula {0!r}.".format(rule.formula))
+    raw = np.asarray(raw)
+    if out is None:
+        out = np.empty(raw.shape, dtype=dtype)
+    for a in (out, mask):
+        if a is not None and a.shape != raw.shape:
+            msg = "Output of shape {0} for input of shape {1}."
+            raise ValueError(msg.format(a.shape, raw.shape))
+
+    rows = raw.shape[0] if raw.ndim else 1
+    r = raw.reshape(rows, -1)
+    o = _rows(out, rows)
+    m = None if mask is None else _rows(mask, rows)
+    step = max(1, _BLOCK // max(1, r.shape[1]))
+    for i in range(0, rows, step):
+        block = slice(i, i + step)
+        x = r[block]
+        # Validity is judged on the stored values, before writing.
+        bad = _invalid(x, rule)
+        y = o[block]
+        y[...] = x
+        if rule.formula == 'cf':
+            y *= rule.scale
+            y += rule.offset
+        else:
+            y -= rule.offset
+            if rule.formula == 'modis':
+                y *= rule.scale
+            else:
+                y /= rule.scale
+        y[bad] = np.nan
+        if m is not None:
+            m[block] = bad
+    return out
+
+
+def decode_masked(raw, rule, dtype=np.float64, out=None):
+    """
+    decode() into a masked array, masked where values are invalid.
+    """
+    mask = np.zeros(np.shape(raw), dtype=bool)
+    out = decode(raw, rule, dtype, out, mask)
+    return np.ma.MaskedArray(out, mask=mask, copy=False)
+
+
+def read(var, key=Ellipsis, convention='cf', index=None, dtype=np.float64):
+    """
+    Read var[key] of a zoo.io.Variable and decode it by its attributes into
+    a masked array.
+    """
+    return decode_masked(var[key], rule_for(var.attrs, convention, index),
+                         dtype)
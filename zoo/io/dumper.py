@@ -0,0 +1,70 @@
+"""
+Binary cache for the lat/lon text written by the HDF-EOS2 dumper (eos2dump).
+
+Several examples read geolocation that eos2dump wrote as one value per line,
+
+    >>> lat = zoo.io.dumper.load('lat_MYD09GQ.A2012246.h35v10.output',
+    ...                          data.shape)
+
+Parsing a 4800x4800 tile of text takes seconds.  The first load() of a file
+converts it into a float32 .npy sidecar, and every later load() memory maps
+that sidecar instead.  The sidecar remembers the size, modification time and
+SHA-1 of the text it came from, and is rebuilt when the text changes.
+"""
+
+import os
+
+import numpy as np
+
+from .. import phases
+from . import cache
+
+
+def convert(filename, dtype=np.float32):
+    """
+    Parse dumper text into a .npy sidecar and return the sidecar's path.
+    """
+    dtype = np.dtype(dtype)
+    suffix = '.{0}.npy'.format(dtype.name)
+    path = cache.sidecar(filename, suffix)
+
+    signature = cache.signature(filename)
+    values = np.loadtxt(filename, delimiter=',', usecols=0, ndmin=1)
+    with cache.atomic_path(path) as tmp:
+        with open(tmp, 'wb') as fh:
+            np.save(fh, values.astype(dtype))
+
+    manifest = dict(signature, sha1=cache.file_digest(filename),
+                    dtype=dtype.name, count=values.size)
+    cache.write_manifest(path + '.json', manifest)
+    return path
+
+
+@phases.timed('geolocate')
+def load(filename, shape=None, dtype=np.float32):
+    """
+    Values of a dumper text file, memory mapped from the binary sidecar.
+
+    Parameters
+    ----------
+    filename : str
+        A lat_*.output or lon_*.output file written by eos2dump.
+    shape : tuple, optional
+        Shape of the data field the values belong to;  the flat values are
+        reshaped to it.
+    dtype : numpy dtype
+        Type of the sidecar, float32 by default.
+
+    Returns
+    -------
+    numpy.memmap
+        A read-only array.
+    """
+    dtype = np.dtype(dtype)
+    path = cache.sidecar(filename, '.{0}.npy'.format(dtype.name))
+    if not (os.path.exists(path) and cache.fresh(filename, path + '.json')):
+        path = convert(filename, dtype)
+    values = np.load(path, mmap_mode='r')
+    if shape is not None:
+        values = values.reshape(shape)
+    return values
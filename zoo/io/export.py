@@ -0,0 +1,419 @@
+"""
+Copies of granules in chunked, compressed netCDF-4 or Zarr, which later
+reads use instead of the original.
+
+    >>> zoo.io.export.export(hdffile)
+    '.../MOD08_D3.A2010001.051.2010006113616.hdf.zoo.nc'
+    >>> with zoo.io.open_file(hdffile) as f:
+    ...     f['Cloud_Fraction_Liquid'].file.filename
+    '.../MOD08_D3.A2010001.051.2010006113616.hdf.zoo.nc'
+
+    $ python -m zoo.io.export -j 8 *.hdf
+    $ python -m zoo.io.export --format zarr --examples MOD08
+
+HDF4 through pyhdf reads one SDS at a time, on one thread, and most
+products are compressed as a whole or in row-long chunks.  export() copies
+the fields of a file block by block (so that no more than BLOCK_BYTES of a
+field is in memory) into square chunks with deflate (netCDF-4) or Blosc
+(Zarr, with consolidated metadata), keeping the groups, dimensions and
+attributes.  The fields of HDF-EOS grids get their longitude and latitude
+too, as CF auxiliary coordinates.
+
+A copy of the stored values (the default) stands in for the original:
+open_file() notices a fresh copy (see zoo.io.cache) and its variables are
+read from the copy;  the original is still used for anything the copy
+lacks.  With decoded=True the copy holds physical values as float32 with
+NaN for invalid ones and CF attributes, for other tools;  it is not used in
+place of the original.
+"""
+
+import argparse
+import datetime
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+
+from . import backends, cache, decode
+
+FORMATS = ('netcdf', 'zarr')
+SUFFIXES = {'netcdf': '.zoo.nc', 'zarr': '.zoo.zarr'}
+
+# Side of the chunks of 2D and higher fields, and length of 1D ones.
+CHUNK = 512
+CHUNK_1D = 1 << 16
+
+# Largest block of a field read and written at a time.
+BLOCK_BYTES = 64 << 20
+
+# Attributes that only describe the packing, dropped from decoded copies.
+_PACKING = set(['_FillValue', 'missing_value', 'valid_range', 'valid_min',
+                'valid_max', 'scale_factor', 'add_offset', 'scale_factor_err',
+                'add_offset_err', 'calibrated_nt', 'SCALE FACTOR', 'OFFSET',
+                'ScaleFactor', 'Offset'])
+
+
+def path_for(filename, fmt='netcdf'):
+    """
+    Where the copy of filename in format fmt goes.
+    """
+    return cache.sidecar(filename, SUFFIXES[fmt])
+
+
+def find(filename):
+    """
+    Path of a fresh copy of the stored values of filename that can be read
+    here, or None.
+    """
+    if os.environ.get('HDFEOS_ZOO_EXPORTS') == '0':
+        return None
+    for fmt, backend in (('zarr', 'zarr'), ('netcdf', 'netcdf4')):
+        path = path_for(filename, fmt)
+        manifest = path + '.json'
+        if not os.path.exists(manifest) or not backends.available(backend):
+            continue
+        if (cache.fresh(filename, manifest) and
+                not cache.load_manifest(manifest).get('decoded')):
+            return path
+    return None
+
+
+def _chunks(shape):
+    if len(shape) == 1:
+        return (max(1, min(shape[0], CHUNK_1D)),)
+    lead = tuple(1 for _ in shape[:-2])
+    return lead + tuple(max(1, min(n, CHUNK)) for n in shape[-2:])
+
+
+def _blocks(shape, itemsize):
+    """
+    Slices of the first axis that keep blocks under BLOCK_BYTES, in whole
+    chunks.
+    """
+    if not shape:
+        yield ()
+        return
+    row = itemsize * int(np.prod(shape[1:], dtype=np.int64))
+    chunk = _chunks(shape)[0]
+    rows = max(chunk, BLOCK_BYTES // max(row, 1) // chunk * chunk)
+    for start in range(0, shape[0], rows):
+        yield (slice(start, min(start + rows, shape[0])),)
+
+
+def _attr(value):
+    """
+    An attribute value netCDF and JSON both take.
+    """
+    if isinstance(value, list):
+        return '\n'.join(str(v) for v in value)
+    if isinstance(value, np.ndarray) and value.dtype.kind in 'SU':
+        return '\n'.join(str(v) for v in value.ravel())
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class _NetCDFWriter(object):
+    def __init__(self, path):
+        from netCDF4 import Dataset
+        self.root = Dataset(path, 'w', format='NETCDF4')
+
+    def _group(self, parts):
+        group = self.root
+        for part in parts:
+            if part not in group.groups:
+                group.createGroup(part)
+            group = group.groups[part]
+        return group
+
+    def _dims(self, group, dims, shape):
+        names = []
+        for i, (dim, n) in enumerate(zip(dims, shape)):
+            dim = (dim or 'dim{0}'.format(i)).replace('/', '_')
+            existing = group.dimensions.get(dim)
+            if existing is not None and len(existing) != n:
+                dim = '{0}_{1}'.format(dim, n)
+                existing = group.dimensions.get(dim)
+            if existing is None:
+                group.createDimension(dim, n)
+            names.append(dim)
+        return tuple(names)
+
+    def create(self, path, shape, dtype, dims, fill, attrs):
+        parts = [p for p in path.split('/') if p]
+        group = self._group(parts[:-1])
+        dims = self._dims(group, dims, shape)
+        var = group.createVariable(parts[-1], dtype, dims, zlib=True,
+                                   complevel=4, shuffle=True,
+                                   chunksizes=_chunks(shape) or None,
+                                   fill_value=fill)
+        var.set_auto_maskandscale(False)
+        for key, value in attrs.items():
+            var.setncattr(key, _attr(value))
+        return var
+
+    def set_attrs(self, attrs):
+        for key, value in attrs.items():
+            self.root.setncattr(key, _attr(value))
+
+    def close(self):
+        self.root.close()
+
+
+class _ZarrWriter(object):
+    def __init__(self, path):
+        import zarr
+        self.zarr = zarr
+        self.path = path
+        self.root = zarr.open_group(path, mode='w')
+
+    def create(self, path, shape, dtype, dims, fill, attrs):
+        array = self.root.create_dataset(
+            path.strip('/'), shape=shape, dtype=dtype, chunks=_chunks(shape),
+            fill_value=None if fill is None else np.asarray(fill).item())
+        names = [dim or 'dim{0}'.format(i) for i, dim in enumerate(dims)]
+        array.attrs['_ARRAY_DIMENSIONS'] = names
+        for key, value in attrs.items():
+            value = _attr(value)
+            if isinstance(value, np.ndarray):
+                value = value.tolist()
+            array.attrs[key] = value
+        return array
+
+    def set_attrs(self, attrs):
+        for key, value in attrs.items():
+            self.root.attrs[key] = _attr(value)
+
+    def close(self):
+        self.zarr.consolidate_metadata(self.path)
+
+
+def _grid_coordinates(f, names):
+    """
+    {grid name: (grid, [field paths])} for the named fields of f that are
+    fields of an HDF-EOS grid and end with its two dimensions.
+    """
+    from .structmetadata import structmetadata
+
+    try:
+        meta = structmetadata(f)
+    except KeyError:
+        return {}
+    grids = {}
+    for name in names:
+        grid = meta.grid_of(name.rstrip('/').split('/')[-1])
+        if (grid is None or grid.projection == 'SOM' or
+                f[name].shape[-2:] != grid.shape):
+            continue
+        grids.setdefault(grid.name, (grid, []))[1].append(name)
+    return grids
+
+
+def _write(writer, var, path, decoded, convention, attrs):
+    if decoded:
+        rule = decode.rule_for(var.attrs, convention)
+        attrs = dict((k, v) for k, v in attrs.items() if k not in _PACKING)
+        out = writer.create(path, var.shape, np.float32, var.dimensions,
+                            np.float32(np.nan), attrs)
+    else:
+        attrs = dict((k, v) for k, v in attrs.items() if k != '_FillValue')
+        fill = var.attrs.get('_FillValue')
+        if fill is not None:
+            fill = np.asarray(fill, var.dtype).ravel()[0]
+        out = writer.create(path, var.shape, var.dtype, var.dimensions,
+                            fill, attrs)
+    for block in _blocks(var.shape, var.dtype.itemsize):
+        data = var[block]
+        if decoded:
+            data = decode.decode(data, rule, np.float32)
+        out[block] = data
+
+
+def export(filename, names=None, fmt='netcdf', output=None, decoded=False,
+           convention='cf', geolocation=True):
+    """
+    Copy fields of a file into a chunked, compressed netCDF-4 file or Zarr
+    store.
+
+    Parameters
+    ----------
+    filename : str
+        The granule.
+    names : sequence of str, optional
+        Fields to copy, by default all of them.
+    fmt : str
+        'netcdf' or 'zarr'.
+    output : str, optional
+        Where to write, by default path_for(filename, fmt), where
+        open_file() looks for it.
+    decoded : bool
+        Copy physical values (see zoo.io.decode) instead of stored ones.
+    convention : str
+        Decoding convention for decoded copies.
+    geolocation : bool
+        Add longitude and latitude of the fields of HDF-EOS grids.
+
+    Returns
+    -------
+    str
+        The path written.
+    """
+    from .reader import open_file
+
+    if fmt not in FORMATS:
+        msg = "Unknown format {0!r}, not one of {1}."
+        raise ValueError(msg.format(fmt, FORMATS))
+    if output is None:
+        output = path_for(filename, fmt)
+    signature = cache.signature(filename)
+    directory = os.path.dirname(os.path.abspath(output))
+    tmp = tempfile.mkdtemp(prefix='.export', dir=directory)
+    try:
+        target = os.path.join(tmp, os.path.basename(output))
+        writer = (_ZarrWriter if fmt == 'zarr' else _NetCDFWriter)(target)
+        try:
+            with open_file(filename, backend=_source_backend(filename)) as f:
+                if names is None:
+                    names = sorted(f.variables)
+                # Text datasets (the StructMetadata.0 of HDF-EOS5, say) stay
+                # in the original.
+                names = [f[name].name for name in names
+                         if f[name].dtype.kind in 'biuf']
+                grids = _grid_coordinates(f, names) if geolocation else {}
+                coordinates = {}
+                for grid, fields in grids.values():
+                    coordinates.update(_write_lonlat(writer, f, grid,
+                                                     fields[0]))
+                    for name in fields:
+                        coordinates[name] = coordinates[fields[0]]
+                for name in names:
+                    var = f[name]
+                    attrs = dict(var.attrs)
+                    if name in coordinates:
+                        attrs['coordinates'] = coordinates[name]
+                    _write(writer, var, name, decoded, convention, attrs)
+                history = '{0} converted from {1} by zoo.io.export'.format(
+                    datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    os.path.basename(filename))
+                attrs = dict(f.attrs)
+                attrs.update(Conventions='CF-1.6', source=filename,
+                             history=history)
+                writer.set_attrs(attrs)
+        finally:
+            writer.close()
+        if os.path.isdir(output):
+            shutil.rmtree(output)
+        os.replace(target, output)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    manifest = dict(signature, sha1=cache.file_digest(filename), format=fmt,
+                    decoded=decoded, variables=names)
+    cache.write_manifest(output + '.json', manifest)
+    return output
+
+
+def _source_backend(filename):
+    """
+    Read the original, not an older copy of it.
+    """
+    fmt = backends.sniff(filename)
+    for name in backends.PREFERENCES[fmt]:
+        if backends.available(name):
+            return name
+    return None
+
+
+def _write_lonlat(writer, f, grid, name):
+    """
+    Write the longitude and latitude of a grid next to field name, and
+    return {name: 'lat lon'} with the paths of the two.
+    """
+    from ..geo.grid import GridGeolocator
+
+    var = f[name]
+    dims = var.dimensions[-2:]
+    prefix = name.rstrip('/').rsplit('/', 1)[0] + '/' if '/' in name else ''
+    lon_path = '{0}{1}_longitude'.format(prefix, grid.name)
+    lat_path = '{0}{1}_latitude'.format(prefix, grid.name)
+    lon = writer.create(lon_path, grid.shape, np.float32, dims, None,
+                        {'units': 'degrees_east',
+                         'standard_name': 'longitude'})
+    lat = writer.create(lat_path, grid.shape, np.float32, dims, None,
+                        {'units': 'degrees_north',
+                         'standard_name': 'latitude'})
+    geo = GridGeolocator(grid, np.float32)
+    for block in _blocks(grid.shape, 8):
+        lon[block], lat[block] = geo.lonlat(block[0])
+    return {name: '{0} {1}'.format(lat_path.split('/')[-1],
+                                   lon_path.split('/')[-1])}
+
+
+def _export_task(task):
+    filename, kwargs = task
+    try:
+        return filename, export(filename, **kwargs), None
+    except Exception as e:
+        return filename, None, '{0}: {1}'.format(type(e).__name__, e)
+
+
+def export_many(filenames, processes=None, **kwargs):
+    """
+    export() each of filenames in a pool of processes;  return (filename,
+    output or None, error or None) for each, in order.
+    """
+    tasks = [(filename, kwargs) for filename in filenames]
+    if processes == 1 or len(tasks) < 2:
+        return [_export_task(task) for task in tasks]
+    context = multiprocessing.get_context('spawn')
+    pool = context.Pool(processes)
+    try:
+        return pool.map(_export_task, tasks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m zoo.io.export',
+                                     description=__doc__.split('\n')[1])
+    parser.add_argument('files', nargs='*', help='granules to copy')
+    parser.add_argument('-f', '--format', choices=FORMATS, default='netcdf')
+    parser.add_argument('--decoded', action='store_true',
+                        help='copy physical values, not stored ones')
+    parser.add_argument('-e', '--examples', nargs='+', default=[],
+                        metavar='PATTERN',
+                        help="copy the data files of the examples matching")
+    parser.add_argument('-d', '--data-dir',
+                        default=os.environ.get('HDFEOS_ZOO_DIR', '.'),
+                        help='data files of the examples (default '
+                             '$HDFEOS_ZOO_DIR or .)')
+    parser.add_argument('-j', '--processes', type=int, default=None,
+                        help='worker processes (default: one per CPU)')
+    args = parser.parse_args(argv)
+
+    files = list(args.files)
+    if args.examples:
+        from ..batch import discover
+        for _, _, data in discover(args.examples):
+            path = None if data is None else os.path.join(args.data_dir,
+                                                          data)
+            if path is not None and os.path.exists(path) and \
+                    path not in files:
+                files.append(path)
+    status = 0
+    for filename, output, error in export_many(
+            files, args.processes, fmt=args.format, decoded=args.decoded):
+        if error is None:
+            print('{0} -> {1}'.format(filename, output))
+        else:
+            print('{0}: {1}'.format(filename, error))
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
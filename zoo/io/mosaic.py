@@ -0,0 +1,222 @@
+"""
+Mosaics of MODIS sinusoidal tiles.
+
+    >>> files = glob.glob('MOD13A1.A2007113.h*v*.hdf')
+    >>> zoo.io.mosaic.mosaic(files, '500m 16 days EVI', 'evi.he5')
+    '/HDFEOS/GRIDS/MODIS_Grid_16DAY_500m_VI/Data Fields/500m 16 days EVI'
+
+The land products come as 10 x 10 degree tiles of one global sinusoidal
+grid, h 0-35 from the west and v 0-17 from the north.  mosaic() finds the
+place of each tile (from the hNNvNN of its name, or from the corners in its
+StructMetadata), then reads every tile once, in a pool of threads, and
+writes it straight into its slot of a chunked, compressed HDF-EOS5 grid
+covering the tiles' bounding box.  Chunks divide the tile, so each tile
+fills whole chunks and none is read back;  tiles missing from the box are
+never written and read back as the fill value.  Values keep their stored
+type and attributes, so the field decodes as the tiles do, and the grid's
+StructMetadata lets zoo.geo.grid_geolocator() place the mosaic.
+
+The HDF4 library is not thread-safe, so reads of HDF4 tiles take turns;
+the pool then overlaps one tile's read with the writing of the others.
+"""
+
+import collections
+import concurrent.futures
+import os
+import re
+
+import numpy as np
+
+from . import backends, cache
+from .reader import open_file
+from .structmetadata import structmetadata
+
+# Side of a tile in metres, and the upper left corner of tile h00v00.
+TILE_M = 1111950.519667
+ULX = -20015109.354
+ULY = 10007554.677
+
+# Largest side of the output chunks.
+CHUNK = 512
+
+_TILE = re.compile(r'\.h(\d{2})v(\d{2})\.')
+
+METADATA = """\
+GROUP=SwathStructure
+END_GROUP=SwathStructure
+GROUP=GridStructure
+	GROUP=GRID_1
+		GridName="{grid}"
+		XDim={nx}
+		YDim={ny}
+		UpperLeftPointMtrs=({ulx:.6f},{uly:.6f})
+		LowerRightMtrs=({lrx:.6f},{lry:.6f})
+		Projection=HE5_GCTP_SNSOID
+		ProjParams=({params})
+		SphereCode={sphere}
+		GridOrigin=HE5_HDFE_GD_UL
+		PixelRegistration=HE5_HDFE_CENTER
+		GROUP=Dimension
+			OBJECT=Dimension_1
+				DimensionName="YDim"
+				Size={ny}
+			END_OBJECT=Dimension_1
+			OBJECT=Dimension_2
+				DimensionName="XDim"
+				Size={nx}
+			END_OBJECT=Dimension_2
+		END_GROUP=Dimension
+		GROUP=DataField
+			OBJECT=DataField_1
+				DataFieldName="{field}"
+				DataType=H5T_NATIVE_{dtype}
+				DimList=("YDim","XDim")
+			END_OBJECT=DataField_1
+		END_GROUP=DataField
+	END_GROUP=GRID_1
+END_GROUP=GridStructure
+GROUP=PointStructure
+END_GROUP=PointStructure
+GROUP=ZaStructure
+END_GROUP=ZaStructure
+END
+"""
+
+Tile = collections.namedtuple('Tile', 'h v filename')
+Tile.__doc__ = "A tile's horizontal and vertical number and its file."
+
+
+def tile_of(filename, name=None):
+    """
+    (h, v) of a tile, from its file name (e.g. MOD09A1.A2007001.h09v05...)
+    or else from the corner of its grid, the one holding field name if the
+    file has several.
+    """
+    match = _TILE.search(os.path.basename(filename))
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    grid = _grid(filename, name)
+    return (int(round((grid.upper_left[0] - ULX) / TILE_M)),
+            int(round((ULY - grid.upper_left[1]) / TILE_M)))
+
+
+def _grid(filename, name=None):
+    with backends.lock_for(filename):
+        meta = structmetadata(filename)
+    grid = meta.grid_of(name) if name else None
+    if grid is None:
+        if len(meta.grids) != 1:
+            msg = "{0} has no grid with a field {1!r}."
+            raise KeyError(msg.format(filename, name))
+        grid = list(meta.grids.values())[0]
+    if grid.projection != 'SNSOID':
+        msg = "Grid {0!r} of {1} is not sinusoidal but {2}."
+        raise ValueError(msg.format(grid.name, filename, grid.projection))
+    return grid
+
+
+def _read(filename, name, shape):
+    with backends.lock_for(filename):
+        with open_file(filename) as f:
+            var = f[name]
+            if var.shape != shape:
+                msg = "{0} of {1} is {2}, not {3} like the first tile."
+                raise ValueError(msg.format(name, filename, var.shape,
+                                            shape))
+            return var[...]
+
+
+def _chunk(n):
+    """
+    Largest divisor of n not above CHUNK, or CHUNK if they are all tiny.
+    """
+    for size in range(min(n, CHUNK), 0, -1):
+        if n % size == 0:
+            break
+    return size if size >= 64 or size == n else CHUNK
+
+
+def mosaic(filenames, name, output, threads=4):
+    """
+    Write the field name of many sinusoidal tiles as one grid.
+
+    Parameters
+    ----------
+    filenames : sequence of str
+        The tiles, of one product.
+    name : str
+        The field, as for zoo.io.File.
+    output : str
+        The HDF-EOS5 file to write;  it replaces any file there only once
+        complete.
+    threads : int
+        Tiles read at a time.
+
+    Returns
+    -------
+    str
+        Path of the field in output.
+    """
+    import h5py
+
+    if not filenames:
+        raise ValueError("No tiles to mosaic.")
+    tiles = {}
+    for filename in filenames:
+        h, v = tile_of(filename, name)
+        if (h, v) in tiles:
+            msg = "Tile h{0:02d}v{1:02d} is given twice:  {2} and {3}."
+            raise ValueError(msg.format(h, v, tiles[h, v].filename,
+                                        filename))
+        tiles[h, v] = Tile(h, v, filename)
+    tiles = sorted(tiles.values(), key=lambda t: (t.v, t.h))
+
+    grid = _grid(tiles[0].filename, name)
+    with backends.lock_for(tiles[0].filename):
+        with open_file(tiles[0].filename) as f:
+            var = f[name]
+            shape, dtype, attrs = var.shape, var.dtype, dict(var.attrs)
+            field = var.name.rstrip('/').split('/')[-1]
+    ny, nx = shape
+    h0 = min(t.h for t in tiles)
+    v0 = min(t.v for t in tiles)
+    nh = max(t.h for t in tiles) - h0 + 1
+    nv = max(t.v for t in tiles) - v0 + 1
+    ulx, uly = ULX + h0 * TILE_M, ULY - v0 * TILE_M
+    metadata = METADATA.format(
+        grid=grid.name, field=field, nx=nh * nx, ny=nv * ny, ulx=ulx,
+        uly=uly, lrx=ulx + nh * TILE_M, lry=uly - nv * TILE_M,
+        params=','.join('{0:f}'.format(p) for p in grid.proj_params),
+        sphere=-1 if grid.sphere_code is None else grid.sphere_code,
+        dtype=np.dtype(dtype).name.upper())
+    path = '/HDFEOS/GRIDS/{0}/Data Fields/{1}'.format(grid.name, field)
+
+    fill = attrs.get('_FillValue')
+    with cache.atomic_path(output) as tmp:
+        with h5py.File(tmp, 'w') as out:
+            out.create_dataset('HDFEOS INFORMATION/StructMetadata.0',
+                               data=np.bytes_(metadata))
+            dset = out.create_dataset(
+                path, shape=(nv * ny, nh * nx), dtype=dtype,
+                chunks=(_chunk(ny), _chunk(nx)), compression='gzip',
+                shuffle=True,
+                fillvalue=None if fill is None else np.asarray(fill, dtype))
+            for key, value in attrs.items():
+                dset.attrs[key] = value
+
+            def place(tile, future):
+                row = (tile.v - v0) * ny
+                col = (tile.h - h0) * nx
+                dset[row:row + ny, col:col + nx] = future.result()
+
+            # At most twice as many tiles in memory as there are threads.
+            pending = collections.deque()
+            with concurrent.futures.ThreadPoolExecutor(threads) as pool:
+                for tile in tiles:
+                    pending.append((tile, pool.submit(
+                        _read, tile.filename, name, shape)))
+                    if len(pending) > 2 * threads:
+                        place(*pending.popleft())
+                while pending:
+                    place(*pending.popleft())
+    return path
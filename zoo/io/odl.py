@@ -0,0 +1,141 @@
+"""
+Parser for the ODL (Object Description Language) text that HDF-EOS stores in
+the StructMetadata.0 attribute (HDF-EOS2) or dataset (HDF-EOS5).
+
+The text is a nest of GROUP/OBJECT blocks holding KEY=value statements:
+
+    GROUP=GridStructure
+        GROUP=GRID_1
+            GridName="MODIS_Grid_2D"
+            XDim=4800
+            UpperLeftPointMtrs=(-20015109.354000,-1111950.519667)
+            Projection=GCTP_SNSOID
+            ...
+        END_GROUP=GRID_1
+    END_GROUP=GridStructure
+    END
+
+parse() turns it into a tree of Group objects.  Values become str, int,
+float or tuples of those.
+"""
+
+import re
+
+# One regular expression tokenizes the whole text, so values that wrap over
+# several lines (long DimLists, for instance) need no special handling.
+_TOKEN = re.compile(r'''
+    (?P<string>"[^"]*")
+  | (?P<number>[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eEdD][+-]?\d+)?)(?=[\s,)=]|$)
+  | (?P<punct>[=(),])
+  | (?P<word>[^\s=(),"]+)
+  | (?P<space>\s+)
+''', re.VERBOSE)
+
+
+class Group(object):
+    """
+    A GROUP or OBJECT block.
+
+    Attributes
+    ----------
+    name : str
+        The name given on the GROUP= or OBJECT= line.
+    kind : str
+        'GROUP' or 'OBJECT' (the root is a 'GROUP' named '').
+    attrs : dict
+        The KEY=value statements of the block, in the order given.
+    children : list of Group
+        The nested blocks, in the order given.
+    """
+    def __init__(self, name, kind='GROUP'):
+        self.name = name
+        self.kind = kind
+        self.attrs = {}
+        self.children = []
+
+    def __repr__(self):
+        return "<{0} {1!r}: {2} attrs, {3} children>".format(
+            self.kind, self.name, len(self.attrs), len(self.children))
+
+    def __getitem__(self, key):
+        return self.attrs[key]
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def child(self, name):
+        """
+        The nested block with the given name, or None.
+        """
+        for group in self.children:
+            if group.name == name:
+                return group
+        return None
+
+
+def _tokens(text):
+    for match in _TOKEN.finditer(text):
+        kind = match.lastgroup
+        if kind == 'space':
+            continue
+        value = match.group(kind)
+        if kind == 'string':
+            value = value[1:-1]
+        elif kind == 'number':
+            value = _number(value)
+        yield kind, value
+
+
+def _number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text.replace('D', 'E').replace('d', 'e'))
+
+
+def parse(text):
+    """
+    Parse ODL text into a tree of Group objects and return the root.
+    """
+    root = Group('')
+    stack = [root]
+    tokens = list(_tokens(text))
+    i = 0
+    n = len(tokens)
+
+    def value_at(i):
+        kind, value = tokens[i]
+        if (kind, value) != ('punct', '('):
+            return value, i + 1
+        items = []
+        i += 1
+        while i < n and tokens[i] != ('punct', ')'):
+            if tokens[i] == ('punct', ','):
+                i += 1
+                continue
+            item, i = value_at(i)
+            items.append(item)
+        return tuple(items), i + 1
+
+    while i < n:
+        kind, key = tokens[i]
+        if kind == 'word' and key == 'END':
+            break
+        if i + 2 > n or tokens[i + 1] != ('punct', '='):
+            msg = "Malformed ODL near token {0} ({1!r})."
+            raise ValueError(msg.format(i, key))
+        value, i = value_at(i + 2)
+
+        if key in ('GROUP', 'OBJECT'):
+            group = Group(value, key)
+            stack[-1].children.append(group)
+            stack.append(group)
+        elif key in ('END_GROUP', 'END_OBJECT'):
+            if len(stack) == 1:
+                msg = "Unbalanced {0}={1} in ODL."
+                raise ValueError(msg.format(key, value))
+            stack.pop()
+        else:
+            stack[-1].attrs[key] = value
+
+    return root
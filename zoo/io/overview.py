@@ -0,0 +1,235 @@
+"""
+Overview pyramids of big tiles, so that a map of one reads only what it
+shows.
+
+    >>> with zoo.io.open_file(hdffile) as f:
+    ...     var = f['NDVI_TOA']
+    ...     zoo.io.overview.build(var)
+    ...     data, key = zoo.io.overview.read(var, (8, 8))
+
+Even a strided read of a 4800 x 4800 MODIS or 5000 x 5000 WELD tile goes
+through most of the chunks of the HDF4 SDS.  build() reduces the field once
+into levels of 2, 4, 8, ... times fewer cells a side, each level from the
+one before as gdaladdo does, by block mean for continuous fields and by the
+most frequent value for categories (snow cover, sea ice extent).  The
+levels go into a chunked, compressed HDF5 file next to the source (see
+zoo.io.cache), with a manifest that remembers the size, modification time
+and SHA-1 of the source.  read() picks the coarsest level that still has a
+cell for every step of the requested stride and reads only that.
+
+Means are kept in stored units, as float32 with NaN where a block had no
+valid value, so that the field's decode rule applies to them unchanged.
+Modes keep the stored type, fill values included.
+"""
+
+import os
+import re
+
+import numpy as np
+
+from .. import phases
+from . import cache, decode
+
+HOWS = ('mean', 'mode')
+
+# Levels stop before either side would get shorter than this.
+MIN_SIZE = 256
+
+# Side of the HDF5 chunks.
+CHUNK = 256
+
+# Elements read at a time while building.
+_BAND = 1 << 22
+
+
+def block_reduce(data, factors, how='mean'):
+    """
+    Reduce each block of factors[0] x factors[1] cells of 2D data to one,
+    by 'mean', 'min', 'max' or 'mode' (the most frequent of integer codes,
+    the smallest on ties).  Masked and NaN cells are left out;  rows and
+    columns that do not fill a block are dropped.  Returns a masked array.
+    """
+    if how not in ('mean', 'min', 'max', 'mode'):
+        raise ValueError("Unknown reduction {0!r}.".format(how))
+    data = np.ma.asarray(data)
+    if data.dtype.kind == 'f':
+        data = np.ma.masked_invalid(data, copy=False)
+    f0, f1 = factors
+    rows, cols = data.shape[0] // f0, data.shape[1] // f1
+    blocks = data[:rows * f0, :cols * f1].reshape(rows, f0, cols, f1)
+    if how == 'mean':
+        return blocks.mean(axis=(1, 3))
+    if how == 'min':
+        return blocks.min(axis=(1, 3))
+    if how == 'max':
+        return blocks.max(axis=(1, 3))
+
+    blocks = blocks.transpose(0, 2, 1, 3).reshape(rows * cols, f0 * f1)
+    valid = ~np.ma.getmaskarray(blocks)
+    mode = cell_mode(np.nonzero(valid)[0], np.ma.getdata(blocks)[valid],
+                     rows * cols)
+    return mode.reshape(rows, cols)
+
+
+def cell_mode(cell, codes, size):
+    """
+    Most frequent of the codes that fall in each of size cells, the
+    smallest on ties, as a masked array of the codes' type, masked where no
+    code falls.
+    """
+    # Sort the codes by cell and take the longest run of each, so that
+    # memory goes with the number of codes, not with the largest one.
+    order = np.lexsort((codes, cell))
+    codes, cell = codes[order], cell[order]
+    starts = np.flatnonzero(np.r_[True, (cell[1:] != cell[:-1]) |
+                                  (codes[1:] != codes[:-1])])
+    lengths = np.diff(np.r_[starts, codes.size])
+    run_cell, run_code = cell[starts], codes[starts]
+    best = np.lexsort((run_code, -lengths, run_cell))
+    best = best[np.r_[True, run_cell[best][1:] != run_cell[best][:-1]]]
+    mode = np.zeros(size, dtype=codes.dtype)
+    mask = np.ones(size, dtype=bool)
+    mode[run_cell[best]] = run_code[best]
+    mask[run_cell[best]] = False
+    return np.ma.MaskedArray(mode, mask=mask)
+
+
+def path_for(var):
+    """
+    Path of the overview file of a zoo.io.Variable.
+    """
+    name = re.sub(r'[^\w.-]+', '_', var.name.strip('/'))
+    return cache.sidecar(var.file.filename, '.{0}.ovr.h5'.format(name))
+
+
+def find(var):
+    """
+    Manifest of the overviews of var, or None if there are none or they
+    are out of date.
+    """
+    path = path_for(var)
+    manifest_path = path + '.json'
+    if not (os.path.exists(path) and
+            cache.fresh(var.file.filename, manifest_path)):
+        return None
+    manifest = cache.load_manifest(manifest_path)
+    if manifest.get('name') != var.name:
+        return None
+    return manifest
+
+
+def _reduce(src, dst, how, rule=None):
+    """
+    Halve 2D src into the dataset dst, a band of rows at a time.  Stored
+    values of src that rule finds invalid are left out of means.
+    """
+    rows, cols = dst.shape
+    band = max(1, _BAND // (2 * src.shape[1]))
+    for i in range(0, rows, band):
+        j = min(rows, i + band)
+        raw = np.asarray(src[2 * i:2 * j, :2 * cols])
+        if how == 'mean' and rule is not None:
+            raw = np.ma.masked_array(raw, decode._invalid(raw, rule))
+        reduced = block_reduce(raw, (2, 2), how)
+        if how == 'mean':
+            reduced = reduced.astype(np.float32).filled(np.nan)
+        dst[i:j] = np.ma.getdata(reduced)
+
+
+def build(var, how='mean', min_size=MIN_SIZE, force=False):
+    """
+    Build the overviews of a 2D field, unless they are up to date.
+
+    Parameters
+    ----------
+    var : zoo.io.Variable
+        The field.
+    how : str
+        'mean' for continuous fields, 'mode' for categories.
+    min_size : int
+        No level has a side shorter than this.
+    force : bool
+        Build even if the overviews are up to date.
+
+    Returns
+    -------
+    str
+        Path of the overview file.
+    """
+    import h5py
+
+    if how not in HOWS:
+        raise ValueError("Unknown reduction {0!r}.".format(how))
+    if var.ndim != 2:
+        msg = "Overviews need a 2D field, not {0} of shape {1}."
+        raise ValueError(msg.format(var.name, var.shape))
+    path = path_for(var)
+    manifest = None if force else find(var)
+    if manifest is not None and manifest['how'] == how:
+        return path
+
+    filename = var.file.filename
+    signature = cache.signature(filename)
+    rule = decode.rule_for(var.attrs)
+    dtype = np.float32 if how == 'mean' else var.dtype
+    factors = []
+    with cache.atomic_path(path) as tmp:
+        with h5py.File(tmp, 'w') as out:
+            src = var
+            factor = 2
+            while min(var.shape) // factor >= min_size:
+                shape = (var.shape[0] // factor, var.shape[1] // factor)
+                chunks = (min(CHUNK, shape[0]), min(CHUNK, shape[1]))
+                dst = out.create_dataset(str(factor), shape, dtype=dtype,
+                                         chunks=chunks, compression='gzip',
+                                         shuffle=True)
+                _reduce(src, dst, how, rule if src is var else None)
+                factors.append(factor)
+                src = dst
+                factor *= 2
+
+    manifest = dict(signature, sha1=cache.file_digest(filename),
+                    name=var.name, how=how, shape=list(var.shape),
+                    dtype=np.dtype(dtype).name, factors=factors)
+    cache.write_manifest(path + '.json', manifest)
+    return path
+
+
+@phases.timed('read')
+def read(var, step, how=None):
+    """
+    Read a field from its coarsest overview with a cell for every step.
+
+    Parameters
+    ----------
+    var : zoo.io.Variable
+        The field.
+    step : (int, int)
+        Read step along each axis of the field, e.g. from zoo.plot.stride().
+    how : str, optional
+        Only use overviews built this way.
+
+    Returns
+    -------
+    (data, key) or None
+        The level, sampled at the rest of the step, and the cells of the
+        field that data stands for, located by the centre cell of each
+        block;  or None if var has no such overview.
+    """
+    import h5py
+
+    manifest = find(var)
+    if manifest is None or how not in (None, manifest['how']):
+        return None
+    usable = [f for f in manifest['factors'] if f <= min(step)]
+    if not usable:
+        return None
+    factor = usable[-1]
+    t0, t1 = max(1, step[0] // factor), max(1, step[1] // factor)
+    with h5py.File(path_for(var), 'r') as f:
+        level = f[str(factor)]
+        rows, cols = level.shape
+        data = level[::t0, ::t1]
+    key = (slice(factor // 2, rows * factor, factor * t0),
+           slice(factor // 2, cols * factor, factor * t1))
+    return data, key
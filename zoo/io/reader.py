@@ -0,0 +1,231 @@
+"""
+File and Variable objects of the zoo reader layer.
+"""
+
+import os
+
+import numpy as np
+
+from .. import phases
+from . import backends
+from . import slicing
+
+
+class Variable(object):
+    """
+    Lazy handle on one dataset in a file.
+
+    Nothing is read until the variable is indexed.  The index is planned
+    into a native start/count/stride read (see zoo.io.slicing) so that only
+    the requested hyperslab is read, whatever the step or direction.  Data
+    come back in the type stored in the file;  no promotion to float64
+    happens here.
+    """
+    def __init__(self, file, name):
+        self.file = file
+        self.name = name
+        shape, dtype, dims, attrs = file.backend.info(name)
+        self.shape = tuple(int(n) for n in shape)
+        self.dtype = dtype
+        self.dimensions = tuple(dims)
+        self.attrs = attrs
+
+    def __repr__(self):
+        return "<zoo.io.Variable {0!r} shape={1} dtype={2} ({3})>".format(
+            self.name, self.shape, self.dtype, self.file.backend.name)
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        n = 1
+        for extent in self.shape:
+            n *= extent
+        return n
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        return self.read_slab(slicing.plan(key, self.shape))
+
+    def read(self, start=None, stop=None, stride=None):
+        """
+        Read a strided hyperslab given as start/stop/stride sequences, one
+        entry per dimension (None meaning the whole axis).
+        """
+        return self.read_slab(slicing.from_bounds(self.shape, start, stop,
+                                                  stride))
+
+    @phases.timed('read')
+    def read_slab(self, slab):
+        """
+        Read a Hyperslab planned by zoo.io.slicing.
+        """
+        if slab.empty:
+            data = np.empty(slab.count, dtype=self.dtype)
+        else:
+            data = self.file.backend.read(self.name, slab)
+        return slab.finish(data)
+
+    def __array__(self, dtype=None):
+        data = self[...]
+        return data if dtype is None else data.astype(dtype)
+
+
+class File(object):
+    """
+    A file opened through the fastest backend available for its format.
+
+    Variables are looked up by name.  HDF5 and grouped netCDF variables can
+    be given either by full path ('/HDFEOS/SWATHS/BrO/Data Fields/BrO') or,
+    when it is unique, by the last component of the path ('BrO').
+
+    Unless a backend is named, variables are read from a fresh exported copy
+    of the file when there is one (see zoo.io.export).
+    """
+    def __init__(self, filename, backend=None):
+        self.filename = filename
+        self.format = backends.sniff(filename)
+        self.backend = _open_backend(filename, self.format, backend)
+        self._variables = {}
+        self._attrs = None
+        self._export = None if backend is None else False
+
+    def __repr__(self):
+        return "<zoo.io.File {0!r} ({1})>".format(self.filename,
+                                                  self.backend.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._export:
+            self._export.close()
+        self.backend.close()
+
+    @property
+    def attrs(self):
+        """
+        Global (file) attributes.
+        """
+        if self._attrs is None:
+            self._attrs = self.backend.attrs()
+        return self._attrs
+
+    @property
+    def variables(self):
+        """
+        Names of all variables in the file.
+        """
+        return self.backend.variables()
+
+    def vdata(self, name):
+        """
+        Records of an HDF4 vdata (HDF-EOS keeps SOM block offsets in one,
+        for instance), as a list of lists.
+        """
+        return self.backend.vdata(name)
+
+    @property
+    def structmetadata(self):
+        """
+        The parsed HDF-EOS StructMetadata (see zoo.io.structmetadata).
+        """
+        from .structmetadata import structmetadata
+        return structmetadata(self)
+
+    def __contains__(self, name):
+        try:
+            self._resolve(name)
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, name):
+        path = self._resolve(name)
+        try:
+            return self._variables[path]
+        except KeyError:
+            exported = self._exported()
+            if exported is not None and path in exported:
+                var = exported[path]
+            else:
+                var = Variable(self, path)
+            self._variables[path] = var
+            return var
+
+    def _exported(self):
+        """
+        The fresh exported copy of the file, opened, or None.
+        """
+        if self._export is None:
+            from .export import find
+
+            self._export = False
+            path = find(self.filename)
+            if path is not None:
+                backend = 'zarr' if path.endswith('.zarr') else 'netcdf4'
+                self._export = File(path, backend=backend)
+        return self._export or None
+
+    def _resolve(self, name):
+        names = self.backend.variables()
+        if name in names:
+            return name
+        stripped = name.strip('/')
+        for candidate in names:
+            if candidate.strip('/') == stripped:
+                return candidate
+        matches = [c for c in names if c.rstrip('/').split('/')[-1] == name]
+        if len(matches) == 1:
+            return matches[0]
+        if len(matches) > 1:
+            msg = "{0!r} is ambiguous in {1}, use one of {2}."
+            raise KeyError(msg.format(name, self.filename, sorted(matches)))
+        msg = "No variable {0!r} in {1}."
+        raise KeyError(msg.format(name, self.filename))
+
+
+def _open_backend(filename, fmt, backend):
+    """
+    Open a file with the named backend, or with the first backend in the
+    preference list for its format that is installed and able to read it.
+    """
+    if backend is None:
+        backend = os.environ.get('HDFEOS_ZOO_BACKEND')
+    if backend is not None:
+        return backends.BACKENDS[backend](filename)
+
+    errors = []
+    for name in backends.PREFERENCES[fmt]:
+        if not backends.available(name):
+            continue
+        try:
+            return backends.BACKENDS[name](filename)
+        except Exception as e:
+            errors.append('{0}: {1}'.format(name, e))
+    msg = "No backend could read {0} ({1} format).  Tried: {2}"
+    raise IOError(msg.format(filename, fmt, '; '.join(errors) or 'none'))
+
+
+@phases.timed('read')
+def open_file(filename, backend=None):
+    """
+    Open a HDF4, HDF5 or netCDF file for lazy reading.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the file.
+    backend : str, optional
+        One of 'pyhdf', 'netcdf4', 'h5py' or 'gdal'.  By default the
+        HDFEOS_ZOO_BACKEND environment variable is consulted, and failing
+        that the fastest backend installed for the file's format is used.
+    """
+    return File(filename, backend=backend)
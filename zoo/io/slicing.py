@@ -0,0 +1,179 @@
+"""
+Slice planning for the zoo reader layer.
+
+An index into a Variable is turned into a Hyperslab:  one (start, count,
+stride) triple per dimension with a positive stride, which is what
+SDS.get, h5py, netCDF4 and GDAL windows can all read natively, plus the few
+steps that have to happen in memory afterwards (reversing axes read with a
+negative step, dropping axes indexed by an integer, picking the elements of
+an integer array index out of the bounding hyperslab).  The amount of data
+read is therefore proportional to the output, not to the dataset.
+"""
+
+import numpy as np
+
+
+class Hyperslab(object):
+    """
+    A planned read.
+
+    Attributes
+    ----------
+    start, count, stride : tuple of int
+        What to read from the file, one entry per dimension.
+    shape : tuple of int
+        Shape of the array after finish() has been applied.
+    """
+    def __init__(self, start, count, stride, flip, drop, take):
+        self.start = tuple(start)
+        self.count = tuple(count)
+        self.stride = tuple(stride)
+        self._flip = tuple(flip)
+        self._drop = tuple(drop)
+        self._take = dict(take)
+
+        shape = []
+        for axis, n in enumerate(self.count):
+            if axis in self._drop:
+                continue
+            if axis in self._take:
+                n = len(self._take[axis])
+            shape.append(n)
+        self.shape = tuple(shape)
+
+    def __repr__(self):
+        return "Hyperslab(start={0}, count={1}, stride={2})".format(
+            self.start, self.count, self.stride)
+
+    @property
+    def empty(self):
+        return any(n == 0 for n in self.count)
+
+    @property
+    def slices(self):
+        """
+        The read as a tuple of slices with positive steps.
+        """
+        return tuple(slice(s, s + (n - 1) * k + 1, k) if n > 0 else slice(s, s)
+                     for s, n, k in zip(self.start, self.count, self.stride))
+
+    @property
+    def size(self):
+        """
+        Number of elements read from the file.
+        """
+        n = 1
+        for c in self.count:
+            n *= c
+        return n
+
+    def finish(self, data):
+        """
+        Apply the in-memory part of the plan to the array that was read.
+        """
+        data = np.asarray(data).reshape(self.count)
+        for axis in self._flip:
+            data = np.flip(data, axis)
+        for axis, index in self._take.items():
+            data = np.take(data, index, axis=axis)
+        if self._drop:
+            data = data.reshape([n for i, n in enumerate(data.shape)
+                                 if i not in self._drop])
+        return data
+
+
+def plan(key, shape):
+    """
+    Plan the read for an index into an array of the given shape.
+
+    Slices (with any step), integers, Ellipsis, boolean masks and integer
+    arrays are supported.  Array indices are applied independently along
+    their axes (outer indexing, as in netCDF4), reading the smallest strided
+    hyperslab that contains them.
+    """
+    key = expand(key, len(shape))
+    start, count, stride = [], [], []
+    flip, drop, take = [], [], {}
+
+    for axis, (index, size) in enumerate(zip(key, shape)):
+        if isinstance(index, slice):
+            first, stop, step = index.indices(size)
+            n = len(range(first, stop, step))
+            if step < 0:
+                # Read ascending and reverse in memory.
+                first = first + (n - 1) * step if n > 0 else 0
+                step = -step
+                flip.append(axis)
+            start.append(first)
+            count.append(n)
+            stride.append(step)
+        elif np.ndim(index) == 0:
+            i = int(index)
+            if i < 0:
+                i += size
+            if not 0 <= i < size:
+                msg = "index {0} is out of bounds for axis {1} with size {2}"
+                raise IndexError(msg.format(index, axis, size))
+            start.append(i)
+            count.append(1)
+            stride.append(1)
+            drop.append(axis)
+        else:
+            index = np.asarray(index)
+            if index.dtype == bool:
+                if index.shape != (size,):
+                    msg = "boolean index does not match axis {0}"
+                    raise IndexError(msg.format(axis))
+                index = np.flatnonzero(index)
+            index = np.where(index < 0, index + size, index).astype(np.intp)
+            if index.size == 0:
+                start.append(0)
+                count.append(0)
+                stride.append(1)
+                take[axis] = index
+                continue
+            if index.min() < 0 or index.max() >= size:
+                raise IndexError("index out of bounds for axis "
+                                 "{0} with size {1}".format(axis, size))
+            lo, hi = int(index.min()), int(index.max())
+            # Read with the largest stride common to all requested elements.
+            step = int(np.gcd.reduce(index - lo)) or 1
+            start.append(lo)
+            count.append((hi - lo) // step + 1)
+            stride.append(step)
+            take[axis] = (index - lo) // step
+
+    return Hyperslab(start, count, stride, flip, drop, take)
+
+
+def from_bounds(shape, start=None, stop=None, stride=None):
+    """
+    Plan a read from start/stop/stride sequences, one entry per dimension.
+    None entries (or a missing sequence) mean the whole axis.
+    """
+    ndim = len(shape)
+    start = list(start or [None] * ndim)
+    stop = list(stop or [None] * ndim)
+    stride = list(stride or [None] * ndim)
+    key = tuple(slice(a, b, c) for a, b, c in zip(start, stop, stride))
+    return plan(key, shape)
+
+
+def expand(key, ndim):
+    """
+    Turn an index into a tuple with exactly one entry per dimension.
+    """
+    if not isinstance(key, tuple):
+        key = (key,)
+    n_ellipsis = sum(1 for k in key if k is Ellipsis)
+    if n_ellipsis > 1:
+        raise IndexError("an index can only have a single ellipsis")
+    if n_ellipsis:
+        i = [k is Ellipsis for k in key].index(True)
+        fill = (slice(None),) * (ndim - len(key) + 1)
+        key = key[:i] + fill + key[i + 1:]
+    if len(key) > ndim:
+        raise IndexError("too many indices for variable")
+    if any(k is None for k in key):
+        raise IndexError("newaxis is not supported, index the result instead")
+    return key + (slice(None),) * (ndim - len(key))
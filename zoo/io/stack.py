@@ -0,0 +1,230 @@
+"""
+Time series of a field over a stack of granules, as one lazy array.
+
+    >>> ndvi = zoo.io.TimeStack('/data/MOD13A1', '500m 16 days NDVI',
+    ...                         pattern='MOD13A1.*.h09v05.*.hdf')
+    >>> ndvi.shape
+    (230, 2400, 2400)
+    >>> history = ndvi[:, 1200, 800]
+
+A TimeStack finds the granules of a directory (or takes a list of files),
+orders them by the acquisition date in their names (the A2007257 of
+MOD13A1.A2007257.h09v05.005...hdf) and indexes like a (time, y, x) array.
+Nothing is read until it is indexed;  then only the dates asked for are
+opened, a pool of threads reads the same window out of each, and the
+windows are stacked.  A pixel history over ten years of tiles so reads a
+few values from each of a few hundred files.
+
+persist() copies the whole stack once into an HDF5 cube chunked along
+time, which later TimeStacks over the same, unchanged, files read instead
+of the granules.
+"""
+
+import concurrent.futures
+import datetime
+import glob
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+
+from . import backends, cache, decode, slicing
+from .reader import open_file
+
+_DATE = re.compile(r'(?:^|\.)A(\d{4})(\d{3})(?:\.|$)')
+
+# Chunks of the persisted cube:  dates, rows and columns.
+CHUNKS = (16, 128, 128)
+
+
+def date_of(filename):
+    """
+    Acquisition date in a granule's name, e.g. MOD11C2.A2007257...hdf, or
+    None.
+    """
+    match = _DATE.search(os.path.basename(filename))
+    if match is None:
+        return None
+    year, day = int(match.group(1)), int(match.group(2))
+    return datetime.date(year, 1, 1) + datetime.timedelta(day - 1)
+
+
+class TimeStack(object):
+    """
+    Lazy (time, ...) array of a field over granules ordered by date.
+
+    Parameters
+    ----------
+    source : str or sequence of str
+        A directory, searched with pattern, or a list of granules.
+    name : str
+        The field, as for zoo.io.File.
+    pattern : str
+        Shell pattern of the granules in a directory;  only names with a
+        date are used.
+    convention : str, optional
+        If given, values are decoded (see zoo.io.decode) by this convention
+        into masked float64 arrays;  otherwise they come back as stored.
+    threads : int
+        Granules read at a time.
+    """
+    def __init__(self, source, name, pattern='*', convention=None,
+                 threads=4):
+        if isinstance(source, str):
+            files = [f for f in glob.glob(os.path.join(source, pattern))
+                     if date_of(f) is not None]
+        else:
+            files = list(source)
+        dated = {}
+        for filename in files:
+            date = date_of(filename)
+            if date is None:
+                msg = "No acquisition date in the name of {0}."
+                raise ValueError(msg.format(filename))
+            if date in dated:
+                msg = "{0} and {1} are both of {2};  narrow the pattern."
+                raise ValueError(msg.format(dated[date], filename, date))
+            dated[date] = filename
+        if not dated:
+            msg = "No granules with a date in {0!r}."
+            raise ValueError(msg.format(source))
+
+        self.dates = sorted(dated)
+        self.files = [dated[d] for d in self.dates]
+        self.name = name
+        self.convention = convention
+        self.threads = threads
+        with backends.lock_for(self.files[0]):
+            with open_file(self.files[0]) as f:
+                var = f[name]
+                self.shape = (len(self.files),) + var.shape
+                self.dtype = var.dtype
+                self.attrs = dict(var.attrs)
+        self.cube = None
+        if os.path.exists(self._cube_path()):
+            self.cube = self._cube_path()
+
+    def __repr__(self):
+        return "<TimeStack {0!r} {1} from {2} to {3}>".format(
+            self.name, self.shape, self.dates[0], self.dates[-1])
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def index(self, date):
+        """
+        Position of the granule of date (a datetime.date).
+        """
+        try:
+            return self.dates.index(date)
+        except ValueError:
+            msg = "No granule of {0} in the stack."
+            raise KeyError(msg.format(date))
+
+    def __getitem__(self, key):
+        key = slicing.expand(key, self.ndim)
+        times = np.arange(len(self))[key[0]]
+        window = slicing.plan(key[1:], self.shape[1:])
+        if self.cube is not None:
+            return self._read_cube(times, window)
+        return self._read(times, window, self.convention)
+
+    def _read(self, times, window, convention):
+        def read(i):
+            filename = self.files[i]
+            with backends.lock_for(filename):
+                with open_file(filename) as f:
+                    var = f[self.name]
+                    if var.shape != self.shape[1:]:
+                        msg = "{0} of {1} is {2}, not {3}."
+                        raise ValueError(msg.format(
+                            self.name, filename, var.shape,
+                            self.shape[1:]))
+                    data = var.read_slab(window)
+                    attrs = var.attrs
+            if convention is None:
+                return data
+            return decode.decode_masked(data,
+                                        decode.rule_for(attrs, convention))
+
+        if np.ndim(times) == 0:
+            return read(int(times))
+        with concurrent.futures.ThreadPoolExecutor(self.threads) as pool:
+            slabs = list(pool.map(read, times))
+        if not slabs:
+            dtype = np.float64 if convention else self.dtype
+            return np.empty((0,) + window.shape, dtype=dtype)
+        stack = np.ma.stack if convention else np.stack
+        return stack(slabs)
+
+    def _key(self):
+        """
+        Digest of the field and of the name, size and modification time of
+        every granule.
+        """
+        files = [[os.path.abspath(f), cache.signature(f)]
+                 for f in self.files]
+        text = json.dumps([self.name, files], sort_keys=True)
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def _cube_path(self):
+        return os.path.join(cache.cache_dir(),
+                            'stack_{0}.h5'.format(self._key()))
+
+    def _read_cube(self, times, window):
+        import h5py
+
+        with h5py.File(self.cube, 'r') as f:
+            dset = f['stack']
+            if np.ndim(times) == 0:
+                data = window.finish(dset[(int(times),) + window.slices])
+            elif len(times) == 0:
+                data = np.empty((0,) + window.shape, dtype=self.dtype)
+            else:
+                # h5py wants increasing coordinates along one axis.
+                order, inverse = np.unique(times, return_inverse=True)
+                data = dset[(order.tolist(),) + window.slices][inverse]
+                data = np.stack([window.finish(d) for d in data])
+        if self.convention is None:
+            return data
+        rule = decode.rule_for(self.attrs, self.convention)
+        return decode.decode_masked(data, rule)
+
+    def persist(self, chunks=CHUNKS):
+        """
+        Copy the stack into a chunked, compressed HDF5 cube under the cache
+        directory, if it is not there already, and read from it from now
+        on.  The cube holds the values as stored;  the granules are read
+        chunks[0] dates at a time.
+        """
+        import h5py
+
+        path = self._cube_path()
+        if os.path.exists(path):
+            self.cube = path
+            return path
+        chunks = tuple(min(c, n) for c, n in zip(chunks, self.shape))
+        fill = self.attrs.get('_FillValue')
+        with cache.atomic_path(path) as tmp:
+            with h5py.File(tmp, 'w') as f:
+                dset = f.create_dataset(
+                    'stack', shape=self.shape, dtype=self.dtype,
+                    chunks=chunks, compression='gzip', shuffle=True,
+                    fillvalue=(None if fill is None
+                               else np.asarray(fill, self.dtype)))
+                for key, value in self.attrs.items():
+                    dset.attrs[key] = value
+                dset.attrs['dates'] = [d.isoformat() for d in self.dates]
+                everything = slicing.plan(Ellipsis, self.shape[1:])
+                for t in range(0, len(self), chunks[0]):
+                    times = np.arange(t, min(t + chunks[0], len(self)))
+                    dset[t:t + len(times)] = self._read(times, everything,
+                                                        None)
+        self.cube = path
+        return path
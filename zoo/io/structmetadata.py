@@ -0,0 +1,317 @@
+"""
+Typed view of HDF-EOS StructMetadata, parsed once per file.
+
+    >>> meta = zoo.io.structmetadata(hdffile)
+    >>> grid = meta.grids['mod08']
+    >>> grid.projection, grid.shape
+    ('GEO', (180, 360))
+    >>> lon, lat = grid.x, grid.y
+
+The parsed metadata is memoized per file, keyed by path, modification time
+and size, so reading several fields from one granule parses the metadata
+only once, and a rewritten file is parsed again.
+"""
+
+import collections
+import os
+import threading
+
+import numpy as np
+
+from . import odl
+
+Field = collections.namedtuple('Field', 'name dtype dims')
+Field.__doc__ = "A geolocation or data field and its dimension names."
+
+DimensionMap = collections.namedtuple('DimensionMap',
+                                      'geo_dim data_dim offset increment')
+DimensionMap.__doc__ = """\
+Regular mapping from a geolocation dimension onto a data dimension:
+data index = offset + increment * geolocation index."""
+
+
+def dms_to_degrees(value):
+    """
+    Convert GCTP packed degrees/minutes/seconds (DDDMMMSSS.SS) to degrees.
+    """
+    value = np.asarray(value, dtype=np.float64)
+    sign = np.where(value < 0, -1.0, 1.0)
+    value = np.abs(value)
+    degrees = np.floor(value / 1e6)
+    minutes = np.floor((value - degrees * 1e6) / 1e3)
+    seconds = value - degrees * 1e6 - minutes * 1e3
+    result = sign * (degrees + minutes / 60.0 + seconds / 3600.0)
+    return result if result.ndim else float(result)
+
+
+def _strip_prefix(text):
+    """
+    'HE5_GCTP_SNSOID' and 'GCTP_SNSOID' both become 'SNSOID', 'DFNT_INT16'
+    becomes 'INT16'.
+    """
+    for prefix in ('HE5_GCTP_', 'GCTP_', 'HE5_HDFE_', 'HDFE_', 'DFNT_',
+                   'H5T_NATIVE_'):
+        if text.startswith(prefix):
+            return text[len(prefix):]
+    return text
+
+
+def _fields(group, name_key):
+    fields = collections.OrderedDict()
+    if group is None:
+        return fields
+    for obj in group.children:
+        name = obj.get(name_key)
+        if name is None:
+            continue
+        dims = obj.get('DimList', ())
+        if not isinstance(dims, tuple):
+            dims = (dims,)
+        dtype = _strip_prefix(str(obj.get('DataType', '')))
+        fields[name] = Field(name, dtype, dims)
+    return fields
+
+
+def _dimensions(group):
+    dims = collections.OrderedDict()
+    if group is None:
+        return dims
+    for obj in group.children:
+        if 'DimensionName' in obj.attrs:
+            dims[obj['DimensionName']] = obj.get('Size')
+    return dims
+
+
+class Grid(object):
+    """
+    An HDF-EOS grid:  size, corners, projection and fields.
+
+    Corners and cell sizes are in projection units, except for geographic
+    (GEO) grids whose packed DMS corners are converted to degrees.
+    """
+    def __init__(self, group):
+        self.name = group['GridName']
+        self.xdim = int(group['XDim'])
+        self.ydim = int(group['YDim'])
+        self.projection = _strip_prefix(str(group.get('Projection', '')))
+        self.proj_params = tuple(group.get('ProjParams', ()))
+        self.zone = group.get('ZoneCode')
+        self.sphere_code = group.get('SphereCode')
+        self.origin = _strip_prefix(str(group.get('GridOrigin',
+                                                  'HDFE_GD_UL')))
+        self.pixel_registration = _strip_prefix(
+            str(group.get('PixelRegistration', 'HDFE_CENTER')))
+
+        upper_left = group.get('UpperLeftPointMtrs')
+        lower_right = group.get('LowerRightMtrs')
+        if self.projection == 'GEO':
+            if upper_left is not None:
+                upper_left = tuple(dms_to_degrees(v) for v in upper_left)
+            if lower_right is not None:
+                lower_right = tuple(dms_to_degrees(v) for v in lower_right)
+        self.upper_left = upper_left
+        self.lower_right = lower_right
+
+        self.dimensions = _dimensions(group.child('Dimension'))
+        self.fields = _fields(group.child('DataField'), 'DataFieldName')
+
+    def __repr__(self):
+        return "<Grid {0!r} {1}x{2} {3}>".format(self.name, self.ydim,
+                                                  self.xdim, self.projection)
+
+    @property
+    def shape(self):
+        return (self.ydim, self.xdim)
+
+    @property
+    def cell_size(self):
+        """
+        (dx, dy) in projection units;  dy is negative for north-up grids.
+        """
+        (x0, y0), (x1, y1) = self.upper_left, self.lower_right
+        return (x1 - x0) / self.xdim, (y1 - y0) / self.ydim
+
+    @property
+    def x(self):
+        """
+        Projection x coordinate of each column, at the pixel registration
+        point (cell center unless the grid says HDFE_CORNER).
+        """
+        dx = self.cell_size[0]
+        shift = 0.0 if self.pixel_registration == 'CORNER' else 0.5
+        return self.upper_left[0] + (np.arange(self.xdim) + shift) * dx
+
+    @property
+    def y(self):
+        """
+        Projection y coordinate of each row.
+        """
+        dy = self.cell_size[1]
+        shift = 0.0 if self.pixel_registration == 'CORNER' else 0.5
+        return self.upper_left[1] + (np.arange(self.ydim) + shift) * dy
+
+
+class Swath(object):
+    """
+    An HDF-EOS swath:  dimensions, dimension maps and fields.
+    """
+    def __init__(self, group):
+        self.name = group['SwathName']
+        self.dimensions = _dimensions(group.child('Dimension'))
+
+        self.dimension_maps = []
+        maps = group.child('DimensionMap')
+        for obj in (maps.children if maps is not None else []):
+            self.dimension_maps.append(DimensionMap(obj['GeoDimension'],
+                                                    obj['DataDimension'],
+                                                    obj['Offset'],
+                                                    obj['Increment']))
+
+        self.index_maps = []
+        maps = group.child('IndexDimensionMap')
+        for obj in (maps.children if maps is not None else []):
+            self.index_maps.append((obj['GeoDimension'],
+                                    obj['DataDimension']))
+
+        self.geo_fields = _fields(group.child('GeoField'), 'GeoFieldName')
+        self.data_fields = _fields(group.child('DataField'), 'DataFieldName')
+
+    def __repr__(self):
+        return "<Swath {0!r}: {1} geo fields, {2} data fields>".format(
+            self.name, len(self.geo_fields), len(self.data_fields))
+
+    def dimension_map(self, geo_dim, data_dim):
+        """
+        The DimensionMap from geo_dim onto data_dim, or None.
+        """
+        for dimmap in self.dimension_maps:
+            if (dimmap.geo_dim, dimmap.data_dim) == (geo_dim, data_dim):
+                return dimmap
+        return None
+
+
+class StructMetadata(object):
+    """
+    All grids and swaths described by a file's StructMetadata.
+
+    Attributes
+    ----------
+    grids, swaths : OrderedDict
+        Grid and Swath objects by name.
+    tree : odl.Group
+        The raw parse tree, for anything not covered by the typed view.
+    """
+    def __init__(self, text):
+        self.tree = odl.parse(text)
+        self.grids = collections.OrderedDict()
+        self.swaths = collections.OrderedDict()
+
+        structure = self.tree.child('GridStructure')
+        for group in (structure.children if structure is not None else []):
+            if 'GridName' in group.attrs:
+                grid = Grid(group)
+                self.grids[grid.name] = grid
+
+        structure = self.tree.child('SwathStructure')
+        for group in (structure.children if structure is not None else []):
+            if 'SwathName' in group.attrs:
+                swath = Swath(group)
+                self.swaths[swath.name] = swath
+
+    def __repr__(self):
+        return "<StructMetadata grids={0} swaths={1}>".format(
+            list(self.grids), list(self.swaths))
+
+    def grid_of(self, field):
+        """
+        The grid holding a data field, or None.
+        """
+        for grid in self.grids.values():
+            if field in grid.fields:
+                return grid
+        return None
+
+    def swath_of(self, field):
+        """
+        The swath holding a data or geolocation field, or None.
+        """
+        for swath in self.swaths.values():
+            if field in swath.data_fields or field in swath.geo_fields:
+                return swath
+        return None
+
+
+def text_of(f, kind='StructMetadata'):
+    """
+    The StructMetadata text of an open zoo.io.File, or with kind the text
+    of another metadata, e.g. 'CoreMetadata'.
+
+    HDF-EOS2 splits long metadata over StructMetadata.0, .1, ... global
+    attributes;  HDF-EOS5 keeps it in a dataset under /HDFEOS INFORMATION.
+    """
+    parts = []
+    i = 0
+    while '{0}.{1}'.format(kind, i) in f.attrs:
+        parts.append(f.attrs['{0}.{1}'.format(kind, i)])
+        i += 1
+    if not parts:
+        i = 0
+        while True:
+            name = '/HDFEOS INFORMATION/{0}.{1}'.format(kind, i)
+            if name not in f:
+                break
+            value = f[name][()]
+            if isinstance(value, np.ndarray):
+                value = value.item()
+            if isinstance(value, bytes):
+                value = value.decode('utf-8', 'replace')
+            parts.append(value)
+            i += 1
+    if not parts:
+        msg = "{0} has no {1}."
+        raise KeyError(msg.format(f.filename, kind))
+    return ''.join(p.rstrip('\x00') for p in parts)
+
+
+# Parsed metadata is small, but batch jobs touch many thousands of files.
+_CACHE_SIZE = 256
+_cache = collections.OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def structmetadata(source):
+    """
+    Parsed StructMetadata of a file, memoized by (path, mtime, size).
+
+    Parameters
+    ----------
+    source : str or zoo.io.File
+        A file name, or an already open file (which is then reused for
+        reading the metadata on a cache miss).
+    """
+    from .reader import open_file
+
+    filename = getattr(source, 'filename', source)
+    path = os.path.abspath(filename)
+    st = os.stat(path)
+    key = (path, st.st_mtime, st.st_size)
+    with _cache_lock:
+        meta = _cache.get(key)
+    if meta is not None:
+        return meta
+
+    if isinstance(source, str):
+        with open_file(filename) as f:
+            text = text_of(f)
+    else:
+        text = text_of(source)
+    meta = StructMetadata(text)
+
+    with _cache_lock:
+        # Drop entries for older versions of the same file.
+        for old in [k for k in _cache if k[0] == path]:
+            del _cache[old]
+        _cache[key] = meta
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return meta
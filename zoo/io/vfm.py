@@ -0,0 +1,192 @@
+"""
+Unpack the CALIPSO Vertical Feature Mask into an altitude resolved grid.
+
+    >>> vfm = zoo.io.vfm.read(hdffile, fields=('type', 'phase'))
+    >>> cloud = vfm['type'] == 2    # (profiles, altitude())
+
+Each 5 km record of Feature_Classification_Flags packs three altitude
+regimes of different resolution one after the other, each profile from the
+top down:
+
+    ==========  ============  ==========  ============  =======
+    altitude    columns       vertical    horizontal    offset
+    ==========  ============  ==========  ============  =======
+    20.2-30.1   3 x 55        180 m       1665 m        0
+     8.2-20.2   5 x 200       60 m        1000 m        165
+    -0.5- 8.2   15 x 290      30 m        333 m         1165
+    ==========  ============  ==========  ============  =======
+
+grid() spreads a record over 15 profiles of 1020 bins of 30 m, repeating
+the coarser bins 5 or 3 times across and 6 or 2 times down, with a single
+cached gather index.  unpack() takes every bit field of the 16 bit flags
+apart with one shift and mask each, before the expansion, on the packed
+records.
+"""
+
+import collections
+
+import numpy as np
+
+from .. import phases
+
+# (top km, bottom km, bins, profiles) of each regime, in file order.
+BLOCKS = ((30.1, 20.2, 55, 3), (20.2, 8.2, 200, 5), (8.2, -0.5, 290, 15))
+
+# Values in a record.
+RECORD = sum(bins * profiles for _, _, bins, profiles in BLOCKS)
+
+# Profiles and altitude bins of a record on the uniform grid.
+PROFILES = 15
+BIN_KM = 0.03
+BINS = int(round((BLOCKS[0][0] - BLOCKS[-1][1]) / BIN_KM))
+
+# Bit field name: (shift, bits), in the order of the CALIPSO data products
+# catalog.
+FIELDS = collections.OrderedDict([
+    # 0 invalid, 1 clear air, 2 cloud, 3 aerosol, 4 stratospheric feature,
+    # 5 surface, 6 subsurface, 7 no signal.
+    ('type', (0, 3)),
+    # 0 none, 1 low, 2 medium, 3 high.
+    ('type_qa', (3, 2)),
+    # 0 unknown, 1 randomly oriented ice, 2 water, 3 horizontally oriented
+    # ice.
+    ('phase', (5, 2)),
+    ('phase_qa', (7, 2)),
+    # Aerosol, cloud or PSC subtype, by type.
+    ('subtype', (9, 3)),
+    ('subtype_qa', (12, 1)),
+    # 0 not applicable, 1 1/3 km, 2 1 km, 3 5 km, 4 20 km, 5 80 km.
+    ('averaging', (13, 3)),
+])
+
+_cache = {}
+
+
+def altitude():
+    """
+    Altitude in km of the centre of each bin of the uniform grid, from
+    30.1 km down to -0.5 km.  The array is shared and read only.
+    """
+    value = _cache.get('altitude')
+    if value is None:
+        value = BLOCKS[0][0] - BIN_KM * (np.arange(BINS) + 0.5)
+        value.setflags(write=False)
+        _cache['altitude'] = value
+    return value
+
+
+def _index():
+    """
+    Flat (PROFILES * BINS) index into a record for each cell of its grid.
+    """
+    value = _cache.get('index')
+    if value is None:
+        parts = []
+        start = 0
+        profile = np.arange(PROFILES)[:, np.newaxis]
+        for top, bottom, bins, profiles in BLOCKS:
+            repeat = int(round((top - bottom) / bins / BIN_KM))
+            fine = np.arange(bins * repeat)[np.newaxis, :]
+            sub = profile // (PROFILES // profiles)
+            parts.append(start + sub * bins + fine // repeat)
+            start += bins * profiles
+        value = np.concatenate(parts, axis=1).ravel()
+        value.setflags(write=False)
+        _cache['index'] = value
+    return value
+
+
+@phases.timed('decode')
+def grid(records):
+    """
+    Spread (n, 5515) records, of any type, over the (n * 15, 1020) uniform
+    grid.  Row 15 * i + j is sub-profile j of record i, from the top down.
+    """
+    records = np.asarray(records)
+    if records.ndim != 2 or records.shape[1] != RECORD:
+        msg = "Records of shape {0}, where (n, {1}) was expected."
+        raise ValueError(msg.format(records.shape, RECORD))
+    out = records.take(_index(), axis=1)
+    return out.reshape(records.shape[0] * PROFILES, BINS)
+
+
+@phases.timed('decode')
+def unpack(flags, fields=None):
+    """
+    Bit fields of Feature_Classification_Flags.
+
+    Parameters
+    ----------
+    flags : array_like
+        The flags, of any shape.
+    fields : sequence of str, optional
+        Keys of FIELDS, by default all of them.
+
+    Returns
+    -------
+    dict
+        uint8 array of the shape of flags for each field.
+    """
+    if fields is None:
+        fields = list(FIELDS)
+    flags = np.asarray(flags).astype(np.uint16, copy=False)
+    work = np.empty(flags.shape, dtype=np.uint16)
+    out = collections.OrderedDict()
+    for name in fields:
+        try:
+            shift, bits = FIELDS[name]
+        except KeyError:
+            msg = "Unknown field {0!r}, not one of {1}."
+            raise ValueError(msg.format(name, list(FIELDS)))
+        np.right_shift(flags, shift, out=work)
+        np.bitwise_and(work, (1 << bits) - 1, out=work)
+        out[name] = work.astype(np.uint8)
+    return out
+
+
+def read(source, key=slice(None), fields=('type',)):
+    """
+    Read and unpack the Vertical Feature Mask of a file onto the uniform
+    grid.
+
+    Parameters
+    ----------
+    source : str or zoo.io.File
+        A CAL_LID_L2_VFM file.
+    key : slice, optional
+        Records to read.
+    fields : sequence of str, optional
+        Keys of FIELDS.
+
+    Returns
+    -------
+    dict
+        A (n * 15, 1020) uint8 array for each field, and 'latitude' and
+        'longitude' of each of the n * 15 profiles.  Profiles of a record
+        share its geolocation.
+    """
+    from .reader import open_file
+
+    f = open_file(source) if isinstance(source, str) else source
+    try:
+        flags = f['Feature_Classification_Flags'][key, :]
+        lat = f['Latitude'][key]
+        lon = f['Longitude'][key]
+    finally:
+        if f is not source:
+            f.close()
+    out = collections.OrderedDict()
+    for name, value in unpack(flags, fields).items():
+        out[name] = grid(value)
+    out['latitude'] = np.repeat(np.ravel(lat), PROFILES)
+    out['longitude'] = np.repeat(np.ravel(lon), PROFILES)
+    return out
+
+
+def iter_granules(filenames, key=slice(None), fields=('type',)):
+    """
+    read() one granule after another, yielding (filename, dict), so that a
+    day or more of files is never in memory at once.
+    """
+    for filename in filenames:
+        yield filename, read(filename, key, fields)
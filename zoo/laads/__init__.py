@@ -1,3 +1,7 @@
-from . import mod
-from . import myd
-from . import viirs
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'mod',
+    'myd',
+    'viirs',
+])
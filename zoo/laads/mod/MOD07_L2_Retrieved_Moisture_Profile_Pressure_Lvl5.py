@@ -18,90 +18,49 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'Retrieved_Moisture_Profile'
 
-    if USE_NETCDF4:        
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-        var = nc.variables[DATAFIELD_NAME]
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
 
-        # The scaling equation to be used here is not 
+        # Read only the 5th level.  The scaling equation to be used here is
+        # not
         #
         #     data = data * scale + offset
         #
-        # We'll turn autoscaling off in order to correctly scale the data.
-        var.set_auto_maskandscale(False)
-        data = var[5,:,:].astype(np.double)
-    
+        # but the MODIS one.
+        datam = zoo.io.decode.read(var, np.s_[5, :, :], convention='modis')
+
         # Retrieve the geolocation data.
-        longitude = nc.variables['Longitude'][:]
-        latitude = nc.variables['Latitude'][:]
+        latitude = f['Latitude'][:]
+        longitude = f['Longitude'][:]
 
         # Retrieve attributes.
-        scale_factor = var.scale_factor 
-        add_offset = var.add_offset
-        _FillValue = var._FillValue
-        long_name = var.long_name
-        units = var.units
+        long_name = var.attrs['long_name']
+        units = var.attrs['units']
 
         # Retrieve dimension name.
         dimname = var.dimensions[0]
-
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data3D = hdf.select(DATAFIELD_NAME)
-        data = data3D[5,:,:].astype(np.double)
-
-        # Read geolocation dataset.
-        lat = hdf.select('Latitude')
-        latitude = lat[:,:]
-        lon = hdf.select('Longitude')
-        longitude = lon[:,:]
-
-        # Retrieve attributes.
-        attrs = data3D.attributes(full=1)
-        lna=attrs["long_name"]
-        long_name = lna[0]
-        aoa=attrs["add_offset"]
-        add_offset = aoa[0]
-        fva=attrs["_FillValue"]
-        _FillValue = fva[0]
-        sfa=attrs["scale_factor"]
-        scale_factor = sfa[0]        
-        ua=attrs["units"]
-        units = ua[0]
-
-        # Retrieve dimension name.
-        dim = data3D.dim(0)
-        dimname = dim.info()[0]
-
-
-
-    data[data == _FillValue] = np.nan
-    data = (data - add_offset) * scale_factor 
-    datam = np.ma.masked_array(data, np.isnan(data))
     
     # Render the plot in a south plar stereographic projection.
-    m = Basemap(projection='spstere', resolution='l',
-                boundinglat=-60, lon_0=180)
+    m = zoo.plot.basemap(projection='spstere', resolution='l',
+                         boundinglat=-60, lon_0=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 50., 10.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 181., 30), labels=[0, 0, 0, 1])
@@ -25,95 +25,39 @@ import re
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
-import mpl_toolkits.basemap.pyproj as pyproj
 import numpy as np
 
-USE_GDAL = False
+import zoo.io
+import zoo.io.decode
+import zoo.plot
 
 def run(FILE_NAME):
     
     # Identify the data field.
-    GRID_NAME = 'mod08'
     DATAFIELD_NAME = 'Cloud_Fraction_Liquid'
 
-    if USE_GDAL:
-        import gdal
-        gname = 'HDF4_EOS:EOS_GRID:"{0}":{1}:{2}'.format(FILE_NAME,
-                                                         GRID_NAME,
-                                                         DATAFIELD_NAME)
-        gdset = gdal.Open(gname)
-        data = gdset.ReadAsArray().astype(np.float64)
-
-        # Read parameters for constructing the grid.
-        x0, xinc, _, y0, _, yinc = gdset.GetGeoTransform()
-        nx, ny = (gdset.RasterXSize, gdset.RasterYSize)
-
-
-        # Read fill value, valid range, scale factor, add_offset attributes.
-        metadata = gdset.GetMetadata()
-        valid_range = [float(x) for x in metadata['valid_range'].split(', ')]
-        _FillValue = float(metadata['_FillValue'])
-        scale_factor = float(metadata['scale_factor'])                   
-        add_offset = float(metadata['add_offset'])
-        units = metadata['units']
-        long_name = metadata['long_name']
-        del gdset
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:].astype(np.double)
-        attrs = data2D.attributes(full=1)
-        lna=attrs["long_name"]
-        long_name = lna[0]
-        vra=attrs["valid_range"]
-        valid_range = vra[0]
-        aoa=attrs["add_offset"]
-        add_offset = aoa[0]
-        fva=attrs["_FillValue"]
-        _FillValue = fva[0]
-        sfa=attrs["scale_factor"]
-        scale_factor = sfa[0]        
-        ua=attrs["units"]
-        units = ua[0]
-        
-        # This product uses geographic projection. 
-        # Ideally, these parameters should be obtained by parsing
-        # StructMetadta attribute but we assume that user has 
-        # checked it with HDFView.
-        # Upper left corner: HDF-EOS2 convention
-        x0 = -180 
-        y0 = 90
-        # Grid spacing
-        xinc = 1
-        yinc = -1     
-        # Grid size
-        nx = 360
-        ny = 180
-                           
-
-    invalid = data < valid_range[0]
-    invalid = np.logical_or(invalid, data > valid_range[1])
-    invalid = np.logical_or(invalid, data == _FillValue)
-    data[invalid] = np.nan
-
-    data =  scale_factor * (data - add_offset)
-    data = np.ma.masked_array(data, np.isnan(data))
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+
+        # Apply the fill value, valid range, scale factor and add_offset
+        # attributes as they are read.
+        data = zoo.io.decode.read(var, convention='modis')
+        long_name = var.attrs['long_name']
+        units = var.attrs['units']
     
-    x = np.linspace(x0, x0 + xinc*nx, nx)
-    y = np.linspace(y0, y0 + yinc*ny, ny)
-    lon, lat = np.meshgrid(x, y)
+    # This product uses geographic projection.  The grid parameters (corners,
+    # spacing and size) come from the StructMetadata.0 attribute.
+    grid = zoo.io.structmetadata(FILE_NAME).grid_of(DATAFIELD_NAME)
 
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-180, urcrnrlon = 180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-180, urcrnrlon = 180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 180., 45.), labels=[0, 0, 0, 1])
-    m.pcolormesh(lon, lat, data)
+    zoo.plot.image(m, grid.x, grid.y, data)
     cb = m.colorbar()
     cb.set_label(units)
 
@@ -18,86 +18,44 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = True
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'EV_1KM_Emissive'
-    if USE_NETCDF4:    
-        from netCDF4 import Dataset    
-        nc = Dataset(FILE_NAME)
-        var = nc.variables[DATAFIELD_NAME]
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
 
-        # Have to be very careful of the scaling equation here.
-        # We'll turn autoscaling off in order to correctly scale the data.
-        var.set_auto_maskandscale(False)
-        data = var[0,:,:].astype(np.double)
+        # Read only level 0.  The scale and offset attributes do not have
+        # standard names in this case, and hold one value per level.
+        data = zoo.io.decode.read(var, np.s_[0, :, :],
+                                  convention='modis_radiance', index=0)
 
-        # Retrieve the geolocation data.
-        longitude = nc.variables['Longitude'][:]
-        latitude = nc.variables['Latitude'][:]
-
-        # Retrieve attributes.
-        scale_factor = var.radiance_scales[0]
-        add_offset = var.radiance_offsets[0]
-        _FillValue = var._FillValue
-        valid_min = var.valid_range[0]
-        valid_max = var.valid_range[1]
-        long_name = var.long_name
-        units = var.radiance_units
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data3D = hdf.select(DATAFIELD_NAME)
-        data = data3D[0,:,:].astype(np.double)
-        
         # Read geolocation dataset.
-        lat = hdf.select('Latitude')
-        latitude = lat[:,:]
-        lon = hdf.select('Longitude')
-        longitude = lon[:,:]
+        latitude = f['Latitude'][:]
+        longitude = f['Longitude'][:]
 
         # Retrieve attributes.
-        attrs = data3D.attributes(full=1)
-        lna=attrs["long_name"]
-        long_name = lna[0]
-        aoa=attrs["radiance_offsets"]
-        add_offset = aoa[0][0]
-        fva=attrs["_FillValue"]
-        _FillValue = fva[0]
-        sfa=attrs["radiance_scales"]
-        scale_factor = sfa[0][0]       
-        vra=attrs["valid_range"]
-        valid_min = vra[0][0]        
-        valid_max = vra[0][1]        
-        ua=attrs["radiance_units"]
-        units = ua[0]
-
-    invalid = np.logical_or(data > valid_max,
-                            data < valid_min)
-    invalid = np.logical_or(invalid, data == _FillValue)
-    data[invalid] = np.nan
-    data = (data - add_offset) * scale_factor 
-    data = np.ma.masked_array(data, np.isnan(data))
+        long_name = var.attrs['long_name']
+        units = var.attrs['radiance_units']
 
 
     # Render the plot in a cylindrical projection.
-    m = Basemap(projection='cyl', resolution='l', 
-                llcrnrlat=-12, urcrnrlat = -9,
-                llcrnrlon=-64, urcrnrlon = -61)
+    m = zoo.plot.basemap(projection='cyl', resolution='l', 
+                         llcrnrlat=-12, urcrnrlat = -9,
+                         llcrnrlon=-64, urcrnrlon = -61)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-12., -8., 1.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-64, -60., 1), labels=[0, 0, 0, 1])
@@ -18,104 +18,45 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'Cloud_Fraction'
-    if USE_NETCDF4:        
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-        var = nc.variables[DATAFIELD_NAME]
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
 
         # Have to be very careful of the scaling equation here.
-        # We'll turn autoscaling off in order to correctly scale the data.
-        var.set_auto_maskandscale(False)
-        data = var[:].astype(np.double)
+        data = zoo.io.decode.read(var, convention='modis')
 
-        # Retrieve the geolocation data.
-        longitude = nc.variables['Longitude'][:]
-        latitude = nc.variables['Latitude'][:]
+        # Read geolocation dataset, which is scaled by the same equation.
+        lat = f['Latitude']
+        lon = f['Longitude']
+        latitude = ((lat[:] - lat.attrs['add_offset'])
+                    * lat.attrs['scale_factor'])
+        longitude = ((lon[:] - lon.attrs['add_offset'])
+                     * lon.attrs['scale_factor'])
 
         # Retrieve attributes.
-        scale_factor = var.scale_factor 
-        add_offset = var.add_offset
-        _FillValue = var._FillValue
-        valid_min = var.valid_range[0]
-        valid_max = var.valid_range[1]
-        long_name = var.long_name
-        units = var.units
-
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:].astype(np.double)
-
-        # Read geolocation dataset.
-        lat = hdf.select('Latitude')
-        latitude = lat[:,:]
-        lon = hdf.select('Longitude')
-        longitude = lon[:,:]
-        
-        # Retrieve attributes.
-        attrs = data2D.attributes(full=1)
-        lna=attrs["long_name"]
-        long_name = lna[0]
-        aoa=attrs["add_offset"]
-        add_offset = aoa[0]
-        fva=attrs["_FillValue"]
-        _FillValue = fva[0]
-        sfa=attrs["scale_factor"]
-        scale_factor = sfa[0]        
-        vra=attrs["valid_range"]
-        valid_min = vra[0][0]        
-        valid_max = vra[0][1]        
-        ua=attrs["units"]
-        units = ua[0]
-
-        # Retrieve attributes for lat/lon.
-        attrs = lat.attributes(full=1)
-        aoa=attrs["add_offset"]
-        lat_add_offset = aoa[0]
-        sfa=attrs["scale_factor"]
-        lat_scale_factor = sfa[0]        
-
-        attrs = lon.attributes(full=1)
-        aoa=attrs["add_offset"]
-        lon_add_offset = aoa[0]
-        sfa=attrs["scale_factor"]
-        lon_scale_factor = sfa[0]        
-
-        # NetCDF does the following automatically but PyHDF doesn't
-        latitude = (latitude - lat_add_offset) * lat_scale_factor
-        longitude = (longitude - lon_add_offset) * lon_scale_factor
-
-
-    invalid = np.logical_or(data > valid_max,
-                            data < valid_min)
-    invalid = np.logical_or(invalid, data == _FillValue)
-    data[invalid] = np.nan
-    data = (data - add_offset) * scale_factor 
-    data = np.ma.masked_array(data, np.isnan(data))
+        long_name = var.attrs['long_name']
+        units = var.attrs['units']
     
     # Render the plot in a lambert equal area projection.
-    m = Basemap(projection='laea', resolution='l', lat_ts=63,
-                lat_0=63, lon_0=-45,
-                width=1500000,height=1000000)
+    m = zoo.plot.basemap(projection='laea', resolution='l', lat_ts=63,
+                         lat_0=63, lon_0=-45,
+                         width=1500000,height=1000000)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(50., 90., 10), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-55, -25., 10), labels=[0, 0, 0, 1])
@@ -1,7 +1,11 @@
-from . import MODARNSS_EV_1KM_Emissive_level0
-from . import MODATML2_Cloud_Fraction
-from . import MOD05_L2_Water_Vapor_Near_Infrared
-from . import MOD06_L2_Cloud_Optical_Thickness
-from . import MOD07_L2_Retrieved_Moisture_Profile_Pressure_Lvl5
-from . import MOD08_D3_Cloud_Fraction_Liquid
-from . import MOD21KM_EV_Band26
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'MODARNSS_EV_1KM_Emissive_level0',
+    'MODATML2_Cloud_Fraction',
+    'MOD05_L2_Water_Vapor_Near_Infrared',
+    'MOD06_L2_Cloud_Optical_Thickness',
+    'MOD07_L2_Retrieved_Moisture_Profile_Pressure_Lvl5',
+    'MOD08_D3_Cloud_Fraction_Liquid',
+    'MOD21KM_EV_Band26',
+])
@@ -18,102 +18,52 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.geo
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 
 def run(FILE_NAME):
     GEO_FILE_NAME = 'MYD03.A2002226.0000.005.2009193071127.hdf'
     GEO_FILE_NAME = os.path.join(os.environ['HDFEOS_ZOO_DIR'], GEO_FILE_NAME)
     DATAFIELD_NAME = 'EV_1KM_Emissive'
 
-    if USE_NETCDF4:    
-        from netCDF4 import Dataset    
-        nc = Dataset(FILE_NAME)
-
-        # Just read the first level, Band 20.
-        # lat/lon resolution.
-        data = nc.variables[DATAFIELD_NAME][0,:,:].astype(np.float64)
-
-        # Retrieve the geolocation data from MYD03 product.
-        nc_geo = Dataset(GEO_FILE_NAME)
-        longitude = nc_geo.variables['Longitude'][:]
-        latitude = nc_geo.variables['Latitude'][:]
-
-        # Retrieve attributes.
-        units = nc.variables[DATAFIELD_NAME].radiance_units
-        long_name = nc.variables[DATAFIELD_NAME].long_name
-
-        # The scale and offset attributes do not have standard names in this 
-        # case, so we have to apply the scaling equation ourselves.
-        scale_factor = nc.variables[DATAFIELD_NAME].radiance_scales[0]
-        add_offset = nc.variables[DATAFIELD_NAME].radiance_offsets[0]
-        valid_range = nc.variables[DATAFIELD_NAME].valid_range
-        _FillValue = nc.variables[DATAFIELD_NAME]._FillValue
-        valid_min = valid_range[0]
-        valid_max = valid_range[1]
-
-        # Retrieve dimension name.
-        dimname = nc.variables[DATAFIELD_NAME].dimensions[0]
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
 
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
+        # Just read the first level, Band 20.  The scale and offset
+        # attributes do not have standard names in this case;  the first of
+        # each applies to it.
+        data = zoo.io.decode.read(var, np.s_[0, :, :],
+                                  convention='modis_radiance', index=0)
 
-        # Read dataset.
-        data3D = hdf.select(DATAFIELD_NAME)
-        data = data3D[0,:,:].astype(np.double)
+        # Read geolocation dataset from MYD03 product.  It is read once and
+        # shared by every product of the same granule.
+        longitude, latitude = zoo.geo.swath_geolocation(f, DATAFIELD_NAME,
+                                                        GEO_FILE_NAME)
 
-        hdf_geo = SD(GEO_FILE_NAME, SDC.READ)
-
-        # Read geolocation dataset from MOD03 product.
-        lat = hdf_geo.select('Latitude')
-        latitude = lat[:,:]
-        lon = hdf_geo.select('Longitude')
-        longitude = lon[:,:]
-        
         # Retrieve attributes.
-        attrs = data3D.attributes(full=1)
-        lna=attrs["long_name"]
-        long_name = lna[0]
-        aoa=attrs["radiance_offsets"]
-        add_offset = aoa[0][0]
-        fva=attrs["_FillValue"]
-        _FillValue = fva[0]
-        sfa=attrs["radiance_scales"]
-        scale_factor = sfa[0][0]        
-        vra=attrs["valid_range"]
-        valid_min = vra[0][0]        
-        valid_max = vra[0][1]        
-        ua=attrs["radiance_units"]
-        units = ua[0]
-
+        long_name = var.attrs['long_name']
+        units = var.attrs['radiance_units']
 
         # Retrieve dimension name.
-        dim = data3D.dim(0)
-        dimname = dim.info()[0]
-
-    invalid = np.logical_or(data > valid_max,
-                            data < valid_min)
-    invalid = np.logical_or(invalid, data == _FillValue)
-    data[invalid] = np.nan
-    data = (data - add_offset) * scale_factor 
-    data = np.ma.masked_array(data, np.isnan(data))
+        dimname = var.dimensions[0]
     
     # The data is close to the equator in Africa, so a global projection is
     # not needed.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-5, urcrnrlat=30, llcrnrlon=5, urcrnrlon=45)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-5, urcrnrlat=30, llcrnrlon=5, urcrnrlon=45)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(0, 50, 10), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(0, 50., 10), labels=[0, 0, 0, 1])
@@ -18,83 +18,43 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'Water_Vapor'
 
-    if USE_NETCDF4:    
-        
-        from netCDF4 import Dataset    
-        nc = Dataset(FILE_NAME)
-
-        # The netCDF4 module will correctly apply fill value and
-        # scaling equation.
-        data = nc.variables[DATAFIELD_NAME][:]
-
-        latitude = nc.variables['Latitude'][:]
-        longitude = nc.variables['Longitude'][:]
-        
-        # Retrieve attributes.
-        units = nc.variables[DATAFIELD_NAME].units
-        long_name = nc.variables[DATAFIELD_NAME].long_name
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
 
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:].astype(np.double)
+        # Apply _FillValue, scale and offset.
+        data = zoo.io.decode.read(var)
 
-        # Read geolocation dataset.
-        lat = hdf.select('Latitude')
-        latitude = lat[:,:]
-        lon = hdf.select('Longitude')
-        longitude = lon[:,:]
+        latitude = f['Latitude'][:]
+        longitude = f['Longitude'][:]
 
         # Retrieve attributes.
-        attrs = data2D.attributes(full=1)
-        lna=attrs["long_name"]
-        long_name = lna[0]
-        aoa=attrs["add_offset"]
-        add_offset = aoa[0]
-        fva=attrs["_FillValue"]
-        _FillValue = fva[0]
-        sfa=attrs["scale_factor"]
-        scale_factor = sfa[0]        
-        ua=attrs["units"]
-        units = ua[0]
-        vra=attrs["valid_range"]
-        valid_min = vra[0][0]        
-        valid_max = vra[0][1]        
-
-        # Apply _FillValue, scale and offset.
-        invalid = np.logical_or(data > valid_max,
-                                data < valid_min)
-        invalid = np.logical_or(invalid, data == _FillValue)
-        data[invalid] = np.nan
-        data = data * scale_factor + add_offset
-        data = np.ma.masked_array(data, np.isnan(data))
+        long_name = var.attrs['long_name']
+        units = var.attrs['units']
     
     # The data is local to Alaska, so no need for a global or hemispherical
     # projection.
-    m = Basemap(projection='laea', resolution='l',
-                lat_ts=65, lat_0=65, lon_0=-150,
-                width=4800000,height=3500000)
+    m = zoo.plot.basemap(projection='laea', resolution='l',
+                         lat_ts=65, lat_0=65, lon_0=-150,
+                         width=4800000,height=3500000)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(40, 81, 10), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-210, -89., 30), labels=[0, 0, 0, 1])
@@ -18,95 +18,48 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'EV_1KM_Emissive'
 
-    if USE_NETCDF4:    
-        from netCDF4 import Dataset    
-        nc = Dataset(FILE_NAME)
-
-        # Read 3D dataset and subset it.
-        data = nc.variables[DATAFIELD_NAME][9,:,:].astype(np.float64)
-
-        # Read geo-location dataset.
-        latitude = nc.variables['Latitude'][:]
-        longitude = nc.variables['Longitude'][:]
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
 
-        # Read attributes.
-        units = nc.variables[DATAFIELD_NAME].radiance_units
-        long_name = nc.variables[DATAFIELD_NAME].long_name
+        # Read only level 9.  The scale and offset attributes do not have
+        # standard names in this case, and hold one value per level.
+        data = zoo.io.decode.read(var, np.s_[9, :, :],
+                                  convention='modis_radiance', index=9)
 
-        # The scale and offset attributes do not have standard names in this 
-        # case, so we have to apply the scaling equation ourselves.
-        scale_factor = nc.variables[DATAFIELD_NAME].radiance_scales[9]
-        add_offset = nc.variables[DATAFIELD_NAME].radiance_offsets[9]
-        valid_range = nc.variables[DATAFIELD_NAME].valid_range
-        _FillValue = nc.variables[DATAFIELD_NAME]._FillValue
-        valid_min = valid_range[0]
-        valid_max = valid_range[1]
-
-        # Retrieve dimension name.
-        dimname = nc.variables[DATAFIELD_NAME].dimensions[0]
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data3D = hdf.select(DATAFIELD_NAME)
-        data = data3D[9,:,:].astype(np.double)
-        
         # Read geolocation dataset.
-        lat = hdf.select('Latitude')
-        latitude = lat[:,:]
-        lon = hdf.select('Longitude')
-        longitude = lon[:,:]
+        latitude = f['Latitude'][:]
+        longitude = f['Longitude'][:]
 
         # Retrieve attributes.
-        attrs = data3D.attributes(full=1)
-        lna=attrs["long_name"]
-        long_name = lna[0]
-        aoa=attrs["radiance_offsets"]
-        add_offset = aoa[0][9]
-        fva=attrs["_FillValue"]
-        _FillValue = fva[0]
-        sfa=attrs["radiance_scales"]
-        scale_factor = sfa[0][9]       
-        vra=attrs["valid_range"]
-        valid_min = vra[0][0]        
-        valid_max = vra[0][1]        
-        ua=attrs["radiance_units"]
-        units = ua[0]
+        long_name = var.attrs['long_name']
+        units = var.attrs['radiance_units']
 
         # Retrieve dimension name.
-        dim = data3D.dim(0)
-        dimname = dim.info()[0]
-
-    invalid = np.logical_or(data > valid_max,
-                            data < valid_min)
-    invalid = np.logical_or(invalid, data == _FillValue)
-    data[invalid] = np.nan
-    data = scale_factor * (data - add_offset)
-    data = np.ma.masked_array(data, np.isnan(data))
+        dimname = var.dimensions[0]
 
     
-    m = Basemap(projection='laea', resolution='i',
-                lat_ts=71.25, lat_0=71.25, lon_0=-156.5,
-                width=100000,height=100000)
+    m = zoo.plot.basemap(projection='laea', resolution='i',
+                         lat_ts=71.25, lat_0=71.25, lon_0=-156.5,
+                         width=100000,height=100000)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(70, 72.1, 0.5), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-158, -154.9, 0.5), labels=[0, 0, 0, 1])
@@ -1,9 +1,12 @@
-# Swath codes.
-from . import MYD021KM_EV_1KM_Emissive_level0
-from . import MYD021KM_EV_Band26
-from . import MYD02HKM_A2010031_0035_005_2010031183706_EV_500_RefSB_lvl0
-from . import MYD07_L2_Water_Vapor
-from . import MYDARNSS_EV_1KM_Emissive_lvl9
+from ..._lazy import attach
 
-# Grid codes.
-from . import MYD08_D3_Cloud_Fraction_Liquid
+__getattr__, __dir__, __all__ = attach(__name__, [
+    # Swath codes.
+    'MYD021KM_EV_1KM_Emissive_level0',
+    'MYD021KM_EV_Band26',
+    'MYD02HKM_A2010031_0035_005_2010031183706_EV_500_RefSB_lvl0',
+    'MYD07_L2_Water_Vapor',
+    'MYDARNSS_EV_1KM_Emissive_lvl9',
+    # Grid codes.
+    'MYD08_D3_Cloud_Fraction_Liquid',
+])
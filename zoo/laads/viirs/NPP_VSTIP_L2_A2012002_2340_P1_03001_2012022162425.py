@@ -18,18 +18,16 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
@@ -40,39 +38,22 @@ def run(FILE_NAME):
     rows = slice(0, 6144, 6)
     cols = slice(0, 6400, 6)
 
-    if USE_NETCDF4:    
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        data = f[DATAFIELD_NAME][rows, cols]
 
-        data = nc.variables[DATAFIELD_NAME][rows, cols]
-    
         # Retrieve the geolocation data.
-        latitude = nc.variables['Latitude'][rows, cols]
-        longitude = nc.variables['Longitude'][rows, cols]
-        
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[rows,cols]
-
-        # Read geolocation dataset.
-        lat = hdf.select('Latitude')
-        latitude = lat[rows,cols]
-        lon = hdf.select('Longitude')
-        longitude = lon[rows,cols]
-        
+        latitude = f['Latitude'][rows, cols]
+        longitude = f['Longitude'][rows, cols]
 
     # Apply the fill value.  The valid minimum is zero, although there's no
     # attribute.
-    data[data < 0] = np.nan
-    data = np.ma.masked_array(data, np.isnan(data))
+    data = np.ma.masked_less(data, 0)
     
     # Render the data in a lambert azimuthal equal area projection.
-    m = Basemap(projection='nplaea', resolution='l',
-                boundinglat=60, lon_0=43)
+    m = zoo.plot.basemap(projection='nplaea', resolution='l',
+                         boundinglat=60, lon_0=43)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(50, 90, 10), labels=[1, 0, 0, 1])
     m.drawmeridians(np.arange(-180, 180, 30))
@@ -1,2 +1,6 @@
-from . import NPP_D16BRDF3_L3D_A2012241_h20v03_C1_03001_2012258151353
-from . import NPP_VSTIP_L2_A2012002_2340_P1_03001_2012022162425
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'NPP_D16BRDF3_L3D_A2012241_h20v03_C1_03001_2012258151353',
+    'NPP_VSTIP_L2_A2012002_2340_P1_03001_2012022162425',
+])
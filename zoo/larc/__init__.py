@@ -1,3 +1,7 @@
-from . import ceres
-from . import mopitt
-from . import tes
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'ceres',
+    'mopitt',
+    'tes',
+])
@@ -24,66 +24,48 @@ import os
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
-from mpl_toolkits.basemap import Basemap
 from matplotlib import colors
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     # Identify the data field.
     DATAFIELD_NAME = 'Feature_Classification_Flags'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-    
-        # Subset the data to match the size of the swath geolocation fields.
-        # Turn off autoscaling, we'll handle that ourselves due to presence of
-        # a valid range.
-        var = nc.variables[DATAFIELD_NAME]
-        data = var[:,1256]
-
-        # Read geolocation datasets.
-        lat = nc.variables['Latitude'][:]
-        lon = nc.variables['Longitude'][:]
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-        
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,1256]
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        # Read only the column to be drawn.
+        data = f[DATAFIELD_NAME][:, 1256]
 
         # Read geolocation datasets.
-        latitude = hdf.select('Latitude')
-        lat = latitude[:]
-        longitude = hdf.select('Longitude')
-        lon = longitude[:]
+        lat = f['Latitude'][:]
+        lon = f['Longitude'][:]
 
 
-    # Subset data. Otherwise, all points look black.
-    lat = lat[::10]
-    lon = lon[::10]
-    data = data[::10]
-
     # Extract Feature Type only through bitmask.
     data = data & 7
 
     # Make a color map of fixed colors.
     cmap = colors.ListedColormap(['black', 'blue', 'yellow', 'green', 'red', 'purple', 'gray', 'white']) 
+
+    # define the bins and normalize
+    bounds = np.linspace(0,8,9)
+    norm = mpl.colors.BoundaryNorm(bounds, cmap.N)
+
     # The data is global, so render in a global projection.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90.,90,45))
     m.drawmeridians(np.arange(-180.,180,45), labels=[True,False,False,True])
-    x,y = m(lon, lat)
-    i = 0
-    for feature in data:
-        m.plot(x[i], y[i], 'o', color=cmap(feature),  markersize=3)
-        i = i+1
+    # Draw every footprint in a single artist.
+    zoo.plot.points(m, lon, lat, data, cmap=cmap, norm=norm, size=3,
+                    categorical=True)
 
 
     long_name = 'Feature Type at Altitude = 2500m'
@@ -92,10 +74,6 @@ def run(FILE_NAME):
 
     fig = plt.gcf()
 
-    # define the bins and normalize
-    bounds = np.linspace(0,8,9)
-    norm = mpl.colors.BoundaryNorm(bounds, cmap.N)
-
     # create a second axes for the colorbar
     ax2 = fig.add_axes([0.93, 0.2, 0.01, 0.6])
     cb = mpl.colorbar.ColorbarBase(ax2, cmap=cmap, norm=norm, spacing='proportional', ticks=bounds, boundaries=bounds, format='%1i')
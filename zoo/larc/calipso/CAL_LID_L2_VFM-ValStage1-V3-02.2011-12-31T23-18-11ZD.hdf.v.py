@@ -27,82 +27,29 @@ import numpy as np
 from mpl_toolkits.basemap import Basemap
 from matplotlib import colors
 
-USE_NETCDF4 = False
+import zoo.io.vfm
 
 def run(FILE_NAME):
-    # Identify the data field.
-    DATAFIELD_NAME = 'Feature_Classification_Flags'
-
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-
-    
-        # Subset the data to match the size of the swath geolocation fields.
-        # Turn off autoscaling, we'll handle that ourselves due to presence of
-        # a valid range.
-        var = nc.variables[DATAFIELD_NAME]
-        data = var[:,:]
-        print data.shape
-
-        # Read geolocation datasets.
-        lat = nc.variables['Latitude'][:]
-
-        lat = np.squeeze(lat)
-        print lat.shape
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-        
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:]
-
-        # Read geolocation datasets.
-        latitude = hdf.select('Latitude')
-        lat = latitude[:]
-        
-
-    # Extract Feature Type only (1-3 bits) through bitmask.
-    data = data & 7
-
-    # Subset latitude values for the region of interest (40N to 62N).
+    # Subset the region of interest (40N to 62N) while reading, and unpack
+    # Feature Type (bits 1-3) onto a grid of 30 m altitude bins with all 15
+    # sub-profiles of each record.
     # See the output of CAL_LID_L2_VFM-ValStage1-V3-02.2011-12-31T23-18-11ZD.hdf.py example.
-    lat = lat[3500:4000]
-    size = lat.shape[0]
-    
-    # You can visualize other blocks by changing subset parameters.
-    #  data2d = data[3500:3999, 0:164]    # 20.2km to 30.1km
-    #  data2d = data[3500:3999, 165:1164] #  8.2km to 20.2km
-
-    # data2d = data[3500:4000, 1165:]  # -0.5km to  8.2km
-    data2d = data[3500:4000, 1165:]  # -0.5km to  8.2km
-    data3d = np.reshape(data2d, (size, 15, 290))
-    data = data3d[:,0,:]
+    vfm = zoo.io.vfm.read(FILE_NAME, slice(3500, 4000), ['type'])
+    lat = vfm['latitude']
+    alt = zoo.io.vfm.altitude()
 
-    # Focus on cloud (=2) data only.
-    data[data > 2] = 0;
-    data[data < 2] = 0;
-    data[data == 2] = 1;
-
-    # Generate altitude data according to file specification [1].
-    alt = np.zeros(290)
-
-    # You can visualize other blocks by changing subset parameters.
+    # Keep the lowest altitude block (-0.5km to 8.2km).
+    #
+    # You can visualize other blocks by changing the altitude range.
     #  20.2km to 30.1km
-    # for i in range (0, 54):
-    #       alt[i] = 20.2 + i*0.18;
-
     #  8.2km to 20.2km
-    # for i in range (0, 199):
-    #       alt[i] = 8.2 + i*0.06;
+    low = alt < 8.2
+    alt = alt[low]
 
-    # -0.5km to 8.2km
-    for i in range (0, 289):
-          alt[i] = -0.5 + i*0.03
+    # Focus on cloud (=2) data only.
+    data = (vfm['type'][:, low] == 2).astype(np.uint8)
 
-      
-    # Contour the data on a grid of longitude vs. pressure
+    # Contour the data on a grid of latitude vs. altitude
     latitude, altitude = np.meshgrid(lat, alt)
 
 
@@ -116,7 +63,7 @@ def run(FILE_NAME):
 
     long_name = 'Feature Type (Bits 1-3) in Feature Classification Flag'
     basename = os.path.basename(FILE_NAME)
-    plt.contourf(latitude, altitude, np.rot90(data,3), cmap=cmap)
+    plt.contourf(latitude, altitude, data.T, cmap=cmap)
     plt.title('{0}\n{1}'.format(basename, long_name))
     plt.xlabel('Latitude (degrees north)')
     plt.ylabel('Altitude (km)')
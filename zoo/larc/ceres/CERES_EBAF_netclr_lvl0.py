@@ -24,66 +24,41 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     # Identify the data field.
     DATAFIELD_NAME = 'netclr'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-    
-        # Subset the data to match the size of the swath geolocation fields.
-        # Turn off autoscaling, we'll handle that ourselves due to presence of
-        # a valid range.
-        var = nc.variables[DATAFIELD_NAME]
-        data = var[0,:,:].astype(np.float64)
-        latitude = nc.variables['lat'][:]
-        longitude = nc.variables['lon'][:]
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
 
-        # Read attributes.
-        valid_range = [np.float(x) for x in meta['valid_range'].split(', ')]
-        units = ncvar.units
-        long_name = ncvar.long_name
-
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-        
-        # Read dataset.
-        data3D = hdf.select(DATAFIELD_NAME)
-        data = data3D[0,:,:]
+        # Read only the first month.
+        data = var[0, :, :]
 
         # Read geolocation datasets.
-        lat = hdf.select('lat')
-        latitude = lat[:]
-        lon = hdf.select('lon')
-        longitude = lon[:]
+        latitude = f['lat'][:]
+        longitude = f['lon'][:]
 
         # Read attributes.
-        attrs = data3D.attributes(full=1)
-        ua=attrs["units"]
-        units = ua[0]
-        vra=attrs["valid_range"]
-        valid_range = vra[0]
-        lna=attrs["long_name"]
-        long_name = lna[0]    
+        units = var.attrs['units']
+        valid_range = var.attrs['valid_range']
+        long_name = var.attrs['long_name']
 
     # Apply the valid_range attribute.
-    invalid = np.logical_or(data < valid_range[0],
-                            data > valid_range[1])
-    data[invalid] = np.nan
-    datam = np.ma.masked_array(data, mask=np.isnan(data))
+    datam = np.ma.masked_outside(data, valid_range[0], valid_range[1])
     
     # The data is global, so render in a global projection.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 30), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 181, 45), labels=[0, 0, 0, 1])
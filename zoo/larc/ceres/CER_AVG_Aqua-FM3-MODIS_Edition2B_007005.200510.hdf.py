@@ -24,66 +24,42 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     # Identify the data field.
     DATAFIELD_NAME = 'LW TOA Clear-Sky'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-    
-        # Subset the data to match the size of the swath geolocation fields.
-        # Turn off autoscaling, we'll handle that ourselves due to presence of
-        # a valid range.
-        var = nc.variables[DATAFIELD_NAME]
-        data = var[1,0,:,:].astype(np.float64)
-        latitude = nc.variables['Colatitude'][:]
-        longitude = nc.variables['Longitude'][:]
-
-        # Read attributes.
-        units = ncvar.units
-        fillvalue = ncvar._FillValue
-
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-        
-        # Read dataset.
-        data4D = hdf.select(DATAFIELD_NAME)
-
-        data = data4D[1,0,:,:].astype(np.double)
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+        data = var[1, 0, :, :]
 
         # Read geolocation datasets.
-        lat = hdf.select('Colatitude')
-        latitude = lat[:]
-        lon = hdf.select('Longitude')
-        longitude = lon[:]
+        latitude = f['Colatitude'][:]
+        longitude = f['Longitude'][:]
 
         # Read attributes.
-        attrs = data4D.attributes(full=1)
-        ua=attrs["units"]
-        units = ua[0]
-        fva=attrs["_FillValue"]
-        fillvalue = fva[0]
+        units = var.attrs['units']
+        fillvalue = var.attrs['_FillValue']
 
     # Apply the fill value attribute.
-    data[data == fillvalue] = np.nan
-    data = np.ma.masked_array(data, np.isnan(data))
+    data = np.ma.masked_equal(data, fillvalue)
 
     # Adjust lat/lon values.
     latitude = 90 - latitude
     longitude[longitude>180]=longitude[longitude>180]-360;
 
     # The data is global, so render in a global projection.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 30), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 181, 45), labels=[0, 0, 0, 1])
@@ -28,62 +28,44 @@ from mpl_toolkits.basemap import Basemap
 import numpy as np
 
 # The file has many 'Net radiation flux' dataset under
-# different Vgroup.
-#
-# Using netcdf4 will limit the number of datasets that you can plot.
-#
-# This is a good example why PyHDF is better than netcdf4 python.
-USE_NETCDF4 = False
+# different Vgroup.  They can only be told apart by reference number, which
+# zoo.io does not expose, so this example reads the file with pyhdf.  The
+# field is a single 1-D profile, so reading it whole costs little.
 
 def run(FILE_NAME):
 
     # Identify the data field.
     DATAFIELD_NAME = 'Net radiant flux'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-    
-        var = nc.variables[DATAFIELD_NAME]
-        data = var[:].astype(np.float64)
-        latitude = nc.variables['Colatitude'][:]
-        longitude = nc.variables['Longitude'][:]
-
-        # Read attributes.
-        units = var.units
-        fillvalue = var._FillValue
-        long_name = var.long_name
-
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        # The file has many 'Net radiation flux' dataset under
-        # different Vgroup.
-        # 
-        # Use HDFView to look up ref number.
-        index = hdf.reftoindex(141)
-        data1D = hdf.select(index)
-
-        data = data1D[:].astype(np.double)
-
-        # Read geolocation datasets.
-        lat = hdf.select(hdf.reftoindex(185))
-        latitude = lat[:]
-
-        lon = hdf.select(hdf.reftoindex(184))
-        longitude = lon[:]
-
-
-        # Read attributes.
-        attrs = data1D.attributes(full=1)
-        ua=attrs["units"]
-        units = ua[0]
-        fva=attrs["_FillValue"]
-        fillvalue = fva[0]
-        lna=attrs["long_name"]
-        long_name = lna[0]
+    from pyhdf.SD import SD, SDC
+    hdf = SD(FILE_NAME, SDC.READ)
+
+    # Read dataset.
+    # The file has many 'Net radiation flux' dataset under
+    # different Vgroup.
+    # 
+    # Use HDFView to look up ref number.
+    index = hdf.reftoindex(141)
+    data1D = hdf.select(index)
+
+    data = data1D[:].astype(np.double)
+
+    # Read geolocation datasets.
+    lat = hdf.select(hdf.reftoindex(185))
+    latitude = lat[:]
+
+    lon = hdf.select(hdf.reftoindex(184))
+    longitude = lon[:]
+
+
+    # Read attributes.
+    attrs = data1D.attributes(full=1)
+    ua=attrs["units"]
+    units = ua[0]
+    fva=attrs["_FillValue"]
+    fillvalue = fva[0]
+    lna=attrs["long_name"]
+    long_name = lna[0]
 
     # Apply the fill value attribute.
     data[data == fillvalue] = np.nan
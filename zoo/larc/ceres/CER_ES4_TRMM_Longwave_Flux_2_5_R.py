@@ -19,9 +19,6 @@ Usage:  save this script and run
 The netCDF file must either be in your current working directory
 or in a directory specified by the environment variable HDFEOS_ZOO_DIR.
 
-In order for the netCDF code path to work, the netcdf library must be compiled
-with HDF4 support.  Please see the README for details.
-
 References
 ----------
 [1] http://ceres.larc.nasa.gov/documents/collect_guide/pdf/ES4_CG_R1V1.pdf
@@ -32,35 +29,23 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
     # Identify the data field.
     DATAFIELD_NAME = 'Longwave Flux (2.5R)'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-        data = nc.variables[DATAFIELD_NAME][:].astype(np.float64)
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-        
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:]
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        data = f[DATAFIELD_NAME][:]
 
-
-    # Set fillvalue and units.
-    # See "CERES Data Management System ES-4 Collection Guide" [1] and a sample
-    # image by NASA [2] for details.  The fillvalue is 3.4028235E38.  Here, we
-    # just use the max of the data.
-    fillvalue = np.max(data)
-    data[data == fillvalue] = np.nan
-    datam = np.ma.masked_array(data, mask=np.isnan(data))
+    # The fill value is the max of the data.
+    datam = np.ma.masked_equal(data, np.max(data))
     
     # Set fillvalue and units.
     # See "CERES Data Management System ES-4 Collection Guide" [1] and a
@@ -79,9 +64,9 @@ def run(FILE_NAME):
     latitude = latitude[::-1]
     
     # The data is global, so render in a global projection.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90.,90,45))
     m.drawmeridians(np.arange(-180.,180,45), labels=[True,False,False,True])
@@ -28,47 +28,31 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     # Identify the data field.
     DATAFIELD_NAME = 'Liquid Log Optical Depth - Altocumulus - M'
 
-    if USE_NETCDF4:    
-    
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-        # Subset the data to match the size of the swath geolocation fields.
-        # Turn off autoscaling, we'll handle that ourselves due to presence of
-        # a valid range.
-        var = nc.variables[DATAFIELD_NAME]
-        data = var[0,:,:].astype(np.float64)
-    
-        # Read the attributes.
-        fillvalue = var._FillValue
-        units = var.units
-        
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-        # Read dataset.
-        data3D = hdf.select(DATAFIELD_NAME)
-        data = data3D[0,:,:].astype(np.float64)
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+
+        # Read only the plane to be drawn.
+        data = var[0, :, :]
 
         # Read attributes.
-        attrs = data3D.attributes(full=1)
-        fva=attrs["_FillValue"]
-        fillvalue = fva[0]
-        ua=attrs["units"]
-        units = ua[0]
+        fillvalue = var.attrs['_FillValue']
+        units = var.attrs['units']
 
     # Handle fill value.
-    data[data == fillvalue] = np.nan
-    datam = np.ma.masked_array(data, mask=np.isnan(data))
+    datam = np.ma.masked_equal(data, fillvalue)
 
     # The normal grid information is not present.  We have to generate the geo-
     # location data, see [1] for details.
@@ -82,14 +66,13 @@ def run(FILE_NAME):
 
     # Flip the latitude to run from 90 to -90.
     lat = lat[::-1]
-    longitude, latitude = np.meshgrid(lon, lat)
     
     # The data is global, so render in a global projection.
-    m = Basemap(projection='hammer', lon_0=0, resolution='l')
+    m = zoo.plot.basemap(projection='hammer', lon_0=0, resolution='l')
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90.,90,45))
     m.drawmeridians(np.arange(-180.,180,45))
-    m.pcolormesh(longitude, latitude, datam, latlon=True)
+    zoo.plot.image(m, lon, lat, datam)
     cb = m.colorbar()
     cb.set_label(units)
 
@@ -24,65 +24,42 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     # Identify the data field.
     DATAFIELD_NAME = 'Effective Temperature - M'
 
-    if USE_NETCDF4:    
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-    
-        # Subset the data to match the size of the swath geolocation fields.
-        # Turn off autoscaling, we'll handle that ourselves due to presence of
-        # a valid range.
-        var = nc.variables[DATAFIELD_NAME]
-        data = var[0,0,:,:].astype(np.float64)
-
-        # Read the geolocation.
-        longitude = nc.variables['Longitude - MH'][0,:,:].astype(np.float64)
-        colatitude = nc.variables['Colatitude - MH'][0,:,:].astype(np.float64)
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
 
-        # Read attributes.
-        fillvalue = var._FillValue
-        units = var.units
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data4D = hdf.select(DATAFIELD_NAME)
-        data = data4D[0,0,:,:].astype(np.float64)
+        # Read only the plane to be drawn.
+        data = var[0, 0, :, :]
 
         # Read geolocation dataset.
-        lon3D = hdf.select('Longitude - MH')
-        longitude = lon3D[0,:,:].astype(np.float64)
-        lat3D = hdf.select('Colatitude - MH')
-        colatitude = lat3D[0,:,:].astype(np.float64)
-
+        longitude = f['Longitude - MH'][0, :, :]
+        colatitude = f['Colatitude - MH'][0, :, :]
 
         # Read attributes.
-        attrs = data4D.attributes(full=1)
-        fva=attrs["_FillValue"]
-        fillvalue = fva[0]
-        ua=attrs["units"]
-        units = ua[0]
+        fillvalue = var.attrs['_FillValue']
+        units = var.attrs['units']
 
     # Apply the attributes.
-    data[data == fillvalue] = np.nan
-    datam = np.ma.masked_array(data, mask=np.isnan(data))
+    datam = np.ma.masked_equal(data, fillvalue)
 
     latitude = 90 - colatitude
     
     # The data is global, so render in a global projection.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=0, urcrnrlon=360)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=0, urcrnrlon=360)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90.,90,45))
     m.drawmeridians(np.arange(-180.,180,45), labels=[True,False,False,True])
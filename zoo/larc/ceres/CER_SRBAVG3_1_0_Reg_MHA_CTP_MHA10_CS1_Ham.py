@@ -24,47 +24,31 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     # Identify the data field.
     DATAFIELD_NAME = 'Cloud Top Pressure'
 
-    if USE_NETCDF4:    
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-    
-        # Subset the data to match the size of the swath geolocation fields.
-        # Turn off autoscaling, we'll handle that ourselves due to presence of
-        # a valid range.
-        var = nc.variables[DATAFIELD_NAME]
-        data = var[1,10,:,:].astype(np.float64)
-
-        # Read attributes.
-        fillvalue = var._FillValue
-        units = var.units
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
 
-        # Read dataset.
-        data4D = hdf.select(DATAFIELD_NAME)
-        data = data4D[1,10,:,:].astype(np.float64)
+        # Read only the plane to be drawn.
+        data = var[1, 10, :, :]
 
         # Read attributes.
-        attrs = data4D.attributes(full=1)
-        fva=attrs["_FillValue"]
-        fillvalue = fva[0]
-        ua=attrs["units"]
-        units = ua[0]
+        fillvalue = var.attrs['_FillValue']
+        units = var.attrs['units']
 
     # Apply the fill value.
-    data[data == fillvalue] = np.nan
-    datam = np.ma.masked_array(data, mask=np.isnan(data))
+    datam = np.ma.masked_equal(data, fillvalue)
 
     # The lat and lon should be calculated following [1].
     ysize, xsize = data.shape
@@ -79,7 +63,7 @@ def run(FILE_NAME):
     longitude, latitude = np.meshgrid(lon, lat)
     
     # The data is global, so render in a global projection.
-    m = Basemap(projection='hammer', lon_0=0, resolution='l')
+    m = zoo.plot.basemap(projection='hammer', lon_0=0, resolution='l')
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90.,90,45))
     m.pcolormesh(longitude, latitude, datam, latlon=True)
@@ -24,46 +24,32 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
 
     DATAFIELD_NAME = 'LW TOA Clear-Sky'
 
-    if USE_NETCDF4:    
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-        var = nc.variables[DATAFIELD_NAME]
-        # Subset the data for synoptic hours = 2.  
-        data = var[2,:,:].astype(np.float64)
-
-        # Read attributes.
-        fillvalue = var._FillValue
-        units = var.units
-
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
 
-        # Read dataset.
-        data3D = hdf.select(DATAFIELD_NAME)
-        data = data3D[2,:,:].astype(np.float64)
+        # Read only the plane to be drawn.
+        data = var[2, :, :]
 
         # Read attributes.
-        attrs = data3D.attributes(full=1)
-        ua=attrs["units"]
-        units = ua[0]
-        fva=attrs["_FillValue"]
-        fillvalue = fva[0]
+        fillvalue = var.attrs['_FillValue']
+        units = var.attrs['units']
 
     # Apply the fill value.
-    data[data == fillvalue] = np.nan
-    datam = np.ma.masked_array(data, mask=np.isnan(data))
+    datam = np.ma.masked_equal(data, fillvalue)
 
     
     # The normal grid information is not present.  We have to generate the geo-
@@ -81,10 +67,10 @@ def run(FILE_NAME):
     longitude, latitude = np.meshgrid(lon, lat)
     
     # The data is global, so render in a global projection.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
-    m = Basemap(projection='hammer', lon_0=0, resolution='l')
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='hammer', lon_0=0, resolution='l')
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90.,90,45))
     m.drawmeridians(np.arange(-180.,180,45))
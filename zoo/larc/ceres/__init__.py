@@ -1,6 +1,10 @@
-from . import CER_ES4_TRMM_Longwave_Flux_2_5_R
-from . import CER_ISCCP_GEO_Effective_Temperature_M_tt0_MHA0
-from . import CER_ISCCP_Day_LLO_Dep_Alt_M_Ham
-from . import CER_ISCCP_Day_LLO_Dep_Alt_M_Sin
-from . import CER_SYN_Aqua_OTF_LTC_Sky_lvl2_Ham
-from . import CERES_EBAF_netclr_lvl0
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'CER_ES4_TRMM_Longwave_Flux_2_5_R',
+    'CER_ISCCP_GEO_Effective_Temperature_M_tt0_MHA0',
+    'CER_ISCCP_Day_LLO_Dep_Alt_M_Ham',
+    'CER_ISCCP_Day_LLO_Dep_Alt_M_Sin',
+    'CER_SYN_Aqua_OTF_LTC_Sky_lvl2_Ham',
+    'CERES_EBAF_netclr_lvl0',
+])
@@ -19,12 +19,9 @@ Usage:  save this script and run
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
 
- The file contains SOM projection. We need to use eosdump to generate 1D 
- lat and lon and then convert them to 2D lat and lon accordingly.
- For example, run command as follows to get SOM projectoin lat/lon in ASCII.
-
- eos2dump -c1 MISR_AM1_AS_AEROSOL_P004_O066234_F12_0022.hdf RegParamsAer all > lat_MISR_AM1_AS_AEROSOL_P004_O066234_F12_0022.output
- eos2dump -c2 MISR_AM1_AS_AEROSOL_P004_O066234_F12_0022.hdf RegParamsAer all > lon_MISR_AM1_AS_AEROSOL_P004_O066234_F12_0022.output
+ The file contains SOM projection.  zoo.geo.som_geolocator computes the
+ lat and lon of every block from the grid's projection parameters and
+ block offsets.
  
  To properly display the data, the latitude/longitude must be remapped.
 
@@ -36,9 +33,11 @@ import re
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import mpl_toolkits.basemap.pyproj as pyproj
 import numpy as np
+
+import zoo.geo
+import zoo.plot
 from pyhdf.HDF import *
 from pyhdf.SD import *
 from pyhdf.V import *
@@ -56,18 +55,9 @@ def run(FILE_NAME):
     # Subset the Blue Band. 1=Blue, 2=Green, 3=Red, 4=NIR.
     data = data4D[:,:,:,0].astype(np.double)
 
-    # Read geolocation dataset from HDF-EOS2 dumper output.
-    GEO_FILE_NAME = 'lat_MISR_AM1_AS_AEROSOL_P004_O066234_F12_0022.output'
-    GEO_FILE_NAME = os.path.join(os.environ['HDFEOS_ZOO_DIR'], 
-                                 GEO_FILE_NAME)
-    lat = np.genfromtxt(GEO_FILE_NAME, delimiter=',', usecols=[0])
-    lat = lat.reshape(data.shape)
-    
-    GEO_FILE_NAME = 'lon_MISR_AM1_AS_AEROSOL_P004_O066234_F12_0022.output'
-    GEO_FILE_NAME = os.path.join(os.environ['HDFEOS_ZOO_DIR'], 
-                                 GEO_FILE_NAME)
-    lon = np.genfromtxt(GEO_FILE_NAME, delimiter=',', usecols=[0])
-    lon = lon.reshape(data.shape)
+    # Compute the geolocation of the SOM blocks.
+    geo = zoo.geo.som_geolocator(FILE_NAME, DATAFIELD_NAME)
+    lon, lat = geo[:]
         
     # Read attributes.
     attrs = data4D.attributes(full=1)
@@ -88,9 +78,9 @@ def run(FILE_NAME):
 
 
     # Set the limit for the plot.
-    m = Basemap(projection='cyl', resolution='h',
-                llcrnrlat=np.min(lat), urcrnrlat = np.max(lat),
-                llcrnrlon=np.min(lon), urcrnrlon = np.max(lon))
+    m = zoo.plot.basemap(projection='cyl', resolution='h',
+                         llcrnrlat=np.min(lat), urcrnrlat = np.max(lat),
+                         llcrnrlon=np.min(lon), urcrnrlon = np.max(lon))
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180., 181., 45.), labels=[0, 0, 0, 1])
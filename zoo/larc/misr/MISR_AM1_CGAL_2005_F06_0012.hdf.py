@@ -22,13 +22,14 @@ specified by the environment variable HDFEOS_ZOO_DIR.
 
 
 import os
-import re
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import mpl_toolkits.basemap.pyproj as pyproj
 import numpy as np
 
+import zoo.geo
+import zoo.plot
+
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'Local albedo average - 1 deg'
@@ -40,11 +41,6 @@ def run(FILE_NAME):
     data3D = hdf.select(DATAFIELD_NAME)
     data = data3D[:,:,3].astype(np.double)
 
-    # Read file attribute.
-    fattrs = hdf.attributes(full=1)
-    ga = fattrs["StructMetadata.0"]
-    gridmeta = ga[0]
-
     # Read dataset attribute.
     attrs = data3D.attributes(full=1)
     fva=attrs["_FillValue"]
@@ -54,37 +50,12 @@ def run(FILE_NAME):
     data[data == _FillValue] = np.nan
     datam = np.ma.masked_array(data, mask=np.isnan(data))
 
+    # Compute the geolocation from the grid's projection.
+    lon, lat = zoo.geo.grid_geolocator(FILE_NAME, DATAFIELD_NAME)[:]
 
-    # Construct the grid.  The needed information is in a global attribute
-    # called 'StructMetadata.0'.  Use regular expressions to tease out the
-    # extents of the grid.
-    ul_regex = re.compile(r'''UpperLeftPointMtrs=\(
-                                  (?P<upper_left_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<upper_left_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-    match = ul_regex.search(gridmeta)
-    x0 = np.float(match.group('upper_left_x')) / 1000000.0
-    y0 = np.float(match.group('upper_left_y')) / 1000000.0
-
-    lr_regex = re.compile(r'''LowerRightMtrs=\(
-                                  (?P<lower_right_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<lower_right_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-    match = lr_regex.search(gridmeta)
-    x1 = np.float(match.group('lower_right_x')) / 1000000.0
-    y1 = np.float(match.group('lower_right_y')) / 1000000.0
-
-    data = data.T
-    nx, ny = data.shape
-    x = np.linspace(x0, x1, nx)
-    y = np.linspace(y0, y1, ny)
-    lon, lat = np.meshgrid(x, y)
-
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-180, urcrnrlon = 180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-180, urcrnrlon = 180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180., 181., 45.), labels=[0, 0, 0, 1])
@@ -26,9 +26,11 @@ import re
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import mpl_toolkits.basemap.pyproj as pyproj
 import numpy as np
+
+import zoo.geo
+import zoo.plot
 from pyhdf.SD import SD, SDC
 
 def run(FILE_NAME):
@@ -46,18 +48,9 @@ def run(FILE_NAME):
     NBandDim = 0;
     data = data4D[SOMBlockDim,:,:,NBandDim].astype(np.double)
 
-    # Read geolocation dataset from HDF-EOS2 dumper output.
-    GEO_FILE_NAME = 'lat_MISR_TC_ALBEDO_P223_F05_lvl50.output'
-    GEO_FILE_NAME = os.path.join(os.environ['HDFEOS_ZOO_DIR'], 
-                                 GEO_FILE_NAME)
-    lat = np.genfromtxt(GEO_FILE_NAME, delimiter=',', usecols=[0])
-    lat = lat.reshape(data.shape)
-    
-    GEO_FILE_NAME = 'lon_MISR_TC_ALBEDO_P223_F05_lvl50.output'
-    GEO_FILE_NAME = os.path.join(os.environ['HDFEOS_ZOO_DIR'], 
-                                 GEO_FILE_NAME)
-    lon = np.genfromtxt(GEO_FILE_NAME, delimiter=',', usecols=[0])
-    lon = lon.reshape(data.shape)
+    # Compute the geolocation of the SOM blocks.
+    geo = zoo.geo.som_geolocator(FILE_NAME, DATAFIELD_NAME)
+    lon, lat = geo[SOMBlockDim]
         
     # Read attributes.
     attrs = data4D.attributes(full=1)
@@ -70,9 +63,9 @@ def run(FILE_NAME):
 
 
     # Set the limit for the plot.
-    m = Basemap(projection='cyl', resolution='h',
-                llcrnrlat=np.min(lat), urcrnrlat = np.max(lat),
-                llcrnrlon=np.min(lon), urcrnrlon = np.max(lon))
+    m = zoo.plot.basemap(projection='cyl', resolution='h',
+                         llcrnrlat=np.min(lat), urcrnrlat = np.max(lat),
+                         llcrnrlon=np.min(lon), urcrnrlon = np.max(lon))
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(np.floor(np.min(lat)), np.ceil(np.max(lat)), 1), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(np.floor(np.min(lon)), np.ceil(np.max(lon)), 1), labels=[0, 0, 0, 1])
@@ -26,13 +26,14 @@ import re
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import mpl_toolkits.basemap.pyproj as pyproj
 import numpy as np
 from pyhdf.HDF import *
 from pyhdf.SD import *
 from pyhdf.V import *
 
+import zoo.plot
+
 def run(FILE_NAME):
     
     # Identify the data field.
@@ -110,9 +111,9 @@ def run(FILE_NAME):
 
 
     # Set the limit for the plot.
-    m = Basemap(projection='cyl', resolution='h',
-                llcrnrlat=np.min(lat), urcrnrlat = np.max(lat),
-                llcrnrlon=np.min(lon), urcrnrlon = np.max(lon))
+    m = zoo.plot.basemap(projection='cyl', resolution='h',
+                         llcrnrlat=np.min(lat), urcrnrlat = np.max(lat),
+                         llcrnrlon=np.min(lon), urcrnrlon = np.max(lon))
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180., 181., 45.), labels=[0, 0, 0, 1])
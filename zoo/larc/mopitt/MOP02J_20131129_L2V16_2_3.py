@@ -25,9 +25,10 @@ import os
 import h5py
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
+import zoo.plot
+
 def run(FILE_NAME):
     
     with h5py.File(FILE_NAME, mode='r') as f:
@@ -43,9 +44,9 @@ def run(FILE_NAME):
         latitude = f['/HDFEOS/SWATHS/MOP02/Geolocation Fields/Latitude'][:]
         longitude = f['/HDFEOS/SWATHS/MOP02/Geolocation Fields/Longitude'][:]
 
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 45))
     m.drawmeridians(np.arange(-180, 180, 45), labels=[True,False,False,True])
@@ -24,11 +24,12 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
 from pyhdf import HDF, SD, VS, V
 
+import zoo.plot
+
 def run(FILE_NAME):
     
     # Initialize the SD, V, and VS interfaces.
@@ -63,9 +64,9 @@ def run(FILE_NAME):
     vs.end()
     sd.end()
 
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 45))
     m.drawmeridians(np.arange(-180, 180, 45), labels=[True,False,False,True])
@@ -26,9 +26,10 @@ import re
 import h5py
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
+import zoo.plot
+
 def run(FILE_NAME):
     
     with h5py.File(FILE_NAME, mode='r') as f:
@@ -50,9 +51,9 @@ def run(FILE_NAME):
         x = f['/HDFEOS/GRIDS/MOP03/Data Fields/Longitude'][:]
         longitude, latitude = np.meshgrid(x, y)
 
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 45))
     m.drawmeridians(np.arange(-180, 180, 45), labels=[True,False,False,True])
@@ -18,9 +18,6 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 
 import os
@@ -30,37 +27,26 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4=False
+import zoo.io
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'CO Profiles Day'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-
-        data = nc.variables[DATAFIELD_NAME][111, :, :].astype(np.float64)
-        lat = nc.variables['Latitude'][:]
-        lon = nc.variables['Longitude'][:]
-        pres = nc.variables['Pressure Grid'][:]
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data3D = hdf.select(DATAFIELD_NAME)
-        data = data3D[111, :, :].astype(np.float64)
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        # Read only the slice to be drawn.
+        data = f[DATAFIELD_NAME][111, :, :]
 
         # Read coordinates.
-        lat = hdf.select('Latitude')[:]
-        lon = hdf.select('Longitude')[:]
-        pres = hdf.select('Pressure Grid')[:]
-
+        lat = f['Latitude'][:]
+        lon = f['Longitude'][:]
+        pres = f['Pressure Grid'][:]
 
-    # Replace the fill value with NaN
-    data[data == -9999] = np.nan
-    data = np.ma.masked_array(data, np.isnan(data))
+    # Apply the fill value.
+    data = np.ma.masked_equal(data, -9999)
     
     # Contour the data on a grid of longitude vs. pressure
     longitude, pressure = np.meshgrid(lon, pres)
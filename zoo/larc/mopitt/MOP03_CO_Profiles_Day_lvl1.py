@@ -18,54 +18,39 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4=False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = 'CO Profiles Day'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-    
-        nc = Dataset(FILE_NAME)
-
-        data = nc.variables[DATAFIELD_NAME][:, :, 1].astype(np.float64)
-        latitude = nc.variables['Latitude'][:]
-        longitude = nc.variables['Longitude'][:]
-        pressure = nc.variables['Pressure Grid'][:]
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data3D = hdf.select(DATAFIELD_NAME)
-        data = data3D[:, :, 1].astype(np.float64)
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        # Read only the slice to be drawn.
+        data = f[DATAFIELD_NAME][:, :, 1]
 
         # Read coordinates.
-        latitude = hdf.select('Latitude')[:]
-        longitude = hdf.select('Longitude')[:]
-        pressure = hdf.select('Pressure Grid')[:]
-
+        latitude = f['Latitude'][:]
+        longitude = f['Longitude'][:]
+        pressure = f['Pressure Grid'][:]
 
-    # Replace the fill value with NaN
-    data[data == -9999] = np.nan
-    data = np.ma.masked_array(data, np.isnan(data))
+    # Apply the fill value.
+    data = np.ma.masked_equal(data, -9999)
     
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 45), labels=[True,False,False,True])
     m.drawmeridians(np.arange(-180, 180, 45), labels=[True,False,False,True])
@@ -1,9 +1,12 @@
-# Swaths
-from . import MOP02_20000303_L2V5_7_1
-from . import MOP02J_20131129_L2V16_2_3
+from ..._lazy import attach
 
-# Grids
-from . import MOP03_CO_Profiles_Day_horizontal_lvl111
-from . import MOP03_CO_Profiles_Day_lvl1
-from . import MOP03_CO_Profiles_Day_vertical_lvl178
-from . import MOP03T_20131129_L3V4_2_1
+__getattr__, __dir__, __all__ = attach(__name__, [
+    # Swaths
+    'MOP02_20000303_L2V5_7_1',
+    'MOP02J_20131129_L2V16_2_3',
+    # Grids
+    'MOP03_CO_Profiles_Day_horizontal_lvl111',
+    'MOP03_CO_Profiles_Day_lvl1',
+    'MOP03_CO_Profiles_Day_vertical_lvl178',
+    'MOP03T_20131129_L3V4_2_1',
+])
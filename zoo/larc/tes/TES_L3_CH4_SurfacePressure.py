@@ -21,24 +21,20 @@ specified by the environment variable HDFEOS_ZOO_DIR.
 """
 
 import os
-import re
 
 import h5py
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import mpl_toolkits.basemap.pyproj as pyproj
 import numpy as np
 
+import zoo.geo
+import zoo.plot
+
 def run(FILE_NAME):
     
     with h5py.File(FILE_NAME, mode='r') as f:
 
-        # Need to retrieve the grid metadata.  The hdfeos5 library stores it
-        # in a string dataset.
-        METADATA_FIELD = '/HDFEOS INFORMATION/StructMetadata.0'
-        gridmeta = str(f[METADATA_FIELD][...])
-
         # Need to transpose the data
         DATA_FIELD = '/HDFEOS/GRIDS/NadirGrid/Data Fields/SurfacePressure'
         data = f[DATA_FIELD][...].astype(np.float64).T
@@ -51,34 +47,13 @@ def run(FILE_NAME):
     data[invalid] = np.nan
     data = np.ma.masked_array(data, np.isnan(data))
 
-    # Construct the grid.  Use regular expressions to tease out the
-    # extents of the grid.  
-    ul_regex = re.compile(r'''UpperLeftPointMtrs=\(
-                              (?P<upper_left_x>[+-]?\d+\.\d+)
-                              ,
-                              (?P<upper_left_y>[+-]?\d+\.\d+)
-                              \)''', re.VERBOSE)
-    match = ul_regex.search(gridmeta)
-    x0 = np.float(match.group('upper_left_x')) / 1e6
-    y0 = np.float(match.group('upper_left_y')) / 1e6
-
-    lr_regex = re.compile(r'''LowerRightMtrs=\(
-                              (?P<lower_right_x>[+-]?\d+\.\d+)
-                              ,
-                              (?P<lower_right_y>[+-]?\d+\.\d+)
-                              \)''', re.VERBOSE)
-    match = lr_regex.search(gridmeta)
-    x1 = np.float(match.group('lower_right_x')) / 1e6
-    y1 = np.float(match.group('lower_right_y')) / 1e6
-        
-    ny, nx = data.shape
-    x = np.linspace(x0, x1, nx)
-    y = np.linspace(y0, y1, ny)
-    lon, lat = np.meshgrid(x, y)
+    # Compute the geolocation from the grid in the StructMetadata.0
+    # dataset.
+    lon, lat = zoo.geo.grid_geolocator(FILE_NAME, 'NadirGrid')[:]
     
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-45, 91, 45), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 180, 45), labels=[0, 0, 0, 1])
@@ -1,3 +1,7 @@
-from . import TES_Aura_L2_O3_Nadir_r0000011015_F05_07
-from . import TES_L2_O3_line_lvls
-from . import TES_L3_CH4_SurfacePressure
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'TES_Aura_L2_O3_Nadir_r0000011015_F05_07',
+    'TES_L2_O3_line_lvls',
+    'TES_L3_CH4_SurfacePressure',
+])
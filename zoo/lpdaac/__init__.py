@@ -1,6 +1,10 @@
-from . import ged
-from . import mcd
-from . import mod
-from . import myd
-from . import vip
-from . import weld
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'ged',
+    'mcd',
+    'mod',
+    'myd',
+    'vip',
+    'weld',
+])
@@ -27,57 +27,36 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
 
-def run(FILE_NAME):
-
-    if USE_NETCDF4:
 
-        from netCDF4 import Dataset
+def run(FILE_NAME):
 
-        nc = Dataset(FILE_NAME)
-        var = nc.groups['Emissivity'].variables['Mean']
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f['/Emissivity/Mean']
 
         # Subset for Band 10.
-        data = var[1,:,:].astype(np.float64)
+        data = var[1, :, :]
 
         # Retrieve the geolocation data.
-        latitude = nc.groups['Geolocation'].variables['Latitude'][:]
-        longitude = nc.groups['Geolocation'].variables['Longitude'][:]
-
-        # Read attribute
-        description = var.Description
-
-    else:
-        
-        import h5py
-
-        with h5py.File(FILE_NAME, mode='r') as f:
-
-            dset = f['/Emissivity/Mean']
-            data =dset[1,:,:].astype(np.float64)
-
-            # Retrieve the geolocation data.
-            latitude = f['/Geolocation/Latitude'][:]
-            longitude = f['/Geolocation/Longitude'][:]
-
-            # Retrieve attribute
-            description = dset.attrs['Description'][0]
+        latitude = f['/Geolocation/Latitude'][:]
+        longitude = f['/Geolocation/Longitude'][:]
 
+        # Retrieve attribute
+        description = var.attrs['Description']
 
     # Apply the fillvalue and scaling (see [1])
-    data[data == -9999] = np.nan
-    data = 0.001 * data
-    datam = np.ma.masked_where(np.isnan(data), data)
+    datam = 0.001 * np.ma.masked_equal(data, -9999)
 
     # Draw an equidistant cylindrical projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='h',
-                llcrnrlat=62.5,   urcrnrlat=64.5,
-                llcrnrlon=-89.5,  urcrnrlon=-87.5)
+    m = zoo.plot.basemap(projection='cyl', resolution='h',
+                         llcrnrlat=62.5,   urcrnrlat=64.5,
+                         llcrnrlon=-89.5,  urcrnrlon=-87.5)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(62, 65, 1), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-89, -87.5, 1), labels=[0, 0, 0, 1])
@@ -1 +1,5 @@
-from . import AGNS100_v003_64__089_0001
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'AGNS100_v003_64__089_0001',
+])
@@ -1,3 +1,7 @@
-from . import MCD43A3_A2013305_h12v11_005_2013322102420
-from . import MCD43B4_Nadir_Reflectance_Band1
-from . import MCD43C1_Black_Sky_Albedo_Num_Albedo_Bands1
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'MCD43A3_A2013305_h12v11_005_2013322102420',
+    'MCD43B4_Nadir_Reflectance_Band1',
+    'MCD43C1_Black_Sky_Albedo_Num_Albedo_Bands1',
+])
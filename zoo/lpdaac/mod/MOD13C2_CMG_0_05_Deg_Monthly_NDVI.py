@@ -25,85 +25,47 @@ import re
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import mpl_toolkits.basemap.pyproj as pyproj
 import numpy as np
 
-USE_GDAL = False
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 
 def run(FILE_NAME):
     
     # Identify the data field.
     DATAFIELD_NAME = 'CMG 0.05 Deg Monthly NDVI'
 
-    if  USE_GDAL:    
-        import gdal        
-        GRID_NAME = 'MOD_Grid_monthly_CMG_VI'
-        gname = 'HDF4_EOS:EOS_GRID:"{0}":{1}:{2}'.format(FILE_NAME,
-                                                         GRID_NAME,
-                                                         DATAFIELD_NAME)
-
-        gdset = gdal.Open(gname)
-        data = gdset.ReadAsArray().astype(np.float64)
-
-        # Read the attributes.
-        meta = gdset.GetMetadata()
-        long_name = meta['long_name']        
-        units = meta['units']
-        _FillValue = np.float(meta['_FillValue'])
-        scale_factor = np.float(meta['scale_factor'])
-        add_offset = np.float(meta['add_offset'])
-        valid_range = [np.float(x) for x in meta['valid_range'].split(', ')] 
-        del gdset
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:].astype(np.double)
-
-        
-        # Read attributes.
-        attrs = data2D.attributes(full=1)
-        lna=attrs["long_name"]
-        long_name = lna[0]
-        vra=attrs["valid_range"]
-        valid_range = vra[0]
-        aoa=attrs["add_offset"]
-        add_offset = aoa[0]
-        fva=attrs["_FillValue"]
-        _FillValue = fva[0]
-        sfa=attrs["scale_factor"]
-        scale_factor = sfa[0]        
-        ua=attrs["units"]
-        units = ua[0]
-
-
-    # Have to be careful of the scaling equation here.
-    invalid = data == _FillValue
-    invalid = np.logical_or(invalid, data < valid_range[0])
-    invalid = np.logical_or(invalid, data > valid_range[1])
-    data[invalid] = np.nan
-    data = (data - add_offset) / scale_factor
-    data = np.ma.masked_array(data, np.isnan(data))
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+        shape = var.shape
+        long_name = var.attrs['long_name']
+        units = var.attrs['units']
+
+        # Read only as many cells as the figure has pixels for, applying the
+        # fill value, valid range and scaling attributes as they are read.
+        rule = zoo.io.decode.rule_for(var.attrs, 'modis_divide')
+        data, key = zoo.plot.read_decimated(var, rule=rule)
         
 
     # Normally we would use the HDF-EOS metadata to reconstruct the grid, but
     # the grid metadata is incorrect in this case, specifically the upper left
     # and lower right coordinates of the grid.  We'll construct the grid
     # manually.
-    x = np.linspace(-180, 180, data.shape[1])
-    y = np.linspace(90, -90, data.shape[0])
-    lon, lat = np.meshgrid(x, y)
+    x = np.linspace(-180, 180, shape[1])[key[1]]
+    y = np.linspace(90, -90, shape[0])[key[0]]
 
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 90, 45), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 181, 45), labels=[0, 0, 0, 1])
-    m.pcolormesh(lon, lat, data)
+    zoo.plot.image(m, x, y, data)
     cb = m.colorbar()
     cb.set_label(units)
 
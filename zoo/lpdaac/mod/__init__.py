@@ -1,8 +1,12 @@
-from . import MOD09GA_Range
-from . import MOD09GHK_sur_refl_01_1
-from . import MOD11_L2_LST
-from . import MOD11C2_LST_Night_CMG
-from . import MOD13A1_500m_16_days_EVI
-from . import MOD13C2_CMG_0_05_Deg_Monthly_NDVI
-from . import MOD17A2_PsnNet_1km
-from . import MOD43B4_Nadir_Reflectance_lvl5
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'MOD09GA_Range',
+    'MOD09GHK_sur_refl_01_1',
+    'MOD11_L2_LST',
+    'MOD11C2_LST_Night_CMG',
+    'MOD13A1_500m_16_days_EVI',
+    'MOD13C2_CMG_0_05_Deg_Monthly_NDVI',
+    'MOD17A2_PsnNet_1km',
+    'MOD43B4_Nadir_Reflectance_lvl5',
+])
@@ -18,164 +18,44 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-In order for the netCDF code path to work, the netcdf library must be compiled
-with HDF4 support.  Please see the README for details.
 """
 
 import os
-import re
-
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
-import mpl_toolkits.basemap.pyproj as pyproj
 import numpy as np
 
-USE_NETCDF = False
-USE_GDAL = False
+import zoo.geo
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 
 def run(FILE_NAME):
     
     DATAFIELD_NAME = 'sur_refl_b02'
 
-    if USE_NETCDF:
-
-        from netCDF4 import Dataset
-
-        # The scaling equation isn't what netcdf4 expects, so turn it off.
-        nc = Dataset(FILE_NAME)
-        ncvar = nc.variables[DATAFIELD_NAME]
-        ncvar.set_auto_maskandscale(False)
-        data = ncvar[:].astype(np.float64)
-
-        # Get any needed attributes.
-        scale_factor = ncvar.scale_factor
-        add_offset = ncvar.add_offset
-        _FillValue = ncvar._FillValue
-        valid_range = ncvar.valid_range
-        units = ncvar.units
-        long_name = ncvar.long_name
-
-        # Construct the grid.  The needed information is in a global attribute
-        # called 'StructMetadata.0'.  Use regular expressions to tease out the
-        # extents of the grid.
-        gridmeta = getattr(nc, 'StructMetadata.0')
-        ul_regex = re.compile(r'''UpperLeftPointMtrs=\(
-                                  (?P<upper_left_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<upper_left_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-        match = ul_regex.search(gridmeta)
-        x0 = np.float(match.group('upper_left_x'))
-        y0 = np.float(match.group('upper_left_y'))
-
-        lr_regex = re.compile(r'''LowerRightMtrs=\(
-                                  (?P<lower_right_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<lower_right_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-        match = lr_regex.search(gridmeta)
-        x1 = np.float(match.group('lower_right_x'))
-        y1 = np.float(match.group('lower_right_y'))
-        
-        nx, ny = data.shape
-        x = np.linspace(x0, x1, nx)
-        y = np.linspace(y0, y1, ny)
-        xv, yv = np.meshgrid(x, y)
-
-        # In basemap, the sinusoidal projection is global, so we won't use it.
-        # Instead we'll convert the grid back to lat/lons.
-        sinu = pyproj.Proj("+proj=sinu +R=6371007.181 +nadgrids=@null +wktext")
-        wgs84 = pyproj.Proj("+init=EPSG:4326") 
-        lon, lat= pyproj.transform(sinu, wgs84, xv, yv)
-    
-    elif USE_GDAL:
-
-        # GDAL
-        import gdal
-
-        GRID_NAME = 'MOD_Grid_500m_Surface_Reflectance'
-        gname = 'HDF4_EOS:EOS_GRID:"{0}":{1}:{2}'.format(FILE_NAME,
-                                                         GRID_NAME,
-                                                         DATAFIELD_NAME)
-        gdset = gdal.Open(gname)
-        data = gdset.ReadAsArray().astype(np.float64)
-    
-        # Get any needed attributes.
-        meta = gdset.GetMetadata()
-        scale_factor = np.float(meta['scale_factor'])
-        add_offset = np.float(meta['add_offset'])
-        _FillValue = np.float(meta['_FillValue'])
-        valid_range = [np.float(x) for x in meta['valid_range'].split(', ')]
-        units = meta['units']
-        long_name = meta['long_name']
-    
-        # Construct the grid.
-        x0, xinc, _, y0, _, yinc = gdset.GetGeoTransform()
-        nx, ny = (gdset.RasterXSize, gdset.RasterYSize)
-        x = np.linspace(x0, x0 + xinc*nx, nx)
-        y = np.linspace(y0, y0 + yinc*ny, ny)
-        xv, yv = np.meshgrid(x, y)
-
-        # In basemap, the sinusoidal projection is global, so we won't use it.
-        # Instead we'll convert the grid back to lat/lons.
-        sinu = pyproj.Proj("+proj=sinu +R=6371007.181 +nadgrids=@null +wktext")
-        wgs84 = pyproj.Proj("+init=EPSG:4326") 
-        lon, lat= pyproj.transform(sinu, wgs84, xv, yv)
-
-        del gdset
-
-    else:
-        # PyHDF
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:].astype(np.double)
-
-        # Read geolocation dataset from HDF-EOS2 dumper output.
-        GEO_FILE_NAME = 'lat_MYD09A1.A2007273.h03v07.005.2007285103507.output'
-        GEO_FILE_NAME = os.path.join(os.environ['HDFEOS_ZOO_DIR'], 
-                                     GEO_FILE_NAME)
-        lat = np.genfromtxt(GEO_FILE_NAME, delimiter=',', usecols=[0])
-        lat = lat.reshape(data.shape)
-
-        GEO_FILE_NAME = 'lon_MYD09A1.A2007273.h03v07.005.2007285103507.output'
-        GEO_FILE_NAME = os.path.join(os.environ['HDFEOS_ZOO_DIR'], 
-                                      GEO_FILE_NAME)
-        lon = np.genfromtxt(GEO_FILE_NAME, delimiter=',', usecols=[0])
-        lon = lon.reshape(data.shape)
-        
-        # Read attributes.
-        attrs = data2D.attributes(full=1)
-        lna=attrs["long_name"]
-        long_name = lna[0]
-        vra=attrs["valid_range"]
-        valid_range = vra[0]
-        fva=attrs["_FillValue"]
-        _FillValue = fva[0]
-        sfa=attrs["scale_factor"]
-        scale_factor = sfa[0]        
-        ua=attrs["units"]
-        units = ua[0]
-        aoa=attrs["add_offset"]
-        add_offset = aoa[0]
-
-
-    # Apply the attributes to the data.
-    invalid = np.logical_or(data < valid_range[0], data > valid_range[1])
-    invalid = np.logical_or(invalid, data == _FillValue)
-    data[invalid] = np.nan
-    data = (data - add_offset) * scale_factor
-    data = np.ma.masked_array(data, np.isnan(data))
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+        long_name = var.attrs['long_name']
+        units = var.attrs['units']
+
+        # Read only as many cells as the figure has pixels for, applying the
+        # fill value, valid range and scaling attributes as they are read.
+        rule = zoo.io.decode.rule_for(var.attrs, 'modis')
+        data, key = zoo.plot.read_decimated(var, rule=rule)
+
+        # Compute the geolocation of the same cells from the grid's
+        # projection.
+        lon, lat = zoo.geo.grid_geolocator(f, DATAFIELD_NAME)[key]
     
 
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=7.5, urcrnrlat=22.5,
-                llcrnrlon=-162.5, urcrnrlon = -137.5)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=7.5, urcrnrlat=22.5,
+                         llcrnrlon=-162.5, urcrnrlon = -137.5)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(5, 25, 5), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-170, -130, 10), labels=[0, 0, 0, 1])
@@ -1,6 +1,10 @@
-from . import MYD09A1_sur_refl_b02
-from . import MYD09GQ_A2012246_h35v10_005_2012248075505
-from . import MYD11C2_LST_Night_CMG
-from . import MYD11_L2_LST
-from . import MYD17A2_Gpp_1km
-from . import MYD13A1_MODIS_Grid_16DAY_500m_NDVI
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'MYD09A1_sur_refl_b02',
+    'MYD09GQ_A2012246_h35v10_005_2012248075505',
+    'MYD11C2_LST_Night_CMG',
+    'MYD11_L2_LST',
+    'MYD17A2_Gpp_1km',
+    'MYD13A1_MODIS_Grid_16DAY_500m_NDVI',
+])
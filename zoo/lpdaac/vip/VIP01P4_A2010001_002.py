@@ -18,151 +18,54 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-In order for the netCDF code path to work, the netcdf library must be compiled
-with HDF4 support.  Please see the README for details.
 """
 
 import os
-import re
-
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import mpl_toolkits.basemap.pyproj as pyproj
 import numpy as np
 
-USE_NETCDF = True
-USE_GDAL = False
+import zoo.io
+import zoo.plot
+
 def run(FILE_NAME):
     
     DATAFIELD_NAME = 'CMG 0.05 Deg NDVI'
 
-    if USE_GDAL:
-        # Gdal
-        import gdal
-
-        GRID_NAME = 'VIP_CMG_GRID'
-        gname = 'HDF4_EOS:EOS_GRID:"{0}":{1}:{2}'.format(FILE_NAME,
-                                                         GRID_NAME,
-                                                         DATAFIELD_NAME)
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
 
         # Scale down the data by a factor of 6 so that low-memory machines
         # can handle it.
-        gdset = gdal.Open(gname)
-        data = gdset.ReadAsArray().astype(np.float64)[::6, ::6]
-    
-        # Get any needed attributes.
-        meta = gdset.GetMetadata()
-        scale = np.float(meta['scale_factor'])
-        fillvalue = np.float(meta['_FillValue'])
-        valid_range = [np.float(x) for x in meta['valid_range'].split(', ')]
-        units = meta['units']
-        long_name = meta['long_name']
-    
-        # Construct the grid.
-        x0, xinc, _, y0, _, yinc = gdset.GetGeoTransform()
-        ny, nx = (gdset.RasterYSize / 6, gdset.RasterXSize / 6)
-        x = np.linspace(x0, x0 + xinc*6*nx, nx)
-        y = np.linspace(y0, y0 + yinc*6*ny, ny)
-        lon, lat = np.meshgrid(x, y)
-
-        del gdset
-
-    else:
-        if USE_NETCDF:
-
-            from netCDF4 import Dataset
-
-            # The scaling equation isn't what netcdf4 expects, so turn it off.
-            # Scale down the data by a factor of 6 so that low-memory machines
-            # can handle it.
-            nc = Dataset(FILE_NAME)
-            ncvar = nc.variables[DATAFIELD_NAME]
-            ncvar.set_auto_maskandscale(False)
-
-            # Scale down the data by a factor of 6 so that low-memory machines
-            # can handle it.
-            data = ncvar[::6, ::6].astype(np.float64)
-
-            # Get any needed attributes.  The valid_range attribute is a string,
-            # which is not usually the case.
-            scale = ncvar.scale_factor
-            fillvalue = ncvar._FillValue
-            valid_range = [np.float64(x) for x in ncvar.valid_range.split(', ')]
-            units = ncvar.units
-            long_name = ncvar.long_name
-            gridmeta = getattr(nc, 'StructMetadata.0')
-
-        else:
-            from pyhdf.SD import SD, SDC
-            hdf = SD(FILE_NAME, SDC.READ)
-
-            # Read dataset.
-            data2D = hdf.select(DATAFIELD_NAME)
-            data = data2D[:,:].astype(np.double)
-
-            # Scale down the data by a factor of 6 so that low-memory machines
-            # can handle it.
-            data = data[::6, ::6]
-
-        
-            # Read attributes.
-            attrs = data2D.attributes(full=1)
-            lna=attrs["long_name"]
-            long_name = lna[0]
-            vra=attrs["valid_range"]
-            valid_range = vra[0]
-            fva=attrs["_FillValue"]
-            fillvalue = fva[0]
-            sfa=attrs["scale_factor"]
-            scale = sfa[0]        
-            ua=attrs["units"]
-            units = ua[0]
-            fattrs = hdf.attributes(full=1)
-            ga = fattrs["StructMetadata.0"]
-            gridmeta = ga[0]
-            
-        # Construct the grid.  The needed information is in a global attribute
-        # called 'StructMetadata.0'.  Use regular expressions to tease out the
-        # extents of the grid.  In addition, the grid is in packed decimal
-        # degrees, so we need to normalize to degrees.
-
-        ul_regex = re.compile(r'''UpperLeftPointMtrs=\(
-                                  (?P<upper_left_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<upper_left_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-        match = ul_regex.search(gridmeta)
-        x0 = np.float(match.group('upper_left_x')) / 1e6
-        y0 = np.float(match.group('upper_left_y')) / 1e6
-
-        lr_regex = re.compile(r'''LowerRightMtrs=\(
-                                  (?P<lower_right_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<lower_right_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-        match = lr_regex.search(gridmeta)
-        x1 = np.float(match.group('lower_right_x')) / 1e6
-        y1 = np.float(match.group('lower_right_y')) / 1e6
-        
-        ny, nx = data.shape
-        x = np.linspace(x0, x1, nx)
-        y = np.linspace(y0, y1, ny)
+        data = var[::6, ::6]
+
+        # Get any needed attributes.  The valid_range attribute is a string,
+        # which is not usually the case.
+        scale = var.attrs['scale_factor']
+        fillvalue = var.attrs['_FillValue']
+        valid_range = [float(x) for x in var.attrs['valid_range'].split(', ')]
+        units = var.attrs['units']
+        long_name = var.attrs['long_name']
+
+        # Take the cell centers of the cells read, in degrees, from the
+        # grid in the StructMetadata.0 attribute.
+        grid = f.structmetadata().grid_of(DATAFIELD_NAME)
+        x = grid.x[::6]
+        y = grid.y[::6]
         lon, lat = np.meshgrid(x, y)
-    
 
     # Apply the attributes to the data.
-    invalid = np.logical_or(data < valid_range[0], data > valid_range[1])
-    invalid = np.logical_or(invalid, data == fillvalue)
-    data[invalid] = np.nan
+    data = np.ma.masked_outside(data, valid_range[0], valid_range[1])
+    data = np.ma.masked_equal(data, fillvalue)
     data = data / scale
-    data = np.ma.masked_array(data, np.isnan(data))
     
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon = 180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon = 180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 30), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 181, 45), labels=[0, 0, 0, 1])
@@ -1 +1,5 @@
-from . import VIP01P4_A2010001_002
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'VIP01P4_A2010001_002',
+])
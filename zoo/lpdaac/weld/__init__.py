@@ -1 +1,5 @@
-from . import CONUS_annual_2012_h01v06_doy007to356_v1_5
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'CONUS_annual_2012_h01v06_doy007to356_v1_5',
+])
@@ -1,4 +1,8 @@
-from . import amsre
-from . import icesat
-from . import modis
-from . import nise
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'amsre',
+    'icesat',
+    'modis',
+    'nise',
+])
@@ -27,55 +27,42 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io.decode
+import zoo.plot
+
+# The file has several Latitude and Longitude datasets under different
+# groups.  They can only be told apart by reference number, which zoo.io
+# does not expose, so this example reads the file with pyhdf.
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = '89.0V_Res.5B_TB_(not-resampled)'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
+    from pyhdf.SD import SD, SDC
+    hdf = SD(FILE_NAME, SDC.READ)
 
-        data = nc.variables[DATAFIELD_NAME][:].astype(np.float64)
-        latitude = nc.variables['Latitude'][:]
-        longitude = nc.variables['Longitude'][:]
-    
-        # Replace the filled value with NaN, replace with a masked array.
-        # Apply the scaling equation.  These attributes are named in a VERY
-        # non-standard manner.
-        scale_factor = getattr(nc.variables[DATAFIELD_NAME], 'SCALE FACTOR')
-        add_offset = nc.variables[DATAFIELD_NAME].OFFSET
-
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:].astype(np.float64)
-
-        # Read geolocation dataset.
-		# This product has multiple 'Latitude' and 'Longitude' pair under different groups.
-        lat = hdf.select(hdf.reftoindex(192)) # Use HDFView to get ref number 192.
-        latitude = lat[:,:]
-        lon = hdf.select(hdf.reftoindex(194)) # Use HDFView to get ref number 194.
-        longitude = lon[:,:]
-
-        # Retrieve attributes.
-        attrs = data2D.attributes(full=1)
-        sfa=attrs["SCALE FACTOR"]
-        scale_factor = sfa[0]        
-        aoa=attrs["OFFSET"]
-        add_offset = aoa[0]
-        
-    data[data == -32768] = np.nan
-    data = data * scale_factor + add_offset
-    datam = np.ma.masked_array(data, np.isnan(data))
+    # Read dataset.
+    data2D = hdf.select(DATAFIELD_NAME)
+    data = data2D[:,:].astype(np.float64)
+
+    # Read geolocation dataset.
+    # This product has multiple 'Latitude' and 'Longitude' pair under different
+    # groups.
+    lat = hdf.select(hdf.reftoindex(192)) # Use HDFView to get ref number 192.
+    latitude = lat[:,:]
+    lon = hdf.select(hdf.reftoindex(194)) # Use HDFView to get ref number 194.
+    longitude = lon[:,:]
+
+    # Retrieve attributes.
+    attrs = data2D.attributes()
+
+    # Mask the fill value, which is not given as an attribute, and apply the
+    # scaling equation.
+    rule = zoo.io.decode.rule_for(attrs, 'amsre')._replace(fill=-32768)
+    datam = zoo.io.decode.decode_masked(data, rule)
 
     units = "degrees K"
     long_name = DATAFIELD_NAME
@@ -85,17 +72,17 @@ def run(FILE_NAME):
     # for a projection.  We show the full global map plus a limited polar map.
     fig = plt.figure(figsize=(15, 6))
     ax1 = plt.subplot(1, 2, 1)
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 30), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 181., 45), labels=[0, 0, 0, 1])
     m.pcolormesh(longitude, latitude, datam, latlon=True)
 
     ax2 = plt.subplot(1, 2, 2)
-    m = Basemap(projection='npstere', resolution='l',
-                boundinglat=65, lon_0=0)
+    m = zoo.plot.basemap(projection='npstere', resolution='l',
+                         boundinglat=65, lon_0=0)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(60, 81, 10), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180., 181., 30.), labels=[1, 0, 0, 1])
@@ -18,50 +18,35 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     # Identify the data field.
     DATAFIELD_NAME = 'High_res_cloud'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-        data = nc.variables[DATAFIELD_NAME][:].astype(np.float64)
-        latitude = nc.variables['Latitude'][:]
-        longitude = nc.variables['Longitude'][:]
-        scale_factor = nc.variables[DATAFIELD_NAME].Scale
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:].astype(np.float64)
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+        data = var[:]
 
         # Read geolocation dataset.
-        lat = hdf.select('Latitude')
-        latitude = lat[:,:]
-        lon = hdf.select('Longitude')
-        longitude = lon[:,:]
+        latitude = f['Latitude'][:]
+        longitude = f['Longitude'][:]
 
         # Retrieve attributes.
-        attrs = data2D.attributes(full=1)
-        sfa=attrs["Scale"]
-        scale_factor = sfa[0]        
+        scale_factor = var.attrs['Scale']
 
     # There is a wrap-around effect to deal with, as some of the swath extends
     # eastward over the international dateline.  Adjust the longitude to avoid
@@ -69,18 +54,16 @@ def run(FILE_NAME):
     longitude[longitude < -170] += 360
 
     # Apply the fill value and scaling equation.
-    data[data == -9990] = np.nan
-    data = data * scale_factor
-    data = np.ma.masked_array(data, np.isnan(data))
+    data = np.ma.masked_equal(data, -9990) * scale_factor
 
     units = "mm"
     long_name = DATAFIELD_NAME
 
     # Draw a polar stereographic projection using the low resolution coastline
     # database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-170, urcrnrlon=190)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-170, urcrnrlon=190)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 45), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180,181,45), labels=[0, 0, 0, 1])
@@ -18,108 +18,45 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 
 import os
-import re
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_GDAL = False
+import zoo.geo
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
     
     # Identify the data field.
     DATAFIELD_NAME = 'High_res_cloud'
 
-    if USE_GDAL:    
-        import gdal
-        import mpl_toolkits.basemap.pyproj as pyproj
-        GRID_NAME = 'GlobalGrid'
-        gname = 'HDF4_EOS:EOS_GRID:"{0}":{1}:{2}'.format(FILE_NAME,
-                                                         GRID_NAME,
-                                                         DATAFIELD_NAME)
-        gdset = gdal.Open(gname)
-        data = gdset.ReadAsArray().astype(np.float64)
-
-        # Construct the grid.  The projection is GEO, so this immediately 
-        # gives us latitude and longitude.
-        meta = gdset.GetMetadata()
-        x0, xinc, _, y0, _, yinc = gdset.GetGeoTransform()
-        nx, ny = (gdset.RasterXSize, gdset.RasterYSize)
-        x = np.linspace(x0, x0 + xinc*nx, nx)
-        y = np.linspace(y0, y0 + yinc*ny, ny)
-        longitude, latitude = np.meshgrid(x, y)
-
-        scale_factor = float(meta['Scale'])
-        units = meta['Unit']
-        del gdset
-
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:].astype(np.float64)
-
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+        data = var[:]
 
         # Retrieve attributes.
-        attrs = data2D.attributes(full=1)
-        sfa=attrs["Scale"]
-        scale_factor = sfa[0]        
-        ua=attrs["Unit"]
-        units = ua[0]
-
-        # Read global attribute.
-        fattrs = hdf.attributes(full=1)
-        ga = fattrs["StructMetadata.0"]
-        gridmeta = ga[0]
-            
-        # Construct the grid.  The needed information is in a global attribute
-        # called 'StructMetadata.0'.  Use regular expressions to tease out the
-        # extents of the grid.  In addition, the grid is in packed decimal
-        # degrees, so we need to normalize to degrees.
-
-        ul_regex = re.compile(r'''UpperLeftPointMtrs=\(
-                                  (?P<upper_left_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<upper_left_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-        match = ul_regex.search(gridmeta)
-        x0 = np.float(match.group('upper_left_x')) / 1e6
-        y0 = np.float(match.group('upper_left_y')) / 1e6
-
-        lr_regex = re.compile(r'''LowerRightMtrs=\(
-                                  (?P<lower_right_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<lower_right_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-        match = lr_regex.search(gridmeta)
-        x1 = np.float(match.group('lower_right_x')) / 1e6
-        y1 = np.float(match.group('lower_right_y')) / 1e6
-        
-        ny, nx = data.shape
-        x = np.linspace(x0, x1, nx)
-        y = np.linspace(y0, y1, ny)
-        longitude, latitude = np.meshgrid(x, y)
-
-    # Apply the attributes information.        
-    data[data == -9999] = np.nan
-    data = data * scale_factor
-    data = np.ma.masked_array(data, np.isnan(data))
+        scale_factor = var.attrs['Scale']
+        units = var.attrs['Unit']
+
+        # Compute the geolocation from the grid's projection.
+        longitude, latitude = zoo.geo.grid_geolocator(f, DATAFIELD_NAME)[:]
+
+    # Apply the attributes information.
+    data = np.ma.masked_equal(data, -9999) * scale_factor
 
     long_name = DATAFIELD_NAME.replace('_', ' ')
 
-    m = Basemap(projection='cyl', resolution='l', lon_0=0,
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-180, urcrnrlon = 180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l', lon_0=0,
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-180, urcrnrlon = 180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 45), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 181, 45), labels=[0, 0, 0, 1])
@@ -1,15 +1,18 @@
-# swath codes
-from . import AMSR_E_L2A_BrightnessTemperatures_V12_201110032238_D_hdf
-from . import AMSR_E_L2_Ocean_V06_200206190029_D_High_res_cloud
+from ..._lazy import attach
 
-# grid codes.
-from . import AMSR_E_L3_5DaySnow_NH_SWE
-from . import AMSR_E_L3_DL_A_TB36_5H_Res_1
-from . import AMSR_E_L3_DO_High_res_cloud
-from . import AMSR_E_L3_MO_Med_res_vapor
-from . import AMSR_E_L3_RG_TbOceanRain
-from . import AMSR_E_L3_SI_06km_NH_89V_DAY
-from . import AMSR_E_L3_SI_12km_NH_18H_DSC
-from . import AMSR_E_L3_SI_12km_SH_36H_DAY
-from . import AMSR_E_L3_SI_25km_NH_06V_ASC
-from . import AMSR_E_L3_WO_High_res_cloud
+__getattr__, __dir__, __all__ = attach(__name__, [
+    # swath codes
+    'AMSR_E_L2A_BrightnessTemperatures_V12_201110032238_D_hdf',
+    'AMSR_E_L2_Ocean_V06_200206190029_D_High_res_cloud',
+    # grid codes.
+    'AMSR_E_L3_5DaySnow_NH_SWE',
+    'AMSR_E_L3_DL_A_TB36_5H_Res_1',
+    'AMSR_E_L3_DO_High_res_cloud',
+    'AMSR_E_L3_MO_Med_res_vapor',
+    'AMSR_E_L3_RG_TbOceanRain',
+    'AMSR_E_L3_SI_06km_NH_89V_DAY',
+    'AMSR_E_L3_SI_12km_NH_18H_DSC',
+    'AMSR_E_L3_SI_12km_SH_36H_DAY',
+    'AMSR_E_L3_SI_25km_NH_06V_ASC',
+    'AMSR_E_L3_WO_High_res_cloud',
+])
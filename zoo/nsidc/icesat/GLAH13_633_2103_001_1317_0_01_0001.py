@@ -24,61 +24,33 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-# Can do this using either netCDF4 or h5py.
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     DATAFIELD_NAME = '/Data_1HZ/Atmosphere/d_Surface_temp'
 
-    if USE_NETCDF4:
-    
-        from netCDF4 import Dataset
-    
-        nc = Dataset(FILE_NAME)
-
-        latvar = nc.groups['Data_1HZ'].groups['Geolocation'].variables['d_lat']
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        latvar = f['/Data_1HZ/Geolocation/d_lat']
         latitude = latvar[:]
-        lat_vr = [latvar.valid_min, latvar.valid_max]
+        lat_vr = [latvar.attrs['valid_min'], latvar.attrs['valid_max']]
 
-        lonvar = nc.groups['Data_1HZ'].groups['Geolocation'].variables['d_lon']
+        lonvar = f['/Data_1HZ/Geolocation/d_lon']
         longitude = lonvar[:]
-        lon_vr = [lonvar.valid_min, lonvar.valid_max]
-
-        tempvar = nc.groups['Data_1HZ'].groups['Atmosphere'].variables['d_Surface_temp']
-        long_name = tempvar.long_name
-        units = tempvar.units
+        lon_vr = [lonvar.attrs['valid_min'], lonvar.attrs['valid_max']]
 
+        tempvar = f['/Data_1HZ/Atmosphere/d_Surface_temp']
         temp = tempvar[:]
-        temp_vr = [tempvar.valid_min, tempvar.valid_max]
-
-        timevar = nc.groups['Data_1HZ'].groups['Time'].variables['d_UTCTime_1']
-        time = timevar[:]
+        temp_vr = [tempvar.attrs['valid_min'], tempvar.attrs['valid_max']]
+        units = tempvar.attrs['units']
+        long_name = tempvar.attrs['long_name']
 
-    else:
-    
-        import h5py
-    
-        with h5py.File(FILE_NAME, mode='r') as f:
-    
-            latvar = f['/Data_1HZ/Geolocation/d_lat']
-            latitude = latvar[:]
-            lat_vr = [latvar.attrs['valid_min'], latvar.attrs['valid_max']]
-    
-            lonvar = f['/Data_1HZ/Geolocation/d_lon']
-            longitude = lonvar[:]
-            lon_vr = [lonvar.attrs['valid_min'], lonvar.attrs['valid_max']]
-    
-            tempvar = f['/Data_1HZ/Atmosphere/d_Surface_temp']
-            temp = tempvar[:]
-            temp_vr = [tempvar.attrs['valid_min'], tempvar.attrs['valid_max']]
-            units = tempvar.attrs['units']
-            long_name = tempvar.attrs['long_name']
-    
-            time = f['/Data_1HZ/Time/d_UTCTime_1'][:]
+        time = f['/Data_1HZ/Time/d_UTCTime_1'][:]
 
     # apply valid max, min
     latitude[latitude < lat_vr[0]] = np.nan
@@ -103,15 +75,14 @@ def run(FILE_NAME):
 
     # Draw an equidistant cylindrical projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-180, urcrnrlon = 180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-180, urcrnrlon = 180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.))
     m.drawmeridians(np.arange(-180, 180., 45.))
     # m.pcolormesh(longitude, latitude, temp, latlon=True, vmin=0, vmax=1)
-    m.scatter(longitude, latitude, c=temp, s=1, cmap=plt.cm.jet,
-              edgecolors=None, linewidth=0)
+    zoo.plot.points(m, longitude, latitude, temp, cmap=plt.cm.jet, size=1)
     cb = m.colorbar()
     cb.set_label(units)
 
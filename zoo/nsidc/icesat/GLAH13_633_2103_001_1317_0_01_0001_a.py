@@ -24,57 +24,30 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-# Can do this using either netCDF4 or h5py.
-USE_NETCDF4 = False
+import zoo.io
+import zoo.plot
 
-def run(FILE_NAME):
-    if USE_NETCDF4:
-    
-        from netCDF4 import Dataset
-    
-        nc = Dataset(FILE_NAME)
 
-        latvar = nc.groups['Data_1HZ'].groups['Geolocation'].variables['d_lat']
+def run(FILE_NAME):
+    # zoo.io reads the file with h5py or netCDF4, whichever is installed.
+    with zoo.io.open_file(FILE_NAME) as f:
+        latvar = f['/Data_1HZ/Geolocation/d_lat']
         latitude = latvar[:]
-        lat_vr = [latvar.valid_min, latvar.valid_max]
+        lat_vr = [latvar.attrs['valid_min'], latvar.attrs['valid_max']]
 
-        lonvar = nc.groups['Data_1HZ'].groups['Geolocation'].variables['d_lon']
+        lonvar = f['/Data_1HZ/Geolocation/d_lon']
         longitude = lonvar[:]
-        lon_vr = [lonvar.valid_min, lonvar.valid_max]
+        lon_vr = [lonvar.attrs['valid_min'], lonvar.attrs['valid_max']]
 
-        tempvar = nc.groups['Data_1HZ'].groups['Atmosphere'].variables['d_Surface_temp']
+        tempvar = f['/Data_1HZ/Atmosphere/d_Surface_temp']
         temp = tempvar[:]
-        temp_vr = [tempvar.valid_min, tempvar.valid_max]
-        units = tempvar.units
-        longname = tempvar.long_name
-
-        timevar = nc.groups['Data_1HZ'].groups['Time'].variables['d_UTCTime_1']
-        time = timevar[:]
+        temp_vr = [tempvar.attrs['valid_min'], tempvar.attrs['valid_max']]
+        units = tempvar.attrs['units']
+        longname = tempvar.attrs['long_name']
 
-    else:
-    
-        import h5py
-    
-        with h5py.File(FILE_NAME, mode='r') as f:
-    
-            latvar = f['/Data_1HZ/Geolocation/d_lat']
-            latitude = latvar[:]
-            lat_vr = [latvar.attrs['valid_min'], latvar.attrs['valid_max']]
-    
-            lonvar = f['/Data_1HZ/Geolocation/d_lon']
-            longitude = lonvar[:]
-            lon_vr = [lonvar.attrs['valid_min'], lonvar.attrs['valid_max']]
-    
-            tempvar = f['/Data_1HZ/Atmosphere/d_Surface_temp']
-            temp = tempvar[:]
-            temp_vr = [tempvar.attrs['valid_min'], tempvar.attrs['valid_max']]
-            units = tempvar.attrs['units']
-            longname = tempvar.attrs['long_name']
-    
-            time = f['/Data_1HZ/Time/d_UTCTime_1'][:]
+        time = f['/Data_1HZ/Time/d_UTCTime_1'][:]
     
     # Apply attribute restrictions.
     latitude[latitude < lat_vr[0]] = np.nan
@@ -101,8 +74,8 @@ def run(FILE_NAME):
     # The 2nd plot is the trajectory.
     # Use a north polar azimuthal equal area projection.
     ax2 = plt.subplot(1, 2, 2)
-    m = Basemap(projection='nplaea', resolution='l',
-                boundinglat=52, lon_0=0)
+    m = zoo.plot.basemap(projection='nplaea', resolution='l',
+                         boundinglat=52, lon_0=0)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(0., 91., 10.), labels=[0, 0, 0, 1])
     m.drawmeridians(np.arange(-180, 180., 30.), labels=[0, 1, 0, 0])
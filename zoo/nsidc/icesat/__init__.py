@@ -1 +1,5 @@
-from . import GLAH13_633_2103_001_1317_0_01_0001_a
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'GLAH13_633_2103_001_1317_0_01_0001_a',
+])
@@ -21,86 +21,36 @@ specified by the environment variable HDFEOS_ZOO_DIR.
 """
 
 import os
-import re
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
-import mpl_toolkits.basemap.pyproj as pyproj
 import numpy as np
 
-USE_GDAL = False
+import zoo.geo
+import zoo.io
+import zoo.io.overview
+import zoo.plot
+
 
 def run(FILE_NAME):
     
     # Identify the data field.
     DATAFIELD_NAME = 'Snow_Cover_Daily_Tile'
 
-    if USE_GDAL:    
-        import gdal
-        GRID_NAME = 'MOD_Grid_Snow_500m'
-    
-        gname = 'HDF4_EOS:EOS_GRID:"{0}":{1}:{2}'.format(FILE_NAME,
-                                                         GRID_NAME,
-                                                         DATAFIELD_NAME)
-        gdset = gdal.Open(gname)
-
-        data = gdset.ReadAsArray()
-
-        # Construct the grid.
-        meta = gdset.GetMetadata()
-        x0, xinc, _, y0, _, yinc = gdset.GetGeoTransform()
-        nx, ny = (gdset.RasterXSize, gdset.RasterYSize)
-
-        del gdset
-
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:].astype(np.float64)
-
-        # Read global attribute.
-        fattrs = hdf.attributes(full=1)
-        ga = fattrs["StructMetadata.0"]
-        gridmeta = ga[0]
-            
-        # Construct the grid.  The needed information is in a global attribute
-        # called 'StructMetadata.0'.  Use regular expressions to tease out the
-        # extents of the grid. 
-        ul_regex = re.compile(r'''UpperLeftPointMtrs=\(
-                                  (?P<upper_left_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<upper_left_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-        match = ul_regex.search(gridmeta)
-        x0 = np.float(match.group('upper_left_x')) 
-        y0 = np.float(match.group('upper_left_y')) 
-
-        lr_regex = re.compile(r'''LowerRightMtrs=\(
-                                  (?P<lower_right_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<lower_right_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-        match = lr_regex.search(gridmeta)
-        x1 = np.float(match.group('lower_right_x')) 
-        y1 = np.float(match.group('lower_right_y')) 
-        ny, nx = data.shape
-        xinc = (x1 - x0) / nx
-        yinc = (y1 - y0) / ny
-
-
-    x = np.linspace(x0, x0 + xinc*nx, nx)
-    y = np.linspace(y0, y0 + yinc*ny, ny)
-    xv, yv = np.meshgrid(x, y)
-
-    # In basemap, the sinusoidal projection is global, so we won't use it.
-    # Instead we'll convert the grid back to lat/lons.
-    sinu = pyproj.Proj("+proj=sinu +R=6371007.181 +nadgrids=@null +wktext")
-    wgs84 = pyproj.Proj("+init=EPSG:4326") 
-    lon, lat= pyproj.transform(sinu, wgs84, xv, yv)
+    # Keep the most frequent class of each block of cells, so that there
+    # are about as many blocks as the figure has pixels.  The first run
+    # writes overviews of the tile next to the file, and later runs read
+    # only the coarsest level that will do.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+        zoo.io.overview.build(var, 'mode')
+        data, key = zoo.plot.read_decimated(var, 'mode')
+
+        # Compute the geolocation of the same cells from the grid's
+        # projection, as given in the StructMetadata.0 attribute of the
+        # open file.
+        geo = zoo.geo.grid_geolocator(f, DATAFIELD_NAME)
+        lon, lat = geo[key]
 
     # There's a wraparound issue for the longitude, as part of the tile extends
     # over the international dateline, and pyproj wraps longitude values west
@@ -108,12 +58,10 @@ def run(FILE_NAME):
     # doesn't like that.
     lon[lon > 0] -= 360
 
-
-
-    m = Basemap(projection='cyl', resolution='h',
-                lon_0=-10,
-                llcrnrlat=-5, urcrnrlat = 30,
-                llcrnrlon=-185, urcrnrlon = -150)
+    m = zoo.plot.basemap(projection='cyl', resolution='h',
+                         lon_0=-10,
+                         llcrnrlat=-5, urcrnrlat = 30,
+                         llcrnrlon=-185, urcrnrlon = -150)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(0, 21, 10), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, -159, 10), labels=[0, 0, 0, 1])
@@ -125,9 +73,7 @@ def run(FILE_NAME):
     bounds = [0, 25, 39, 255, 256]
     norm = mpl.colors.BoundaryNorm(bounds, cmap.N)
     
-    # 2400x2400 seems to be too much, so we'll subset it.
-    m.pcolormesh(lon[::2,::2], lat[::2,::2], data[::2,::2], latlon=True,
-                 cmap=cmap, norm=norm)
+    m.pcolormesh(lon, lat, data, latlon=True, cmap=cmap, norm=norm)
     
     color_bar = plt.colorbar()
     color_bar.set_ticks([12, 32, 147, 255.5])
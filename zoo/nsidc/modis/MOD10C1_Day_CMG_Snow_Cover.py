@@ -21,81 +21,38 @@ specified by the environment variable HDFEOS_ZOO_DIR.
 """
 
 import os
-import re
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import mpl_toolkits.basemap.pyproj as pyproj
 import numpy as np
 
-USE_GDAL = False
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
     
     # Identify the data field.
     DATAFIELD_NAME = 'Day_CMG_Snow_Cover'
 
-    if USE_GDAL:    
-        import gdal
-        GRID_NAME = 'MOD_CMG_Snow_5km'    
-        gname = 'HDF4_EOS:EOS_GRID:"{0}":{1}:{2}'.format(FILE_NAME,
-                                                         GRID_NAME,
-                                                         DATAFIELD_NAME)
-        gdset = gdal.Open(gname)
-        data = gdset.ReadAsArray()
-        
-        # Read projection parameters.
-        x0, xinc, _, y0, _, yinc = gdset.GetGeoTransform()
-        nx, ny = (gdset.RasterXSize, gdset.RasterYSize)
-
-        del gdset
-
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:].astype(np.float64)
-
-        # Read global attribute.
-        fattrs = hdf.attributes(full=1)
-        ga = fattrs["StructMetadata.0"]
-        gridmeta = ga[0]
-            
-        # Read projection parameters. 
-        # The needed information is in a global attribute called 'StructMetadata.0'.  
-        # Use regular expressions to tease out the extents of the grid. 
-        ul_regex = re.compile(r'''UpperLeftPointMtrs=\(
-                                  (?P<upper_left_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<upper_left_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-        match = ul_regex.search(gridmeta)
-        x0 = np.float(match.group('upper_left_x')) / 1e6
-        y0 = np.float(match.group('upper_left_y')) / 1e6
-
-        lr_regex = re.compile(r'''LowerRightMtrs=\(
-                                  (?P<lower_right_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<lower_right_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-        match = lr_regex.search(gridmeta)
-        x1 = np.float(match.group('lower_right_x')) / 1e6
-        y1 = np.float(match.group('lower_right_y')) / 1e6
-        ny, nx = data.shape
-        xinc = (x1 - x0) / nx
-        yinc = (y1 - y0) / ny
-        
-    # Construct the grid.  It's already in lat/lon.
-    x = np.linspace(x0, x0 + xinc*nx, nx)
-    y = np.linspace(y0, y0 + yinc*ny, ny)
-    lon, lat = np.meshgrid(x, y)
-
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat = 90,
-                llcrnrlon=-180, urcrnrlon = 180)
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+
+        # Keep the most frequent class of each block of cells, so that there
+        # are about as many blocks as the figure has pixels.
+        data, key = zoo.plot.read_decimated(var, 'mode')
+
+        # Take the cell centers of the cells kept, in degrees, from the
+        # grid in the StructMetadata.0 attribute.
+        grid = f.structmetadata().grid_of(DATAFIELD_NAME)
+        x, y = grid.x[key[1]], grid.y[key[0]]
+
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat = 90,
+                         llcrnrlon=-180, urcrnrlon = 180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90., 120., 30.), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 180., 45.), labels=[0, 0, 0, 1])
@@ -121,9 +78,8 @@ def run(FILE_NAME):
     bounds = [0, 1, 100, 107, 111, 250, 254, 255, 256]
     norm = mpl.colors.BoundaryNorm(bounds, cmap.N)
     
-    # Render the image in the projected coordinate system.
-    m.pcolormesh(lon[::2,::2], lat[::2,::2], data[::2,::2],
-                 latlon=True, cmap=cmap, norm=norm)
+    # Render the grid at full resolution as a single image.
+    zoo.plot.image(m, x, y, data, cmap=cmap, norm=norm)
 
     long_name = 'Day CMG Snow Cover'
     basename = os.path.basename(FILE_NAME)
@@ -18,60 +18,43 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.io.dumper
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     # Identify the data field.
     DATAFIELD_NAME = 'Snow_Cover'
     
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-        # Subset the data to match the size of the swath geolocation fields.
-        rows = slice(5, 4060, 10)
-        cols = slice(5, 2708, 10)
-        data = nc.variables['Snow_Cover'][rows, cols]
-        latitude = nc.variables['Latitude'][:]
-        longitude = nc.variables['Longitude'][:]
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:].astype(np.float64)
-
-        # Read geolocation dataset from HDF-EOS2 dumper output.
-        GEO_FILE_NAME = 'lat_MOD10_L2.A2000065.0040.005.2008235221207.output'
-        GEO_FILE_NAME = os.path.join(os.environ['HDFEOS_ZOO_DIR'], 
-                                     GEO_FILE_NAME)
-        lat = np.genfromtxt(GEO_FILE_NAME, delimiter=',', usecols=[0])
-        latitude = lat.reshape(data.shape)
-        
-        GEO_FILE_NAME = 'lon_MOD10_L2.A2000065.0040.005.2008235221207.output'
-        GEO_FILE_NAME = os.path.join(os.environ['HDFEOS_ZOO_DIR'], 
-                                     GEO_FILE_NAME)
-        lon = np.genfromtxt(GEO_FILE_NAME, delimiter=',', usecols=[0])
-        longitude = lon.reshape(data.shape)
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        data = f[DATAFIELD_NAME][:]
+
+    # Read geolocation dataset from HDF-EOS2 dumper output.
+    GEO_FILE_NAME = 'lat_MOD10_L2.A2000065.0040.005.2008235221207.output'
+    GEO_FILE_NAME = os.path.join(os.environ['HDFEOS_ZOO_DIR'], GEO_FILE_NAME)
+    latitude = zoo.io.dumper.load(GEO_FILE_NAME, data.shape)
+
+    GEO_FILE_NAME = 'lon_MOD10_L2.A2000065.0040.005.2008235221207.output'
+    GEO_FILE_NAME = os.path.join(os.environ['HDFEOS_ZOO_DIR'], GEO_FILE_NAME)
+    longitude = zoo.io.dumper.load(GEO_FILE_NAME, data.shape)
 
     
     # Draw a polar stereographic projection using the low resolution coastline
     # database.
-    m = Basemap(projection='npstere', resolution='l',
-                boundinglat=64, lon_0 = 0)
+    m = zoo.plot.basemap(projection='npstere', resolution='l',
+                         boundinglat=64, lon_0 = 0)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(60.,81,10.))
     m.drawmeridians(np.arange(-180.,181.,30.), labels=[True,False,False,True])
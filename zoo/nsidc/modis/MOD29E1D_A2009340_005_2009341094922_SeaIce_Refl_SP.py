@@ -18,80 +18,39 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 
 import os
-import re
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
-import mpl_toolkits.basemap.pyproj as pyproj
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.geo
+import zoo.io
+import zoo.plot
+
 
 def run(FILE_NAME):
     
     DATAFIELD_NAME = 'Sea_Ice_by_Reflectance_SP'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-        ncvar = nc.variables[DATAFIELD_NAME]
-        data = ncvar[:].astype(np.float64)
-        gridmeta = getattr(nc, 'StructMetadata.0')
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:].astype(np.float64)
-
-        # Read global attribute.
-        fattrs = hdf.attributes(full=1)
-        ga = fattrs["StructMetadata.0"]
-        gridmeta = ga[0]
-
-    # Construct the grid.  The needed information is in a global attribute
-    # called 'StructMetadata.0'.  Use regular expressions to tease out the
-    # extents of the grid.  
-    ul_regex = re.compile(r'''UpperLeftPointMtrs=\(
-                              (?P<upper_left_x>[+-]?\d+\.\d+)
-                              ,
-                              (?P<upper_left_y>[+-]?\d+\.\d+)
-                              \)''', re.VERBOSE)
-    match = ul_regex.search(gridmeta)
-    x0 = np.float(match.group('upper_left_x'))
-    y0 = np.float(match.group('upper_left_y'))
-
-    lr_regex = re.compile(r'''LowerRightMtrs=\(
-                              (?P<lower_right_x>[+-]?\d+\.\d+)
-                              ,
-                              (?P<lower_right_y>[+-]?\d+\.\d+)
-                              \)''', re.VERBOSE)
-    match = lr_regex.search(gridmeta)
-    x1 = np.float(match.group('lower_right_x'))
-    y1 = np.float(match.group('lower_right_y'))
-        
-    ny, nx = data.shape
-    x = np.linspace(x0, x1, nx)
-    y = np.linspace(y0, y1, ny)
-    xv, yv = np.meshgrid(x, y)
-    
-    # Reproject into latlon
-    # Reproject the coordinates out of lamaz into lat/lon.
-    lamaz = pyproj.Proj("+proj=laea +a=6371228 +lat_0=-90 +lon_0=0 +units=m")
-    wgs84 = pyproj.Proj("+init=EPSG:4326") 
-    lon, lat= pyproj.transform(lamaz, wgs84, xv, yv)
+    # Render only a subset of the mesh, so read only that.
+    rows = slice(500, 4000, 5)
+    cols = slice(500, 4000, 5)
+
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        data = f[DATAFIELD_NAME][rows, cols]
+
+        # The grid's Lambert azimuthal projection is given in the
+        # StructMetadata.0 attribute.
+        lon, lat = zoo.geo.grid_geolocator(f, DATAFIELD_NAME)[rows, cols]
 
     # Use a south polar azimuthal equal area projection.
-    m = Basemap(projection='splaea', resolution='l',
-                boundinglat=-20, lon_0=180)
+    m = zoo.plot.basemap(projection='splaea', resolution='l',
+                         boundinglat=-20, lon_0=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 0, 15), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 180, 45), labels=[0, 0, 0, 1])
@@ -121,10 +80,7 @@ def run(FILE_NAME):
     bounds = [0, 1, 11, 25, 37, 39, 50, 200, 253, 254, 255]
     norm = mpl.colors.BoundaryNorm(bounds, cmap.N)
     
-    # Render only a subset of the mesh.
-    rows = slice(500, 4000, 5)
-    cols = slice(500, 4000, 5)
-    m.pcolormesh(lon[rows,cols], lat[rows,cols], data[rows,cols],
+    m.pcolormesh(lon, lat, data,
                  latlon=True, cmap=cmap, norm=norm)
     
     color_bar = plt.colorbar()
@@ -18,89 +18,47 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.geo
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     # Identify the data field.
     DATAFIELD_NAME = 'Ice_Surface_Temperature'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-    
-        # Subset the data to match the size of the swath geolocation fields.
-        # Turn off autoscaling, we'll handle that ourselves due to presence of
-        # a valid range.
-        var = nc.variables[DATAFIELD_NAME]
-        var.set_auto_maskandscale(False)
-        rows = slice(2, 2030, 5)
-        cols = slice(2, 1354, 5)
-        data = var[rows, cols].astype(np.float64)
-        latitude = nc.variables['Latitude'][:]
-        longitude = nc.variables['Longitude'][:]
-        scale_factor = var.scale_factor
-        add_offset = var.add_offset
-        _FillValue = var._FillValue
-        units = var.units
-        valid_range = var.valid_range
-
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        data2D = hdf.select(DATAFIELD_NAME)
-        data = data2D[:,:].astype(np.float64)
-
-        # Retrieve attributes.
-        attrs = data2D.attributes(full=1)
-        aoa=attrs["add_offset"]
-        add_offset = aoa[0]
-        fva=attrs["_FillValue"]
-        _FillValue = fva[0]
-        sfa=attrs["scale_factor"]
-        scale_factor = sfa[0]        
-        ua=attrs["units"]
-        units = ua[0]
-        va=attrs["valid_range"]
-        valid_range = va[0]
-
-        # Read lat and lon data from the matching geo-location file.
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+
+        # Apply the fill value, valid range, scale and offset attributes as
+        # the data are read.
+        datam = zoo.io.decode.read(var)
+        units = var.attrs['units']
+
+        # Read geolocation dataset from MOD03 product.  It is read once
+        # and shared by every product of the same granule.
         GEO_FILE_NAME = 'MOD03.A2013196.1250.005.2013196194144.hdf'
-        GEO_FILE_NAME = os.path.join(os.environ['HDFEOS_ZOO_DIR'], GEO_FILE_NAME)
-        hdf_geo = SD(GEO_FILE_NAME, SDC.READ)
-
-        # Read geolocation dataset from MOD03 product.
-        lat = hdf_geo.select('Latitude')
-        latitude = lat[:,:]
-        lon = hdf_geo.select('Longitude')
-        longitude = lon[:,:]
-        
-    # Apply the attributes.
-    invalid = np.logical_or(data < valid_range[0],
-                            data > valid_range[1])
-    invalid = np.logical_or(invalid, data == _FillValue)
-    data[invalid] = np.nan
-    data = data * scale_factor + add_offset
-    datam = np.ma.masked_array(data, mask=np.isnan(data))
+        GEO_FILE_NAME = os.path.join(os.environ['HDFEOS_ZOO_DIR'],
+                                     GEO_FILE_NAME)
+        longitude, latitude = zoo.geo.swath_geolocation(f, DATAFIELD_NAME,
+                                                        GEO_FILE_NAME)
     
     # Draw a southern polar stereographic projection using the low resolution
     # coastline database.
-    m = Basemap(projection='spstere', resolution='l',
-                boundinglat=-64, lon_0 = 180)
+    m = zoo.plot.basemap(projection='spstere', resolution='l',
+                         boundinglat=-64, lon_0 = 180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-80.,-59,10.))
     m.drawmeridians(np.arange(-180.,179.,30.), labels=[True,False,False,True])
@@ -21,15 +21,17 @@ specified by the environment variable HDFEOS_ZOO_DIR.
 """
 
 import os
-import re
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
-import mpl_toolkits.basemap.pyproj as pyproj
 import numpy as np
 
-USE_GDAL = False
+import zoo.geo
+import zoo.plot
+
+# 'Extent' is the name of a field of both hemisphere grids.  They can only
+# be told apart by reference number, which zoo.io does not expose, so
+# this example reads the file with pyhdf.
 
 
 def run(FILE_NAME):
@@ -37,70 +39,21 @@ def run(FILE_NAME):
     # Identify the data field.
     DATAFIELD_NAME = 'Extent'
 
-    if USE_GDAL:
-        import gdal
-        GRID_NAME = 'Southern Hemisphere'
-        gname = 'HDF4_EOS:EOS_GRID:"{0}":{1}:{2}'.format(FILE_NAME,
-                                                         GRID_NAME,
-                                                         DATAFIELD_NAME)
-        gdset = gdal.Open(gname)
-        data = gdset.ReadAsArray()
-
-        meta = gdset.GetMetadata()
-        x0, xinc, _, y0, _, yinc = gdset.GetGeoTransform()
-        nx, ny = (gdset.RasterXSize, gdset.RasterYSize)
-        del gdset
-
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset. Dataset name 'Extent' exists under different groups.
-        # Use reference number to resolve ambiguity.
-        data2D = hdf.select(hdf.reftoindex(12))
-        data = data2D[:,:].astype(np.float64)
-
-        # Read global attribute.
-        fattrs = hdf.attributes(full=1)
-        ga = fattrs["StructMetadata.0"]
-        gridmeta = ga[0]
-
-        # Construct the grid.  The needed information is in a global attribute
-        # called 'StructMetadata.0'.  Use regular expressions to tease out the
-        # extents of the grid. 
-        ul_regex = re.compile(r'''UpperLeftPointMtrs=\(
-                                  (?P<upper_left_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<upper_left_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-        match = ul_regex.search(gridmeta)
-        x0 = np.float(match.group('upper_left_x')) 
-        y0 = np.float(match.group('upper_left_y')) 
-
-        lr_regex = re.compile(r'''LowerRightMtrs=\(
-                                  (?P<lower_right_x>[+-]?\d+\.\d+)
-                                  ,
-                                  (?P<lower_right_y>[+-]?\d+\.\d+)
-                                  \)''', re.VERBOSE)
-        match = lr_regex.search(gridmeta)
-        x1 = np.float(match.group('lower_right_x'))
-        y1 = np.float(match.group('lower_right_y'))
-        ny, nx = data.shape
-        xinc = (x1 - x0) / nx
-        yinc = (y1 - y0) / ny
-
-    x = np.linspace(x0, x0 + xinc*nx, nx)
-    y = np.linspace(y0, y0 + yinc*ny, ny)
-    xv, yv = np.meshgrid(x, y)
-
-    # Reproject into WGS84
-    lamaz = pyproj.Proj("+proj=laea +a=6371228 +lat_0=-90 +lon_0=0 +units=m")
-    wgs84 = pyproj.Proj("+init=EPSG:4326") 
-    lon, lat= pyproj.transform(lamaz, wgs84, xv, yv)
+    from pyhdf.SD import SD, SDC
+    hdf = SD(FILE_NAME, SDC.READ)
+
+    # Read dataset. Dataset name 'Extent' exists under different groups.
+    # Use reference number to resolve ambiguity.
+    data2D = hdf.select(hdf.reftoindex(12))
+    data = data2D[:,:].astype(np.float64)
+
+    # Compute the geolocation from the grid's projection.
+    geo = zoo.geo.grid_geolocator(FILE_NAME, 'Southern Hemisphere')
+    lon, lat = geo[:]
 
     # Use a south polar azimuthal equal area projection.
-    m = Basemap(projection='splaea', resolution='l',
-                boundinglat=-60, lon_0=0)
+    m = zoo.plot.basemap(projection='splaea', resolution='l',
+                         boundinglat=-60, lon_0=0)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 0, 15), labels=[1, 0, 0, 0])
     m.drawmeridians(np.arange(-180, 180, 30), labels=[0, 0, 0, 1])
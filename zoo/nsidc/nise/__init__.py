@@ -1,2 +1,6 @@
-from . import NISE_SSMISF17_20110424_Extent_NH
-from . import NISE_SSMISF17_20110424_Extent_SH
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'NISE_SSMISF17_20110424_Extent_NH',
+    'NISE_SSMISF17_20110424_Extent_SH',
+])
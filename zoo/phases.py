@@ -0,0 +1,76 @@
+"""
+Time spent in each phase of an example:  read, decode, geolocate, render.
+
+    >>> zoo.phases.enable()
+    >>> example.run(hdffile)
+    >>> zoo.phases.totals()
+    {'read': 0.41, 'decode': 0.05, 'geolocate': 1.2, 'render': 2.3}
+
+The library layer marks its entry points with @timed('read') and so on.
+Time is exclusive:  a decode inside a read counts as decode only.  Timing is
+off unless enable() was called, and then costs two clock reads per call.
+"""
+
+import collections
+import functools
+import threading
+import time
+
+PHASES = ('read', 'decode', 'geolocate', 'render')
+
+_enabled = False
+_totals = collections.defaultdict(float)
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def enable(on=True):
+    """
+    Start (or with on=False, stop) timing phases.
+    """
+    global _enabled
+    _enabled = on
+
+
+def reset():
+    """
+    Forget the time recorded so far.
+    """
+    with _lock:
+        _totals.clear()
+
+
+def totals():
+    """
+    Seconds spent so far in each phase.
+    """
+    with _lock:
+        return dict(_totals)
+
+
+def timed(name):
+    """
+    Decorator counting the time spent in a function towards phase name.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            stack = getattr(_local, 'stack', None)
+            if stack is None:
+                stack = _local.stack = []
+            # Each frame holds the time its callees took, to subtract.
+            stack.append(0.0)
+            start = time.time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.time() - start
+                inner = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                with _lock:
+                    _totals[name] += elapsed - inner
+        return wrapper
+    return decorate
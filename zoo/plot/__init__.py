@@ -0,0 +1,24 @@
+"""
+Shared plotting layer for the zoo examples.
+
+    >>> import zoo.plot
+    >>> zoo.plot.points(m, lon, lat, data, cmap=plt.cm.jet)
+
+points() draws footprints (CALIPSO, ICESat, OCO-2, Aquarius, ...) in one
+artist, aggregating millions of them onto the pixels of the axes instead of
+drawing a marker each.
+
+image() draws an evenly spaced longitude/latitude grid, given by the 1D
+coordinates of its columns and rows, as a single image instead of a
+pcolormesh of meshgrids.
+
+stride() and read_decimated() size reads of big swaths and tiles to the
+pixels of the figure rather than to the data.
+
+basemap() sets up each map (projection, clipped and projected coastlines)
+once, and keeps it in memory and pickled on disk for later runs.
+"""
+from .decimate import block_reduce, pixel_budget, read_decimated, stride
+from .footprints import aggregate, points
+from .maps import basemap
+from .raster import image
@@ -0,0 +1,189 @@
+"""
+Read no more of a field than the figure has pixels to show.
+
+    >>> step = zoo.plot.stride(var.shape)
+    >>> data = var[::step[0], ::step[1]]
+
+The examples used to hard-code a stride per product ([::2, ::2] for a
+MODIS tile, [::6, ::6] for WELD) to keep pcolormesh within memory.
+pixel_budget() works out how many device pixels the axes will have in the
+saved figure, from its size, the subplot parameters and the savefig DPI,
+and stride() the largest read step that still gives a cell per pixel.  The
+step is meant to go into the read itself, so that the HDF library skips
+the rest.
+
+read_decimated() does the same and can instead reduce each block of cells
+to its mean, min, max or (for categories) most frequent value, reading a
+band of rows at a time.  GDAL bands are read a window at a time too.
+Fields with up to date overviews (see
+zoo.io.overview) are read from the coarsest level that will do.
+"""
+
+import numpy as np
+
+from .. import phases
+from ..io import slicing
+from ..io.backends import read_window
+from ..io.overview import block_reduce
+
+# Elements read at a time by read_decimated().
+_BAND = 1 << 22
+
+REDUCTIONS = ('stride', 'mean', 'min', 'max', 'mode')
+
+
+def _shape(source):
+    """
+    Shape of a shape, an array, a variable, a pyhdf SDS or a GDAL band or
+    one-band dataset.
+    """
+    if isinstance(source, tuple):
+        return source
+    if hasattr(source, 'ReadAsArray'):
+        return _Raster(source).shape
+    shape = getattr(source, 'shape', None)
+    if shape is None:
+        shape = source.info()[2]
+    return tuple(shape)
+
+
+class _Raster(object):
+    """
+    A GDAL band or one-band dataset that takes a pair of slices, reading
+    only the window (and with a step, the rows) that they cover.
+    """
+    def __init__(self, source):
+        if hasattr(source, 'RasterCount'):
+            if source.RasterCount != 1:
+                msg = "Pass one band of a dataset of {0} bands."
+                raise ValueError(msg.format(source.RasterCount))
+            self.shape = (source.RasterYSize, source.RasterXSize)
+        else:
+            self.shape = (source.YSize, source.XSize)
+        self._source = source
+
+    def __getitem__(self, key):
+        slab = slicing.plan(key, self.shape)
+        if slab.empty:
+            return slab.finish(np.empty(slab.count))
+        y, x = zip(slab.start, slab.count, slab.stride)
+        return slab.finish(read_window(self._source, y, x))
+
+
+def pixel_budget(ax=None, dpi=None):
+    """
+    (rows, columns) of device pixels of ax in the saved figure.
+
+    Parameters
+    ----------
+    ax : matplotlib Axes, optional
+        By default the current axes, or if the current figure has none yet,
+        the area its subplot parameters leave for one.
+    dpi : float, optional
+        By default the savefig.dpi setting.
+    """
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+
+    if ax is None:
+        fig = plt.gcf()
+        if fig.axes:
+            ax = fig.gca()
+    if ax is not None:
+        fig = ax.figure
+        box = ax.get_position()
+        width, height = box.width, box.height
+    else:
+        p = fig.subplotpars
+        width, height = p.right - p.left, p.top - p.bottom
+    if dpi is None:
+        dpi = mpl.rcParams['savefig.dpi']
+        if dpi == 'figure':
+            dpi = fig.dpi
+    inches = fig.get_size_inches()
+    return (max(1, int(round(height * inches[1] * dpi))),
+            max(1, int(round(width * inches[0] * dpi))))
+
+
+def stride(source, ax=None, dpi=None, budget=None):
+    """
+    Read step along each of the last two axes of source (a shape, an array,
+    a variable or a pyhdf SDS) that leaves at least one cell per pixel of
+    budget, by default pixel_budget(ax, dpi).
+    """
+    rows, cols = _shape(source)[-2:]
+    if budget is None:
+        budget = pixel_budget(ax, dpi)
+    return max(1, rows // budget[0]), max(1, cols // budget[1])
+
+
+@phases.timed('read')
+def read_decimated(var, how='stride', ax=None, dpi=None, rule=None,
+                   overviews=True):
+    """
+    Read a 2D field at about the resolution of the figure.
+
+    Parameters
+    ----------
+    var : zoo.io.Variable, netCDF4 or h5py variable, pyhdf SDS or GDAL band
+        The field.  Anything that takes a pair of slices will do.  A GDAL
+        band (or one-band dataset) is read a window at a time.
+    how : str
+        'stride' to read every step-th cell, or 'mean', 'min', 'max' or
+        'mode' to reduce each block of cells.
+    ax, dpi
+        See pixel_budget().
+    rule : zoo.io.decode.Rule, optional
+        Decode the values before reducing them.
+    overviews : bool
+        Read a zoo.io.Variable from its overviews if they are up to date
+        and were built by how ('stride' takes any).
+
+    Returns
+    -------
+    data : numpy.ndarray or numpy.ma.MaskedArray
+    key : (slice, slice)
+        The cells of the field that data stands for:  index the
+        geolocation with it.  Reduced blocks are located by their centre
+        cell.
+    """
+    from ..io import decode, overview
+
+    if how not in REDUCTIONS:
+        raise ValueError("Unknown reduction {0!r}.".format(how))
+    if hasattr(var, 'ReadAsArray'):
+        var = _Raster(var)
+    n0, n1 = _shape(var)[-2:]
+    s0, s1 = stride((n0, n1), ax, dpi)
+    if overviews and hasattr(var, 'file') and len(var.shape) == 2:
+        found = overview.read(var, (s0, s1),
+                              None if how == 'stride' else how)
+        if found is not None:
+            data, key = found
+            if rule is not None:
+                data = decode.decode_masked(data, rule)
+            elif how != 'stride':
+                data = np.ma.masked_invalid(data, copy=False)
+            return data, key
+
+    if how == 'stride':
+        key = (slice(None, None, s0), slice(None, None, s1))
+        data = var[key]
+        if rule is not None:
+            data = decode.decode_masked(data, rule)
+        return data, key
+
+    rows, cols = n0 // s0, n1 // s1
+    key = (slice(s0 // 2, rows * s0, s0), slice(s1 // 2, cols * s1, s1))
+    band = max(1, _BAND // (s0 * n1))
+    out = None
+    for i in range(0, rows, band):
+        j = min(rows, i + band)
+        raw = var[i * s0:j * s0, :cols * s1]
+        if rule is not None:
+            raw = decode.decode_masked(raw, rule)
+        reduced = block_reduce(raw, (s0, s1), how)
+        if out is None:
+            out = np.ma.masked_all((rows, cols), dtype=reduced.dtype)
+        out[i:j] = reduced
+    return out, key
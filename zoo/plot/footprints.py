@@ -0,0 +1,153 @@
+"""
+Draw many footprints at once, as one collection or as one image.
+
+    >>> m = Basemap(projection='cyl')
+    >>> zoo.plot.points(m, lon, lat, data, cmap=plt.cm.jet)
+    >>> cb = m.colorbar()
+
+A Line2D per point (m.plot in a loop) takes minutes for a CALIPSO granule,
+and even one scatter collection of millions of markers is slow to draw and
+to save.  Above a few hundred thousand points, points() instead aggregates
+them onto the pixels of the axes, the mean of the values for continuous
+data and the most frequent value for categories, and draws the result with
+one imshow.  Nothing is decimated away.
+"""
+
+import numpy as np
+
+from .. import phases
+from ..io.overview import cell_mode
+
+# Beyond this many points, aggregate onto pixels rather than scatter.
+SCATTER_MAX = 200000
+
+
+def aggregate(x, y, c, extent, shape, categorical=False):
+    """
+    Values of points binned onto a regular raster.
+
+    Parameters
+    ----------
+    x, y : array_like
+        Coordinates of the points.
+    c : array_like
+        Their values;  NaN or masked values are left out.
+    extent : (x0, x1, y0, y1)
+        Area covered by the raster.  Points outside it are left out.
+    shape : (rows, cols)
+        Size of the raster.  Row 0 is at y0.
+    categorical : bool
+        If true, c holds non-negative integer codes and each cell takes the
+        most frequent one, the smallest on ties;  otherwise each cell takes
+        the mean.
+
+    Returns
+    -------
+    numpy.ma.MaskedArray
+        Masked where no point falls.
+    """
+    x0, x1, y0, y1 = extent
+    rows, cols = shape
+    x = np.ravel(x)
+    y = np.ravel(y)
+    c = np.ma.ravel(c)
+    keep = ~np.ma.getmaskarray(c)
+    c = np.ma.getdata(c)
+    if c.dtype.kind == 'f':
+        keep &= ~np.isnan(c)
+    col = np.floor((x - x0) * (cols / float(x1 - x0)))
+    row = np.floor((y - y0) * (rows / float(y1 - y0)))
+    keep &= (col >= 0) & (col < cols) & (row >= 0) & (row < rows)
+    cell = row[keep].astype(np.intp) * cols + col[keep].astype(np.intp)
+    c = c[keep]
+
+    if categorical:
+        codes = c.astype(np.intp)
+        if codes.size and codes.min() < 0:
+            raise ValueError("Categories must be non-negative integers.")
+        return cell_mode(cell, codes, rows * cols).reshape(shape)
+    counts = np.bincount(cell, minlength=rows * cols)
+    sums = np.bincount(cell, weights=c, minlength=rows * cols)
+    empty = counts == 0
+    image = sums / np.maximum(counts, 1)
+    return np.ma.MaskedArray(image.reshape(shape), mask=empty.reshape(shape))
+
+
+@phases.timed('render')
+def points(m, lon, lat, c, cmap=None, norm=None, vmin=None, vmax=None,
+           categorical=False, size=2, method='auto', ax=None):
+    """
+    Draw points colored by value, all in one artist.
+
+    Parameters
+    ----------
+    m : Basemap or None
+        Map to project lon and lat with.  If None, lon and lat are taken as
+        x and y of ax.
+    lon, lat : array_like
+        Location of the points.
+    c : array_like
+        Value of each point.  NaN or masked values are not drawn.
+    cmap, norm, vmin, vmax
+        As for matplotlib's scatter and imshow.
+    categorical : bool
+        Whether c holds category codes, non-negative integers, to be
+        aggregated by the most frequent rather than by the mean.
+    size : int
+        Width of a point, or of a raster cell, in pixels.
+    method : str
+        'scatter' for one PathCollection, 'raster' for one image of the
+        aggregated points, 'auto' for scatter up to SCATTER_MAX points.
+    ax : matplotlib Axes, optional
+        By default that of the map, or the current one.
+
+    Returns
+    -------
+    The collection or the image, also made the current image for
+    colorbar().
+    """
+    import matplotlib.pyplot as plt
+
+    if method not in ('auto', 'scatter', 'raster'):
+        raise ValueError("Unknown method {0!r}.".format(method))
+    if ax is None:
+        ax = getattr(m, 'ax', None) or plt.gca()
+    c = np.ma.ravel(c)
+    lon = np.ravel(lon)
+    lat = np.ravel(lat)
+    x, y = (lon, lat) if m is None else m(lon, lat)
+    x = np.asarray(x)
+    y = np.asarray(y)
+
+    if norm is None and not categorical and c.count():
+        values = np.ma.masked_invalid(c)
+        if vmin is None:
+            vmin = values.min()
+        if vmax is None:
+            vmax = values.max()
+    kwargs = {'cmap': cmap, 'norm': norm}
+    if norm is None:
+        kwargs.update(vmin=vmin, vmax=vmax)
+
+    if method == 'scatter' or (method == 'auto' and x.size <= SCATTER_MAX):
+        keep = ~np.ma.getmaskarray(c)
+        marker = size * 72.0 / ax.figure.dpi
+        artist = ax.scatter(x[keep], y[keep], c=np.ma.getdata(c)[keep],
+                            s=marker ** 2, marker='s', linewidths=0,
+                            edgecolors='none', rasterized=True, **kwargs)
+    else:
+        if m is None:
+            (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+        else:
+            x0, x1, y0, y1 = m.llcrnrx, m.urcrnrx, m.llcrnry, m.urcrnry
+        bbox = ax.get_window_extent()
+        shape = (max(1, int(bbox.height // size)),
+                 max(1, int(bbox.width // size)))
+        image = aggregate(x, y, c, (x0, x1, y0, y1), shape, categorical)
+        aspect = ax.get_aspect()
+        artist = ax.imshow(image, extent=(x0, x1, y0, y1), origin='lower',
+                           interpolation='nearest', aspect=aspect, **kwargs)
+        ax.set_xlim(x0, x1)
+        ax.set_ylim(y0, y1)
+    plt.sci(artist)
+    return artist
@@ -0,0 +1,136 @@
+"""
+Set up each map once:  Basemap instances kept in memory and on disk.
+
+    >>> m = zoo.plot.basemap(projection='npstere', resolution='i',
+    ...                      boundinglat=40, lon_0=0)
+
+Basemap() reads the GSHHS coastlines, rivers and borders at the requested
+resolution, then clips and projects them to the map.  At 'i' or 'h' that
+takes longer than reading and drawing a granule.  basemap() keeps the
+instance for each set of arguments for the rest of the process, and pickles
+it, as the Basemap documentation suggests, under the cache directory (see
+zoo.io.cache) for later processes.  Each call returns a shallow copy with
+its own per-axes state, so that what one figure sets on its map does not
+carry over to the next, nor keeps it alive, while the projected geometry is
+shared.
+
+Parallels and meridians are projected when drawn, which is cheap next to
+the coastlines;  they are not cached.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import pickle
+import sys
+import threading
+
+import numpy as np
+
+from .. import phases
+
+_maps = {}
+_maps_lock = threading.Lock()
+
+# Set HDFEOS_ZOO_BASEMAP_CACHE to 0 to keep maps in memory only.
+_ENV = 'HDFEOS_ZOO_BASEMAP_CACHE'
+
+
+def _copy(m):
+    """
+    Shallow copy of m with the state Basemap keeps about the axes it has
+    drawn on reset, as Basemap() leaves it.
+    """
+    m = copy.copy(m)
+    m.ax = None
+    m._initialized_axes = set()
+    m._mapboundarydrawn = False
+    return m
+
+
+def _key(kwargs):
+    """
+    Hashable key of Basemap arguments and of the versions that affect the
+    pickle.
+    """
+    from mpl_toolkits import basemap
+
+    args = dict((k, np.asarray(v).tolist()) for k, v in kwargs.items())
+    versions = [basemap.__version__, list(sys.version_info[:2])]
+    return json.dumps([args, versions], sort_keys=True)
+
+
+def _path(key):
+    from ..io import cache
+
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return os.path.join(cache.cache_dir(), 'basemap_' + digest + '.pickle')
+
+
+def _load(path):
+    try:
+        with open(path, 'rb') as fh:
+            return pickle.load(fh)
+    except (IOError, EOFError, pickle.UnpicklingError, AttributeError,
+            ImportError):
+        return None
+
+
+def _save(path, m):
+    from ..io import cache
+
+    try:
+        with cache.atomic_path(path) as tmp:
+            with open(tmp, 'wb') as fh:
+                pickle.dump(m, fh, pickle.HIGHEST_PROTOCOL)
+    except (IOError, OSError):
+        # A cache that cannot be written only costs time.
+        pass
+
+
+@phases.timed('render')
+def basemap(**kwargs):
+    """
+    A Basemap for the given arguments, set up once per process and once
+    per machine.
+
+    Parameters
+    ----------
+    kwargs
+        Passed on to Basemap, except ax:  give the axes to the drawing
+        methods instead.
+
+    Returns
+    -------
+    Basemap
+        A copy of the cached instance.
+    """
+    from mpl_toolkits.basemap import Basemap
+
+    if 'ax' in kwargs:
+        raise ValueError("A cached map cannot keep axes;  pass ax to the "
+                         "drawing methods instead.")
+    key = _key(kwargs)
+    with _maps_lock:
+        m = _maps.get(key)
+    if m is None:
+        persist = os.environ.get(_ENV, '1') != '0'
+        path = _path(key) if persist else None
+        if persist:
+            m = _load(path)
+        if m is None:
+            m = Basemap(**kwargs)
+            if persist:
+                _save(path, m)
+        with _maps_lock:
+            m = _maps.setdefault(key, m)
+    return _copy(m)
+
+
+def clear_cache():
+    """
+    Forget the maps kept in memory;  those on disk stay.
+    """
+    with _maps_lock:
+        _maps.clear()
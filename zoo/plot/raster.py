@@ -0,0 +1,140 @@
+"""
+Draw regular longitude/latitude grids as one image.
+
+    >>> zoo.plot.image(m, grid.x, grid.y, data)
+
+m.pcolormesh on a meshgrid of a geographic grid makes two float64 arrays of
+the size of the data and then a quad per cell:  several GB for a 0.05 degree
+CMG of 7200 x 3600.  A grid whose cell centres are evenly spaced needs only
+its first and last edges.  image() looks up the cell under each pixel of
+the axes, through the inverse projection of the map, and draws the result
+with a single imshow, so nothing of the size of the data is allocated and
+grids from 0 to 360 draw on maps from -180 to 180 as they are.
+"""
+
+import numpy as np
+
+from .. import phases
+
+# Relative deviation from even spacing still taken as regular.
+RTOL = 1e-3
+
+# Basemap's value for points outside the projection.
+_HUGE = 1e20
+
+
+def regular(coords, rtol=RTOL):
+    """
+    (first edge, last edge) of evenly spaced cell centres, or None if they
+    are not evenly spaced.
+    """
+    c = np.asarray(coords, dtype=np.float64)
+    if c.ndim != 1 or c.size < 2:
+        return None
+    step = (c[-1] - c[0]) / (c.size - 1)
+    if step == 0 or np.abs(np.diff(c) - step).max() > rtol * abs(step):
+        return None
+    return c[0] - step / 2, c[-1] + step / 2
+
+
+def _cells(values, edges, n):
+    """
+    Index of the cell of each value, and whether it is inside the grid.
+    """
+    first, last = edges
+    index = np.floor((values - first) * (n / (last - first)))
+    inside = (index >= 0) & (index < n)
+    return np.clip(index, 0, n - 1).astype(np.intp), inside
+
+
+def resample(lon, lat, data, lon_edges, lat_edges, period=360.0):
+    """
+    Nearest cell of a regular grid at each given longitude and latitude,
+    masked outside the grid.  Longitudes are taken modulo period, unless it
+    is None.
+    """
+    if period is not None:
+        first = min(lon_edges)
+        lon = first + np.mod(lon - first, period)
+    data = np.asanyarray(data)
+    rows, cols = data.shape
+    col, col_ok = _cells(lon, lon_edges, cols)
+    row, row_ok = _cells(lat, lat_edges, rows)
+    return np.ma.masked_where(~(col_ok & row_ok), data[row, col])
+
+
+@phases.timed('render')
+def image(m, lon, lat, data, ax=None, **kwargs):
+    """
+    Draw a grid given by the centres of its columns and rows.
+
+    Parameters
+    ----------
+    m : Basemap or None
+        Map to draw on.  If None, lon and lat are taken as x and y of ax.
+    lon, lat : array_like
+        1D longitude of each column and latitude of each row.
+    data : array_like
+        2D array of shape (lat.size, lon.size), possibly masked.
+    ax : matplotlib Axes, optional
+        By default that of the map, or the current one.
+    kwargs
+        Passed on to imshow, e.g. cmap, norm, vmin, vmax or alpha.
+
+    Returns
+    -------
+    The image, also made the current image for colorbar().  Grids that are
+    not evenly spaced fall back to pcolormesh, and the mesh is returned.
+    """
+    import matplotlib.pyplot as plt
+
+    if ax is None:
+        ax = getattr(m, 'ax', None) or plt.gca()
+    lon_edges = regular(lon)
+    lat_edges = regular(lat)
+    if lon_edges is None or lat_edges is None:
+        if m is None:
+            artist = ax.pcolormesh(lon, lat, data, **kwargs)
+        else:
+            lon, lat = np.meshgrid(lon, lat)
+            artist = m.pcolormesh(lon, lat, data, latlon=True, ax=ax,
+                                  **kwargs)
+        plt.sci(artist)
+        return artist
+
+    if m is None:
+        limits = ax.get_xlim() + ax.get_ylim()
+    else:
+        limits = (m.llcrnrx, m.urcrnrx, m.llcrnry, m.urcrnry)
+    options = dict(origin='lower', interpolation='nearest',
+                   aspect=ax.get_aspect())
+    options.update(kwargs)
+
+    bbox = ax.get_window_extent()
+    nx = max(1, int(bbox.width))
+    ny = max(1, int(bbox.height))
+    x = np.linspace(limits[0], limits[1], 2 * nx + 1)[1::2]
+    y = np.linspace(limits[2], limits[3], 2 * ny + 1)[1::2]
+    x, y = np.meshgrid(x, y)
+    if m is None:
+        pixels = resample(x, y, data, lon_edges, lat_edges, period=None)
+    else:
+        plon, plat = m(x, y, inverse=True)
+        plon = np.asarray(plon)
+        plat = np.asarray(plat)
+        outside = ~(np.abs(plon) < _HUGE) | ~(np.abs(plat) < _HUGE)
+        plon[outside] = 0
+        plat[outside] = 0
+        # Some inverse projections also return a point for pixels off the
+        # map;  those do not project back onto themselves.
+        fx, fy = m(plon, plat)
+        tolerance = abs(limits[1] - limits[0]) / nx
+        outside |= ~(np.hypot(np.asarray(fx) - x, np.asarray(fy) - y) <
+                     tolerance)
+        pixels = resample(plon, plat, data, lon_edges, lat_edges)
+        pixels = np.ma.masked_where(outside, pixels)
+    artist = ax.imshow(pixels, extent=limits, **options)
+    ax.set_xlim(limits[0], limits[1])
+    ax.set_ylim(limits[2], limits[3])
+    plt.sci(artist)
+    return artist
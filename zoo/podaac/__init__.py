@@ -1,4 +1,8 @@
-from . import aquarius
-from . import avhrr
-from . import quikscat
-from . import seawinds
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, [
+    'aquarius',
+    'avhrr',
+    'quikscat',
+    'seawinds',
+])
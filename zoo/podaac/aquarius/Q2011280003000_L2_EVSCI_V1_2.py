@@ -27,9 +27,10 @@ import os
 import h5py
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
+import zoo.plot
+
 def run(FILE_NAME):
     
     with h5py.File(FILE_NAME, mode='r') as f:
@@ -49,14 +50,14 @@ def run(FILE_NAME):
     # Handle fill value (land area).
     data[data == 0] == np.nan
 
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 45))
     m.drawmeridians(np.arange(-180, 180, 45), labels=[True,False,False,True])
-    sc = m.scatter(longitude, latitude, c=data, s=1, cmap=plt.cm.jet,
-                   edgecolors=None, linewidth=0)
+    sc = zoo.plot.points(m, longitude, latitude, data, cmap=plt.cm.jet,
+                         size=1)
 
     cb = m.colorbar()
     cb.set_label(units)    
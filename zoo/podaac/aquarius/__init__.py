@@ -1,5 +1,8 @@
-# Grid codes
-from . import Q2012034_L3m_DAY_EVSCI_V1_2DR_SSS_1deg
+from ..._lazy import attach
 
-# Swath codes
-from . import Q2011280003000_L2_EVSCI_V1_2
+__getattr__, __dir__, __all__ = attach(__name__, [
+    # Grid codes
+    'Q2012034_L3m_DAY_EVSCI_V1_2DR_SSS_1deg',
+    # Swath codes
+    'Q2011280003000_L2_EVSCI_V1_2',
+])
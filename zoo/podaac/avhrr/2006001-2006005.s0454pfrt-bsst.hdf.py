@@ -18,57 +18,44 @@ Usage:  save this script and run
 
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
-
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
 """
 
 import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     # Identify the data field.
     DATAFIELD_NAME = 'bsst'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)
-        # Subset the data to match the size of the swath geolocation fields.
-        # Turn off autoscaling, we'll handle that ourselves due to non-standard
-        # naming of the offset attribute.
-        var = nc.variables[DATAFIELD_NAME]
-        var.set_auto_maskandscale(False)
-        lat = nc.variables['lat']
-        lon = nc.variables['lon']
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        var = hdf.select(DATAFIELD_NAME)
-        lat = hdf.select('lat')
-        lon = hdf.select('lon')
-
-    latitude = lat[::8]
-    longitude = lon[::8]
-    data = var[::8, ::8].astype(np.float64)
-    
-    # Apply the attributes.  By inspection, fill value is 0
-    data[data==0] = np.nan
-    data = data * var.scale_factor + var.add_off
-    datam = np.ma.masked_array(data, mask=np.isnan(data))
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+
+        # The offset attribute is not named as usual.  By inspection, the
+        # fill value is 0.
+        rule = zoo.io.decode.Rule(scale=var.attrs['scale_factor'],
+                                  offset=var.attrs['add_off'], fill=0)
+
+        # Read only as many cells as the figure has pixels for, applying the
+        # attributes as they are read.
+        datam, key = zoo.plot.read_decimated(var, rule=rule)
+        latitude = f['lat'][key[0]]
+        longitude = f['lon'][key[1]]
     
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 45))
     m.drawmeridians(np.arange(-180, 180, 45), labels=[True,False,False,True])
@@ -1 +1,6 @@
-from . import PODAAC_L3_bsst
+from ..._lazy import attach
+
+# The example is named after its data file, which is not an identifier.
+__getattr__, __dir__, __all__ = attach(__name__, [], {
+    'PODAAC_L3_bsst': '2006001-2006005.s0454pfrt-bsst.hdf',
+})
@@ -1 +1,6 @@
-from . import QS_XWGRDS_des_avg_wind_speed
+from ..._lazy import attach
+
+# The example is named after its data file, which is not an identifier.
+__getattr__, __dir__, __all__ = attach(__name__, [], {
+    'QS_XWGRDS_des_avg_wind_speed': 'QS_XWGRD3_2008001.20080021608.hdf',
+})
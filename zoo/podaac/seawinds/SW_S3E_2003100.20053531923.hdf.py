@@ -19,9 +19,6 @@ Usage:  save this script and run
 The HDF file must either be in your current working directory or in a directory
 specified by the environment variable HDFEOS_ZOO_DIR.
 
-The netcdf library must be compiled with HDF4 support in order for this example
-code to work.  Please see the README for details.
-
 References
 [1] ftp://podaac.jpl.nasa.gov/ocean_wind/seawinds/L3/doc/SWS_L3.pdf
 
@@ -33,58 +30,31 @@ import os
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 
-USE_NETCDF4 = False
+import zoo.io
+import zoo.io.decode
+import zoo.plot
+
 
 def run(FILE_NAME):
 
     # Identify the data field.
     DATAFIELD_NAME = 'rep_wind_speed'
 
-    if USE_NETCDF4:
-        from netCDF4 import Dataset
-        nc = Dataset(FILE_NAME)    
-        # Subset the data to match the size of the swath geolocation fields.
-        # Turn off autoscaling, we'll handle that ourselves due to the existance
-        # of the valid range attribute.
-        var = nc.variables[DATAFIELD_NAME]
-        var.set_auto_maskandscale(False)
-        scale = var.scale_factor
-        offset = var.add_offset
-        valid_range = var.valid_range
-        units = var.units
-        long_name = var.long_name
-    else:
-        from pyhdf.SD import SD, SDC
-        hdf = SD(FILE_NAME, SDC.READ)
-
-        # Read dataset.
-        var = hdf.select(DATAFIELD_NAME)
-
-        # Retrieve attributes.
-        attrs = var.attributes(full=1)
-        sfa=attrs["scale_factor"]
-        scale = sfa[0]   
-        aoa=attrs["add_offset"]
-        offset = aoa[0]
-        vra=attrs["valid_range"]
-        valid_range = vra[0]
-        ua=attrs["units"]
-        units = ua[0]
-        lna=attrs["long_name"]
-        long_name = lna[0]
-    data = var[:,:,0]
-
-    # Retrieve the needed attributes.  By inspection, the fill value is 0.
-    fillvalue = 0
-
-    invalid = np.logical_or(data < valid_range[0], data > valid_range[1])
-    invalid = np.logical_or(invalid, data == fillvalue)
-    data = data * scale + offset
-    data[invalid] = np.nan
-    datam = np.ma.masked_array(data, np.isnan(data))
+    # zoo.io reads the file with pyhdf, netCDF4 or GDAL, whichever is
+    # installed and able to read HDF4.
+    with zoo.io.open_file(FILE_NAME) as f:
+        var = f[DATAFIELD_NAME]
+        data = var[:, :, 0]
+        units = var.attrs['units']
+        long_name = var.attrs['long_name']
+
+        # The fill value attribute is not set.  By inspection, the fill value
+        # is 0.
+        rule = zoo.io.decode.rule_for(var.attrs)._replace(fill=0)
+
+    datam = zoo.io.decode.decode_masked(data, rule)
 
 
     # Calculate lat and lon according to [1]
@@ -97,9 +67,9 @@ def run(FILE_NAME):
     
     # Draw a southern polar stereographic projection using the low resolution
     # coastline database.
-    m = Basemap(projection='cyl', resolution='l',
-                llcrnrlat=-90, urcrnrlat=90,
-                llcrnrlon=-180, urcrnrlon=180)
+    m = zoo.plot.basemap(projection='cyl', resolution='l',
+                         llcrnrlat=-90, urcrnrlat=90,
+                         llcrnrlon=-180, urcrnrlon=180)
     m.drawcoastlines(linewidth=0.5)
     m.drawparallels(np.arange(-90, 91, 45))
     m.drawmeridians(np.arange(-180, 180, 45), labels=[True,False,False,True])
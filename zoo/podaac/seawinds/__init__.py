@@ -1 +1,6 @@
-from . import SW_S3E_rep_wind_speed_lvl0
+from ..._lazy import attach
+
+# The example is named after its data file, which is not an identifier.
+__getattr__, __dir__, __all__ = attach(__name__, [], {
+    'SW_S3E_rep_wind_speed_lvl0': 'SW_S3E_2003100.20053531923.hdf',
+})